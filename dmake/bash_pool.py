@@ -0,0 +1,267 @@
+import atexit
+import hashlib
+import os
+import re
+import subprocess
+import tempfile
+import threading
+
+import dmake.common as common
+
+# Long-lived bash workers evaluating the values that really need a shell
+# (command substitution, arithmetic, ...), instead of spawning `bash -c` per value.
+#
+# One worker per (source file, strict mode): the source file is sourced once when the worker starts,
+# and the worker is restarted when the file content changes.
+# The variables defined by the sourced file can be snapshotted to expand values in pure python.
+# Protocol:
+# - request: one line `__dmake_eval $'<script>'` on the worker stdin
+# - response: `<return code>\0<stdout>\0<stderr>\0` on the worker stdout (bash strings cannot contain \0)
+# Each request is evaluated in a subshell so it cannot alter the worker state.
+
+enabled = os.getenv('DMAKE_SHELL_WORKERS', '1') != '0'
+
+worker_script = r'''
+__dmake_err_file=$1
+__dmake_out_file=$2
+set --
+exec 3>&1 1>/dev/null
+__dmake_reply() {
+    printf '%s\0%s\0%s\0' "$1" "$2" "$3" >&3
+}
+__dmake_eval() {
+    local __dmake_script=$1 __dmake_out __dmake_err='' __dmake_rc
+    shift
+    __dmake_out=$(eval "$__dmake_script" 2>"$__dmake_err_file" 3>&-)
+    __dmake_rc=$?
+    IFS= read -r -d '' __dmake_err < "$__dmake_err_file"
+    __dmake_reply "$__dmake_rc" "$__dmake_out" "$__dmake_err"
+}
+__dmake_source() {
+    local __dmake_out='' __dmake_err='' __dmake_rc
+    if [ "$2" = 1 ]; then set -euo pipefail; fi
+    eval "source $1" >"$__dmake_out_file" 2>"$__dmake_err_file" 3>&- && __dmake_rc=0 || __dmake_rc=$?
+    set +euo pipefail
+    IFS= read -r -d '' __dmake_out < "$__dmake_out_file"
+    IFS= read -r -d '' __dmake_err < "$__dmake_err_file"
+    __dmake_reply "$__dmake_rc" "$__dmake_out" "$__dmake_err"
+}
+__dmake_variables() {
+    local __dmake_name
+    local -a __dmake_names=($(compgen -v))
+    printf '0\0%s\0' "${#__dmake_names[@]}" >&3
+    for __dmake_name in "${__dmake_names[@]}"; do
+        if [[ -v $__dmake_name ]]; then
+            printf '1\0%s\0%s\0' "$__dmake_name" "${!__dmake_name}" >&3
+        else
+            printf '0\0%s\0\0' "$__dmake_name" >&3
+        fi
+    done
+}
+while IFS= read -r __dmake_request; do
+    eval "$__dmake_request"
+done
+'''
+
+name_re = re.compile(r'[A-Za-z_][A-Za-z0-9_]*\Z')
+
+
+class Unsupported(Exception):
+    pass
+
+
+def ansi_c_quote(s):
+    # single line bash literal: $'...'
+    s = s.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
+    return "$'%s'" % s
+
+
+def get_environment():
+    env = os.environ.copy()
+    # don't trace shell execution when run from dmake process: it would be detected as an error otherwise
+    env.pop('DMAKE_DEBUG', None)
+    return env
+
+
+source_hashes = {}
+def get_source_hash(source):
+    try:
+        st = os.stat(source)
+    except OSError:
+        # not a plain path: let bash report the error if any
+        return None
+    stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = source_hashes.get(source)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+    with open(source, 'rb') as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()
+    source_hashes[source] = (stat_key, source_hash)
+    return source_hash
+
+
+class BashWorker(object):
+    def __init__(self, source, strict, source_hash=None):
+        self.source = source
+        self.source_hash = source_hash
+        self.strict = strict
+        self.variables = None
+        self.lock = threading.Lock()
+        self.env = get_environment()
+        fd, self.err_file = tempfile.mkstemp(prefix='dmake-worker-err.')
+        os.close(fd)
+        fd, self.out_file = tempfile.mkstemp(prefix='dmake-worker-out.')
+        os.close(fd)
+        self.process = subprocess.Popen(['bash', '--noprofile', '--norc', '-c', worker_script, 'bash', self.err_file, self.out_file],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=self.env)
+        self.buffer = b''
+        self.source_rc = 0
+        self.source_stdout = ''
+        self.source_stderr = ''
+        if source:
+            self.source_rc, self.source_stdout, self.source_stderr = self.request('__dmake_source %s %d' % (ansi_c_quote(source), 1 if strict else 0))
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def read_field(self):
+        while True:
+            index = self.buffer.find(b'\0')
+            if index >= 0:
+                field = self.buffer[:index]
+                self.buffer = self.buffer[index + 1:]
+                return field.decode()
+            data = os.read(self.process.stdout.fileno(), 65536)
+            if not data:
+                raise EOFError()
+            self.buffer += data
+
+    def request(self, line):
+        try:
+            self.process.stdin.write((line + '\n').encode())
+            self.process.stdin.flush()
+            rc = int(self.read_field())
+            stdout = self.read_field()
+            stderr = self.read_field()
+        except (EOFError, OSError):
+            # the worker died (e.g. `set -u` error while sourcing): report what it printed on stderr
+            with open(self.err_file) as f:
+                stderr = f.read()
+            self.close()
+            raise common.ShellError(stderr or "bash worker exited unexpectedly\n")
+        return rc, stdout, stderr
+
+    def get_variables(self):
+        """Return the variables defined after sourcing the file, or None if sourcing was not clean."""
+        if self.source_rc != 0 or self.source_stdout or self.source_stderr:
+            return None
+        with self.lock:
+            if self.variables is None:
+                try:
+                    self.process.stdin.write(b'__dmake_variables\n')
+                    self.process.stdin.flush()
+                    self.read_field()
+                    variables = {}
+                    for _ in range(int(self.read_field())):
+                        is_set = self.read_field() == '1'
+                        name = self.read_field()
+                        value = self.read_field()
+                        if is_set and not name.startswith('__dmake_'):
+                            variables[name] = value
+                except (EOFError, OSError):
+                    self.close()
+                    raise Unsupported()
+                self.variables = variables
+            return self.variables
+
+    def eval_str(self, value, env):
+        script = ''
+        if self.strict:
+            script += 'set -euo pipefail; '
+        for key, val in env.items():
+            if self.env.get(key) != val:
+                if not name_re.match(key) or not isinstance(val, str):
+                    raise Unsupported()
+                script += 'export %s=%s; ' % (key, common.wrap_cmd_simple_quotes(val))
+        for key in self.env:
+            if key not in env:
+                if not name_re.match(key):
+                    raise Unsupported()
+                script += 'unset %s; ' % key
+        script += 'echo %s' % common.wrap_cmd(value)
+        with self.lock:
+            if self.source_rc != 0:
+                # `source <file> && echo ...`: echo is never run
+                rc, stdout, stderr = 0, '', ''
+            else:
+                rc, stdout, stderr = self.request('__dmake_eval %s' % ansi_c_quote(script))
+        stdout = self.source_stdout + stdout
+        stderr = self.source_stderr + stderr
+        if len(stderr) > 0:
+            raise common.ShellError(stderr)
+        return stdout.strip()
+
+    def close(self):
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        self.process.stdout.close()
+        for path in [self.err_file, self.out_file]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+workers = {}
+workers_lock = threading.Lock()
+
+def get_worker(source, strict, env):
+    key = (source, strict)
+    source_hash = get_source_hash(source) if source else None
+    with workers_lock:
+        worker = workers.get(key)
+        if worker is not None and (not worker.is_alive() or (source and (worker.env != env or worker.source_hash != source_hash))):
+            # a sourced file must see the current environment and content: restart the worker
+            worker.close()
+            worker = None
+        if worker is None:
+            worker = BashWorker(source, strict, source_hash)
+            workers[key] = worker
+        return worker
+
+def eval_str(value, env, strict=False, source=None):
+    """Same as common.eval_str_in_env_with_shell, evaluated by a persistent bash worker."""
+    full_env = get_environment()
+    full_env.update(env)
+    if source and env:
+        # the additional env would need to be set before sourcing the file
+        raise Unsupported()
+    worker = get_worker(source, strict, full_env)
+    return worker.eval_str(value, full_env)
+
+def get_source_snapshot(source, strict=False):
+    """
+    Return all the variables visible after sourcing `source` in the current environment,
+    or None when they cannot be used in place of the real shell.
+    The file is sourced once per content and environment.
+    """
+    worker = get_worker(source, strict, get_environment())
+    return worker.get_variables()
+
+def forget_workers():
+    """In a forked process: the workers belong to the parent process."""
+    global workers, workers_lock
+    workers = {}
+    workers_lock = threading.Lock()
+
+@atexit.register
+def close_workers():
+    with workers_lock:
+        for worker in workers.values():
+            worker.close()
+        workers.clear()
@@ -2,14 +2,13 @@ import sys
 import os
 import argcomplete
 import argparse
-import dmake.commands as commands
-import dmake.core as core
 import dmake.common as common
+import dmake.git_metadata as git_metadata
 
 
 def check_is_git_repo():
     try:
-        common.run_shell_command('git rev-parse --abbrev-ref HEAD')
+        git_metadata.get_head_branch()
         return True
     except common.ShellError as e:
         common.logger.error("Current directory is not a Git repository:\n%s" % str(e))
@@ -25,6 +24,19 @@ def completion_action(args):
     print(argcomplete.shellcode(['dmake'], shell=args.shell))
 
 
+def lazy_entry_point(module_name, function_name='entry_point'):
+    # only import the modules a command needs when it runs: keeps `--help`, completion and light commands fast
+    def entry_point(options):
+        module = __import__(module_name, fromlist=[function_name])
+        return getattr(module, function_name)(options)
+    return entry_point
+
+
+def service_completer(prefix, parsed_args, **kwargs):
+    import dmake.core as core
+    return core.service_completer(prefix, parsed_args, **kwargs)
+
+
 # Find root
 try:
     root_dir, sub_dir = common.find_repo_root()
@@ -59,15 +71,15 @@ parser_generate_doc = subparsers.add_parser('generate-doc', help="Generate DMake
 
 # "service" argument
 for parser in [parser_deploy]:
-    parser.add_argument("service", nargs='?', default='*', help="Apply command to the full repository or, if specified, to the app/service. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = core.service_completer
+    parser.add_argument("service", nargs='?', default='*', help="Apply command to the full repository or, if specified, to the app/service. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = service_completer
 for parser in [parser_test]:
-    parser.add_argument("service", nargs='?', default='*', help="Apply command to the full repository (`*`) or to changed services (`+`), or the specified app/service. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = core.service_completer
+    parser.add_argument("service", nargs='?', default='*', help="Apply command to the full repository (`*`) or to changed services (`+`), or the specified app/service. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = service_completer
 for parser in [parser_shell]:
-    parser.add_argument("service", nargs='?', default='.', help="Run a shell session withing the docker base image for the given service. You may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = core.service_completer
+    parser.add_argument("service", nargs='?', default='.', help="Run a shell session withing the docker base image for the given service. You may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = service_completer
 for parser in [parser_run]:
-    parser.add_argument("service", help="Run an application or a service. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = core.service_completer
+    parser.add_argument("service", help="Run an application or a service. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = service_completer
 for parser in [parser_build]:
-    parser.add_argument("service", help="Build an application or a service. Use `+` to build only changed services. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = core.service_completer
+    parser.add_argument("service", help="Build an application or a service. Use `+` to build only changed services. When specifying a service, you may skip the app if there is no ambiguity, otherwise, you need to specify 'app/service'.").completer = service_completer
 
 parser_shell.add_argument("-c", '--command', help="Pass to `docker run` specified command instead of `docker.command` defined in `dmake.yml` (default: `bash`).")
 add_argument([parser_shell, parser_run, parser_test, parser_deploy],
@@ -85,15 +97,15 @@ parser_generate_doc.add_argument("kind", choices=['usage', 'format', 'example'])
 parser_graph.add_argument('--output', default='dmake-services.gv', help="The generated DOT graph filename.")
 parser_graph.add_argument('--format', default='png', help="The generated DOT graph format (`png`, `svg`, `pdf`, ...).")
 
-parser_test.set_defaults(func=core.make)
-parser_run.set_defaults(func=core.make)
-parser_build.set_defaults(func=core.make)
-parser_stop.set_defaults(func=commands.stop.entry_point)
-parser_shell.set_defaults(func=core.make)
-parser_deploy.set_defaults(func=core.make)
-parser_release.set_defaults(func=commands.release.entry_point)
-parser_graph.set_defaults(func=commands.graph.entry_point)
-parser_generate_doc.set_defaults(func=commands.generate_doc.entry_point)
+parser_test.set_defaults(func=lazy_entry_point('dmake.core', 'make'))
+parser_run.set_defaults(func=lazy_entry_point('dmake.core', 'make'))
+parser_build.set_defaults(func=lazy_entry_point('dmake.core', 'make'))
+parser_stop.set_defaults(func=lazy_entry_point('dmake.commands.stop'))
+parser_shell.set_defaults(func=lazy_entry_point('dmake.core', 'make'))
+parser_deploy.set_defaults(func=lazy_entry_point('dmake.core', 'make'))
+parser_release.set_defaults(func=lazy_entry_point('dmake.commands.release'))
+parser_graph.set_defaults(func=lazy_entry_point('dmake.commands.graph'))
+parser_generate_doc.set_defaults(func=lazy_entry_point('dmake.commands.generate_doc'))
 
 
 
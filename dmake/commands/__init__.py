@@ -1,4 +1 @@
-from . import stop
-from . import release
-from . import graph
-from . import generate_doc
+# commands are imported on demand by dmake.cli: do not import them here
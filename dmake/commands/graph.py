@@ -1,8 +1,10 @@
 import dmake.common as common
-import dmake.core as core
 
 
 def entry_point(options):
+    # lazy load for faster cli
+    import dmake.core as core
+
     loaded_files = core.make(options, parse_files_only=True)
 
     from graphviz import Digraph
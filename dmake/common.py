@@ -1,16 +1,23 @@
 import os
 import sys
 import argparse
+import collections
 from datetime import datetime
 import hashlib
 import io
 import logging
+import pwd
+import random
 import subprocess
 import re
-from ruamel.yaml import YAML
-from ruamel.yaml.emitter import Emitter as YAML_Emitter
+import time
 import uuid
 
+import dmake.bash_pool as bash_pool
+import dmake.git_metadata as git_metadata
+import dmake.shell_expand as shell_expand
+import dmake.yaml_backend as yaml_backend
+
 # Set logger
 logger = logging.getLogger("dmake")
 logger.setLevel(os.environ.get('DMAKE_LOGLEVEL', 'INFO').upper())
@@ -67,18 +74,9 @@ class FlagBooleanAction(argparse.Action):
 
 ###############################################################################
 
-class YAMLEmitterNoVersionDirective(YAML_Emitter):
-    def write_version_directive(self, version_text):
-        # disable emitting version directive (%YAML 1.1)
-        pass
-
 def yaml_ordered_load(stream, all=False):
     try:
-        yaml = YAML(typ='safe', pure=True)
-        # kubectl and everyone else uses yaml 1.1
-        yaml.version = (1, 1)
-        data = list(yaml.load_all(stream)) if all else yaml.load(stream)
-        return data
+        return yaml_backend.load(stream, all)
     except Exception as e:
         raise DMakeException(str(e))
 
@@ -87,18 +85,7 @@ def yaml_ordered_dump(data, stream=None, default_flow_style=False, all=False, no
     if stream is None:
         stream = io.StringIO()
         return_string = True
-    yaml = YAML(pure=True)
-    # simplify concatenating yaml files
-    yaml.explicit_start = True
-    # kubernetes reads yaml 1.1, notably interprets `no` as boolean instead of string vs default ruamel which dumps yaml 1.2
-    yaml.version = (1, 1)
-    # kubectl does not tolerate %YAML 1.1 directive, disabling it
-    yaml.Emitter = YAMLEmitterNoVersionDirective
-    if normalize_indent:
-        yaml.default_flow_style = default_flow_style
-        yaml.width = 4096
-        yaml.indent(mapping=2, sequence=4, offset=2)
-    yaml.dump_all(data, stream) if all else yaml.dump(data, stream)
+    yaml_backend.dump(data, stream, default_flow_style=default_flow_style, all=all, normalize_indent=normalize_indent)
     if return_string:
         return stream.getvalue()
 
@@ -117,13 +104,21 @@ def append_command(commands, cmd, prepend = False, **args):
     elif cmd == "stage_end":
         check_cmd(args, [])
     elif cmd == "parallel":
-        check_cmd(args, [])
+        check_cmd(args, [], optional = ['fail_fast'])
     elif cmd == "parallel_end":
         check_cmd(args, [])
     elif cmd == "parallel_branch":
         check_cmd(args, ['name'])
     elif cmd == "parallel_branch_end":
         check_cmd(args, [])
+    elif cmd == "wait_nodes":
+        check_cmd(args, ['names'])
+    elif cmd == "node_done":
+        check_cmd(args, ['name'])
+    elif cmd == "node":
+        check_cmd(args, ['name'])
+    elif cmd == "node_end":
+        check_cmd(args, [])
     elif cmd == "lock":
         check_cmd(args, ['label'], optional = ['quantity', 'variable'])
     elif cmd == "lock_end":
@@ -143,7 +138,7 @@ def append_command(commands, cmd, prepend = False, **args):
     elif cmd == "echo":
         check_cmd(args, ['message'])
     elif cmd == "sh":
-        check_cmd(args, ['shell'])
+        check_cmd(args, ['shell'], optional = ['label'])
     elif cmd == "read_sh":
         check_cmd(args, ['var', 'shell'], optional = ['fail_if_empty'])
         if 'fail_if_empty' not in args:
@@ -209,6 +204,9 @@ def make_tmp_dir(name, in_root_dir=False):
     if in_root_dir:
         # force generate directly in /tmp
         additional_env['DMAKE_TMP_DIR'] = ""
+    elif 'tmp_dir' in lazy_attributes:
+        # sub directories are created in the session tmp dir
+        __getattr__('tmp_dir')
     return run_shell_command2('dmake_make_tmp_dir "{name}"'.format(name=name),
                               additional_env=additional_env)
 
@@ -226,7 +224,92 @@ def wrap_cmd_simple_quotes(cmd):
     # Example: foo'bar -> 'foo'\''bar' (i.e. 3 concatenated literal strings: 'foo', \' and 'bar', which is interpreted by bash as one arg: foo'bar)
     return "'%s'" % cmd.replace("'", "'\\''")
 
+caches = []
+
+class LRUCache(object):
+    def __init__(self, name, max_size=4096):
+        caches.append(self)
+        self.name = name
+        self.max_size = max_size
+        self.enabled = os.getenv('DMAKE_EVAL_CACHE', '1') != '0'
+        self.data = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        if not self.enabled or key is None:
+            return compute()
+        try:
+            value = self.data[key]
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+        except KeyError:
+            pass
+        self.misses += 1
+        value = compute()
+        self.data[key] = value
+        if len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.data.clear()
+
+    def log_stats(self):
+        logger.debug("%s cache: %d hits, %d misses, %d entries" % (self.name, self.hits, self.misses, len(self.data)))
+
+eval_cache = LRUCache('Environment evaluation')
+
+def has_side_effects(value):
+    # command substitution output may change from one call to the next, e.g. `$(date)`: never cache it
+    return '$(' in value or '`' in value
+
+def set_environ(name, value):
+    os.environ[name] = value
+    # evaluation results depend on the environment
+    for cache in caches:
+        cache.clear()
+
+def log_caches_stats():
+    for cache in caches:
+        cache.log_stats()
+
 def eval_str_in_env(value, env=None, strict=False, source=None):
+    if env is None:
+        env = {}
+    key = None
+    if isinstance(value, str) and not has_side_effects(value):
+        source_hash = bash_pool.get_source_hash(source) if source else None
+        key = (value, tuple(env.items()), strict, source, source_hash)
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+    return eval_cache.get(key, lambda: eval_str_in_env_uncached(value, env, strict, source))
+
+def eval_str_in_env_uncached(value, env, strict=False, source=None):
+    if not source:
+        try:
+            return shell_expand.expand(value, env, strict)
+        except shell_expand.NeedsShell:
+            pass
+    if bash_pool.enabled:
+        if source and not env:
+            # expand against the variables defined by the file, sourced once per session
+            snapshot = bash_pool.get_source_snapshot(source, strict)
+            if snapshot is not None:
+                try:
+                    return shell_expand.expand(value, strict=strict, environ=snapshot)
+                except shell_expand.NeedsShell:
+                    pass
+        try:
+            return bash_pool.eval_str(value, env, strict, source)
+        except bash_pool.Unsupported:
+            pass
+    return eval_str_in_env_with_shell(value, env, strict, source)
+
+def eval_str_in_env_with_shell(value, env=None, strict=False, source=None):
     if env is None:
         env = {}
     cmd = ''
@@ -277,17 +360,14 @@ def sanitize_name_unique(name, mode):
 ###############################################################################
 
 def find_repo_root(path=os.getcwd()):
-    root_dir = run_shell_command('git -C %s rev-parse --show-toplevel' % (path))
+    root_dir = git_metadata.get_toplevel(path)
     sub_dir = os.path.relpath(path, root_dir)
     if sub_dir == '.':
         sub_dir = ''  # IMPORTANT: Need to get rid of the leading '.' to unify behaviour
     return root_dir, sub_dir
 
 def git_get_upstream_branch_remote(branch):
-    try:
-        upstream_branch = run_shell_command('git rev-parse --abbrev-ref --symbolic-full-name {}@{{upstream}}'.format(branch), raise_on_return_code=True)
-    except ShellError:
-        upstream_branch = None
+    upstream_branch = git_metadata.get_upstream_branch(branch)
     if not upstream_branch:
         # assume 'origin' as remote name
         return 'origin'
@@ -397,20 +477,53 @@ def dump_debug_dot_graph(dependencies, nodes_height):
 
 ###############################################################################
 
+# Module attributes only computed on first access (see `__getattr__`): most commands never need them
+lazy_attributes = {}
+
+def __getattr__(name):
+    if name in lazy_attributes:
+        value = lazy_attributes.pop(name)()
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def set_lazy_attribute(name, compute):
+    globals().pop(name, None)
+    lazy_attributes[name] = compute
+
+def new_session_tmp_dir_path(name):
+    # same layout as `dmake_make_tmp_dir <name>` with an empty DMAKE_TMP_DIR
+    tmp_root = '/private/tmp' if uname == 'Darwin' else '/tmp'
+    while True:
+        path = os.path.join(tmp_root, 'dmake_tmp_{}_{:05d}_{}/'.format(time.time_ns(), random.randint(0, 32767), name))
+        if not os.path.isdir(path):
+            return path
+
+def make_session_tmp_dir(path):
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def get_username():
+    try:
+        return pwd.getpwuid(os.geteuid()).pw_name
+    except KeyError:
+        return run_shell_command("id -un")
+
 def init(_options, early_exit=False):
     global generate_dot_graph, exit_after_generate_dot_graph, dot_graph_group_by, dot_graph_pretty, dot_graph_filename, dot_graph_format
-    global root_dir, sub_dir, tmp_dir, config_dir, cache_dir, relative_cache_dir
+    global root_dir, sub_dir, config_dir, cache_dir, relative_cache_dir
     global branch, real_git_branch, target, is_pr, pr_id, build_id, commit_id, name_prefix, image_tag_prefix, force_full_deploy
     global remote, repo_url, repo, use_pipeline, is_local, skip_tests, is_release_branch
     global no_gpu, need_gpu
     global build_description
-    global command, options, uname, username
+    global command, options, uname
     global do_pull_config_dir
     global use_host_ports
     global session_id
     global session_timestamp
     global change_detection, change_detection_override_dirs
-    global parallel_execution
+    global parallel_execution, parallel_execution_dag
+    global coalesce_sh_steps, split_pipeline
 
     options = _options
     command = _options.cmd
@@ -434,6 +547,12 @@ def init(_options, early_exit=False):
         change_detection_override_dirs = os.getenv('DMAKE_CHANGE_DETECTION_OVERRIDE_DIRS').split(',')
 
     parallel_execution = os.getenv('DMAKE_PARALLEL_EXECUTION', '0') != '0'
+    # Jenkins: schedule by dependencies instead of by height (always the case with the bash runtime)
+    parallel_execution_dag = os.getenv('DMAKE_PARALLEL_EXECUTION_DAG', '0') != '0'
+    # Jenkins: merge the adjacent `sh` steps of each node (see core.coalesce_sh_commands)
+    coalesce_sh_steps = os.getenv('DMAKE_COALESCE_SH_STEPS', '1') != '0'
+    # Jenkins: emit the nodes as functions called by chunks (see core.generate_command_pipeline)
+    split_pipeline = os.getenv('DMAKE_PIPELINE_SPLIT', '1') != '0'
 
     try:
         root_dir, sub_dir = find_repo_root()
@@ -458,10 +577,10 @@ def init(_options, early_exit=False):
     use_host_ports = os.getenv('DMAKE_USE_HOST_PORTS', '0') != '0'
 
     # Get uname
-    uname = run_shell_command("uname")
+    uname = os.uname().sysname
 
     # Get username
-    username = run_shell_command("id -un")
+    set_lazy_attribute('username', get_username)
 
     # Make sure DMAKE_ON_BUILD_SERVER is correctly configured
     is_local = os.getenv('DMAKE_ON_BUILD_SERVER', 0) != "1"
@@ -483,7 +602,7 @@ def init(_options, early_exit=False):
         branch = os.getenv('BRANCH_NAME', None)
     if branch is None:
         # Not on Jenkins: bash mode: do not emit jenkins pipeline script
-        branch = run_shell_command("git rev-parse --abbrev-ref HEAD")
+        branch = git_metadata.get_head_branch()
         use_pipeline = False
         target = os.getenv('CHANGE_TARGET', '@{upstream}')
         pr_id  = None
@@ -508,15 +627,9 @@ def init(_options, early_exit=False):
     repo_github_owner = None
     commit_id = ''
     # Find remote
-    upstream_branch = run_shell_command('git rev-parse --abbrev-ref --symbolic-full-name @{upstream}', ignore_error=True)
-    if not upstream_branch:
-        # assume 'origin' as remote name
-        remote = 'origin'
-    else:
-        remote = upstream_branch.split('/')[0]
-    # Find repo
     remote = git_get_upstream_branch_remote('HEAD')
-    repo_url = run_shell_command('git config --get remote.%s.url' % (remote), ignore_error=True)
+    # Find repo
+    repo_url = git_metadata.get_remote_url(remote)
     repo = re.search('/([^/]*?)(\.git)?$', repo_url)
     if repo is not None:
         repo = repo.group(1)
@@ -528,13 +641,15 @@ def init(_options, early_exit=False):
     repo_github_owner = re.search('github.com[:/](.*?)/', repo_url)
     if repo_github_owner is not None:
         repo_github_owner = repo_github_owner.groups()[0]
-    commit_id = run_shell_command('git rev-parse HEAD')
+    commit_id = git_metadata.get_commit_id()
 
     # Generate name prefix: readable, unique, stable identifier
     name_prefix = sanitize_name_unique('{repo}.{branch}.{build_id}'.format(repo=repo, branch=branch, build_id=build_id), mode='docker')
 
-    tmp_dir = make_tmp_dir(name_prefix, in_root_dir=True)
-    os.environ['DMAKE_TMP_DIR'] = tmp_dir
+    # The session tmp dir path is exported right away, but the directory is only created when `tmp_dir` is first used
+    session_tmp_dir = new_session_tmp_dir_path(name_prefix)
+    set_environ('DMAKE_TMP_DIR', session_tmp_dir)
+    set_lazy_attribute('tmp_dir', lambda: make_session_tmp_dir(session_tmp_dir))
 
     # Generate default image tag prefix
     image_tag_prefix = sanitize_name_unique(branch, mode='docker')
@@ -557,13 +672,13 @@ def init(_options, early_exit=False):
                     "https://github.com/%s/%s/tree/%s" % (repo_github_owner, repo, branch),
                     branch, "All targets" if app == '*' else app)
 
-    os.environ["REPO"]        = repo
-    os.environ["BRANCH"]      = str(branch)
-    os.environ["COMMIT_ID"]   = commit_id
-    os.environ["BUILD"]       = str(build_id)
-    os.environ["REPO_SANITIZED"]   = sanitize_name(repo)
-    os.environ["BRANCH_SANITIZED"] = sanitize_name(str(branch))
-    os.environ["IMAGE_TAG_PREFIX"] = image_tag_prefix
+    set_environ("REPO",        repo)
+    set_environ("BRANCH",      str(branch))
+    set_environ("COMMIT_ID",   commit_id)
+    set_environ("BUILD",       str(build_id))
+    set_environ("REPO_SANITIZED",   sanitize_name(repo))
+    set_environ("BRANCH_SANITIZED", sanitize_name(str(branch)))
+    set_environ("IMAGE_TAG_PREFIX", image_tag_prefix)
 
     if early_exit:
         return
@@ -1,36 +1,34 @@
+import concurrent.futures
+import multiprocessing
 import os
+import re
 import subprocess
 import sys
 import uuid
 
+import dmake.bash_pool as bash_pool
 import dmake.common as common
+import dmake.dag as dag
+import dmake.deepobuild as deepobuild
+import dmake.discovery as discovery
+import dmake.durations as durations
+import dmake.executor as executor
+import dmake.files_cache as files_cache
+import dmake.fingerprint as fingerprint
 from dmake.common import DMakeException, SharedVolumeNotFoundException, append_command
 from dmake.deepobuild import DMakeFile
+from dmake.path_index import PathTrie
 
 tag_push_error_msg = "Unauthorized to push the current state of deployment to git server. If the repository belongs to you, please check that the credentials declared in the DMAKE_JENKINS_SSH_AGENT_CREDENTIALS and DMAKE_JENKINS_HTTP_CREDENTIALS allow you to write to the repository."
 
 ###############################################################################
 
-def find_symlinked_directories():
-    symlinks = []
-    for line in common.run_shell_command("for f in $(dmake_find . -type l); do echo \"$f $(ls -l $f | sed -e 's/.* -> //')\"; done").split('\n'):
-        l = line.split(' ')
-        if len(l) != 2:
-            continue
-        link_path = os.path.normpath(l[0])
-        if not os.path.isdir(link_path):
-            continue
-        linked_dir = os.path.normpath(os.path.join(os.path.dirname(link_path), l[1]))
-        if not os.path.isdir(linked_dir) or linked_dir[0] == '/':
-            continue
-        symlinks.append((link_path, linked_dir))
-    return symlinks
-
 def look_for_changed_directories():
+    """Return the changed files (or directories) as a PathTrie, or None when unknown: then everything has changed."""
     if common.change_detection_override_dirs is not None:
-        changed_dirs = common.change_detection_override_dirs
-        common.logger.info("Changed directories (forced via DMAKE_CHANGE_DETECTION_OVERRIDE_DIRS): %s", set(changed_dirs))
-        return changed_dirs
+        changed_paths = PathTrie(common.change_detection_override_dirs)
+        common.logger.info("Changed directories (forced via DMAKE_CHANGE_DETECTION_OVERRIDE_DIRS): %s", set(common.change_detection_override_dirs))
+        return changed_paths
 
     if not common.target:
         tag = get_tag_name()
@@ -58,55 +56,35 @@ def look_for_changed_directories():
         return None
 
     if len(output) == 0:
-        return []
+        return PathTrie()
 
     output = [file.strip() for file in output.split('\n')]
-    symlinks = find_symlinked_directories()
+    symlinks = discovery.find_symlinked_directories()
     to_append = []
     for file in output:
         if len(file) == 0:
             continue
         for sl in symlinks:
-            if file.startswith(sl[1]):
-                f = file[len(sl[1]):]
-                if len(f) == 0:
-                    continue
-                if f[0] == '/':
-                    f = f[1:]
+            # component-aware prefix: `app` is not a prefix of `app2/file`
+            if file.startswith(sl[1] + '/'):
+                f = file[len(sl[1]) + 1:]
                 to_append.append(os.path.join(sl[0], f))
     output += to_append
     common.logger.debug("Changed files: %s", output)
 
-    changed_dirs = set()
+    # index the files, not only their directories: services `sources` can be files
+    changed_paths = PathTrie()
     for file in output:
         if len(file) == 0:
             continue
-        d = os.path.dirname(file)
-        if d in changed_dirs:
-            continue
-
-        # Only keep bottom changed directories
-        do_add = True
-        to_remove = []
-        for directory in changed_dirs:
-            if directory.startswith(d): # sub directory of d
-                do_add = False
-            elif d.startswith(directory):
-                to_remove = directory
-
-        changed_dirs.difference_update(to_remove)
-        if do_add:
-            changed_dirs.add(d)
-    common.logger.info("Changed directories: %s", changed_dirs)
-    return list(changed_dirs)
+        changed_paths.add(file)
+    common.logger.info("Changed directories: %s", set(os.path.dirname(file) for file in output if len(file) > 0))
+    return changed_paths
 
 ###############################################################################
 
 def load_dmake_files_list():
-    # Ignore permission issues when searching for dmake.yml files, in a portable way
-    build_files = common.run_shell_command('dmake_find . -name dmake.yml').split("\n")
-    build_files = filter(lambda f: len(f.strip()) > 0, build_files)
-    build_files = [file[2:] for file in build_files]
+    build_files = discovery.find_dmake_files()
     # Important: for block listed files: we load file in order from root to deepest file
     build_files = sorted(build_files, key = lambda path: len(os.path.dirname(path)))
     return build_files
@@ -198,107 +176,178 @@ def activate_base(base_variant):
 
 ###############################################################################
 
-def activate_link(loaded_files, service_providers, service_dependencies, service):
+def activate_link(loaded_files, service_providers, service):
+    """Return the activation requests of the `needed_links` of `service`."""
     file, _, _, _ = service_providers[service]
     dmake = loaded_files[file]
     s = dmake._get_service_(service)
 
-    children = []
-    for link in s.needed_links:
-        children += activate_service(loaded_files, service_providers, service_dependencies, 'run_link', 'links/%s/%s' % (dmake.get_app_name(), link))
-
-    return children
+    return [('run_link', 'links/%s/%s' % (dmake.get_app_name(), link), None) for link in s.needed_links]
 
 ###############################################################################
 
-def activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command, needed_for):
-    children = []
-    for service, service_customization in needs:
-        if service_customization is None or service_customization.needed_for.kind(needed_for):
-            children += activate_service(loaded_files, service_providers, service_dependencies, command, service, service_customization)
-    return children
+def activate_needed_services(needs, command, needed_for):
+    """Return the activation requests of the needed services in `needs`."""
+    return [(command, service, service_customization)
+            for service, service_customization in needs
+            if service_customization is None or service_customization.needed_for.kind(needed_for)]
 
 ###############################################################################
 
-def activate_service(loaded_files, service_providers, service_dependencies, command, service, service_customization=None):
-    common.logger.debug("activate_service: command: %s,\tservice: %s,\tservice_customization: %s" % (command, service, service_customization))
-    if command != 'run':
-        assert service_customization == None
-    node = (command, service, service_customization)
-    if command == 'test' and common.skip_tests:
-        return []
+# Service activation: builds `service_dependencies`, the graph of the nodes (command, service, service_customization) to run.
+# - The children of a node only depend on its command and service: they are computed once per `make()`
+#   as a template, a list of (is_request, value): either a node added as is (shared volumes, base images),
+#   or an activation request (command, service, service_customization), replaced by the activated node,
+#   or by nothing for skipped tests.
+# - Activation is a depth first worklist on an explicit stack (see activate_service), in the order of the templates:
+#   the nodes are added to `service_dependencies` once all their children are, like a recursive implementation would.
+
+activation_templates = {}  # (command, service) -> template
+
+def make_activation_template(loaded_files, service_providers, command, service):
+    file, needs, base_variant, trigger_test_parents = service_providers[service]
+    template = []
+    def add_nodes(nodes):
+        template.extend((False, node) for node in nodes)
+    def add_requests(requests):
+        template.extend((True, request) for request in requests)
+
+    if command == 'shell':
+        add_nodes(activate_service_shared_volumes(loaded_files, service_providers, service))
+        if common.options.with_dependencies and needs is not None:
+            add_requests(activate_needed_services(needs, command='run', needed_for='run'))
+        if common.options.with_dependencies:
+            add_requests(activate_link(loaded_files, service_providers, service))
+        add_nodes(activate_base(base_variant))
+    elif command == 'test':
+        add_nodes(activate_service_shared_volumes(loaded_files, service_providers, service))
+        if common.options.with_dependencies and needs is not None:
+            add_requests(activate_needed_services(needs, command='run', needed_for='test'))
+        add_requests([('build_docker', service, None)])
+        if common.options.with_dependencies:
+            add_requests(activate_link(loaded_files, service_providers, service))
+    elif command == 'build_docker':
+        add_nodes(activate_base(base_variant))
+    elif command == 'run':
+        add_nodes(activate_service_shared_volumes(loaded_files, service_providers, service))
+        # ~hackish: run service depends on test service if we are doing tests
+        if common.command in ['test', 'deploy']:
+            if common.change_detection:
+                # in change detection mode, don't add "test service" node: only create the link between run and test if the test node exists.
+                # the services to be tested are either:
+                # - created directly via graph construction starting on the target services: the ones that changed
+                # - independently created from "test child service" to "test parent service"
+                # we can reach here in the middle of the DAG construction (e.g. when multiple services have changed: we fully work one by one sequentially),
+                # so we don't know yet if the test node will exist at the end or not.
+                # the link will be created later, in a second global pass in make(), see "second pass" there
+                pass
+            else:
+                # normal mode, activate "test service" as dependance of "run service"
+                # REMARK: if we wanted, we could change the semantic of `dmake test foo` to only test foo (while still running its dependencies needed for tests or run, recursively), instead of also testing all children services too: just use the second pass
+                add_requests([('test', service, None)])
+        add_requests([('build_docker', service, None)])
+        if common.options.with_dependencies and needs is not None:
+            add_requests(activate_needed_services(needs, command='run', needed_for='run'))
+        if common.options.with_dependencies:
+            add_requests(activate_link(loaded_files, service_providers, service))
+    elif command == 'run_link':
+        add_nodes(activate_link_shared_volumes(loaded_files, service_providers, service))
+    elif command == 'deploy':
+        add_requests([('build_docker', service, None), ('test', service, None)])
+        if common.options.with_dependencies and needs is not None:
+            # enforce deployment order by re-using needed_services dependency graph
+            # but we don't want to create extra deployments because of customization
+            # => deploy recursively using needs dependency, but ignore service customization
+            uncustomized_needs = [(child_service, None) for child_service, child_service_customization in needs]
+            add_requests(activate_needed_services(uncustomized_needs, command='deploy', needed_for='fake__not_used'))
+    else:
+        raise Exception("Unknown command '%s'" % command)
+    return template
+
+def get_activation_template(loaded_files, service_providers, command, service):
+    key = (command, service)
+    template = activation_templates.get(key)
+    if template is None:
+        template = activation_templates[key] = make_activation_template(loaded_files, service_providers, command, service)
+    return template
+
+class ActivationFrame(object):
+    """A node being activated: its template is walked from `position`, then its `trigger_test_parents`, if any."""
+    __slots__ = ('node', 'template', 'position', 'children', 'parents')
+
+    def __init__(self, node, template):
+        self.node = node
+        self.template = template
+        self.position = 0
+        self.children = []
+        self.parents = None
 
-    if node not in service_dependencies:
+def activate_service(loaded_files, service_providers, service_dependencies, command, service, service_customization=None):
+    """Activate the node (command, service, service_customization) and its dependencies; return [node], or [] for skipped tests."""
+    stack = []
+    active_nodes = set()
+
+    def start(request):
+        # return the activation result, or None when the node was pushed on the stack to be activated
+        command, service, service_customization = request
+        common.logger.debug("activate_service: command: %s,\tservice: %s,\tservice_customization: %s" % (command, service, service_customization))
+        if command != 'run':
+            assert service_customization == None
+        if command == 'test' and common.skip_tests:
+            return []
+        if request in service_dependencies:
+            return [request]
+        if request in active_nodes:
+            nodes = [frame.node for frame in stack]
+            cycle = nodes[nodes.index(request):] + [request]
+            raise DMakeException("Circular dependencies: %s" % ' -> '.join(map(display_command_node, cycle)))
         if service not in service_providers:
             raise DMakeException("Cannot find service: %s" % service)
-        file, needs, base_variant, trigger_test_parents = service_providers[service]
-        children = []
-        if command == 'shell':
-            children += activate_service_shared_volumes(loaded_files, service_providers, service)
-            if common.options.with_dependencies and needs is not None:
-                children += activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command='run', needed_for='run')
-            if common.options.with_dependencies:
-                children += activate_link(loaded_files, service_providers, service_dependencies, service)
-            children += activate_base(base_variant)
-        elif command == 'test':
-            children += activate_service_shared_volumes(loaded_files, service_providers, service)
-            if common.options.with_dependencies and needs is not None:
-                children += activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command='run', needed_for='test')
-            children += activate_service(loaded_files, service_providers, service_dependencies, 'build_docker', service)
-            if common.options.with_dependencies:
-                children += activate_link(loaded_files, service_providers, service_dependencies, service)
-        elif command == 'build_docker':
-            children += activate_base(base_variant)
-        elif command == 'run':
-            children += activate_service_shared_volumes(loaded_files, service_providers, service)
-            # ~hackish: run service depends on test service if we are doing tests
-            if common.command in ['test', 'deploy']:
-                if common.change_detection:
-                    # in change detection mode, don't add "test service" node: only create the link between run and test if the test node exists.
-                    # the services to be tested are either:
-                    # - created directly via graph construction starting on the target services: the ones that changed
-                    # - independently created from "test child service" to "test parent service"
-                    # we can reach here in the middle of the DAG construction (e.g. when multiple services have changed: we fully work one by one sequentially),
-                    # so we don't know yet if the test node will exist at the end or not.
-                    # the link will be created later, in a second global pass in make(), see "second pass" there
-                    pass
-                else:
-                    # normal mode, activate "test service" as dependance of "run service"
-                    # REMARK: if we wanted, we could change the semantic of `dmake test foo` to only test foo (while still running its dependencies needed for tests or run, recursively), instead of also testing all children services too: just use the second pass
-                    children += activate_service(loaded_files, service_providers, service_dependencies, 'test', service)
-            children += activate_service(loaded_files, service_providers, service_dependencies, 'build_docker', service)
-            if common.options.with_dependencies and needs is not None:
-                children += activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command='run', needed_for='run')
-            if common.options.with_dependencies:
-                children += activate_link(loaded_files, service_providers, service_dependencies, service)
-        elif command == 'run_link':
-            children += activate_link_shared_volumes(loaded_files, service_providers, service)
-        elif command == 'deploy':
-            children += activate_service(loaded_files, service_providers, service_dependencies, 'build_docker', service)
-            children += activate_service(loaded_files, service_providers, service_dependencies, 'test', service)
-            if common.options.with_dependencies and needs is not None:
-                # enforce deployment order by re-using needed_services dependency graph
-                # but we don't want to create extra deployments because of customization
-                # => deploy recursively using needs dependency, but ignore service customization
-                uncustomized_needs = [(child_service, None) for child_service, child_service_customization in needs]
-                children += activate_needed_services(loaded_files, service_providers, service_dependencies, uncustomized_needs, command='deploy', needed_for='fake__not_used')
-
-        else:
-            raise Exception("Unknown command '%s'" % command)
+        stack.append(ActivationFrame(request, get_activation_template(loaded_files, service_providers, command, service)))
+        active_nodes.add(request)
+        return None
 
-        service_dependencies[node] = children
+    result = start((command, service, service_customization))
+    while stack:
+        frame = stack[-1]
+        if result is not None:
+            if frame.parents is None:
+                frame.children += result
+            else:
+                # parent test node activated
+                parent_children = service_dependencies[result[0]]
+                if frame.node not in parent_children:
+                    parent_children.append(frame.node)
+            result = None
+
+        if frame.parents is None:
+            if frame.position < len(frame.template):
+                is_request, value = frame.template[frame.position]
+                frame.position += 1
+                if is_request:
+                    result = start(value)
+                else:
+                    frame.children.append(value)
+                continue
+            service_dependencies[frame.node] = frame.children
+            # parent dependencies, after updating service_dependencies
+            # test parent when child changed
+            command, service, _ = frame.node
+            if command == 'test' and common.options.with_dependencies and common.change_detection:
+                frame.parents = iter(service_providers[service][3])
+            else:
+                frame.parents = iter(())
 
-        # parent dependencies, after updating service_dependencies to avoid infinite recursion
-        # test parent when child changed
-        if command == 'test':
-            if common.options.with_dependencies and common.change_detection:
-                for parent_service in trigger_test_parents:
-                    common.logger.debug("activate_service: parent test: service: %s,\tparent service: %s" % (service, parent_service))
-                    parent_node = activate_service(loaded_files, service_providers, service_dependencies, 'test', parent_service)[0]
-                    if node not in service_dependencies[parent_node]:
-                        service_dependencies[parent_node].append(node)
+        parent_service = next(frame.parents, None)
+        if parent_service is not None:
+            common.logger.debug("activate_service: parent test: service: %s,\tparent service: %s" % (frame.node[1], parent_service))
+            result = start(('test', parent_service, None))
+            continue
+        stack.pop()
+        active_nodes.discard(frame.node)
+        result = [frame.node]
 
-    return [node]
+    return result
 
 ###############################################################################
 
@@ -310,48 +359,51 @@ def display_command_node(node):
 ###############################################################################
 
 def find_active_files(loaded_files, service_providers, service_dependencies, sub_dir, command):
-    """Find file where changes have happened, and activate them; or activate all when common.force_full_deploy"""
+    """
+    Find file where changes have happened, and activate them; or activate all when common.force_full_deploy.
+    Services with `sources` are only activated when one of their sources has changed.
+    """
     if common.force_full_deploy:
         common.logger.info("Forcing full re-build")
     else:
         # TODO warn if command == deploy: not really supported? or fatal error? or nothing?
-        changed_dirs = look_for_changed_directories()
+        changed_paths = look_for_changed_directories()
 
-    def has_changed(root):
-        for d in changed_dirs:
-            if d.startswith(root):
-                return True
-        return False
+    def has_changed(path):
+        if common.force_full_deploy or changed_paths is None:
+            return True
+        return changed_paths.has_changed(path)
 
     for file_name, dmake_file in loaded_files.items():
         if not file_name.startswith(sub_dir):
             continue
         root = os.path.dirname(file_name)
-        if common.force_full_deploy or has_changed(root):
+        services = dmake_file.get_services()
+        root_has_changed = has_changed(root)
+        if root_has_changed and all(service.sources is None for service in services):
             activate_file(loaded_files, service_providers, service_dependencies, command, file_name)
             continue
-        # still, maybe activate some services in this file with extended build context
-        #  (to support docker_image.build.context: ../)
-        for service in dmake_file.get_services():
-            contexts = set()
-            for additional_root in service.config.docker_image.get_source_directories_additional_contexts():
-                contexts.add(os.path.normpath(os.path.join(root, additional_root)))
-            # activate service if any of its additional contexts has changed
-            for root in contexts:
-                if has_changed(root):
-                    full_service_name = "%s/%s" % (dmake_file.app_name, service.service_name)
-                    activate_service(loaded_files, service_providers, service_dependencies, command, full_service_name)
-                    break
+        for service in services:
+            if service.sources is not None:
+                # paths relative to the repository root
+                is_active = any(has_changed(source) for source in service.sources)
+            elif root_has_changed:
+                is_active = True
+            else:
+                # still, maybe activate some services in this file with extended build context
+                #  (to support docker_image.build.context: ../)
+                contexts = set()
+                for additional_root in service.config.docker_image.get_source_directories_additional_contexts():
+                    contexts.add(os.path.normpath(os.path.join(root, additional_root)))
+                # activate service if any of its additional contexts has changed
+                is_active = any(has_changed(context) for context in contexts)
+            if is_active:
+                full_service_name = "%s/%s" % (dmake_file.app_name, service.service_name)
+                activate_service(loaded_files, service_providers, service_dependencies, command, full_service_name)
 
 ###############################################################################
 
-def load_dmake_file(loaded_files, blocklist, service_providers, service_dependencies, file):
-    if file in loaded_files:
-        return
-
-    if file in blocklist:
-        return
-
+def read_dmake_file(file):
     # Load YAML and check version
     with open(file, 'r') as stream:
         data = common.yaml_ordered_load(stream)
@@ -360,9 +412,95 @@ def load_dmake_file(loaded_files, blocklist, service_providers, service_dependen
     version = str(data['dmake_version'])
     if version not in ['0.1']:
         raise DMakeException("Incorrect version '%s'" % str(data['dmake_version']))
+    # (TODO: versionning)
+    return data
+
+###############################################################################
+
+# YAML parsing and validation of the dmake files are CPU bound: they are done in parallel by forked worker
+# processes, before loading the files in order.
+# Only the validation is done by the workers, with the same result as a cache entry (see dmake.files_cache):
+# the cross-file steps (blocklists, shared registries, `docker:`/`env:` references, service providers) are
+# replayed by the main process in the usual order.
+# A worker failure (invalid file, needed migrations, ...) is not an error: the file is loaded again serially if
+# it is not blocklisted, which reports the usual error.
+# DMAKE_LOAD_JOBS: number of worker processes (default: number of CPUs, max 8), 1 to disable.
+load_jobs_max = 8
+load_jobs_min_files = 16
+prevalidated_files = {}
+
+def get_load_jobs(files_count):
+    jobs = os.getenv('DMAKE_LOAD_JOBS')
+    if jobs is None:
+        jobs = min(os.cpu_count() or 1, load_jobs_max)
+    else:
+        try:
+            jobs = int(jobs)
+        except ValueError:
+            raise DMakeException("Invalid DMAKE_LOAD_JOBS: '%s', expected a number" % jobs)
+    if files_count < load_jobs_min_files:
+        return 1
+    return max(1, min(jobs, files_count))
+
+def init_load_worker():
+    # the parent logs the validation warnings when it loads the files
+    common.logger.handlers = []
+    common.logger.propagate = False
+    bash_pool.forget_workers()
+
+def prevalidate_dmake_file(file):
+    try:
+        content_hash = files_cache.get_content_hash(file)
+        data = read_dmake_file(file)
+        deepobuild.reset()
+        with files_cache.record() as record:
+            dmake_file = DMakeFile(file, data, validate_only=True)
+        return files_cache.make_entry(file, content_hash, dmake_file, record)
+    except Exception as e:
+        common.logger.debug("Cannot validate '%s' in a worker: %s" % (file, e))
+        return None
+
+def prevalidate_dmake_files(files):
+    prevalidated_files.clear()
+    files = [file for file in files if files_cache.lookup(file) is None]
+    jobs = get_load_jobs(len(files))
+    if jobs <= 1:
+        return
+    try:
+        mp_context = multiprocessing.get_context('fork')
+    except ValueError:
+        return
+    common.logger.debug("Validating %d dmake files with %d processes" % (len(files), jobs))
+    chunksize = max(1, len(files) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(jobs, mp_context=mp_context, initializer=init_load_worker) as executor:
+        for file, entry in zip(files, executor.map(prevalidate_dmake_file, files, chunksize=chunksize)):
+            if entry is not None:
+                prevalidated_files[file] = entry
+
+def get_prevalidated_dmake_file(file):
+    entry = prevalidated_files.pop(file, None)
+    if entry is None:
+        return None
+    dmake_file = files_cache.load_entry(file, entry)
+    if dmake_file is not None:
+        files_cache.store(file, entry)
+    return dmake_file
+
+###############################################################################
 
-    # Load appropriate version (TODO: versionning)
-    if version == '0.1':
+def load_dmake_file(loaded_files, blocklist, service_providers, service_dependencies, file):
+    if file in loaded_files:
+        return
+
+    if file in blocklist:
+        return
+
+    # Reuse the file validated by a previous run if it did not change, or by a loading worker
+    dmake_file = files_cache.get(file)
+    if dmake_file is None:
+        dmake_file = get_prevalidated_dmake_file(file)
+    if dmake_file is None:
+        data = read_dmake_file(file)
         dmake_file = DMakeFile(file, data)
     loaded_files[file] = dmake_file
 
@@ -390,16 +528,16 @@ def load_dmake_file(loaded_files, blocklist, service_providers, service_dependen
         load_dmake_file(loaded_files, blocklist, service_providers, service_dependencies, ref)
         if isinstance(loaded_files[ref].docker, str):
             raise DMakeException('Circular references: trying to load %s which is already loaded.' % loaded_files[ref].docker)
-        dmake_file.__fields__['docker'] = loaded_files[ref].docker
+        dmake_file._set_field_('docker', loaded_files[ref].docker)
     else:
         if isinstance(dmake_file.docker.root_image, str):
             ref = dmake_file.docker.root_image
             load_dmake_file(loaded_files, blocklist, service_providers, service_dependencies, ref)
-            dmake_file.docker.__fields__['root_image'] = loaded_files[ref].docker.root_image
+            dmake_file.docker._set_field_('root_image', loaded_files[ref].docker.root_image)
         elif dmake_file.docker.root_image is not None:
             default_root_image = dmake_file.docker.root_image
             default_root_image = common.eval_str_in_env(default_root_image.name + ":" + default_root_image.tag)
-            dmake_file.docker.__fields__['root_image'] = default_root_image
+            dmake_file.docker._set_field_('root_image', default_root_image)
 
         default_root_image = dmake_file.docker.root_image
         for base_image in dmake_file.docker.base_image:
@@ -411,7 +549,7 @@ def load_dmake_file(loaded_files, blocklist, service_providers, service_dependen
                 if default_root_image is None:
                     raise DMakeException("Missing field 'root_image' (and default 'docker.root_image') for base_image '%s' in '%s'" % (base_image_name, file))
                 root_image = default_root_image
-                base_image.__fields__['root_image'] = root_image
+                base_image._set_field_('root_image', root_image)
 
             add_service_provider(service_providers, base_image_service, file)
             service_dependencies[('base', base_image_service, None)] = [('base', root_image, None)]
@@ -423,58 +561,7 @@ def load_dmake_file(loaded_files, blocklist, service_providers, service_dependen
         load_dmake_file(loaded_files, blocklist, service_providers, service_dependencies, ref)
         if isinstance(loaded_files[ref].env, str):
             raise DMakeException('Circular references: trying to load %s which is already loaded.' % ref)
-        dmake_file.__fields__['env'] = loaded_files[ref].env
-
-###############################################################################
-
-def check_no_circular_dependencies(dependencies):
-    is_leaf = {}
-    for k in dependencies:
-        is_leaf[k] = True
-
-    tree_depth = {}
-    def sub_check(key, walked_nodes = []):
-        if key in tree_depth:
-            return tree_depth[key]
-        if key not in dependencies:
-            return 0
-
-        walked_nodes = [key] + walked_nodes
-        depth = 0
-        for dep in dependencies[key]:
-            is_leaf[dep] = False
-            if dep in walked_nodes:
-                raise DMakeException("Circular dependencies: %s" % ' -> '.join(map(str, reversed([dep] + walked_nodes))))
-            depth = max(depth, 1 + sub_check(dep, walked_nodes))
-
-        tree_depth[key] = depth
-        return depth
-
-    for k in dependencies:
-        sub_check(k)
-
-    leaves = []
-    for k, v in is_leaf.items():
-        if v:
-            leaves.append((k, tree_depth[k]))
-
-    return leaves, tree_depth
-
-###############################################################################
-
-def order_dependencies(dependencies, leaves):
-    ordered_build_files = {}
-    def sub_order(key, depth):
-        if key in ordered_build_files and depth >= ordered_build_files[key]:
-            return
-        ordered_build_files[key] = depth
-        if key in dependencies:
-            for f in dependencies[key]:
-                sub_order(f, depth - 1)
-
-    for file, depth in leaves:
-        sub_order(file, depth)
-    return ordered_build_files
+        dmake_file._set_field_('env', loaded_files[ref].env)
 
 ###############################################################################
 
@@ -489,17 +576,171 @@ def make_path_unique_per_variant(path, service_name):
 
 ###############################################################################
 
-def generate_command_pipeline(file, cmds):
+def coalesce_sh_commands(cmds):
+    """
+    Return `cmds` with the runs of adjacent `echo` and `sh` commands merged into one `sh` script, labeled by its leading
+    `echo` message: Jenkins pays a step setup cost for each `sh` step (and `dmake_echo`).
+    A run starts at each `echo` (e.g. the first command of each node), and stops at any other command (`try`, `catch`,
+    `read_sh`, `env`, `lock`, parallel `sh`, ...): the control flow and the Jenkins environment updates are preserved.
+    The merged commands run in subshells of a `set -e` script: like separate steps, they stop at the first failure and
+    don't share their working directory nor variables.
+    """
+    result = []
+    run = []
+
+    def flush():
+        if len(run) == 1:
+            result.append(run[0])
+        elif len(run) > 1:
+            lines = ['set -e']
+            for cmd, kwargs in run:
+                if cmd == 'echo':
+                    lines.append('echo %s' % common.wrap_cmd_simple_quotes(kwargs['message']))
+                else:
+                    lines.append('(\n%s\n)' % kwargs['shell'])
+            label = {}
+            if run[0][0] == 'echo':
+                label['label'] = run[0][1]['message']
+            append_command(result, 'sh', shell='\n'.join(lines), **label)
+        del run[:]
+
+    for cmd, kwargs in cmds:
+        if cmd == 'echo':
+            flush()
+            run.append((cmd, kwargs))
+        elif cmd == 'sh' and isinstance(kwargs['shell'], str) and 'label' not in kwargs:
+            run.append((cmd, kwargs))
+        else:
+            flush()
+            result.append((cmd, kwargs))
+    flush()
+    return result
+
+
+# Split Jenkinsfiles (see generate_command_pipeline): max consecutive calls in the driver, and by chunk function
+pipeline_chunk_size = 50
+pipeline_step_re = re.compile(r"^\s*(?:env\.\w+ = )?(sh|dmake_echo|readFile|lock|timeout|waitUntil|parallel|junit|publishHTML|recordCoverage|withCredentials|slackSend|input)\b")
+
+
+def get_pipeline_stats(lines, functions):
+    """Return the size report of a generated Jenkinsfile: `lines`: the driver, `functions`: the lines of each function."""
+    all_lines = lines + [line for function in functions for line in function]
+    return {
+        'lines': len(all_lines),
+        'bytes': sum(len(line) + 1 for line in all_lines),
+        'steps': sum(1 for line in all_lines if pipeline_step_re.match(line)),
+        'driver_lines': len(lines),
+        'functions': len(functions),
+        'max_function_lines': max((len(function) for function in functions), default=0),
+    }
+
+
+def generate_command_pipeline(file, cmds, split=False):
+    """
+    Write the Jenkinsfile of `cmds`, and return its size report (see get_pipeline_stats).
+    `split`: emit each node (the `node` commands, and each parallel branch) as a function called from the driver, by
+    chunk functions of `pipeline_chunk_size` calls when more: the Groovy script body is compiled as a single method,
+    limited to 64KB by the JVM, and slow to interpret by CPS when huge.
+    """
     indent_level = 0
+    lines = []
+    # split: the functions lines, the stack of the outer lines of the nodes being generated (None: not a function),
+    # the pending calls, the stacks of the parallel branches map names and branch names, and the functions counts
+    functions = []
+    node_stack = []
+    pending = {'calls': [], 'branches': None, 'indent': 0}
+    branches_stack = []
+    branch_names = []
+    counts = {'node': 0, 'chunk': 0, 'parallel': 0}
+    # read_sh in parallel branches: `env` is global to the build, the value is scoped by `withEnv` blocks instead,
+    # closed with their enclosing block: the count of open `withEnv` blocks by enclosing block
+    with_env_scopes = [0]
+    branch_depth = [0]
+
+    def emit(data, indent):
+        lines.append('  ' * indent + data if len(data) > 0 else data)
 
     def write_line(data):
-        if len(data) > 0:
-            file.write('  ' * indent_level)
-        file.write(data + '\n')
+        flush_calls()
+        emit(data, indent_level)
+
+    def add_call(call, branch_name=None, branches=None):
+        # a node function call, or its parallel branch in the `branches` map
+        if pending['branches'] != branches:
+            flush_calls()
+        if len(pending['calls']) == 0:
+            pending['branches'] = branches
+            pending['indent'] = indent_level
+        pending['calls'].append((call, branch_name))
+
+    def format_call(call, branch_name, branches):
+        if branch_name is None:
+            return call
+        return "%s['%s'] = { %s }" % (branches, branch_name, call)
+
+    def flush_calls():
+        calls = pending['calls']
+        branches = pending['branches']
+        if len(calls) <= pipeline_chunk_size:
+            for call, branch_name in calls:
+                emit(format_call(call, branch_name, branches), pending['indent'])
+        else:
+            for i in range(0, len(calls), pipeline_chunk_size):
+                name = 'dmake_chunk_%d' % counts['chunk']
+                counts['chunk'] += 1
+                functions.append(['def %s(%s) {' % (name, 'branches' if branches else '')] +
+                                 ['  ' + format_call(call, branch_name, 'branches') for call, branch_name in calls[i:i + pipeline_chunk_size]] +
+                                 ['}'])
+                emit('%s(%s)' % (name, branches or ''), pending['indent'])
+        del calls[:]
+
+    def open_scope():
+        with_env_scopes.append(0)
+
+    def close_scope(indent):
+        # return the indent of the enclosing block
+        for _ in range(with_env_scopes.pop()):
+            indent -= 1
+            flush_calls()
+            emit('}', indent)
+        return indent
+
+    def begin_function(nested):
+        if nested and len(node_stack) > 0:
+            # already in a function
+            node_stack.append(None)
+            return indent_level
+        # the pending calls stay in the outer lines
+        node_stack.append((list(lines), indent_level, dict(pending, calls=list(pending['calls']))))
+        del lines[:]
+        del pending['calls'][:]
+        return 1
+
+    def end_function():
+        outer = node_stack.pop()
+        if outer is None:
+            return indent_level, None
+        flush_calls()
+        name = 'dmake_node_%d' % counts['node']
+        counts['node'] += 1
+        functions.append(['def %s() {' % name] + lines + ['}'])
+        outer_lines, outer_indent_level, outer_pending = outer
+        lines[:] = outer_lines
+        pending.update(outer_pending)
+        return outer_indent_level, '%s()' % name
 
     if common.build_description is not None:
         write_line("currentBuild.description = '%s'" % common.build_description.replace("'", "\\'"))
     write_line("def dmake_echo(message) { sh(script: \"echo '${message}'\", label: message) }")
+    if any(cmd == "node_done" for cmd, _ in cmds):
+        # parallel execution by dependencies: the done nodes
+        if split:
+            # in the binding: shared with the functions
+            write_line("dmake_nodes_done = [:]")
+            write_line("@NonCPS")
+            write_line("def dmake_nodes_are_done(names) { names.every { dmake_nodes_done[it] == true } }")
+        else:
+            write_line("def dmake_nodes_done = [:]")
     write_line('try {')
     indent_level += 1
 
@@ -526,11 +767,23 @@ def generate_command_pipeline(file, cmds):
         elif cmd == "parallel":
             # new scope on check_no_duplicate_parallel_branch_names stack
             check_no_duplicate_parallel_branch_names_stack.append(set())
-            write_line("parallel(")
-            indent_level += 1
+            if split:
+                # the branches are added to a map, then run
+                branches = 'dmake_branches_%d' % counts['parallel']
+                counts['parallel'] += 1
+                branches_stack.append(branches)
+                write_line("def %s = [%s]" % (branches, 'failFast: true' if kwargs.get('fail_fast') else ':'))
+            else:
+                write_line("parallel(")
+                indent_level += 1
+                if kwargs.get('fail_fast'):
+                    write_line("failFast: true,")
         elif cmd == "parallel_end":
-            indent_level -= 1
-            write_line(")")
+            if split:
+                write_line("parallel(%s)" % branches_stack.pop())
+            else:
+                indent_level -= 1
+                write_line(")")
             # end scope on check_no_duplicate_parallel_branch_names stack
             check_no_duplicate_parallel_branch_names_stack.pop()
         elif cmd == "parallel_branch":
@@ -539,11 +792,40 @@ def generate_command_pipeline(file, cmds):
             check_no_duplicate_parallel_branch_names_stack[-1].add(kwargs['name'])
 
             name = kwargs['name'].replace("'", "\\'")
-            write_line("'%s': {" % name)
-            indent_level += 1
+            if split:
+                branch_names.append(name)
+                indent_level = begin_function(nested=False)
+            else:
+                write_line("'%s': {" % name)
+                indent_level += 1
+            branch_depth[0] += 1
+            open_scope()
         elif cmd == "parallel_branch_end":
-            indent_level -= 1
-            write_line("},")
+            indent_level = close_scope(indent_level)
+            branch_depth[0] -= 1
+            if split:
+                indent_level, call = end_function()
+                add_call(call, branch_names.pop(), branches_stack[-1])
+            else:
+                indent_level -= 1
+                write_line("},")
+        elif cmd == "node":
+            if split:
+                indent_level = begin_function(nested=True)
+        elif cmd == "node_end":
+            if split:
+                indent_level, call = end_function()
+                if call is not None:
+                    add_call(call)
+        elif cmd == "wait_nodes":
+            if split:
+                names = ', '.join("'%s'" % name.replace("'", "\\'") for name in kwargs['names'])
+                write_line("waitUntil { dmake_nodes_are_done([%s]) }" % names)
+            else:
+                condition = ' && '.join("dmake_nodes_done['%s'] == true" % name.replace("'", "\\'") for name in kwargs['names'])
+                write_line("waitUntil { %s }" % condition)
+        elif cmd == "node_done":
+            write_line("dmake_nodes_done['%s'] = true" % kwargs['name'].replace("'", "\\'"))
         elif cmd == "lock":
             if 'quantity' not in kwargs:
                 kwargs['quantity'] = 1
@@ -551,28 +833,36 @@ def generate_command_pipeline(file, cmds):
                 kwargs['variable'] = ""  # empty variable is accepted by the lock step as "'variable' not set"
             write_line("lock(label: '{label}', quantity: {quantity}, variable: '{variable}') {{".format(**kwargs))
             indent_level += 1
+            open_scope()
         elif cmd == "lock_end":
+            indent_level = close_scope(indent_level)
             indent_level -= 1
             write_line("}")
         elif cmd == "timeout":
             time = kwargs['time']
             write_line("timeout(time: %s, unit: 'SECONDS') {" % time)
             indent_level += 1
+            open_scope()
         elif cmd == "timeout_end":
+            indent_level = close_scope(indent_level)
             indent_level -= 1
             write_line("}")
         elif cmd == "try":
             write_line("try {")
             indent_level += 1
+            open_scope()
         elif cmd == "catch":
             what = kwargs['what']
+            indent_level = close_scope(indent_level)
             indent_level -= 1
             write_line("} catch(%s) {" % what)
             indent_level += 1
+            open_scope()
         elif cmd == "throw":
             what = kwargs['what']
             write_line("throw %s" % what)
         elif cmd == "catch_end":
+            indent_level = close_scope(indent_level)
             indent_level -= 1
             write_line("}")
         elif cmd == "echo":
@@ -582,10 +872,12 @@ def generate_command_pipeline(file, cmds):
             commands = kwargs['shell']
             if isinstance(commands, str):
                 commands = [commands]
-            commands = [common.escape_cmd(c) for c in commands]
+            commands = [common.escape_cmd(c).replace('\n', '\\n') for c in commands]
             if len(commands) == 0:
-                return
-            if len(commands) == 1:
+                continue
+            if 'label' in kwargs:
+                write_line("sh(script: \"%s\", label: '%s')" % (commands[0], kwargs['label'].replace("'", "\\'")))
+            elif len(commands) == 1:
                 write_line('sh("%s")' % commands[0])
             else:
                 write_line('parallel (')
@@ -597,7 +889,12 @@ def generate_command_pipeline(file, cmds):
         elif cmd == "read_sh":
             file_output = os.path.join(common.cache_dir, "output_%s" % uuid.uuid4())
             write_line("sh('%s > %s')" % (kwargs['shell'], file_output))
-            write_line("env.%s = readFile '%s'" % (kwargs['var'], file_output))
+            if branch_depth[0] > 0:
+                write_line("withEnv([\"%s=${readFile '%s'}\"]) {" % (kwargs['var'], file_output))
+                indent_level += 1
+                with_env_scopes[-1] += 1
+            else:
+                write_line("env.%s = readFile '%s'" % (kwargs['var'], file_output))
             if kwargs['fail_if_empty']:
                 write_line("sh('if [ -z \"${%s}\" ]; then exit 1; fi')" % kwargs['var'])
         elif cmd == "env":
@@ -677,12 +974,22 @@ def generate_command_pipeline(file, cmds):
     indent_level -= 1
     write_line('}')
 
-###############################################################################
+    stats = get_pipeline_stats(lines, functions)
+    for function in functions:
+        lines.append('')
+        lines += function
+    file.write(''.join(line + '\n' for line in lines))
+    return stats
 
-def generate_command_bash(file, cmds):
-    assert not common.parallel_execution, "parallel execution not supported with bash runtime"
+###############################################################################
 
+def generate_command_bash(file, cmds, timeouts=False):
+    """
+    `timeouts`: enforce the `timeout` commands (the executor node scripts, see generate_executor_plan), else ignored:
+    the timed out commands run as background jobs, and could be stopped reading the terminal of a sequential run.
+    """
     indent_level = 0
+    timeouts_stack = []
 
     def write_line(data):
         if len(data) > 0:
@@ -721,6 +1028,25 @@ function ignoreErrors()
     set +e
 }
 
+""")
+    if timeouts:
+        write_line("""
+# wait for the background job $1 (started with job control: in its own process group), kill it after $2 seconds
+# SIGCONT: in case it was stopped anyway
+function dmake_wait_timeout()
+{
+    local pid=$1 time=$2 watchdog rc=0
+    set -m
+    ( sleep "$time" && echo "Timeout: killed after ${time} seconds" >&2 && kill -TERM -- -"$pid" 2>/dev/null && kill -CONT -- -"$pid" 2>/dev/null ) &
+    watchdog=$!
+    set +m
+    trap 'kill -TERM -- -"$pid" 2>/dev/null; kill -CONT -- -"$pid" 2>/dev/null' INT TERM
+    wait "$pid" || rc=$?
+    trap - INT TERM
+    kill -TERM -- -"$watchdog" 2>/dev/null || true
+    wait "$watchdog" 2>/dev/null || true
+    return $rc
+}
 """)
 
     write_line('set -e')
@@ -733,7 +1059,7 @@ function ignoreErrors()
             indent_level -= 1
             write_line("}")
         elif cmd == "parallel":
-            # parallel not supported with bash, fallback to running sequentially
+            # parallel not supported with bash, fallback to running sequentially (see executor.py for parallel execution)
             pass
         elif cmd == "parallel_end":
             pass
@@ -742,16 +1068,34 @@ function ignoreErrors()
             pass
         elif cmd == "parallel_branch_end":
             pass
+        elif cmd == "wait_nodes":
+            # sequential: the nodes are already ordered
+            pass
+        elif cmd == "node_done":
+            pass
+        elif cmd == "node":
+            pass
+        elif cmd == "node_end":
+            pass
         elif cmd == "lock":
             # lock not supported with bash, fallback to ignoring locks
             pass
         elif cmd == "lock_end":
             pass
         elif cmd == "timeout":
-            # timeout not supported with bash, fallback to ignoring timeouts
-            pass
+            if timeouts:
+                timeouts_stack.append(kwargs['time'])
+                write_line("set -m")
+                write_line("(")
+                indent_level += 1
+            # else: timeout not supported with bash, fallback to ignoring timeouts
         elif cmd == "timeout_end":
-            pass
+            if timeouts:
+                indent_level -= 1
+                # background job: no terminal input, it would be stopped by SIGTTIN
+                write_line(") </dev/null &")
+                write_line("set +m")
+                write_line("dmake_wait_timeout $! %s" % timeouts_stack.pop())
         elif cmd == "try":
             write_line("try")
             write_line("(")
@@ -800,10 +1144,127 @@ function ignoreErrors()
 
 ###############################################################################
 
+# run in the foreground after the parallel execution: interactive, they need the terminal
+foreground_commands = ['shell']
+
+def get_parallel_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu):
+    """
+    Return the nodes with commands for the parallel execution by dependencies, children first:
+    [{'id': node id, 'name', 'children': [index in the returned list], 'locks': [[label, variable or None]], 'need_gpu'}]
+    (plus `priority`, see durations.set_priorities).
+    The nodes without commands are bypassed: their parents depend on their children instead.
+    The `foreground_commands` nodes are left out (see get_foreground_nodes).
+    The GPUS lock is not per node: a daemon (`run`, `run_link`) keeps using its GPU after its node is done,
+    the lock is held until the end of the run instead, like the parallel execution by height.
+    """
+    nodes = plan.graph.nodes
+    # children first, like the parallel execution by height
+    ids = sorted([i for _, commands in ordered_build_files for i in commands], key=plan.heights.__getitem__)
+    parallel_nodes = []
+    parallel_index = {}
+    # for the nodes without commands: their nearest descendants with commands
+    passthrough_children = {}
+    deploy_nodes = []
+    for i in ids:
+        children = set()
+        for child in plan.graph.children(i):
+            if child in parallel_index:
+                children.add(parallel_index[child])
+            else:
+                children.update(passthrough_children.get(child, ()))
+        if len(nodes_commands[i]) == 0:
+            passthrough_children[i] = children
+            continue
+        if nodes[i][0] in foreground_commands:
+            continue
+        if nodes[i][0] == 'deploy':
+            # like the parallel execution by height: deploy all at the end
+            deploy_nodes.append(i)
+            continue
+
+        parallel_index[i] = len(parallel_nodes)
+        parallel_nodes.append({'id': i, 'name': display_command_node(nodes[i]), 'children': sorted(children),
+                               'locks': [['PARALLEL_BUILDERS', None]], 'need_gpu': nodes_need_gpu[i]})
+
+    built = list(range(len(parallel_nodes)))
+    for i in deploy_nodes:
+        # don't lock PARALLEL_BUILDERS on deploy nodes, it could lead to deployment deadlock if there is a deployment runtime dependancy between services
+        parallel_nodes.append({'id': i, 'name': display_command_node(nodes[i]), 'children': built, 'locks': [], 'need_gpu': nodes_need_gpu[i]})
+    return parallel_nodes
+
+def get_foreground_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu):
+    """Return the `foreground_commands` nodes with commands, run in order after the parallel execution by dependencies:
+    [{'id': node id, 'name', 'need_gpu'}]."""
+    nodes = plan.graph.nodes
+    return [{'id': i, 'name': display_command_node(nodes[i]), 'need_gpu': nodes_need_gpu[i]}
+            for _, commands in ordered_build_files for i in commands
+            if len(nodes_commands[i]) > 0 and nodes[i][0] in foreground_commands]
+
+def append_foreground_commands(commands, foreground_nodes, nodes_commands):
+    for foreground_node in foreground_nodes:
+        append_command(commands, 'node', name=foreground_node['name'])
+        append_command(commands, 'echo', message='- Running {}'.format(foreground_node['name']))
+        commands += nodes_commands[foreground_node['id']]
+        append_command(commands, 'node_end')
+
+def append_parallel_pipeline_commands(commands, parallel_nodes, foreground_nodes, nodes_commands):
+    """Append the Jenkins commands of the parallel execution by dependencies (see get_parallel_nodes) to `commands`."""
+    # one GPUS lock for the whole run (see get_parallel_nodes)
+    need_gpu = any(node['need_gpu'] for node in parallel_nodes + foreground_nodes)
+    if need_gpu:
+        append_command(commands, 'lock', label='GPUS', variable='DMAKE_GPU')
+    # one branch per node in a single parallel step, waiting for its children branches
+    # fail fast: the branches waiting for a failed node are aborted
+    if len(parallel_nodes) > 0:
+        append_command(commands, 'stage', name='Parallel execution')
+        append_command(commands, 'parallel', fail_fast=True)
+        # the first branches get the PARALLEL_BUILDERS lock first
+        for parallel_node in sorted(parallel_nodes, key=lambda parallel_node: -parallel_node.get('priority', 0)):
+            append_command(commands, 'parallel_branch', name=parallel_node['name'])
+            if parallel_node['children']:
+                append_command(commands, 'wait_nodes', names=[parallel_nodes[k]['name'] for k in parallel_node['children']])
+            for label, variable in parallel_node['locks']:
+                append_command(commands, 'lock', label=label, **({'variable': variable} if variable else {}))
+            append_command(commands, 'echo', message='- Running {}'.format(parallel_node['name']))
+            commands += nodes_commands[parallel_node['id']]
+            for _ in parallel_node['locks']:
+                append_command(commands, 'lock_end')
+            append_command(commands, 'node_done', name=parallel_node['name'])
+            append_command(commands, 'parallel_branch_end')
+        append_command(commands, 'parallel_end')
+        append_command(commands, 'stage_end')
+    append_foreground_commands(commands, foreground_nodes, nodes_commands)
+    if need_gpu:
+        append_command(commands, 'lock_end')
+
+def generate_executor_plan(parallel_nodes, nodes_commands):
+    """Write a bash script per node, and the executor plan running them (see executor.py); return the plan file."""
+    executor_dir = os.path.join(common.tmp_dir, 'executor')
+    os.makedirs(executor_dir, exist_ok=True)
+
+    executor_nodes = []
+    for k, parallel_node in enumerate(parallel_nodes):
+        step_commands = []
+        append_command(step_commands, 'echo', message='- Running {}'.format(parallel_node['name']))
+        step_commands += nodes_commands[parallel_node['id']]
+        script = os.path.join(executor_dir, '%d.sh' % k)
+        with open(script, 'w') as f:
+            generate_command_bash(f, step_commands, timeouts=True)
+        # held until the end of the plan (see get_parallel_nodes)
+        held_locks = [['GPUS', 'DMAKE_GPU']] if parallel_node['need_gpu'] else []
+        executor_nodes.append({'name': parallel_node['name'], 'script': script, 'children': parallel_node['children'], 'locks': parallel_node['locks'],
+                               'held_locks': held_locks, 'priority': parallel_node.get('priority', 0)})
+
+    plan_file = os.path.join(executor_dir, 'plan.json')
+    executor.write_plan(plan_file, executor_nodes)
+    return plan_file
+
 def generate_command(file_name, cmds):
     with open(file_name, "w") as file:
         if common.use_pipeline:
-            generate_command_pipeline(file, cmds)
+            stats = generate_command_pipeline(file, cmds, split=common.split_pipeline)
+            common.logger.info("Jenkinsfile: {lines} lines, {kb} KB, {steps} steps; driver: {driver_lines} lines, "
+                               "{functions} functions (largest: {max_function_lines} lines)".format(kb=stats['bytes'] // 1024, **stats))
         else:
             generate_command_bash(file, cmds)
 
@@ -862,8 +1323,11 @@ def make(options, parse_files_only=False):
     loaded_files = {}
     service_providers = {}
     service_dependencies = {}
+    prevalidate_dmake_files(build_files)
     for file in build_files:
         load_dmake_file(loaded_files, blocklist, service_providers, service_dependencies, file)
+    prevalidated_files.clear()
+    files_cache.save()
 
     if parse_files_only:
         return loaded_files
@@ -937,6 +1401,8 @@ def make(options, parse_files_only=False):
         for i in to_delete:
             del deps[i]
 
+    # Activate the nodes to run
+    activation_templates.clear()
     is_app_only = auto_completed_app is None or auto_completed_app.find('/') < 0
 
     if auto_completed_app is None:
@@ -970,39 +1436,47 @@ def make(options, parse_files_only=False):
                 common.logger.debug('activate_service: second pass: change detection mode, *not* adding link: run->test\tfor service: {}'.format(service))
 
 
-    # (warning: tree vocabulary is reversed here: `leaves` are the nodes with no parent dependency, and depth is the number of levels of child dependencies)
-    # check services circularity, and compute leaves, nodes_depth
-    leaves, nodes_depth = check_no_circular_dependencies(service_dependencies)
-    # get nodes leaves related to the dmake command (exclude notably `base` and `shared_volumes` which are created independently from the command)
-    dmake_command_leaves = filter(lambda a_b__c: a_b__c[0][0] == common.command, leaves)
-    # prepare reorder by computing shortest node depth starting from the dmake-command-created leaves
-    #   WARNING: it seems to return different values than nodes_depth: seems to be min(child height)-1 here, vs max(parent height)+1 for nodes_depth (e.g. some run_links have >0 height, but no dependency)
-    #   this effectively runs nodes as late as possible with build_files_order, and as soon as possible with nodes_depth
-    build_files_order = order_dependencies(service_dependencies, dmake_command_leaves)
-
-    # cleanup service_dependencies for debug dot graph: remove nodes with no depth: they are not related (directly or by dependency) to dmake-command-created leaves: they are not needed
-    service_dependencies_pruned = dict(filter(lambda service_deps: service_deps[0] in build_files_order, service_dependencies.items()))
-
-    debug_dot_graph = common.dump_debug_dot_graph(service_dependencies_pruned, nodes_depth)
+    # (warning: tree vocabulary is reversed here: `roots` are the nodes with no parent dependency, and height is the number of levels of child dependencies)
+    # check services circularity, and compute by node id (see dag.Graph, `nodes` maps them back to the nodes):
+    # - roots, heights
+    # - levels: shortest node height starting from the roots related to the dmake command (exclude notably `base` and `shared_volumes` which are created independently from the command)
+    #   WARNING: it returns different values than heights: min(child height)-1 here, vs max(parent height)+1 for heights (e.g. some run_links have >0 height, but no dependency)
+    #   this effectively runs nodes as late as possible with levels, and as soon as possible with heights
+    plan = dag.plan(service_dependencies, lambda node: node[0] == common.command)
+    nodes = plan.graph.nodes
+
+    debug_dot_graph = None
+    if common.generate_dot_graph:
+        # cleanup service_dependencies for debug dot graph: remove nodes with no level: they are not related (directly or by dependency) to dmake-command-created roots: they are not needed
+        service_dependencies_pruned = {node: service_dependencies[node] for i, node in enumerate(service_dependencies) if plan.levels[i] >= 0}
+        debug_dot_graph = common.dump_debug_dot_graph(service_dependencies_pruned, plan.get_heights())
     if common.exit_after_generate_dot_graph:
         print('Exiting after debug graph generation')
         return debug_dot_graph
 
 
+    # Skip the tests already successful with the same fingerprint, and what only they need
+    fingerprints = {}
+    skipped_nodes = {}
+    if fingerprint.enabled:
+        fingerprint_store = fingerprint.get_store()
+        fingerprints = fingerprint.get_fingerprints(plan, loaded_files, service_providers)
+        skipped_nodes = fingerprint.get_skipped_nodes(plan, fingerprints, fingerprint_store)
+
     # Even with parallel execution we start with display (and thus compute) the execution plan the classic way: per stage and order.
 
     # Sort by order
-    ordered_build_files = sorted(build_files_order.items(), key = lambda file_order: file_order[1])
+    ordered_build_files = plan.ordered()
 
     # Separate into base / build / tests / deploy
     if len(ordered_build_files) == 0:
         common.logger.info("Nothing to do:")
     else:
         n = len(ordered_build_files)
-        base   = list(filter(lambda a_b__c: a_b__c[0][0] in ['base'], ordered_build_files))
-        build  = list(filter(lambda a_b__c: a_b__c[0][0] in ['build_docker'], ordered_build_files))
-        test   = list(filter(lambda a_b__c: a_b__c[0][0] in ['test', 'run_link', 'run', 'shared_volume'], ordered_build_files))
-        deploy = list(filter(lambda a_b__c: a_b__c[0][0] in ['shell', 'deploy'], ordered_build_files))
+        base   = [i for i in ordered_build_files if nodes[i][0] in ['base']]
+        build  = [i for i in ordered_build_files if nodes[i][0] in ['build_docker']]
+        test   = [i for i in ordered_build_files if nodes[i][0] in ['test', 'run_link', 'run', 'shared_volume']]
+        deploy = [i for i in ordered_build_files if nodes[i][0] in ['shell', 'deploy']]
         if len(base) + len(build) + len(test) + len(deploy) != len(ordered_build_files):
             raise Exception('Something went wrong when reorganizing build steps. One of the commands is probably missing.')
 
@@ -1011,6 +1485,11 @@ def make(options, parse_files_only=False):
                                ('Running App', test),
                                ('Deploying', deploy)]
 
+    # Historical durations: recorded by the generated commands, to estimate the run and order the parallel execution
+    node_estimates = {}
+    if durations.enabled:
+        node_estimates = durations.get_node_estimates(durations.load(durations.get_store_file()), nodes, plan.reached)
+
     common.logger.info("Here is the plan:")
     # Generate the list of command to run
     common.logger.info("Generating commands...")
@@ -1037,12 +1516,17 @@ def make(options, parse_files_only=False):
         append_command(all_commands, 'stage', name = stage)
 
         stage_commands = []
-        for node, order in commands:
+        for i in commands:
             # Sanity check
-            sub_task_orders = [build_files_order[a] for a in service_dependencies[node]]
-            if any(map(lambda o: order <= o, sub_task_orders)):
+            if not plan.is_ordered(i):
                 raise DMakeException('Bad ordering')
 
+            node = nodes[i]
+            if i in skipped_nodes:
+                common.logger.info("- {} (skipped: {})".format(display_command_node(node), skipped_nodes[i]))
+                nodes_commands[i] = []
+                nodes_need_gpu[i] = False
+                continue
             command, service, service_customization = node
             file, _, _, _ = service_providers[service]
             dmake_file = loaded_files[file]
@@ -1076,15 +1560,24 @@ def make(options, parse_files_only=False):
                 print(('ERROR in file %s:\n' % file) + str(e))
                 sys.exit(1)
 
-            nodes_commands[node] = step_commands
-            nodes_need_gpu[node] = common.need_gpu
+            if command in fingerprint.skippable_commands and i in fingerprints:
+                # reached only if the test succeeded
+                fingerprint_store.generate_record(step_commands, fingerprints[i])
+
+            if durations.enabled and len(step_commands) > 0:
+                step_commands = durations.wrap_commands(step_commands, i, durations.get_key(node))
+
+            nodes_commands[i] = step_commands
+            nodes_need_gpu[i] = common.need_gpu
             common.need_gpu = restore_need_gpu
 
             if len(step_commands) > 0:
                 node_display_str = display_command_node(node)
-                common.logger.info("- {}".format(node_display_str))
+                common.logger.info("- {}{}".format(node_display_str, durations.format_node_estimate(node_estimates, i)))
+                append_command(stage_commands, 'node', name=node_display_str)
                 append_command(stage_commands, 'echo', message = '- Running {}'.format(node_display_str))
                 stage_commands += step_commands
+                append_command(stage_commands, 'node_end')
 
         # GPU resource lock
         # `common.need_gpu` is set during Testing commands generations: need to delay adding commands to all_commands to create the gpu lock if needed around the Testing stage
@@ -1099,9 +1592,18 @@ def make(options, parse_files_only=False):
 
         append_command(all_commands, 'stage_end')
 
+    common.log_caches_stats()
+    executed_nodes = [i for i in nodes_commands if len(nodes_commands[i]) > 0]
+    if not common.parallel_execution:
+        durations.log_estimate(executed_nodes, node_estimates)
 
     # Parallel execution?
     if common.parallel_execution:
+        parallel_nodes = get_parallel_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu)
+        # longest remaining critical path first
+        durations.set_priorities(parallel_nodes, node_estimates)
+
+    if common.parallel_execution and common.use_pipeline and not common.parallel_execution_dag:
         common.logger.info("===============")
         common.logger.info("New plan: parallel execution, by height:")
         # Parallel execution: drop all_commands, start again (but reuse already computed nodes_commands)
@@ -1109,23 +1611,23 @@ def make(options, parse_files_only=False):
         all_commands += init_commands
 
         # group nodes by height
-        #   iterate on ordered_build_files instead of directly build_files_order to reuse common.is_pr filtering
-        #   use nodes_depth instead of build_files_order/ordered_build_files order for ASAP execution instead of ALAP (As Late As Possible)
+        #   iterate on ordered_build_files instead of directly plan.reached to reuse common.is_pr filtering
+        #   use heights instead of levels/ordered_build_files order for ASAP execution instead of ALAP (As Late As Possible)
         nodes_by_height = {}
         deploy_nodes = []
         max_height = 0
         for stage, commands in ordered_build_files:
-            for node, _ in commands:
-                command = node[0]
+            for i in commands:
+                command = nodes[i][0]
                 if command == 'deploy':
                     # isolate deploy to run them all in parallel at the end
-                    deploy_nodes.append(node)
+                    deploy_nodes.append(i)
                     continue
-                height = nodes_depth[node]
+                height = plan.heights[i]
                 max_height = max(max_height, height)
                 if height not in nodes_by_height:
                     nodes_by_height[height] = []
-                nodes_by_height[height].append(node)
+                nodes_by_height[height].append(i)
 
         # inject back the deploy nodes as an extra height
         deploy_height = max_height + 1
@@ -1133,22 +1635,24 @@ def make(options, parse_files_only=False):
             nodes_by_height[deploy_height] = deploy_nodes
 
         # generate parallel by height
+        priorities = {parallel_node['id']: parallel_node['priority'] for parallel_node in parallel_nodes}
         gpu_locked = False
-        for height, nodes in sorted(nodes_by_height.items()):
+        for height, height_nodes in sorted(nodes_by_height.items()):
             common.logger.info("## height: %s ##" % (height))
 
             height_commands = []
             height_need_gpu = False
-            for node in nodes:
-                step_commands = nodes_commands[node]
+            # the first branches get the PARALLEL_BUILDERS lock first
+            for i in sorted(height_nodes, key=lambda i: -priorities.get(i, 0)):
+                step_commands = nodes_commands[i]
 
                 if len(step_commands) == 0:
                     continue
 
-                height_need_gpu |= nodes_need_gpu[node]
+                height_need_gpu |= nodes_need_gpu[i]
 
-                node_display_str = display_command_node(node)
-                common.logger.info("- {}".format(node_display_str))
+                node_display_str = display_command_node(nodes[i])
+                common.logger.info("- {}{}".format(node_display_str, durations.format_node_estimate(node_estimates, i)))
 
                 append_command(height_commands, 'parallel_branch', name=node_display_str)
                 if height != deploy_height:
@@ -1181,6 +1685,29 @@ def make(options, parse_files_only=False):
         if gpu_locked:
             append_command(all_commands, 'lock_end')
 
+        durations.log_estimate(executed_nodes, node_estimates, parallel_nodes, by_height=True)
+
+    elif common.parallel_execution:
+        # by dependencies: each node starts as soon as its children are done, no barrier between heights
+        common.logger.info("===============")
+        common.logger.info("New plan: parallel execution, by dependencies:")
+        all_commands = []
+        all_commands += init_commands
+        foreground_nodes = get_foreground_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu)
+        for parallel_node in parallel_nodes + foreground_nodes:
+            common.logger.info("- {}{}".format(parallel_node['name'], durations.format_node_estimate(node_estimates, parallel_node['id'])))
+
+        if common.use_pipeline:
+            append_parallel_pipeline_commands(all_commands, parallel_nodes, foreground_nodes, nodes_commands)
+        else:
+            # bash runtime: no parallel construct: the nodes scripts are run by the native executor, in the background
+            plan_file = generate_executor_plan(parallel_nodes, nodes_commands)
+            append_command(all_commands, 'sh', shell=executor.get_command(plan_file))
+            append_foreground_commands(all_commands, foreground_nodes, nodes_commands)
+
+        workers = None if common.use_pipeline else len(executor.get_lock_resources('PARALLEL_BUILDERS'))
+        durations.log_estimate(executed_nodes, node_estimates, parallel_nodes, workers=workers)
+
     # end parallel_execution
 
 
@@ -1194,6 +1721,8 @@ def make(options, parse_files_only=False):
         file_to_generate = os.path.join(common.tmp_dir, "DMakefile")
     else:
         file_to_generate = "DMakefile"
+    if common.use_pipeline and common.coalesce_sh_steps:
+        all_commands = coalesce_sh_commands(all_commands)
     generate_command(file_to_generate, all_commands)
     common.logger.info("Commands have been written to %s" % file_to_generate)
 
@@ -0,0 +1,213 @@
+from array import array
+
+from dmake.common import DMakeException
+
+# Dependency graph algorithms used to plan the execution (see core.make), all in O(V+E) and iterative:
+# no recursion limit on deep `needs` chains.
+#
+# Vocabulary (same as core.make): a node depends on its children; `roots` are the nodes no other node depends on,
+# and the `height` of a node is the length of its longest chain of dependencies.
+#
+# The nodes (command, service, service_customization) are hashed once, when interned in `Graph.index`:
+# the algorithms work on their integer ids, with the adjacency and results stored in arrays.
+# Only display and commands generation go back to the nodes, with `Graph.nodes`.
+
+
+class Graph(object):
+    """
+    Nodes interning table and compact adjacency, built from a `dependencies` dict: node -> list of child nodes.
+    - `nodes`: id -> node; `index`: node -> id. Ids are given in `dependencies` order, then to the children
+      that are not keys, in first seen order: iterating by id follows the dict order.
+    - CSR adjacency: the children of node `i` are `targets[offsets[i]:offsets[i + 1]]`, in `dependencies` order.
+    """
+
+    def __init__(self, dependencies):
+        self.nodes = list(dependencies)
+        self.keys_count = len(self.nodes)
+        self.index = index = {node: i for i, node in enumerate(self.nodes)}
+        self.offsets = offsets = array('l', [0])
+        self.targets = targets = array('l')
+        for deps in dependencies.values():
+            for dep in deps:
+                i = index.get(dep)
+                if i is None:
+                    i = index[dep] = len(self.nodes)
+                    self.nodes.append(dep)
+                targets.append(i)
+            offsets.append(len(targets))
+        offsets.extend([len(targets)] * (len(self.nodes) - self.keys_count))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def children(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def find_cycle(self, start, color, order):
+        """
+        Depth first search from `start`, appending the node ids to `order` children first.
+        `color`: 0 not visited, 1 in the current path, 2 done. Return a cycle (list of node ids) or None.
+        """
+        offsets, targets = self.offsets, self.targets
+        color[start] = 1
+        path = [start]
+        positions = [offsets[start]]
+        while path:
+            i = path[-1]
+            position = positions[-1]
+            if position < offsets[i + 1]:
+                positions[-1] = position + 1
+                child = targets[position]
+                if color[child] == 1:
+                    return path[path.index(child):] + [child]
+                if color[child] == 0:
+                    color[child] = 1
+                    path.append(child)
+                    positions.append(offsets[child])
+            else:
+                path.pop()
+                positions.pop()
+                color[i] = 2
+                order.append(i)
+        return None
+
+    def topological_order(self):
+        """Return the node ids, each node after all its children; raise DMakeException on circular dependencies."""
+        color = bytearray(len(self.nodes))
+        order = array('l')
+        for i in range(self.keys_count):
+            if color[i] == 0:
+                cycle = self.find_cycle(i, color, order)
+                if cycle is not None:
+                    raise DMakeException("Circular dependencies: %s" % ' -> '.join(str(self.nodes[j]) for j in cycle))
+        # the children that are not keys have no children: visited from their parents
+        return order
+
+    def heights(self, order):
+        """Return the height of each node id, given the `topological_order`."""
+        offsets, targets = self.offsets, self.targets
+        heights = array('l', bytes(len(self.nodes) * array('l').itemsize))
+        for i in order:
+            height = 0
+            for position in range(offsets[i], offsets[i + 1]):
+                child_height = heights[targets[position]]
+                if child_height >= height:
+                    height = child_height + 1
+            heights[i] = height
+        return heights
+
+    def roots(self):
+        """Return the ids of the keys no other node depends on, in `dependencies` order."""
+        has_parent = bytearray(len(self.nodes))
+        for child in self.targets:
+            has_parent[child] = 1
+        return [i for i in range(self.keys_count) if not has_parent[i]]
+
+    def preorder(self, starts):
+        """Return the node ids reachable from `starts`, in depth first search discovery order."""
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(len(self.nodes))
+        result = array('l')
+        for start in starts:
+            if visited[start]:
+                continue
+            visited[start] = 1
+            result.append(start)
+            path = [start]
+            positions = [offsets[start]]
+            while path:
+                position = positions[-1]
+                if position < offsets[path[-1] + 1]:
+                    positions[-1] = position + 1
+                    child = targets[position]
+                    if not visited[child]:
+                        visited[child] = 1
+                        result.append(child)
+                        path.append(child)
+                        positions.append(offsets[child])
+                else:
+                    path.pop()
+                    positions.pop()
+        return result
+
+    def as_late_as_possible(self, starts, order):
+        """
+        Return the level of each node id reachable from `starts`, a list of (node id, level), -1 for the other nodes:
+        each node gets the lowest `level - distance` over all the paths from the starts, so that nodes run as late as possible
+        before the nodes depending on them. Given the `topological_order`.
+        """
+        offsets, targets = self.offsets, self.targets
+        levels = array('l', [-1]) * len(self.nodes)
+        for i, level in starts:
+            if levels[i] < 0 or level < levels[i]:
+                levels[i] = level
+        # parents first
+        for i in reversed(order):
+            level = levels[i]
+            if level < 0:
+                continue
+            level -= 1
+            for position in range(offsets[i], offsets[i + 1]):
+                child = targets[position]
+                if levels[child] < 0 or level < levels[child]:
+                    levels[child] = level
+        return levels
+
+
+class Plan(object):
+    """
+    The result of `plan`, by node id (see Graph):
+    - `roots`: ids of the nodes no other node depends on,
+    - `heights`: to run nodes as soon as possible,
+    - `levels`: for the nodes reachable from the command roots (-1 for the others): to run nodes as late as possible,
+      (see Graph.as_late_as_possible) starting from the roots heights,
+    - `reached`: ids of the nodes reachable from the command roots, in depth first search discovery order.
+    """
+
+    def __init__(self, graph, roots, heights, levels, reached):
+        self.graph = graph
+        self.roots = roots
+        self.heights = heights
+        self.levels = levels
+        self.reached = reached
+
+    def ordered(self):
+        """Return the ids of the reached nodes sorted by level, in `reached` order for equal levels."""
+        return sorted(self.reached, key=self.levels.__getitem__)
+
+    def is_ordered(self, i):
+        """Check that node id `i` runs after its children."""
+        levels = self.levels
+        level = levels[i]
+        return all(levels[child] < level for child in self.graph.children(i))
+
+    # the results by node, for display
+
+    def get_roots(self):
+        """Return the list of (node, height) of the roots."""
+        return [(self.graph.nodes[i], self.heights[i]) for i in self.roots]
+
+    def get_heights(self):
+        """Return {node: height} for the `dependencies` keys."""
+        nodes = self.graph.nodes
+        return {nodes[i]: self.heights[i] for i in range(self.graph.keys_count)}
+
+    def get_levels(self):
+        """Return {node: level} for the reached nodes, in `reached` order."""
+        nodes = self.graph.nodes
+        return {nodes[i]: self.levels[i] for i in self.reached}
+
+
+def plan(dependencies, is_command_root):
+    """
+    Check that `dependencies` (node -> list of child nodes) has no circular dependencies, and return its Plan,
+    starting from the roots selected by `is_command_root(node)`.
+    """
+    graph = Graph(dependencies)
+    order = graph.topological_order()
+    heights = graph.heights(order)
+    roots = graph.roots()
+    command_roots = [(i, heights[i]) for i in roots if is_command_root(graph.nodes[i])]
+    levels = graph.as_late_as_possible(command_roots, order)
+    reached = graph.preorder([i for i, _ in command_roots])
+    return Plan(graph, roots, heights, levels, reached)
@@ -6,9 +6,11 @@ import uuid
 import importlib
 import re
 from string import Template
-from dmake.serializer import ValidationError, FieldSerializer, YAML2PipelineSerializer, SerializerType
+from dmake.serializer import ValidationError, FieldSerializer, YAML2PipelineSerializer, SerializerType, to_list
+import dmake.bash_pool as bash_pool
 import dmake.common as common
 from dmake.common import DMakeException, SharedVolumeNotFoundException, append_command
+import dmake.files_cache as files_cache
 import dmake.kubernetes as k8s_utils
 from dmake.docker_image import DockerImageFieldSerializer
 
@@ -50,6 +52,39 @@ class EnvBranchSerializer(YAML2PipelineSerializer):
         if additional_variables_layers is None:
             additional_variables_layers = []
 
+        key = self._replaced_variables_cache_key_(additional_variables_layers, docker_links, needed_links, needed_services)
+        # keep a reference on self in the cached value so that id(self) cannot be reused
+        _, replaced_variables = replaced_variables_cache.get(key, lambda: (self, self._get_replaced_variables_(additional_variables_layers, docker_links, needed_links, needed_services)))
+        # callers update the returned environment
+        return replaced_variables.copy()
+
+    def _replaced_variables_cache_key_(self, additional_variables_layers, docker_links, needed_links, needed_services):
+        values = list(self.variables.values()) if self.has_value() else []
+        layers = []
+        for additional_variables in additional_variables_layers:
+            if additional_variables is None:
+                layers.append(None)
+                continue
+            values += additional_variables.values()
+            layers.append(tuple(additional_variables.items()))
+        if any(common.has_side_effects(value) for value in values):
+            return None
+        links = None
+        if common.options.with_dependencies and docker_links is not None and needed_links is not None:
+            links = tuple((link_name, tuple(docker_links[link_name].env_exports.items())) for link_name in needed_links)
+        services = None
+        if common.options.with_dependencies and needed_services is not None:
+            services = tuple(tuple(needed_service.env_exports.items()) for needed_service in needed_services)
+        source_hash = bash_pool.get_source_hash(self.source) if self.has_value() and self.source else None
+        variables = tuple(self.variables.items()) if self.has_value() else None
+        key = (id(self), variables, self.source if self.has_value() else None, common.options.with_dependencies, docker_links is None, needed_links is None, links, services, tuple(layers), source_hash)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_replaced_variables_(self, additional_variables_layers, docker_links, needed_links, needed_services):
         replaced_variables = {}
 
         # first pass: evaluate env in the context of the source
@@ -85,6 +120,8 @@ class EnvBranchSerializer(YAML2PipelineSerializer):
 
         return replaced_variables
 
+replaced_variables_cache = common.LRUCache('Environment variables', max_size=1024)
+
 class EnvSerializer(YAML2PipelineSerializer):
     default  = EnvBranchSerializer(optional = True, help_text = "List of environment variables that will be set by default.")
     branches = FieldSerializer('dict', child = EnvBranchSerializer(), default = {}, help_text = "If the branch matches one of the following fields, those variables will be defined as well, eventually replacing the default.", example = {'master': {'ENV_TYPE': 'prod'}})
@@ -124,12 +161,19 @@ class SharedVolumeSerializer(YAML2PipelineSerializer):
         if not SharedVolumes.allowed_volume_name_pattern.match(self.name):
             raise ValidationError("Invalid volume name '%s': only '[a-zA-Z0-9][a-zA-Z0-9_.-]+' is allowed. " % (self.name))
 
+        self._register_(file)
+        return result
+
+    def _replay_(self, file):
+        super(SharedVolumeSerializer, self)._replay_(file)
+        self._register_(file)
+
+    def _register_(self, file):
         # register volumes globally
         SharedVolumes.register(self, file)
         # unique volume name
         # docker seems to limit around 256, only "[a-zA-Z0-9][a-zA-Z0-9_.-]" are allowed
         self.id = '{name_prefix}.{session_id}.{name}'.format(name_prefix=common.name_prefix, session_id=common.session_id, name=self.name)
-        return result
 
     def _serialize_(self, commands, path_dir):
         cmd = "dmake_create_docker_shared_volume %s 777" % (self.id)
@@ -210,11 +254,11 @@ class DockerBaseSerializer(YAML2PipelineSerializer):
 
     def __init__(self, *args, **kwargs):
         self.serializer_version = kwargs.pop('version', 2)
+        super(DockerBaseSerializer, self).__init__(*args, **kwargs)
         # Version 2 has mandatory 'variant' and 'root_image'
         if self.serializer_version == 2:
-            self.variant.optional = False
-            self.root_image.optional = False
-        super(DockerBaseSerializer, self).__init__(*args, **kwargs)
+            self._customize_field_('variant', optional = False)
+            self._customize_field_('root_image', optional = False)
 
     def _validate_(self, file, needed_migrations, data, field_name=''):
         result = super(DockerBaseSerializer, self)._validate_(file, needed_migrations=needed_migrations, data=data, field_name=field_name)
@@ -414,7 +458,7 @@ class DockerSerializer(YAML2PipelineSerializer):
 
         # make base_image an array
         base_image = self.base_image
-        self.__fields__['base_image'].value = [base_image] if isinstance(base_image, DockerBaseSerializer) else base_image
+        self._set_field_('base_image', [base_image] if isinstance(base_image, DockerBaseSerializer) else base_image)
 
         # check variant duplicates
         seen = set()
@@ -477,6 +521,10 @@ class DockerLinkSerializer(YAML2PipelineSerializer):
         LinkNames.check_duplicate_link_name('docker_link', self, file)
         return result
 
+    def _replay_(self, file):
+        super(DockerLinkSerializer, self)._replay_(file)
+        LinkNames.check_duplicate_link_name('docker_link', self, file)
+
     def get_options(self, path, env):
         options = common.eval_str_in_env(self.testing_options, env)
 
@@ -896,7 +944,7 @@ class DeployConfigPortsSerializer(YAML2PipelineSerializer):
 
 class DeployStageSerializer(YAML2PipelineSerializer):
     description   = FieldSerializer("string", example = "Deployment on AWS and via SSH", help_text = "Deploy stage description.")
-    branches      = FieldSerializer(["string", "array"], child = "string", default = ['stag'], post_validation = lambda x: [x] if isinstance(x, str) else x, help_text = "Branch list for which this stag is active, '*' can be used to match any branch. Can also be a simple string.")
+    branches      = FieldSerializer(["string", "array"], child = "string", default = ['stag'], post_validation = to_list, help_text = "Branch list for which this stag is active, '*' can be used to match any branch. Can also be a simple string.")
     env           = FieldSerializer("dict", child = "string", default = {}, example = {'AWS_ACCESS_KEY_ID': '1234', 'AWS_SECRET_ACCESS_KEY': 'abcd'}, help_text = "Additionnal environment variables for deployment.")
     aws_beanstalk = AWSBeanStalkDeploySerializer(optional = True, help_text = "Deploy via Elastic Beanstalk")
     ssh           = SSHDeploySerializer(optional = True, help_text = "Deploy via SSH")
@@ -1062,8 +1110,8 @@ class TestSerializer(YAML2PipelineSerializer):
     data_volumes       = FieldSerializer("array", child = DataVolumeSerializer(), default = [], help_text = "The data volumes to mount. Used for test and shell.")
     commands           = FieldSerializer("array", child = "string", example = ["python manage.py test"], help_text = "The commands to run for integration tests.")
     timeout            = FieldSerializer(["number", SerializerType("string", deprecated=True)], optional = True, example = "600", help_text = "The timeout (in seconds) to apply to the tests execution (excluding dependencies, setup, and potential resources locks).")
-    junit_report       = FieldSerializer(["string", "array"], child = "string", default = [], post_validation = lambda x: [x] if isinstance(x, str) else x, example = "test-reports/nosetests.xml", help_text = "Filepath or array of file paths of xml xunit test reports. Publish a XUnit test report.")
-    cobertura_report   = FieldSerializer(["string", "array"], child = "string", default = [], post_validation = lambda x: [x] if isinstance(x, str) else x, example = "test-reports/coverage.xml", help_text = "Filepath or array of file paths of xml xunit test reports. Publish a Cobertura report.")
+    junit_report       = FieldSerializer(["string", "array"], child = "string", default = [], post_validation = to_list, example = "test-reports/nosetests.xml", help_text = "Filepath or array of file paths of xml xunit test reports. Publish a XUnit test report.")
+    cobertura_report   = FieldSerializer(["string", "array"], child = "string", default = [], post_validation = to_list, example = "test-reports/coverage.xml", help_text = "Filepath or array of file paths of xml xunit test reports. Publish a Cobertura report.")
     html_report        = HTMLReportSerializer(optional = True, help_text = "Publish an HTML report.")
 
     def get_mounts_opt(self, service_name, path, env):
@@ -1227,11 +1275,19 @@ class NeededServiceSerializer(YAML2PipelineSerializer):
         if self.link_name and \
            not allowed_link_name_pattern.match(self.link_name):
             raise ValidationError("Invalid link name '%s': only '[a-z0-9-]{1,63}' is allowed. " % (self.link_name))
+        self._register_(file)
+        return result
+
+    def _replay_(self, file):
+        super(NeededServiceSerializer, self)._replay_(file)
+        self._register_(file)
+
+    def _register_(self, file):
         LinkNames.check_duplicate_link_name('needed_link', self, file)
         # a unique identifier that is the same for all equivalent NeededServices
+        # (str hashes are salted per process: never reuse the one from a cached object)
         self._id = hash(self)
         common.logger.debug("NeededService _id: %s for %r" % (self._id, self))
-        return result
 
     def get_service_name_unique_suffix(self):
         # what we really want to know if it's a non-default/specialized NeededService in the sense that: is_specialized == (hash(self) != hash(NeededService(service_name=self.service_name, link_name=self.service_name, env={})))
@@ -1271,15 +1327,29 @@ class ServicesSerializer(YAML2PipelineSerializer):
         return self.config.docker_image.get_base_image_variant()
 
     def create_variant(self, variant):
-        """Create service variant."""
+        """
+        Create service variant: a shallow copy sharing the service definition (never modified after validation),
+        with its own `service_name`, `variant`, `config.docker_image.base_image_variant`,
+        and the objects linked back to the service (`config.docker_image`, `deploy`).
+        """
         assert self.get_base_image_variant() is not None, \
             "Create service variants only for services having declared variants"
 
-        service = copy.deepcopy(self)
+        service = copy.copy(self)
         service.is_variant = True
         service.variant = variant
-        service.__fields__['service_name'].value = "%s:%s" % (service.service_name, variant)
-        service.config.docker_image.__fields__['base_image_variant'].value = variant
+        service._set_field_('service_name', "%s:%s" % (self.service_name, variant))
+
+        docker_image = copy.copy(self.config.docker_image)
+        docker_image._set_field_('base_image_variant', variant)
+        docker_image.set_service(service)
+        config = copy.copy(self.config)
+        config._set_field_('docker_image', docker_image)
+        service._set_field_('config', config)
+
+        deploy = copy.copy(self.deploy)
+        deploy.set_service(service)
+        service._set_field_('deploy', deploy)
 
         return service
 
@@ -1296,16 +1366,24 @@ class ServicesSerializer(YAML2PipelineSerializer):
 
 class BuildSerializer(YAML2PipelineSerializer):
     env      = FieldSerializer("dict", child = "string", default = {}, help_text = "List of environment variables used when building applications (excluding base_image).", example = {'BUILD': '${BUILD}'})
-    commands = FieldSerializer("array", default = [], child = FieldSerializer(["string", "array"], child = "string", post_validation = lambda x: [x] if isinstance(x, str) else x), help_text ="Command list (or list of lists, in which case each list of commands will be executed in paralell) to build.", example = ["cmake .", "make"])
+    commands = FieldSerializer("array", default = [], child = FieldSerializer(["string", "array"], child = "string", post_validation = to_list), help_text ="Command list (or list of lists, in which case each list of commands will be executed in paralell) to build.", example = ["cmake .", "make"])
 
     def _validate_(self, file, needed_migrations, data, field_name=''):
         super(BuildSerializer, self)._validate_(file, needed_migrations=needed_migrations, data=data, field_name=field_name)
+        self.raw_env = self.env.copy()
+        self._eval_env_()
+        return self
+
+    def _replay_(self, file):
+        super(BuildSerializer, self)._replay_(file)
+        self._eval_env_()
+
+    def _eval_env_(self):
         # populate env
-        env = self.__fields__['env'].value
+        env = self.env
         # variable substitution on env values from dmake process environment
-        for key in env:
-            env[key] = common.eval_str_in_env(env[key])
-        return self
+        for key, value in self.raw_env.items():
+            env[key] = common.eval_str_in_env(value)
 
 
 class DMakeFileSerializer(YAML2PipelineSerializer):
@@ -1337,16 +1415,31 @@ class DMakeFileSerializer(YAML2PipelineSerializer):
                 service_variant = service.create_variant(the_variant)
                 services.append(service_variant)
 
-        self.__fields__['services'].value = services
+        self._set_field_('services', services)
         return self
 
 
 class DMakeFile(DMakeFileSerializer):
-    def __init__(self, file, data):
+    def __init__(self, file, data, validate_only=False):
         super(DMakeFile, self).__init__()
 
         self.__path__ = os.path.join(os.path.dirname(file), '')
 
+        if validate_only:
+            # validated by a loading worker process (see dmake.core.prevalidate_dmake_files):
+            # the caller records the validation, the main process initializes the runtime
+            self._validate_file_(file, data, apply_migrations=False)
+            return
+
+        with files_cache.record() as record:
+            migrated = self._validate_file_(file, data)
+        if not migrated:
+            files_cache.put(file, self, record)
+
+        self._init_runtime_(file)
+
+    def _validate_file_(self, file, data, apply_migrations=True):
+        """Validate `data`, applying migrations if needed. Only depends on the file (see dmake.files_cache), not on the branch."""
         try:
             migrated = False
 
@@ -1355,6 +1448,8 @@ class DMakeFile(DMakeFileSerializer):
                 self._validate_(file, needed_migrations=needed_migrations, data=data)
                 if len(needed_migrations) == 0:
                     break
+                if not apply_migrations:
+                    raise DMakeException("'%s' needs migrations: %s" % (file, ', '.join(sorted(needed_migrations))))
                 migrated = True
                 needed_migrations.sort()
                 for m in needed_migrations:
@@ -1368,12 +1463,26 @@ class DMakeFile(DMakeFileSerializer):
 
         except ValidationError as e:
             raise DMakeException(("Error in %s:\n" % file) + str(e))
+        return migrated
 
+    def _replay_(self, file):
+        # on conflict: restore the registries, so that the file can be validated again to report the usual error
+        volumes = SharedVolumes.volumes.copy()
+        link_names = LinkNames.link_names.copy()
+        try:
+            super(DMakeFile, self)._replay_(file)
+        except Exception:
+            SharedVolumes.volumes = volumes
+            LinkNames.link_names = link_names
+            raise
+
+    def _init_runtime_(self, file):
+        """Branch and session dependent initialization, done after validation or after loading the file from the cache."""
         if self.env is None:
             fake_needed_migrations = []
             env = EnvBranchSerializer()
             env._validate_(file, needed_migrations=fake_needed_migrations, data={'variables': {}})
-            self.__fields__['env'] = env
+            self._set_field_('env', env)
         else:
             if isinstance(self.env, EnvSerializer):
                 env = copy.deepcopy(self.env.default)
@@ -1381,12 +1490,12 @@ class DMakeFile(DMakeFileSerializer):
                     env_branch = self.env.branches[common.branch]
                     for var, value in env_branch.variables.items():
                         env.variables[var] = value
-                    env.__fields__['source'].value = env_branch.source
+                    env._set_field_('source', env_branch.source)
                 if env.source is not None:
-                    env.__fields__['source'].value = common.eval_str_in_env(env.source)
+                    env._set_field_('source', common.eval_str_in_env(env.source))
                 else:
-                    env.__fields__['source'].value = None
-                self.__fields__['env'] = env
+                    env._set_field_('source', None)
+                self._set_field_('env', env)
 
         self.docker_services_image = None
 
@@ -1453,11 +1562,17 @@ class DMakeFile(DMakeFileSerializer):
         return docker_cmd
 
     def _get_service_(self, service):
-        for t in self.services:
-            t_name = "%s/%s" % (self.app_name, t.service_name)
-            if t_name == service:
-                return t
-        raise DMakeException("Could not find service '%s'" % service)
+        # indexed on first use: called for each activated and generated node
+        services = self.__dict__.get('_services_by_name')
+        if services is None or services[0] is not self.services:
+            index = {}
+            for t in self.services:
+                index.setdefault("%s/%s" % (self.app_name, t.service_name), t)
+            services = self._services_by_name = (self.services, index)
+        t = services[1].get(service)
+        if t is None:
+            raise DMakeException("Could not find service '%s'" % service)
+        return t
 
     def _get_link_opts_(self, needed_links, needed_services):
         if common.options.with_dependencies:
@@ -1625,3 +1740,4 @@ class DMakeFile(DMakeFileSerializer):
 def reset():
     SharedVolumes.reset()
     LinkNames.reset()
+    replaced_variables_cache.clear()
@@ -0,0 +1,232 @@
+import fnmatch
+import os
+import pickle
+import subprocess
+
+import dmake.common as common
+import dmake.git_metadata as git_metadata
+from dmake.common import DMakeException
+
+# Find the dmake.yml files of the repository without spawning `find`.
+#
+# - walk mode (default): recursive os.scandir, in the same order as `find` (directory entries order, pre-order)
+# - git mode (DMAKE_FIND_MODE=git): only the files tracked by git, from `git ls-files`
+#
+# In both modes, directories and files matching a `.dmakeignore` pattern are skipped:
+# like a `.gitignore`, a `.dmakeignore` file applies to its directory and all its sub-directories.
+# Patterns without a `/` match an entry name at any depth; other patterns match the path relative to the `.dmakeignore` directory.
+# A trailing `/` restricts the pattern to directories.
+
+dmake_file_name = 'dmake.yml'
+ignore_file_name = '.dmakeignore'
+# never contain dmake files
+always_pruned_directories = set(['.git', '.dmake'])
+
+
+class IgnorePattern(object):
+    def __init__(self, base_dir, pattern):
+        self.base_dir = base_dir
+        self.directory_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        self.anchored = '/' in pattern
+        self.pattern = pattern.lstrip('/')
+
+    def match(self, path, is_dir):
+        if self.directory_only and not is_dir:
+            return False
+        if self.anchored:
+            if self.base_dir:
+                if not path.startswith(self.base_dir + '/'):
+                    return False
+                path = path[len(self.base_dir) + 1:]
+            return fnmatch.fnmatchcase(path, self.pattern)
+        return fnmatch.fnmatchcase(os.path.basename(path), self.pattern)
+
+
+def read_ignore_file(directory):
+    """Return the patterns of `<directory>/.dmakeignore`; `directory` is relative to the repository root ('' for the root)."""
+    path = os.path.join(directory, ignore_file_name) if directory else ignore_file_name
+    try:
+        with open(path) as f:
+            lines = f.read().split('\n')
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('!'):
+            raise DMakeException("%s: negated patterns are not supported: '%s'" % (path, line))
+        patterns.append(IgnorePattern(directory, line))
+    return patterns
+
+
+def is_ignored(path, is_dir, patterns):
+    return any(pattern.match(path, is_dir) for pattern in patterns)
+
+
+def walk(directory, patterns, result):
+    patterns = patterns + read_ignore_file(directory)
+    try:
+        with os.scandir(directory or '.') as it:
+            entries = list(it)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        # same as dmake_find: ignore directories we cannot read (usually generated in docker)
+        return
+    for entry in entries:
+        path = os.path.join(directory, entry.name) if directory else entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir and entry.name in always_pruned_directories:
+            continue
+        if is_ignored(path, is_dir, patterns):
+            continue
+        if entry.name == dmake_file_name:
+            result.append(path)
+        if is_dir:
+            walk(path, patterns, result)
+
+
+def find_files_walk():
+    result = []
+    walk('', [], result)
+    return result
+
+
+def find_files_git():
+    try:
+        output = subprocess.check_output(['git', 'ls-files', '-z', '--cached', '--recurse-submodules'], stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        raise DMakeException("DMAKE_FIND_MODE=git: 'git ls-files' failed: %s" % e.stderr.decode().strip())
+    ignore_patterns = {}
+
+    def get_patterns(directory):
+        # patterns of all the `.dmakeignore` files from the root to `directory`
+        if directory not in ignore_patterns:
+            parent = [] if not directory else get_patterns(os.path.dirname(directory))
+            ignore_patterns[directory] = parent + read_ignore_file(directory)
+        return ignore_patterns[directory]
+
+    result = []
+    for path in output.decode().split('\0'):
+        if os.path.basename(path) != dmake_file_name:
+            continue
+        # deleted from the worktree but not from the index
+        if not os.path.lexists(path):
+            continue
+        parts = path.split('/')
+        if any(part in always_pruned_directories for part in parts[:-1]):
+            continue
+        ignored = False
+        for i in range(1, len(parts) + 1):
+            sub_path = '/'.join(parts[:i])
+            if is_ignored(sub_path, i < len(parts), get_patterns('/'.join(parts[:i - 1]))):
+                ignored = True
+                break
+        if not ignored:
+            result.append(path)
+    return result
+
+
+def find_dmake_files(mode=None):
+    """Return the dmake.yml files paths relative to the current directory (the repository root)."""
+    if mode is None:
+        mode = os.getenv('DMAKE_FIND_MODE', 'walk')
+    if mode == 'walk':
+        files = find_files_walk()
+    elif mode == 'git':
+        files = find_files_git()
+    else:
+        raise DMakeException("Invalid DMAKE_FIND_MODE: '%s', expected 'walk' or 'git'" % mode)
+    common.logger.debug("Found %d dmake files (%s mode)" % (len(files), mode))
+    return files
+
+
+###############################################################################
+
+# Symlinks to directories of the repository, to map the changed files through them (see core.look_for_changed_directories).
+#
+# Found with os.scandir and os.readlink, and cached in `common.cache_dir` (`.dmake/`): the cache is reused while HEAD
+# points to the same tree and the git index is unchanged (a symlink only created in the worktree is found once added to git).
+# Set DMAKE_SYMLINKS_CACHE=0 to disable the cache.
+
+symlinks_cache_enabled = os.getenv('DMAKE_SYMLINKS_CACHE', '1') != '0'
+symlinks_cache_file_name = 'symlinks.cache'
+
+
+def walk_symlinks(directory, result):
+    try:
+        with os.scandir(directory or '.') as it:
+            entries = list(it)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        path = os.path.join(directory, entry.name) if directory else entry.name
+        if entry.is_symlink():
+            result.append(path)
+            continue
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir and entry.name not in always_pruned_directories:
+            walk_symlinks(path, result)
+
+
+def find_symlinked_directories_walk():
+    links = []
+    walk_symlinks('', links)
+    symlinks = []
+    for link_path in links:
+        if not os.path.isdir(link_path):
+            continue
+        try:
+            target = os.readlink(link_path)
+        except OSError:
+            continue
+        linked_dir = os.path.normpath(os.path.join(os.path.dirname(link_path), target))
+        if not os.path.isdir(linked_dir) or linked_dir[0] == '/':
+            continue
+        symlinks.append((link_path, linked_dir))
+    return symlinks
+
+
+def get_symlinks_cache_key():
+    try:
+        index_stat = os.stat(git_metadata.get_index_path())
+        return (git_metadata.get_tree_id(), index_stat.st_mtime_ns, index_stat.st_size)
+    except (OSError, common.ShellError) as e:
+        common.logger.debug("No symlinks cache: %s" % e)
+        return None
+
+
+def find_symlinked_directories():
+    """Return the (symlink path, linked directory path) pairs, relative to the current directory (the repository root)."""
+    cache_dir = getattr(common, 'cache_dir', None)
+    key = get_symlinks_cache_key() if symlinks_cache_enabled and cache_dir is not None else None
+    if key is None:
+        return find_symlinked_directories_walk()
+
+    path = os.path.join(cache_dir, symlinks_cache_file_name)
+    try:
+        with open(path, 'rb') as f:
+            content = pickle.load(f)
+        if content['key'] == key:
+            return content['symlinks']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        common.logger.debug("Ignoring invalid symlinks cache '%s': %s" % (path, e))
+
+    symlinks = find_symlinked_directories_walk()
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': key, 'symlinks': symlinks}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        common.logger.debug("Cannot write symlinks cache '%s': %s" % (path, e))
+    return symlinks
@@ -243,9 +243,11 @@ class ServiceDockerBuildSerializer(YAML2PipelineSerializer):
         return result
 
     def _serialize_(self, commands, path_dir, image_name, build_args):
-        # variables substitution from dmake process environment
-        common.eval_values_in_env(self.args, strict=True)
-        common.eval_values_in_env(self.labels, strict=True)
+        # variables substitution from dmake process environment; on copies: the fields are shared by the service variants
+        build_args_values = self.args.copy()
+        common.eval_values_in_env(build_args_values, strict=True)
+        labels = self.labels.copy()
+        common.eval_values_in_env(labels, strict=True)
 
         program = 'dmake_build_docker'
         args = [self.context, image_name]
@@ -255,10 +257,11 @@ class ServiceDockerBuildSerializer(YAML2PipelineSerializer):
             dockerfile_path = os.path.join(self.context, self.dockerfile)
             args += ["--file=%s" % (dockerfile_path)]
         # build arg
-        build_args.update(self.args)
+        build_args = dict(build_args)
+        build_args.update(build_args_values)
         args += ["--build-arg=%s=%s" % (key, value) for key, value in build_args.items()]
         # labels
-        args += ["--label=%s=%s" % (key, value) for key, value in self.labels.items()]
+        args += ["--label=%s=%s" % (key, value) for key, value in labels.items()]
         # target
         if self.target:
             args.append("--target=%s" % (self.target))
@@ -295,6 +298,5 @@ class DockerImageFieldSerializer(FieldSerializer):
         # We hook the validation method to transform the string value in "ExternalDockerImage"
         value = FieldSerializer._validate_(self, *args, **kwargs)
         if isinstance(value, str):
-            # TODO: normalize this, either we store the value internally, or we return it
-            self.value = ExternalDockerImage(value)
-        return self.value
+            value = ExternalDockerImage(value)
+        return value
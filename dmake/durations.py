@@ -0,0 +1,137 @@
+import os
+import time
+
+import dmake.common as common
+import dmake.scheduling as scheduling
+
+# Historical wall-clock durations of the nodes, to order the parallel execution by critical path and estimate the run duration.
+#
+# Opt-in with DMAKE_DURATIONS=1: the generated commands of each node then record its duration on success
+# (see dmake_duration_start and dmake_duration_end) in a tab-separated `<key>\t<seconds>` file, appended concurrently
+# by the parallel branches: DMAKE_DURATIONS_STORE (e.g. a shared path on CI), default: `.dmake/durations.tsv`.
+# The estimate of a node is the mean of its last `history_size` durations.
+
+enabled = os.getenv('DMAKE_DURATIONS', '0') != '0'
+
+history_size = 5
+# rewrite the store with only the used history when it is that many times bigger
+compaction_ratio = 4
+
+
+def get_store_file():
+    return os.getenv('DMAKE_DURATIONS_STORE') or os.path.join(common.cache_dir, 'durations.tsv')
+
+
+def get_key(node):
+    command, service, _ = node
+    # without the service customization unique suffix: it is not stable across runs
+    return '%s @ %s' % (command, service)
+
+
+def load(store_file):
+    """Return {key: estimated duration in seconds}."""
+    try:
+        with open(store_file) as f:
+            lines = f.readlines()
+    except OSError:
+        return {}
+    history = {}
+    for line in lines:
+        key, _, seconds = line.rstrip('\n').rpartition('\t')
+        try:
+            seconds = float(seconds)
+        except ValueError:
+            continue
+        if not key:
+            continue
+        values = history.setdefault(key, [])
+        values.append(seconds)
+        if len(values) > history_size:
+            del values[0]
+    if len(lines) > compaction_ratio * history_size * max(1, len(history)):
+        compact(store_file, history)
+    return {key: sum(values) / len(values) for key, values in history.items()}
+
+
+def compact(store_file, history):
+    tmp_file = '%s.%d.tmp' % (store_file, os.getpid())
+    try:
+        with open(tmp_file, 'w') as f:
+            for key, values in history.items():
+                for seconds in values:
+                    f.write('%s\t%s\n' % (key, int(seconds)))
+        os.replace(tmp_file, store_file)
+    except OSError as e:
+        common.logger.debug("Durations store compaction failed: %s" % e)
+
+
+def get_default_store_file():
+    # relative to the repository root: the generated commands may run in another workspace
+    return os.path.join(common.relative_cache_dir, 'durations.tsv')
+
+
+def wrap_commands(commands, record_id, key):
+    """Return `commands` recording their duration under `key`; `record_id`: unique in the plan (e.g. the node id)."""
+    result = []
+    common.append_command(result, 'sh', shell='dmake_duration_start %s' % record_id)
+    result += commands
+    common.append_command(result, 'sh', shell='dmake_duration_end %s "%s" "%s"' % (record_id, get_default_store_file(), key))
+    return result
+
+
+def get_node_estimates(estimates, nodes, ids):
+    """Return {node id: estimated duration} for the nodes `ids` with a history; `nodes`: the node by id."""
+    node_estimates = {}
+    for i in ids:
+        estimate = estimates.get(get_key(nodes[i]))
+        if estimate is not None:
+            node_estimates[i] = estimate
+    return node_estimates
+
+
+def set_priorities(parallel_nodes, node_estimates):
+    """Set the `priority` of the parallel nodes (see core.get_parallel_nodes): their longest remaining critical path."""
+    children = [parallel_node['children'] for parallel_node in parallel_nodes]
+    seconds = [node_estimates.get(parallel_node['id'], 0) for parallel_node in parallel_nodes]
+    for parallel_node, priority in zip(parallel_nodes, scheduling.get_critical_paths(children, seconds)):
+        parallel_node['priority'] = priority
+
+
+def log_estimate(ids, node_estimates, parallel_nodes=None, by_height=False, workers=None):
+    """Log the estimated duration of the run of the nodes `ids`: sequential, or in parallel (see scheduling.py)."""
+    known = [i for i in ids if i in node_estimates]
+    if not known:
+        return
+    if parallel_nodes is None:
+        seconds = sum(node_estimates[i] for i in known)
+    else:
+        children = [parallel_node['children'] for parallel_node in parallel_nodes]
+        durations = [node_estimates.get(parallel_node['id'], 0) for parallel_node in parallel_nodes]
+        priorities = [parallel_node.get('priority', 0) for parallel_node in parallel_nodes]
+        simulate = scheduling.simulate_heights if by_height else scheduling.simulate_dag
+        seconds = simulate(children, durations, workers, priorities)
+    common.logger.info(format_estimate(seconds, len(ids) - len(known)))
+
+
+def format_node_estimate(node_estimates, i):
+    if i not in node_estimates:
+        return ''
+    return ' (~%s)' % format_duration(node_estimates[i])
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return '%ds' % seconds
+    if seconds < 3600:
+        return '%dm%02ds' % (seconds // 60, seconds % 60)
+    return '%dh%02dm' % (seconds // 3600, seconds % 3600 // 60)
+
+
+def format_estimate(seconds, unknown_count):
+    """Return the estimated duration of the run, and its ETA."""
+    eta = time.strftime('%H:%M', time.localtime(time.time() + seconds))
+    message = "Estimated duration: %s, ETA: %s" % (format_duration(seconds), eta)
+    if unknown_count > 0:
+        message += " (+ %d node%s without history)" % (unknown_count, 's' if unknown_count > 1 else '')
+    return message
@@ -0,0 +1,188 @@
+import argparse
+import collections
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+if __name__ == "__main__":
+    # run as a script (see get_command): import dmake from its package directory, not this one
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from dmake.common import DMakeException
+
+# Native parallel execution of the plan for the bash runtime (local runs and non-Jenkins CI), with DMAKE_PARALLEL_EXECUTION=1.
+#
+# Bash has no equivalent of the Jenkins `parallel` and `lock` steps: `core.make` writes a bash script per node instead,
+# and a plan file listing them with their dependencies (children) and the locks they need. The generated DMakefile
+# runs this module on the plan:
+# - a node starts as soon as all its children succeeded, and its locks are available; the ready nodes start by decreasing
+#   `priority` (the longest remaining critical path, see durations.py), then in plan order,
+# - locks are local resources pools: `PARALLEL_BUILDERS` bounds the number of nodes running at the same time
+#   (DMAKE_PARALLEL_BUILDERS, default: the number of CPUs), `GPUS` are the DMAKE_GPUS comma-separated resources names
+#   (default: one resource, all GPUs); the lock variable (e.g. DMAKE_GPU) is set to the acquired resource name,
+# - `held_locks` are acquired by the first node needing them and released at the end of the plan only, shared by the
+#   next nodes needing them: e.g. the GPU of a daemon container is still used after its node is done,
+# - the nodes run in the background, without stdin: the interactive ones (e.g. `shell`) are run after the plan instead,
+# - the output of the nodes is multiplexed line by line, prefixed by the node name,
+# - after a failure no new node is started, the running ones are waited for, and the first failure exit code is returned.
+# Timeouts are enforced by the node scripts themselves (see core.generate_command_bash).
+
+output_lock = threading.Lock()
+
+
+def get_command(plan_file):
+    """Return the shell command executing `plan_file`."""
+    # run as a script: no dependency on dmake being installed for the generated DMakefile python
+    return '"%s" "%s" "%s"' % (sys.executable, os.path.abspath(__file__), plan_file)
+
+
+def write_plan(plan_file, nodes):
+    """`nodes`: list of {'name', 'script', 'children': [index in nodes], 'locks' and 'held_locks': [[label, variable or None]], 'priority'},
+    children first."""
+    with open(plan_file, 'w') as f:
+        json.dump({'nodes': nodes}, f, indent=1)
+
+
+def read_plan(plan_file):
+    with open(plan_file) as f:
+        return json.load(f)['nodes']
+
+###############################################################################
+
+def get_lock_resources(label):
+    """Return the names of the local resources of the lock `label`."""
+    if label == 'GPUS':
+        gpus = os.getenv('DMAKE_GPUS', '')
+        return [gpu for gpu in gpus.split(',') if gpu] or ['']
+    if label == 'PARALLEL_BUILDERS':
+        return [''] * get_parallel_builders()
+    return ['']
+
+
+def get_parallel_builders():
+    value = os.getenv('DMAKE_PARALLEL_BUILDERS')
+    if value is None:
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise DMakeException("Invalid DMAKE_PARALLEL_BUILDERS environment variable: '%s', expected a number of parallel builders." % value)
+
+
+class Locks(object):
+    """The available resources by lock label; only used by the scheduler thread."""
+
+    def __init__(self):
+        self.available = {}
+
+    def _resources_(self, label):
+        if label not in self.available:
+            self.available[label] = collections.deque(get_lock_resources(label))
+        return self.available[label]
+
+    def try_acquire(self, locks):
+        """Acquire all `locks` or none: return {label: resource name}, or None if one of them is not available."""
+        if any(len(self._resources_(label)) == 0 for label, _ in locks):
+            return None
+        return {label: self._resources_(label).popleft() for label, _ in locks}
+
+    def release(self, acquired):
+        for label, resource in acquired.items():
+            self.available[label].append(resource)
+
+
+def write_output(prefix, line):
+    with output_lock:
+        sys.stdout.write('[%s] %s' % (prefix, line))
+        if not line.endswith('\n'):
+            sys.stdout.write('\n')
+        sys.stdout.flush()
+
+
+def run_node(node, env, events, index):
+    start = time.time()
+    try:
+        p = subprocess.Popen(['bash', node['script']], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                             env=env, universal_newlines=True, errors='replace')
+        for line in p.stdout:
+            write_output(node['name'], line)
+        return_code = p.wait()
+    except Exception as e:
+        write_output(node['name'], 'ERROR: %s' % e)
+        return_code = 1
+    events.put((index, return_code, time.time() - start))
+
+
+def execute(nodes):
+    """Run the plan `nodes` (see write_plan), return the exit code."""
+    parents = [[] for _ in nodes]
+    pending_children = [len(set(node['children'])) for node in nodes]
+    for i, node in enumerate(nodes):
+        for child in set(node['children']):
+            parents[child].append(i)
+
+    locks = Locks()
+    held = {}  # label -> resource name, until the end of the plan
+    ready = [i for i, n in enumerate(pending_children) if n == 0]
+    running = {}
+    events = queue.Queue()
+    failures = []
+
+    while ready or running:
+        if not failures:
+            # start what can start: critical path first, then in plan order
+            ready.sort(key=lambda i: (-nodes[i].get('priority', 0), i))
+            for i in list(ready):
+                node_locks = nodes[i]['locks']
+                held_locks = nodes[i].get('held_locks', [])
+                acquired = locks.try_acquire(node_locks + [lock for lock in held_locks if lock[0] not in held])
+                if acquired is None:
+                    continue
+                ready.remove(i)
+                for label, _ in held_locks:
+                    if label in acquired:
+                        held[label] = acquired.pop(label)
+                env = os.environ.copy()
+                for label, variable in node_locks + held_locks:
+                    resource = acquired[label] if label in acquired else held[label]
+                    if variable and resource:
+                        env[variable] = resource
+                running[i] = acquired
+                thread = threading.Thread(target=run_node, args=(nodes[i], env, events, i), daemon=True)
+                thread.start()
+        if not running:
+            break
+
+        i, return_code, duration = events.get()
+        locks.release(running.pop(i))
+        name = nodes[i]['name']
+        if return_code != 0:
+            write_output(name, 'FAILED with exit code %s after %.1fs' % (return_code, duration))
+            failures.append((name, return_code))
+            continue
+        write_output(name, 'Done in %.1fs' % duration)
+        for parent in parents[i]:
+            pending_children[parent] -= 1
+            if pending_children[parent] == 0:
+                ready.append(parent)
+
+    if failures:
+        with output_lock:
+            print('Failed: %s' % ', '.join(name for name, _ in failures))
+        return failures[0][1]
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("plan_file", help="Plan file generated by dmake")
+    args = parser.parse_args()
+    try:
+        sys.exit(execute(read_plan(args.plan_file)))
+    except DMakeException as e:
+        print('ERROR: ' + str(e))
+        sys.exit(1)
@@ -0,0 +1,231 @@
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+import dmake.common as common
+import dmake.serializer as serializer
+
+# Persistent cache of validated dmake files, stored in a single file in `common.cache_dir` (`.dmake/`).
+#
+# An entry is reused when:
+# - the dmake.yml content hash is unchanged (the file path is the entry key),
+# - the dmake code is unchanged (see `get_code_version`),
+# - all the paths checked by the validation (`file`, `dir`, `path` fields, including references
+#   to other dmake files) still have the same status (missing, file, executable file or directory).
+#
+# Only the validated, branch independent form of the file is cached: `DMakeFile._init_runtime_`
+# (env branch selection, env source evaluation, ...) always runs after loading an entry.
+# The validation side effects that are not kept in the objects are replayed on load with
+# `YAML2PipelineSerializer._replay_`, in validation order:
+# - the global registries (`SharedVolumes`, `LinkNames`) are never cached, they are rebuilt by the replay;
+#   on conflict, they are restored and the file is validated from scratch to report the usual error,
+# - values depending on the process (`build.env` evaluation, hashes, session ids) are recomputed,
+# - the warnings logged during validation are logged again.
+# Files needing migrations are never cached: they are rewritten anyway.
+#
+# Set DMAKE_FILES_CACHE=0 to disable it.
+
+enabled = os.getenv('DMAKE_FILES_CACHE', '1') != '0'
+
+cache_file_name = 'dmake_files.cache'
+# the validation depends on most of the package (common, kubernetes, ...): all its modules are hashed
+package_dir = os.path.dirname(os.path.abspath(__file__))
+
+entries = None  # file -> {'hash', 'path_statuses', 'warnings', 'data'}
+entries_path = None
+dirty = False
+# content hash of the files looked up in the cache, to store them after their validation
+pending_hashes = {}
+
+
+class ValidationRecord(object):
+    def __init__(self):
+        self.path_statuses = []
+        self.warnings = []
+
+
+class WarningsRecorder(logging.Handler):
+    def __init__(self, warnings):
+        super(WarningsRecorder, self).__init__(logging.WARNING)
+        self.warnings = warnings
+
+    def emit(self, record):
+        self.warnings.append((record.levelno, record.getMessage()))
+
+
+def get_code_modules():
+    """Return the dmake modules, relative to `package_dir`, sorted: the tests excluded."""
+    modules = []
+    for dir_path, dir_names, file_names in os.walk(package_dir):
+        dir_names[:] = sorted(name for name in dir_names if name != '__pycache__')
+        for name in sorted(file_names):
+            if name.endswith('.py') and not name.startswith('test_'):
+                modules.append(os.path.relpath(os.path.join(dir_path, name), package_dir))
+    return modules
+
+
+code_version = None
+def get_code_version():
+    global code_version
+    if code_version is None:
+        h = hashlib.sha256()
+        h.update(repr((sys.version_info[:2], pickle.HIGHEST_PROTOCOL)).encode())
+        for module in get_code_modules():
+            h.update(module.encode())
+            with open(os.path.join(package_dir, module), 'rb') as f:
+                h.update(f.read())
+        code_version = h.hexdigest()
+    return code_version
+
+
+def get_entries():
+    global entries, entries_path, dirty
+    if not enabled:
+        return None
+    cache_dir = getattr(common, 'cache_dir', None)
+    if cache_dir is None:
+        return None
+    path = os.path.join(cache_dir, cache_file_name)
+    if entries is None or entries_path != path:
+        entries = {}
+        entries_path = path
+        dirty = False
+        try:
+            with open(path, 'rb') as f:
+                content = pickle.load(f)
+            if content['version'] == get_code_version():
+                entries = content['entries']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            common.logger.debug("Ignoring invalid dmake files cache '%s': %s" % (path, e))
+    return entries
+
+
+@contextlib.contextmanager
+def record():
+    """Record what the validation of a dmake file depends on."""
+    validation_record = ValidationRecord()
+    recorder = WarningsRecorder(validation_record.warnings)
+    previous_path_statuses = serializer.recorded_path_statuses
+    serializer.recorded_path_statuses = validation_record.path_statuses
+    common.logger.addHandler(recorder)
+    try:
+        yield validation_record
+    finally:
+        common.logger.removeHandler(recorder)
+        serializer.recorded_path_statuses = previous_path_statuses
+
+
+def get_content_hash(file):
+    with open(file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def lookup(file):
+    """Return the up-to-date entry for `file`, or None."""
+    cache_entries = get_entries()
+    if cache_entries is None:
+        return None
+    content_hash = get_content_hash(file)
+    pending_hashes[file] = content_hash
+
+    entry = cache_entries.get(file)
+    if entry is None or entry['hash'] != content_hash:
+        return None
+    for path, status in entry['path_statuses']:
+        if serializer.get_path_status(path) != status:
+            return None
+    return entry
+
+
+def load_entry(file, entry):
+    """Return the DMakeFile stored in `entry`, ready to use, or None."""
+    try:
+        dmake_file = pickle.loads(entry['data'])
+    except Exception as e:
+        common.logger.debug("Ignoring invalid dmake files cache entry for '%s': %s" % (file, e))
+        return None
+
+    try:
+        dmake_file._replay_(file)
+    except Exception as e:
+        # e.g. duplicate link name with another file: let the validation report it
+        common.logger.debug("Cannot reuse cached '%s': %s" % (file, e))
+        return None
+    for level, message in entry['warnings']:
+        common.logger.log(level, message)
+
+    dmake_file._init_runtime_(file)
+    return dmake_file
+
+
+def get(file):
+    """Return the DMakeFile for `file` from the cache, ready to use, or None."""
+    entry = lookup(file)
+    if entry is None:
+        return None
+    # on failure, the entry is replaced after the validation
+    dmake_file = load_entry(file, entry)
+    if dmake_file is not None:
+        pending_hashes.pop(file, None)
+    return dmake_file
+
+
+def make_entry(file, content_hash, dmake_file, validation_record):
+    """Return the entry for the validated `dmake_file`, before any branch dependent initialization, or None."""
+    try:
+        data = pickle.dumps(dmake_file, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        common.logger.debug("Cannot cache '%s': %s" % (file, e))
+        return None
+    return {
+        'hash': content_hash,
+        'path_statuses': tuple(validation_record.path_statuses),
+        'warnings': tuple(validation_record.warnings),
+        'data': data,
+    }
+
+
+def store(file, entry):
+    global dirty
+    pending_hashes.pop(file, None)
+    cache_entries = get_entries()
+    if cache_entries is None:
+        return
+    cache_entries[file] = entry
+    dirty = True
+
+
+def put(file, dmake_file, validation_record):
+    """Store the validated `dmake_file`, before any branch dependent initialization."""
+    content_hash = pending_hashes.get(file)
+    if get_entries() is None or content_hash is None:
+        # not loaded through `get`: the validated data may not be the file content
+        return
+    entry = make_entry(file, content_hash, dmake_file, validation_record)
+    if entry is not None:
+        store(file, entry)
+
+
+def save():
+    global dirty
+    # the files loaded from now on may not be read through `get`
+    pending_hashes.clear()
+    if entries is None or not dirty:
+        return
+    for file in list(entries):
+        if not os.path.isfile(file):
+            del entries[file]
+    tmp_path = '%s.%d.tmp' % (entries_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': get_code_version(), 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entries_path)
+    except OSError as e:
+        common.logger.debug("Cannot write dmake files cache '%s': %s" % (entries_path, e))
+        return
+    dirty = False
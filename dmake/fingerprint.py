@@ -0,0 +1,319 @@
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import stat
+
+import dmake.common as common
+from dmake.common import append_command
+from dmake.docker_image import ExternalDockerImage
+from dmake.serializer import FieldSerializer, YAML2PipelineSerializer
+
+# Content-addressed fingerprints of the planned nodes, to skip the tests that already succeeded with the same inputs.
+#
+# The fingerprint of a node is a hash of its own definition and of the fingerprints of its children (Merkle tree):
+# - the validated dmake file fields it depends on, with the content of the files and directories they reference
+#   (`file`, `dir` and `path` fields: scripts, requirements, build context, ...),
+# - the values of the environment variables referenced by these fields (`${VAR}`),
+# - `build_docker`: the build configuration of the dmake file, and the dmake file directory for generated Dockerfiles,
+# - `test` and `run`: the dmake file `env` and directory (tests often mount the sources).
+# Directories are hashed file by file, without the files excluded by their `.dockerignore` if any.
+# The base images are fingerprinted from their definition: a root image tag moved to a new digest is not detected.
+#
+# When enabled (DMAKE_FINGERPRINTS=1):
+# - a `test` node is skipped when its fingerprint was recorded by a previous successful run,
+# - the other nodes are skipped when all the nodes depending on them are skipped (e.g. the `build_docker` of a skipped test):
+#   the image tags are per build, so a build is never reused by itself.
+# The fingerprints are recorded by the generated commands, after the tests succeeded, in the store set by
+# DMAKE_FINGERPRINTS_STORE: a directory (default: `.dmake/fingerprints`, can be shared), or `s3://bucket/prefix` (with the aws CLI).
+
+enabled = os.getenv('DMAKE_FINGERPRINTS', '0') != '0'
+
+skippable_commands = ['test']
+
+# path -> hash, for the current plan: directories are shared by services
+path_hashes = {}
+
+env_variable_re = re.compile(r'\$\{?([a-zA-Z_][a-zA-Z0-9_]*)')
+
+###############################################################################
+
+class DockerIgnorePattern(object):
+    """A `.dockerignore` line, matched like docker does: on the path relative to the context, or on one of its parent directories."""
+
+    def __init__(self, pattern):
+        self.exclusion = pattern.startswith('!')
+        if self.exclusion:
+            pattern = pattern[1:].strip()
+        pattern = os.path.normpath(pattern).lstrip('/')
+        regex = ''
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if pattern.startswith('**/', i):
+                regex += '(.*/)?'
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                regex += '.*'
+                i += 2
+                continue
+            if c == '*':
+                regex += '[^/]*'
+            elif c == '?':
+                regex += '[^/]'
+            elif c == '[':
+                end = pattern.find(']', i + 1)
+                if end < 0:
+                    regex += re.escape(c)
+                else:
+                    regex += fnmatch.translate(pattern[i:end + 1])[4:-3]
+                    i = end
+            else:
+                regex += re.escape(c)
+            i += 1
+        self.regex = re.compile('^%s$' % regex)
+
+    def match(self, path):
+        parts = path.split('/')
+        return any(self.regex.match('/'.join(parts[:i])) for i in range(len(parts), 0, -1))
+
+
+def read_dockerignore(directory):
+    try:
+        with open(os.path.join(directory, '.dockerignore')) as f:
+            lines = f.read().split('\n')
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        patterns.append(DockerIgnorePattern(line))
+    return patterns
+
+
+def is_dockerignored(path, patterns):
+    ignored = False
+    for pattern in patterns:
+        if pattern.match(path):
+            ignored = not pattern.exclusion
+    return ignored
+
+
+def hash_file(h, path, st):
+    h.update(b'x' if st.st_mode & stat.S_IXUSR else b'-')
+    with open(path, 'rb') as f:
+        h.update(hashlib.sha256(f.read()).digest())
+
+
+def hash_tree(directory):
+    """Hash the files of `directory` (paths, content, executable bit, symlinks targets), in sorted order."""
+    patterns = read_dockerignore(directory)
+    h = hashlib.sha256()
+    stack = ['']
+    while stack:
+        relative_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(directory, relative_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue
+        sub_dirs = []
+        for entry in entries:
+            path = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+            if entry.name == '.git' or is_dockerignored(path, patterns):
+                continue
+            h.update(path.encode() + b'\0')
+            if entry.is_symlink():
+                h.update(b'l' + os.readlink(entry.path).encode() + b'\0')
+            elif entry.is_dir(follow_symlinks=False):
+                h.update(b'd')
+                sub_dirs.append(path)
+            else:
+                try:
+                    hash_file(h, entry.path, entry.stat(follow_symlinks=False))
+                except OSError:
+                    h.update(b'?')
+        stack.extend(reversed(sub_dirs))
+    return h.hexdigest()
+
+
+def hash_path(path):
+    """Return the hash of a file or directory content, None if it does not exist."""
+    path = os.path.normpath(path)
+    if path not in path_hashes:
+        try:
+            st = os.stat(path)
+        except OSError:
+            result = None
+        else:
+            if stat.S_ISDIR(st.st_mode):
+                result = hash_tree(path)
+            else:
+                h = hashlib.sha256()
+                hash_file(h, path, st)
+                result = h.hexdigest()
+        path_hashes[path] = result
+    return path_hashes[path]
+
+###############################################################################
+
+def is_path_field(field):
+    if not isinstance(field, FieldSerializer):
+        return False
+    for data_type in field.data_type:
+        if data_type in ['path', 'file', 'dir'] or is_path_field(data_type):
+            return True
+    return False
+
+
+def describe(value, path_dir, field=None):
+    """Return a plain data view of `value`, with the content hash of the paths; `path_dir`: the dmake file directory."""
+    if isinstance(value, YAML2PipelineSerializer):
+        if not value.has_value():
+            return None
+        return {name: describe(getattr(value, name, None), path_dir, serializer) for name, serializer in value.__schema__.items()}
+    child = field.child if isinstance(field, FieldSerializer) else None
+    if isinstance(value, list):
+        return [describe(v, path_dir, child) for v in value]
+    if isinstance(value, dict):
+        return {str(k): describe(v, path_dir, child) for k, v in value.items()}
+    if isinstance(value, str):
+        if value and is_path_field(field):
+            # relative to the repository root, unless child_path_only
+            path = os.path.join(path_dir, value) if field.child_path_only else value
+            return [value, hash_path(path)]
+        return value
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    if isinstance(value, ExternalDockerImage):
+        return value.image_name
+    return type(value).__name__
+
+
+def get_node_content(loaded_files, service_providers, node):
+    """Return the plain data defining `node`, without its children."""
+    command, service, service_customization = node
+    file = service_providers[service][0]
+    dmake_file = loaded_files[file]
+    path_dir = dmake_file.get_path()
+    content = {'node': [command, service], 'app': dmake_file.get_app_name()}
+    if command == 'base':
+        content['base'] = describe(dmake_file.docker.get_base_image_from_service_name(service), path_dir)
+        return content
+    if command == 'shared_volume':
+        content['shared_volume'] = describe(dmake_file._get_shared_volume_from_service_name_(service), path_dir)
+        return content
+    if command == 'run_link':
+        content['link'] = describe(dmake_file.get_docker_link(service), path_dir)
+        return content
+
+    s = dmake_file._get_service_(service)
+    if command == 'build_docker':
+        docker_image = s.config.docker_image
+        content['docker_image'] = describe(docker_image, path_dir)
+        content['variant'] = s.variant
+        content['build'] = describe(dmake_file.build, path_dir)
+        content['docker'] = describe(dmake_file.docker, path_dir)
+        sources = [path_dir]
+        for additional_root in docker_image.get_source_directories_additional_contexts():
+            sources.append(os.path.join(path_dir, additional_root))
+        build = getattr(docker_image, 'build', None)
+        if build is not None and build.has_value():
+            # the Dockerfile can be outside of the context
+            sources = [os.path.join(build.context, build.dockerfile or 'Dockerfile')] + sources[1:]
+        content['sources'] = [[os.path.normpath(source), hash_path(source)] for source in sources]
+        return content
+
+    # test, run, deploy, shell
+    content['service'] = {name: describe(getattr(s, name, None), path_dir, serializer) for name, serializer in s.__schema__.items() if name != 'deploy'}
+    content['variant'] = s.variant
+    content['customization'] = describe(service_customization, path_dir) if service_customization is not None else None
+    content['env'] = describe(dmake_file.env, path_dir)
+    content['env_source'] = hash_path(dmake_file.env.source) if dmake_file.env.has_value() and dmake_file.env.source else None
+    content['sources'] = [os.path.normpath(path_dir), hash_path(path_dir)]
+    return content
+
+
+def get_fingerprints(plan, loaded_files, service_providers):
+    """Return {node id: fingerprint} for the nodes reached by the plan (see dag.Plan)."""
+    graph = plan.graph
+    fingerprints = {}
+    path_hashes.clear()
+    # children first: a node is higher than its children
+    for i in sorted(plan.reached, key=plan.heights.__getitem__):
+        content = json.dumps(get_node_content(loaded_files, service_providers, graph.nodes[i]), sort_keys=True)
+        variables = sorted(set(env_variable_re.findall(content)))
+        h = hashlib.sha256()
+        h.update(content.encode())
+        h.update(json.dumps([[name, os.environ.get(name)] for name in variables]).encode())
+        for child in graph.children(i):
+            h.update(fingerprints[child].encode())
+        fingerprints[i] = h.hexdigest()
+    return fingerprints
+
+
+def get_skipped_nodes(plan, fingerprints, store):
+    """Return {node id: reason} of the reached nodes to skip."""
+    graph = plan.graph
+    parents = {i: [] for i in plan.reached}
+    for i in plan.reached:
+        for child in graph.children(i):
+            parents[child].append(i)
+    skipped = {}
+    # parents first
+    for i in sorted(plan.reached, key=plan.heights.__getitem__, reverse=True):
+        if graph.nodes[i][0] in skippable_commands:
+            if store.contains(fingerprints[i]):
+                skipped[i] = 'fingerprint recorded'
+        elif parents[i] and all(parent in skipped for parent in parents[i]):
+            skipped[i] = 'not needed'
+    return skipped
+
+###############################################################################
+
+class DirectoryStore(object):
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+
+    def contains(self, fingerprint):
+        return os.path.isfile(os.path.join(self.path, fingerprint))
+
+    def generate_record(self, commands, fingerprint):
+        append_command(commands, 'sh', shell='mkdir -p "%s" && touch "%s"' % (self.path, os.path.join(self.path, fingerprint)))
+
+
+class S3Store(object):
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+        self.fingerprints = None
+
+    def contains(self, fingerprint):
+        if self.fingerprints is None:
+            # one listing for the whole plan
+            self.fingerprints = set()
+            try:
+                output = common.run_shell_command2('aws s3 ls "%s/"' % self.url)
+            except common.ShellError as e:
+                common.logger.warning("Cannot list the fingerprints store '%s', not skipping anything: %s" % (self.url, e))
+                output = ''
+            for line in output.split('\n'):
+                parts = line.split()
+                if parts:
+                    self.fingerprints.add(parts[-1])
+        return fingerprint in self.fingerprints
+
+    def generate_record(self, commands, fingerprint):
+        append_command(commands, 'sh', shell='aws s3 cp - "%s/%s" < /dev/null' % (self.url, fingerprint))
+
+
+def get_store():
+    url = os.getenv('DMAKE_FINGERPRINTS_STORE')
+    if not url:
+        return DirectoryStore(os.path.join(common.cache_dir, 'fingerprints'))
+    if url.startswith('s3://'):
+        return S3Store(url)
+    return DirectoryStore(url)
@@ -0,0 +1,408 @@
+import os
+import re
+import zlib
+
+import dmake.common as common
+
+# Read the git metadata dmake needs at startup (toplevel, HEAD, branch, upstream, remote url, HEAD tree)
+# directly from the `.git` directory instead of spawning git processes.
+# Any layout or configuration this reader does not fully understand raises Unsupported,
+# and the public functions below fall back to the git CLI.
+
+class Unsupported(Exception):
+    pass
+
+# environment variables changing how git finds the repository or reads its configuration
+unsupported_environment = ['GIT_DIR', 'GIT_WORK_TREE', 'GIT_COMMON_DIR', 'GIT_NAMESPACE', 'GIT_CEILING_DIRECTORIES',
+                           'GIT_DISCOVERY_ACROSS_FILESYSTEM', 'GIT_CONFIG', 'GIT_CONFIG_GLOBAL', 'GIT_CONFIG_SYSTEM',
+                           'GIT_CONFIG_NOSYSTEM', 'GIT_CONFIG_COUNT', 'GIT_CONFIG_PARAMETERS']
+
+object_id_re = re.compile(r'^([0-9a-f]{40}|[0-9a-f]{64})$')
+# refs that live in the worktree git dir instead of the common dir
+per_worktree_ref_re = re.compile(r'^(HEAD|[A-Z_]+_HEAD|refs/(bisect|worktree|rewritten)/.*)$')
+
+###############################################################################
+
+config_section_re = re.compile(r'^\[\s*([-.a-zA-Z0-9]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+config_key_re = re.compile(r'^([a-zA-Z][-a-zA-Z0-9]*)\s*(=|$)')
+
+def parse_config_value(value):
+    result = ''
+    in_quotes = False
+    i = 0
+    escapes = {'n': '\n', 't': '\t', 'b': '\b', '\\': '\\', '"': '"'}
+    pending_spaces = ''
+    while i < len(value):
+        c = value[i]
+        if c == '\\':
+            if i + 1 >= len(value) or value[i + 1] not in escapes:
+                raise Unsupported()
+            result += pending_spaces + escapes[value[i + 1]]
+            pending_spaces = ''
+            i += 2
+            continue
+        if c == '"':
+            result += pending_spaces
+            pending_spaces = ''
+            in_quotes = not in_quotes
+        elif not in_quotes and c in '#;':
+            break
+        elif not in_quotes and c.isspace():
+            # inner spaces are kept, trailing ones are dropped
+            if result:
+                pending_spaces += c
+        else:
+            result += pending_spaces + c
+            pending_spaces = ''
+        i += 1
+    if in_quotes:
+        raise Unsupported()
+    return result
+
+def read_config(path, config):
+    """Update `config` (section, subsection, key) -> [values] with the content of git config file `path`."""
+    try:
+        with open(path) as f:
+            content = f.read()
+    except FileNotFoundError:
+        return
+    except (OSError, UnicodeDecodeError):
+        raise Unsupported()
+    section = None
+    subsection = None
+    # multi-line values
+    content = content.replace('\\\n', '')
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[':
+            m = config_section_re.match(line)
+            if m is None:
+                raise Unsupported()
+            section = m.group(1).lower()
+            subsection = m.group(2)
+            if subsection is not None:
+                subsection = re.sub(r'\\(.)', r'\1', subsection)
+            elif '.' in section:
+                # deprecated [section.subsection] syntax
+                raise Unsupported()
+            if section in ['include', 'includeif']:
+                raise Unsupported()
+            line = line[m.end():].strip()
+            if not line or line[0] in '#;':
+                continue
+        if section is None:
+            raise Unsupported()
+        m = config_key_re.match(line)
+        if m is None:
+            raise Unsupported()
+        key = m.group(1).lower()
+        if m.group(2) == '=':
+            value = parse_config_value(line[m.end():].strip())
+        else:
+            # boolean key without value
+            value = 'true'
+        config.setdefault((section, subsection, key), []).append(value)
+
+###############################################################################
+
+class GitRepository(object):
+    def __init__(self, toplevel, git_dir, common_dir):
+        self.toplevel = toplevel
+        self.git_dir = git_dir
+        self.common_dir = common_dir
+        self.config = self.load_config()
+        if self.get_config('core', None, 'bare', 'false').lower() in ['true', 'yes', 'on', '1'] or \
+           self.get_config('core', None, 'worktree') is not None or \
+           self.get_config('extensions', None, 'refstorage', 'files') != 'files':
+            raise Unsupported()
+
+    @staticmethod
+    def discover(path):
+        for name in unsupported_environment:
+            if name in os.environ:
+                raise Unsupported()
+        path = os.path.realpath(path)
+        if not os.path.isdir(path):
+            raise Unsupported()
+        directory = path
+        while True:
+            dot_git = os.path.join(directory, '.git')
+            if os.path.isdir(dot_git):
+                git_dir = dot_git
+                break
+            if os.path.isfile(dot_git):
+                # worktree or submodule: `gitdir: <path>`
+                with open(dot_git) as f:
+                    content = f.read().strip()
+                if not content.startswith('gitdir: '):
+                    raise Unsupported()
+                git_dir = os.path.normpath(os.path.join(directory, content[len('gitdir: '):]))
+                break
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                # let git report the error
+                raise Unsupported()
+            directory = parent
+
+        if path == git_dir or path.startswith(os.path.join(git_dir, '')):
+            # inside the git dir itself
+            raise Unsupported()
+        if not os.path.isfile(os.path.join(git_dir, 'HEAD')):
+            raise Unsupported()
+        common_dir = git_dir
+        commondir_file = os.path.join(git_dir, 'commondir')
+        if os.path.isfile(commondir_file):
+            with open(commondir_file) as f:
+                common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+        # git refuses repositories owned by someone else unless configured as safe.directory
+        if os.stat(common_dir).st_uid != os.geteuid() or os.stat(directory).st_uid != os.geteuid():
+            raise Unsupported()
+        return GitRepository(directory, git_dir, common_dir)
+
+    def load_config(self):
+        config = {}
+        if 'GIT_CONFIG_NOSYSTEM' not in os.environ:
+            read_config('/etc/gitconfig', config)
+        xdg_config_home = os.getenv('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+        read_config(os.path.join(xdg_config_home, 'git', 'config'), config)
+        read_config(os.path.join(os.path.expanduser('~'), '.gitconfig'), config)
+        read_config(os.path.join(self.common_dir, 'config'), config)
+        if config.get(('extensions', None, 'worktreeconfig'), ['false'])[-1].lower() in ['true', 'yes', 'on', '1']:
+            read_config(os.path.join(self.git_dir, 'config.worktree'), config)
+        return config
+
+    def get_config(self, section, subsection, key, default=None):
+        values = self.config.get((section, subsection, key))
+        if not values:
+            return default
+        return values[-1]
+
+    def get_config_all(self, section, subsection, key):
+        return self.config.get((section, subsection, key), [])
+
+    # refs
+
+    def read_loose_ref(self, ref):
+        directory = self.git_dir if per_worktree_ref_re.match(ref) else self.common_dir
+        try:
+            with open(os.path.join(directory, ref)) as f:
+                return f.read().strip()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return None
+
+    def read_packed_refs(self):
+        refs = {}
+        try:
+            with open(os.path.join(self.common_dir, 'packed-refs')) as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if not line or line[0] in '#^':
+                        continue
+                    object_id, _, ref = line.partition(' ')
+                    refs[ref] = object_id
+        except FileNotFoundError:
+            pass
+        return refs
+
+    def read_ref(self, ref, packed_refs=None):
+        """Return the raw content of `ref`: an object id or `ref: <target>`, or None if it does not exist."""
+        value = self.read_loose_ref(ref)
+        if value is not None:
+            return value
+        if packed_refs is None:
+            packed_refs = self.read_packed_refs()
+        return packed_refs.get(ref)
+
+    def ref_exists(self, ref, packed_refs):
+        return self.read_ref(ref, packed_refs) is not None
+
+    def resolve_ref(self, ref):
+        """Follow symbolic refs: return (full ref name, object id or None if unborn)."""
+        packed_refs = self.read_packed_refs()
+        for _ in range(5):
+            value = self.read_ref(ref, packed_refs)
+            if value is None:
+                return ref, None
+            if value.startswith('ref: '):
+                ref = value[len('ref: '):]
+                continue
+            if not object_id_re.match(value):
+                raise Unsupported()
+            return ref, value
+        raise Unsupported()
+
+    def shorten_ref(self, ref):
+        """Same as `git rev-parse --abbrev-ref`: the shortest unambiguous name."""
+        packed_refs = self.read_packed_refs()
+        for prefix in ['refs/heads/', 'refs/tags/', 'refs/remotes/']:
+            if ref.startswith(prefix):
+                short = ref[len(prefix):]
+                break
+        else:
+            raise Unsupported()
+        # the short name must not match a ref of a prior rev-parse rule
+        candidates = [short, 'refs/' + short, 'refs/tags/' + short, 'refs/heads/' + short]
+        for candidate in candidates:
+            if candidate == ref:
+                break
+            if os.path.exists(os.path.join(self.git_dir, candidate)) or self.ref_exists(candidate, packed_refs):
+                raise Unsupported()
+        return short
+
+    # objects
+
+    def read_loose_object(self, object_id):
+        """Return (type, content) of a loose object; packed objects are not supported."""
+        try:
+            with open(os.path.join(self.common_dir, 'objects', object_id[:2], object_id[2:]), 'rb') as f:
+                data = zlib.decompress(f.read())
+        except (FileNotFoundError, zlib.error):
+            raise Unsupported()
+        header, _, content = data.partition(b'\0')
+        object_type, _, _ = header.partition(b' ')
+        return object_type.decode(), content
+
+    # public API
+
+    def get_head_branch(self):
+        """Same as `git rev-parse --abbrev-ref HEAD`."""
+        ref, object_id = self.resolve_ref('HEAD')
+        if object_id is None:
+            # unborn branch: git fails
+            raise Unsupported()
+        if ref == 'HEAD':
+            # detached
+            return 'HEAD'
+        return self.shorten_ref(ref)
+
+    def get_commit_id(self):
+        """Same as `git rev-parse HEAD`."""
+        _, object_id = self.resolve_ref('HEAD')
+        if object_id is None:
+            raise Unsupported()
+        return object_id
+
+    def get_tree_id(self):
+        """Same as `git rev-parse HEAD^{tree}`."""
+        object_type, content = self.read_loose_object(self.get_commit_id())
+        if object_type != 'commit' or not content.startswith(b'tree '):
+            raise Unsupported()
+        tree_id = content[len(b'tree '):content.index(b'\n')].decode()
+        if not object_id_re.match(tree_id):
+            raise Unsupported()
+        return tree_id
+
+    def get_index_path(self):
+        """Same as `git rev-parse --git-path index`, absolute."""
+        return os.path.join(self.git_dir, 'index')
+
+    def get_upstream_branch(self, branch):
+        """Same as `git rev-parse --abbrev-ref --symbolic-full-name <branch>@{upstream}`, None if there is no upstream."""
+        if branch == 'HEAD':
+            ref, _ = self.resolve_ref('HEAD')
+            if ref == 'HEAD':
+                # detached: no upstream
+                return None
+            if not ref.startswith('refs/heads/'):
+                raise Unsupported()
+            branch = ref[len('refs/heads/'):]
+        remote = self.get_config('branch', branch, 'remote')
+        merges = self.get_config_all('branch', branch, 'merge')
+        if remote is None or not merges:
+            return None
+        if len(merges) != 1:
+            raise Unsupported()
+        merge = merges[0]
+        if remote == '.':
+            tracking_ref = merge
+        else:
+            fetch_refspecs = self.get_config_all('remote', remote, 'fetch')
+            if not fetch_refspecs:
+                raise Unsupported()
+            tracking_ref = None
+            for refspec in fetch_refspecs:
+                refspec = refspec.lstrip('+')
+                if refspec.startswith('^') or ':' not in refspec:
+                    raise Unsupported()
+                src, dst = refspec.split(':', 1)
+                if '*' in src:
+                    prefix, suffix = src.split('*', 1)
+                    if merge.startswith(prefix) and merge.endswith(suffix) and len(merge) >= len(prefix) + len(suffix):
+                        tracking_ref = dst.replace('*', merge[len(prefix):len(merge) - len(suffix)], 1)
+                        break
+                elif src == merge:
+                    tracking_ref = dst
+                    break
+            if tracking_ref is None:
+                raise Unsupported()
+        _, object_id = self.resolve_ref(tracking_ref)
+        if object_id is None:
+            raise Unsupported()
+        return self.shorten_ref(tracking_ref)
+
+    def get_remote_url(self, remote):
+        """Same as `git config --get remote.<remote>.url`, empty string if unset."""
+        return self.get_config('remote', remote, 'url', '')
+
+###############################################################################
+
+repositories = {}
+
+def get_repository(path):
+    path = os.path.realpath(path)
+    if path not in repositories:
+        try:
+            repositories[path] = GitRepository.discover(path)
+        except Unsupported:
+            repositories[path] = None
+    repository = repositories[path]
+    if repository is None:
+        raise Unsupported()
+    return repository
+
+def get_toplevel(path):
+    try:
+        return get_repository(path).toplevel
+    except Unsupported:
+        return common.run_shell_command('git -C %s rev-parse --show-toplevel' % (path))
+
+def get_head_branch(path='.'):
+    try:
+        return get_repository(path).get_head_branch()
+    except Unsupported:
+        return common.run_shell_command('git -C %s rev-parse --abbrev-ref HEAD' % (path))
+
+def get_commit_id(path='.'):
+    try:
+        return get_repository(path).get_commit_id()
+    except Unsupported:
+        return common.run_shell_command('git -C %s rev-parse HEAD' % (path))
+
+def get_tree_id(path='.'):
+    try:
+        return get_repository(path).get_tree_id()
+    except Unsupported:
+        return common.run_shell_command('git -C %s rev-parse HEAD^{tree}' % (path))
+
+def get_index_path(path='.'):
+    try:
+        return get_repository(path).get_index_path()
+    except Unsupported:
+        return os.path.join(path, common.run_shell_command('git -C %s rev-parse --git-path index' % (path)))
+
+def get_upstream_branch(branch, path='.'):
+    try:
+        return get_repository(path).get_upstream_branch(branch)
+    except Unsupported:
+        try:
+            return common.run_shell_command('git -C {} rev-parse --abbrev-ref --symbolic-full-name {}@{{upstream}}'.format(path, branch), raise_on_return_code=True)
+        except common.ShellError:
+            return None
+
+def get_remote_url(remote, path='.'):
+    try:
+        return get_repository(path).get_remote_url(remote)
+    except Unsupported:
+        return common.run_shell_command('git -C %s config --get remote.%s.url' % (path, remote), ignore_error=True)
@@ -0,0 +1,42 @@
+# Index of the changed files for change detection (see core.look_for_changed_directories).
+#
+# Paths are relative to the repository root ('' or '.' for the root), and matched by component:
+# `app` is not a prefix of `app2`. Building the index is linear in the total length of the paths,
+# and answering "has this file, or anything under this directory, changed" is linear in the length of the queried path,
+# whatever the size of the diff.
+
+
+def split_path(path):
+    """Return the components of `path`, without the empty and `.` ones."""
+    return [component for component in path.split('/') if component and component != '.']
+
+
+class PathTrie(object):
+    """Set of paths (files or directories) stored as a tree of their components: {component: sub-tree}."""
+
+    def __init__(self, paths=()):
+        # None: no path at all, not even the root
+        self.root = None
+        for path in paths:
+            self.add(path)
+
+    def add(self, path):
+        if self.root is None:
+            self.root = {}
+        node = self.root
+        for component in split_path(path):
+            child = node.get(component)
+            if child is None:
+                child = node[component] = {}
+            node = child
+
+    def has_changed(self, path):
+        """Return True if `path`, or a path under it, was added."""
+        node = self.root
+        if node is None:
+            return False
+        for component in split_path(path):
+            node = node.get(component)
+            if node is None:
+                return False
+        return True
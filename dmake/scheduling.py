@@ -0,0 +1,90 @@
+import heapq
+
+# Makespan simulation of the parallel execution plans (see core.make), to compare the scheduling modes on synthetic DAGs:
+# - by height: nodes grouped by height, each height is a `stage` with a `parallel` step: a barrier for the next height,
+# - by dependencies (DMAKE_PARALLEL_EXECUTION_DAG): each node starts as soon as its own children are done.
+# Both are bounded by `workers` parallel builders (the PARALLEL_BUILDERS lock, None: unbounded), and start the
+# ready nodes in plan order (list scheduling), or by decreasing `priorities` (e.g. get_critical_paths).
+# DAGs are given as `children`: a list of children indices by node, with children before their parents.
+
+
+def get_heights(children):
+    heights = []
+    for node_children in children:
+        heights.append(1 + max((heights[child] for child in node_children), default=-1))
+    return heights
+
+
+def get_critical_paths(children, durations):
+    """Return the longest remaining duration by node: its duration plus the longest one of its parents."""
+    remaining = [0.0] * len(children)
+    for i in range(len(children) - 1, -1, -1):
+        remaining[i] += durations[i]
+        for child in children[i]:
+            remaining[child] = max(remaining[child], remaining[i])
+    return remaining
+
+
+def simulate_dag(children, durations, workers=None, priorities=None):
+    """Return the makespan when each node starts as soon as its children are done and a worker is free."""
+    count = len(children)
+    if priorities is None:
+        priorities = [0] * count
+    if workers is None:
+        workers = max(1, count)
+    parents = [[] for _ in children]
+    pending_children = []
+    for i, node_children in enumerate(children):
+        pending_children.append(len(node_children))
+        for child in node_children:
+            parents[child].append(i)
+
+    ready = [(-priorities[i], i) for i in range(count) if pending_children[i] == 0]
+    heapq.heapify(ready)
+    running = []
+    now = 0.0
+    free = workers
+    while ready or running:
+        while ready and free > 0:
+            _, i = heapq.heappop(ready)
+            heapq.heappush(running, (now + durations[i], i))
+            free -= 1
+        now, i = heapq.heappop(running)
+        free += 1
+        for parent in parents[i]:
+            pending_children[parent] -= 1
+            if pending_children[parent] == 0:
+                heapq.heappush(ready, (-priorities[parent], parent))
+    return now
+
+
+def simulate_heights(children, durations, workers=None, priorities=None):
+    """Return the makespan when the nodes are run height by height, with a barrier between heights."""
+    if priorities is None:
+        priorities = [0] * len(children)
+    by_height = {}
+    for i, height in enumerate(get_heights(children)):
+        by_height.setdefault(height, []).append(i)
+    makespan = 0.0
+    for height in sorted(by_height):
+        # no dependency inside a height
+        nodes = by_height[height]
+        makespan += simulate_dag([[] for _ in nodes], [durations[i] for i in nodes], workers, [priorities[i] for i in nodes])
+    return makespan
+
+
+def random_dag(rng, count, max_children=3, slow_probability=0.1):
+    """
+    Return (children, durations) of a random DAG of `count` nodes, shaped like dmake plans: few dependencies per node,
+    mostly short nodes and some slow ones (e.g. base images and big builds).
+    """
+    children = []
+    durations = []
+    for i in range(count):
+        candidates = range(max(0, i - 4 * max_children), i)
+        children.append(sorted(rng.sample(candidates, rng.randint(0, min(max_children, len(candidates))))))
+        if rng.random() < slow_probability:
+            durations.append(rng.uniform(10, 30))
+        else:
+            durations.append(rng.uniform(0.5, 3))
+    return children, durations
@@ -1,5 +1,5 @@
 from abc import ABC, ABCMeta
-import os, sys
+import os
 import copy
 from collections import OrderedDict
 from numbers import Number
@@ -8,18 +8,33 @@ import dmake.common as common
 
 
 class MetaSerializerMixin(ABCMeta):
-    """Used to keep track of the order of the fields in order to generate a proper doc."""
+    """
+    Used to keep track of the order of the fields in order to generate a proper doc,
+    and to compile the schema: the fields declared as class attributes are moved to `__schema__`,
+    and their validated values are stored in slots of the same name (see YAML2PipelineSerializer).
+    """
     @classmethod
     def __prepare__(metacls, name, bases, **kwargs):
         return OrderedDict()
 
     def __new__(cls, name, bases, namespace, **kwargs):
-        result = ABCMeta.__new__(cls, name, bases, dict(namespace))
         ns = []
+        schema = OrderedDict()
         for b in bases:
             if isinstance(b, MetaSerializerMixin):
                 ns += b.__fields_order__
+                schema.update(getattr(b, '__schema__', {}))
+        attributes = dict(namespace)
+        fields = [k for k, v in namespace.items() if not k.startswith('_') and is_schema_field(v)]
+        if fields:
+            inherited_slots = set(schema)
+            schema.update((k, attributes.pop(k)) for k in fields)
+            attributes['__slots__'] = tuple(k for k in fields if k not in inherited_slots)
+            schema = OrderedDict((k, schema[k]) for k in tuple(ns) + tuple(namespace) if k in schema)
+        result = ABCMeta.__new__(cls, name, bases, attributes)
         result.__fields_order__ = tuple(ns) + tuple(namespace)
+        if fields or '__schema__' in namespace:
+            result.__schema__ = schema
         return result
 
 class SerializerMixin(ABC, metaclass=MetaSerializerMixin):
@@ -54,6 +69,25 @@ class SerializerType(object):
             str_ += " (deprecated)"
         return str_
 
+# post_validation functions: module level functions so that validated objects can be pickled (see dmake.files_cache)
+def identity(value):
+    return value
+
+def to_list(value):
+    # for fields accepting either a single string or an array of strings
+    return [value] if isinstance(value, str) else value
+
+# The filesystem state the validation of path fields depends on
+def get_path_status(path):
+    if os.path.isfile(path):
+        return 'executable file' if os.access(path, os.X_OK) else 'file'
+    if os.path.isdir(path):
+        return 'dir'
+    return None
+
+# When set to a list, `(path, status)` is appended for each path checked during validation (see dmake.files_cache)
+recorded_path_statuses = None
+
 # Serializers
 class FieldSerializer(object):
 
@@ -64,7 +98,7 @@ class FieldSerializer(object):
             allow_null=False,
             blank=False,
             child=None,
-            post_validation=lambda x: x,
+            post_validation=identity,
             child_path_only=False,        # if True, return path relative to dmake.yml file, else return path relative to repo root
             check_path=True,
             executable=False,
@@ -103,7 +137,6 @@ class FieldSerializer(object):
         self.migration = migration
 
         self.child = child
-        self.value = None
 
     def _validate_(self, file, needed_migrations, data, field_name):
         if data is None and not self.allow_null:
@@ -122,7 +155,7 @@ class FieldSerializer(object):
             for t in self.data_type:
                 if isinstance(t, YAML2PipelineSerializer) or isinstance(t, FieldSerializer):
                     try:
-                        validated_data = t._validate_(file, needed_migrations=needed_migrations, data=data, field_name=field_name)
+                        validated_data = validate(t, file, needed_migrations=needed_migrations, data=data, field_name=field_name)
                         ok = True
                         break
                     except ValidationError as e:
@@ -145,11 +178,7 @@ class FieldSerializer(object):
                     raise ValidationError(err[0])
                 else:
                     raise ValidationError("The error is one of the followings:\n- " + ("\n- ".join(err)))
-        self.value = self.post_validation(validated_data)
-        return self.value
-
-    def _value_(self):
-        return self.value
+        return self.post_validation(validated_data)
 
     def _default_(self):
         if self.default is None:
@@ -215,16 +244,19 @@ class FieldSerializer(object):
                 # then we are outside of the allowed scope (defined by `child_path_only`)
                 raise WrongType("Trying to access a parent directory is forbidden: '%s' ('%s')" % (data, original_data))
             if self.check_path:
+                status = get_path_status(full_path)
+                if recorded_path_statuses is not None:
+                    recorded_path_statuses.append((full_path, status))
                 if data_type == "path":
-                    if not (os.path.isfile(full_path) or os.path.isdir(full_path)):
+                    if status is None:
                         raise WrongType("Could not find file or directory: '%s' ('%s')" % (data, original_data))
                 elif data_type == "file":
-                    if not os.path.isfile(full_path):
+                    if status not in ['file', 'executable file']:
                         raise WrongType("Could not find file: '%s' ('%s')" % (data, original_data))
-                    if self.executable and not os.access(full_path, os.X_OK):
+                    if self.executable and status != 'executable file':
                         raise WrongType("The file must be executable: '%s' ('%s')" % (data, original_data))
                 elif data_type == "dir":
-                    if not os.path.isdir(full_path):
+                    if status != 'dir':
                         raise WrongType("Could not find directory: '%s' ('%s')" % (data, original_data))
             return data
         elif data_type == "array":
@@ -232,30 +264,21 @@ class FieldSerializer(object):
                 raise WrongType("Expecting array")
             valid_data = []
             for d in data:
-                child = copy.deepcopy(self.child)
-                valid_data.append(child._validate_(file, needed_migrations=needed_migrations, data=d, field_name=field_name))
+                valid_data.append(validate(self.child, file, needed_migrations=needed_migrations, data=d, field_name=field_name))
             return valid_data
         elif data_type == "dict":
             if not isinstance(data, dict):
                 raise WrongType("Expecting dict")
             valid_data = {}
             for k, d in data.items():
-                child = copy.deepcopy(self.child)
                 try:
-                    valid_data[k] = child._validate_(file, needed_migrations=needed_migrations, data=d, field_name=field_name)
+                    valid_data[k] = validate(self.child, file, needed_migrations=needed_migrations, data=d, field_name=field_name)
                 except ValidationError as e:
                     raise ValidationError("Error with field '%s': %s" % (k, str(e)))
             return valid_data
         else:
             raise DMakeException("Unkown data type: %s" % data_type)
 
-    def _serialize_(self, *args, **kwargs):
-        if isinstance(self.value, list):
-            for f in self.value:
-                f._serialize_(*args, **kwargs)
-        else:
-            raise DMakeException("Do not known how to serialize non array field")
-
     def get_type_name(self, obj, padding, is_plural = False):
         if isinstance(obj, FieldSerializer) and len(obj.data_type) == 1:
             return obj.get_type_name(obj.data_type[0], padding, is_plural)
@@ -340,10 +363,11 @@ class FieldSerializer(object):
         return infos, help_text, doc_string
 
     def generate_example(self):
+        # copies: the schema is shared
         if self.example is not None:
-            return self.example
+            return copy.deepcopy(self.example)
         elif self.default:
-            return self.default
+            return copy.deepcopy(self.default)
 
         value = None
         for t in self.data_type:
@@ -369,25 +393,56 @@ class FieldSerializer(object):
                     raise DMakeException("Unknown type: %s" % str(t))
         return value
 
+def is_schema_field(value):
+    return isinstance(value, FieldSerializer) or isinstance(value, SerializerMixin)
+
+def validate(schema, file, needed_migrations, data, field_name):
+    """Validate `data` against `schema`, a FieldSerializer or a YAML2PipelineSerializer, and return the validated value."""
+    if isinstance(schema, YAML2PipelineSerializer):
+        # validate into a new object: the schema is never modified
+        schema = schema._make_instance_()
+    return schema._validate_(file, needed_migrations=needed_migrations, data=data, field_name=field_name)
+
 class YAML2PipelineSerializer(SerializerMixin):
+    """
+    The class attributes (FieldSerializer or YAML2PipelineSerializer objects) declare the schema:
+    it is compiled once per class in `__schema__` and never modified by the validation.
+    Objects only store their validated values, in slots named after the fields: reading a field is a plain
+    attribute access. Validating a nested serializer field, or an array/dict element, creates a new object
+    with `_make_instance_`.
+    The fields are read-only: the validation sets them, `_set_field_` replaces them afterwards.
+    """
+    __slots__ = ('__optional__', '__help_text__', '__has_value__')
+    __schema__ = OrderedDict()
+
     def __init__(self, optional = False, help_text = ""):
         self.__optional__  = optional
         self.__help_text__ = help_text
         self.__has_value__ = False
 
-        if sys.version_info >= (3,0):
-            fields_list = self.__fields_order__
-        else:
-            fields_list = dir(self)
-
-        fields = OrderedDict()
-        for k in fields_list:
-            if k.startswith('_'):
-                continue
-            v = getattr(self, k)
-            if isinstance(v, FieldSerializer) or isinstance(v, YAML2PipelineSerializer):
-                fields[k] = copy.deepcopy(v)
-        self.__fields__ = fields
+    def _customize_field_(self, name, **attributes):
+        """Change the schema of field `name` for this object (and the objects validated with it as schema) only."""
+        field = copy.copy(self.__schema__[name])
+        for key, value in attributes.items():
+            setattr(field, key, value)
+        schema = OrderedDict(self.__schema__)
+        schema[name] = field
+        self.__schema__ = schema
+
+    def _make_instance_(self):
+        instance = object.__new__(type(self))
+        attributes = self.__dict__
+        if attributes:
+            instance.__dict__.update(attributes)
+        instance.__optional__ = self.__optional__
+        instance.__help_text__ = self.__help_text__
+        instance.__has_value__ = False
+        return instance
+
+    def _set_field_(self, name, value):
+        """Replace the value of field `name`, e.g. to normalize it after validation, or to resolve a reference to another file."""
+        assert name in self.__schema__, "Unknown field '%s'" % name
+        object.__setattr__(self, name, value)
 
     def _validate_(self, file, needed_migrations, data, field_name=''):
         if data is None:
@@ -396,38 +451,72 @@ class YAML2PipelineSerializer(SerializerMixin):
             data = {}
         if not isinstance(data, dict):
             raise WrongType("Expecting dict, got {}".format(type(data).__name__))
-        for name, serializer in self.__fields__.items():
+        set_field = object.__setattr__
+        for name, serializer in self.__schema__.items():
             try:
-                serializer._validate_(file,
-                                      needed_migrations=needed_migrations,
-                                      data=data[name] if name in data else None,
-                                      field_name=field_name + ':' + name if field_name else name)
+                sub_field_name = field_name + ':' + name if field_name else name
+                sub_data = data[name] if name in data else None
+                if isinstance(serializer, YAML2PipelineSerializer):
+                    # the field is the object, validated or not
+                    value = serializer._make_instance_()
+                    set_field(self, name, value)
+                    value._validate_(file, needed_migrations=needed_migrations, data=sub_data, field_name=sub_field_name)
+                else:
+                    set_field(self, name, serializer._validate_(file, needed_migrations=needed_migrations, data=sub_data, field_name=sub_field_name))
             except ValidationError as e:
                 raise ValidationError("Error with field '%s': %s" % (name, str(e)))
         for key in data:
             if not isinstance(key, str):
                 raise ValidationError("Expected a field name, got: '%s'" % str(key))
-            if key not in self.__fields__:
+            if key not in self.__schema__:
                 raise ValidationError("Unexpected field '%s'" % key)
         self.__has_value__ = True
         return self
 
-    def __getattribute__(self, key):
-        try:
-            fields = object.__getattribute__(self, '__fields__')
-        except AttributeError:
-            return object.__getattribute__(self, key)
-        has_data = object.__getattribute__(self, '__has_value__')
-        if key in fields:
-            if isinstance(fields[key], FieldSerializer):
-                if has_data:
-                    return fields[key]._value_()
-                else:
-                    raise Exception("No data has been validated yet, cannot access field '%s'" % key)
-            else:
-                return fields[key]
-        else:
-            return object.__getattribute__(self, key)
+    def _replay_(self, file):
+        """
+        Called on objects validated by a previous run (see dmake.files_cache), in the same order as `_validate_`:
+        override it to redo the validation side effects that are not kept in the object itself
+        (global registries, values depending on the process environment).
+        """
+        def replay_value(value):
+            if isinstance(value, YAML2PipelineSerializer):
+                if value.has_value():
+                    value._replay_(file)
+            elif isinstance(value, list):
+                for v in value:
+                    replay_value(v)
+            elif isinstance(value, dict):
+                for v in value.values():
+                    replay_value(v)
+
+        for name in self.__schema__:
+            replay_value(getattr(self, name, None))
+
+    def __getattr__(self, key):
+        # only called for unset fields (and unknown attributes): validated fields are read from their slot
+        field = type(self).__schema__.get(key)
+        if field is None:
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, key))
+        if isinstance(field, FieldSerializer):
+            # AttributeError: unset slots are skipped by copy and pickle
+            raise AttributeError("No data has been validated yet, cannot access field '%s'" % key)
+        value = self.__schema__[key]._make_instance_()
+        object.__setattr__(self, key, value)
+        return value
+
+    def __setattr__(self, key, value):
+        if key in type(self).__schema__:
+            raise AttributeError("Field '%s' is read-only, use _set_field_ to replace it" % key)
+        object.__setattr__(self, key, value)
+
+    def __setstate__(self, state):
+        # default `__getstate__` of objects with slots: (__dict__, slots values); unpickled with the fields setter
+        attributes, slots = state if isinstance(state, tuple) else (state, None)
+        if attributes:
+            self.__dict__.update(attributes)
+        for key, value in (slots or {}).items():
+            object.__setattr__(self, key, value)
 
     def has_value(self):
         return self.__has_value__
@@ -436,13 +525,13 @@ class YAML2PipelineSerializer(SerializerMixin):
         if not self.__has_value__:
             return None
         value = {}
-        for k, v in self.__fields__.items():
-            value[k] = v._value_()
+        for k, v in self.__schema__.items():
+            value[k] = getattr(self, k)._value_() if isinstance(v, YAML2PipelineSerializer) else getattr(self, k)
         return value
 
     def default_value(self):
         value = {}
-        for k, v in self.__fields__.items():
+        for k, v in self.__schema__.items():
             try:
                 value[k] = v._default_()
             except ValidationError as e:
@@ -452,7 +541,7 @@ class YAML2PipelineSerializer(SerializerMixin):
     # Returns a tuple (infos, help_text, doc_string)
     def generate_doc(self, padding = 0):
         lines = []
-        for key, field in self.__fields__.items():
+        for key, field in self.__schema__.items():
             infos, help_text, doc_string = field.generate_doc(padding + 4)
 
             infos = ', '.join(infos)
@@ -477,7 +566,7 @@ class YAML2PipelineSerializer(SerializerMixin):
 
     def generate_example(self):
         ex = OrderedDict()
-        for key, field in self.__fields__.items():
+        for key, field in self.__schema__.items():
             value = field.generate_example()
             if value == "":
                 continue
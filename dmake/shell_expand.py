@@ -0,0 +1,196 @@
+import os
+import re
+
+import dmake.common as common
+
+# Pure-python equivalent of `bash -c 'echo "<value>"'` (see common.eval_str_in_env)
+# for the subset of parameter expansion dmake files actually use.
+# Anything outside that subset raises NeedsShell so the caller can fall back to bash.
+
+class NeedsShell(Exception):
+    pass
+
+name_re = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Variables bash sets or rewrites by itself: their value is not the one from the environment
+bash_managed_variables = set([
+    'PWD', 'OLDPWD', 'SHLVL', 'PPID', 'UID', 'EUID', 'GROUPS', 'IFS',
+    'PS1', 'PS2', 'PS3', 'PS4', 'OPTIND', 'OPTERR', 'OPTARG', 'REPLY', 'MAPFILE',
+    'SECONDS', 'RANDOM', 'SRANDOM', 'LINENO', 'EPOCHSECONDS', 'EPOCHREALTIME',
+    'DIRSTACK', 'FUNCNAME', 'PIPESTATUS', 'HISTCMD', 'HISTFILE', 'HISTSIZE', 'HISTFILESIZE',
+    'SHELLOPTS', 'POSIXLY_CORRECT', 'MAILCHECK', 'COLUMNS', 'LINES', 'TMOUT',
+    'HOSTNAME', 'HOSTTYPE', 'OSTYPE', 'MACHTYPE', 'COPROC', 'CHILD_MAX', 'GLOBSORT', '_'])
+bash_managed_prefixes = ('BASH', 'COMP_', 'READLINE_')
+# Variables bash only sets when they are missing from the environment
+bash_default_variables = set(['PATH', 'HOME', 'SHELL', 'TERM'])
+
+special_parameters = '0123456789@*#?-$!'
+# echo considers a single argument made of these flags as options, not text
+echo_option_re = re.compile(r'-[neE]+\Z')
+
+
+class Expander(object):
+    def __init__(self, env, strict, environ):
+        self.env = env
+        self.environ = environ
+        self.strict = strict
+        # variables assigned with ${VAR:=word}
+        self.assigned = {}
+
+    def lookup(self, name):
+        if name in bash_managed_variables or name.startswith(bash_managed_prefixes):
+            raise NeedsShell()
+        if name in self.assigned:
+            return self.assigned[name]
+        if name == 'DMAKE_DEBUG':
+            # popped from the environment by common.run_shell_command
+            value = None
+        elif name in self.env:
+            value = self.env[name]
+        else:
+            value = self.environ.get(name)
+        if value is None:
+            if name in bash_default_variables:
+                raise NeedsShell()
+            return None
+        if not isinstance(value, str):
+            raise NeedsShell()
+        return value
+
+    def unset_error(self, name, message):
+        raise common.ShellError("bash: line 1: %s: %s\n" % (name, message))
+
+    def expand(self, s):
+        # `s` is the content of a double quoted bash string
+        result = []
+        i = 0
+        n = len(s)
+        while i < n:
+            c = s[i]
+            if c == '\\':
+                if i + 1 == n:
+                    # escapes the closing quote: syntax error
+                    raise NeedsShell()
+                nc = s[i + 1]
+                if nc == '\n':
+                    pass
+                elif nc in '$`"\\':
+                    result.append(nc)
+                else:
+                    result.append('\\' + nc)
+                i += 2
+            elif c == '"' or c == '`':
+                # end of quoted string or command substitution
+                raise NeedsShell()
+            elif c == '$':
+                value, i = self.expand_dollar(s, i + 1)
+                result.append(value)
+            else:
+                result.append(c)
+                i += 1
+        return ''.join(result)
+
+    def expand_dollar(self, s, i):
+        if i == len(s):
+            return '$', i
+        c = s[i]
+        if c == '{':
+            return self.expand_braces(s, i + 1)
+        if c in '([' or c in special_parameters:
+            raise NeedsShell()
+        m = name_re.match(s, i)
+        if m is None:
+            return '$', i
+        name = m.group(0)
+        value = self.lookup(name)
+        if value is None:
+            if self.strict:
+                self.unset_error(name, 'unbound variable')
+            value = ''
+        return value, m.end()
+
+    def expand_braces(self, s, i):
+        m = name_re.match(s, i)
+        if m is None:
+            # ${#VAR}, ${!VAR}, ${1}, ...
+            raise NeedsShell()
+        name = m.group(0)
+        i = m.end()
+        if s.startswith('}', i):
+            value = self.lookup(name)
+            if value is None:
+                if self.strict:
+                    self.unset_error(name, 'unbound variable')
+                value = ''
+            return value, i + 1
+
+        check_null = s.startswith(':', i)
+        if check_null:
+            i += 1
+        if i == len(s) or s[i] not in '-=?+':
+            # substring, pattern removal/substitution, case modification, ...
+            raise NeedsShell()
+        operator = s[i]
+        word_start = i + 1
+        word_end = self.find_closing_brace(s, word_start)
+
+        value = self.lookup(name)
+        is_set = value is not None and (not check_null or len(value) > 0)
+        word = s[word_start:word_end]
+        if operator == '-':
+            if not is_set:
+                value = self.expand(word)
+        elif operator == '=':
+            if not is_set:
+                value = self.expand(word)
+                self.assigned[name] = value
+        elif operator == '?':
+            if not is_set:
+                message = self.expand(word)
+                if not message:
+                    message = 'parameter null or not set' if check_null else 'parameter not set'
+                self.unset_error(name, message)
+        elif operator == '+':
+            value = self.expand(word) if is_set else ''
+        return value, word_end + 1
+
+    def find_closing_brace(self, s, i):
+        depth = 0
+        n = len(s)
+        while i < n:
+            c = s[i]
+            if c in '\\"\'`':
+                # quoting inside the word follows rules we do not reimplement
+                raise NeedsShell()
+            if c == '$':
+                if s.startswith('${', i):
+                    depth += 1
+                    i += 2
+                    continue
+                if s.startswith('$(', i):
+                    raise NeedsShell()
+            elif c == '}':
+                if depth == 0:
+                    return i
+                depth -= 1
+            i += 1
+        # bad substitution
+        raise NeedsShell()
+
+
+def expand(value, env=None, strict=False, environ=None):
+    """
+    Return the output of `echo "<value>"` run by bash with `env` added to the
+    environment (`os.environ` by default), stripped like common.run_shell_command does.
+    Raise NeedsShell when bash is needed to get the exact same result.
+    """
+    if env is None:
+        env = {}
+    if environ is None:
+        environ = os.environ
+    # same quoting as common.wrap_cmd
+    quoted = value.replace('"', '\\"')
+    result = Expander(env, strict, environ).expand(quoted)
+    if echo_option_re.match(result):
+        return ''
+    return result.strip()
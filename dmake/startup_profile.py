@@ -0,0 +1,60 @@
+import atexit
+import builtins
+import sys
+import time
+
+# Startup profile, enabled with DMAKE_PROFILE_IMPORTS=1: report on stderr at exit
+# the time spent importing each module (first import only) and in each timed step (init, command, ...).
+
+original_import = builtins.__import__
+imports = {}  # module name -> [cumulative seconds, self seconds]
+steps = []  # (label, seconds)
+import_stack = []
+start_time = None
+
+
+def profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level != 0 or name in sys.modules:
+        return original_import(name, globals, locals, fromlist, level)
+    frame = [name, 0.0]  # name, time spent in nested imports
+    import_stack.append(frame)
+    start = time.perf_counter()
+    try:
+        return original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - start
+        import_stack.pop()
+        if import_stack:
+            import_stack[-1][1] += elapsed
+        imports[name] = [elapsed, elapsed - frame[1]]
+
+
+class step(object):
+    def __init__(self, label):
+        self.label = label
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *args):
+        steps.append((self.label, time.perf_counter() - self.start))
+
+
+def start():
+    global start_time
+    start_time = time.perf_counter()
+    builtins.__import__ = profiled_import
+    atexit.register(report)
+
+
+def report(file=None, top=15):
+    builtins.__import__ = original_import
+    file = file or sys.stderr
+    total_imports = sum(self_time for _, self_time in imports.values())
+    print("DMake startup profile:", file=file)
+    print("  total: %.1f ms" % ((time.perf_counter() - start_time) * 1000), file=file)
+    print("  imports: %.1f ms (%d modules)" % (total_imports * 1000, len(imports)), file=file)
+    for name, (cumulative, self_time) in sorted(imports.items(), key=lambda item: -item[1][0])[:top]:
+        print("    %8.1f ms  %s (self: %.1f ms)" % (cumulative * 1000, name, self_time * 1000), file=file)
+    for label, elapsed in steps:
+        print("  %s: %.1f ms" % (label, elapsed * 1000), file=file)
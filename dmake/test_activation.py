@@ -0,0 +1,281 @@
+import argparse
+import random
+
+import pytest
+
+import dmake.common as common
+from dmake import core
+from dmake.common import DMakeException, SharedVolumeNotFoundException
+
+
+# the recursive implementation previously used by core.make, as reference
+
+def reference_activate_link(loaded_files, service_providers, service_dependencies, service):
+    file, _, _, _ = service_providers[service]
+    dmake = loaded_files[file]
+    s = dmake._get_service_(service)
+
+    children = []
+    for link in s.needed_links:
+        children += reference_activate_service(loaded_files, service_providers, service_dependencies, 'run_link', 'links/%s/%s' % (dmake.get_app_name(), link))
+
+    return children
+
+def reference_activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command, needed_for):
+    children = []
+    for service, service_customization in needs:
+        if service_customization is None or service_customization.needed_for.kind(needed_for):
+            children += reference_activate_service(loaded_files, service_providers, service_dependencies, command, service, service_customization)
+    return children
+
+def reference_activate_service(loaded_files, service_providers, service_dependencies, command, service, service_customization=None):
+    if command != 'run':
+        assert service_customization == None
+    node = (command, service, service_customization)
+    if command == 'test' and common.skip_tests:
+        return []
+
+    if node not in service_dependencies:
+        if service not in service_providers:
+            raise DMakeException("Cannot find service: %s" % service)
+        file, needs, base_variant, trigger_test_parents = service_providers[service]
+        children = []
+        if command == 'shell':
+            children += core.activate_service_shared_volumes(loaded_files, service_providers, service)
+            if common.options.with_dependencies and needs is not None:
+                children += reference_activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command='run', needed_for='run')
+            if common.options.with_dependencies:
+                children += reference_activate_link(loaded_files, service_providers, service_dependencies, service)
+            children += core.activate_base(base_variant)
+        elif command == 'test':
+            children += core.activate_service_shared_volumes(loaded_files, service_providers, service)
+            if common.options.with_dependencies and needs is not None:
+                children += reference_activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command='run', needed_for='test')
+            children += reference_activate_service(loaded_files, service_providers, service_dependencies, 'build_docker', service)
+            if common.options.with_dependencies:
+                children += reference_activate_link(loaded_files, service_providers, service_dependencies, service)
+        elif command == 'build_docker':
+            children += core.activate_base(base_variant)
+        elif command == 'run':
+            children += core.activate_service_shared_volumes(loaded_files, service_providers, service)
+            if common.command in ['test', 'deploy']:
+                if not common.change_detection:
+                    children += reference_activate_service(loaded_files, service_providers, service_dependencies, 'test', service)
+            children += reference_activate_service(loaded_files, service_providers, service_dependencies, 'build_docker', service)
+            if common.options.with_dependencies and needs is not None:
+                children += reference_activate_needed_services(loaded_files, service_providers, service_dependencies, needs, command='run', needed_for='run')
+            if common.options.with_dependencies:
+                children += reference_activate_link(loaded_files, service_providers, service_dependencies, service)
+        elif command == 'run_link':
+            children += core.activate_link_shared_volumes(loaded_files, service_providers, service)
+        elif command == 'deploy':
+            children += reference_activate_service(loaded_files, service_providers, service_dependencies, 'build_docker', service)
+            children += reference_activate_service(loaded_files, service_providers, service_dependencies, 'test', service)
+            if common.options.with_dependencies and needs is not None:
+                uncustomized_needs = [(child_service, None) for child_service, child_service_customization in needs]
+                children += reference_activate_needed_services(loaded_files, service_providers, service_dependencies, uncustomized_needs, command='deploy', needed_for='fake__not_used')
+        else:
+            raise Exception("Unknown command '%s'" % command)
+
+        service_dependencies[node] = children
+
+        if command == 'test':
+            if common.options.with_dependencies and common.change_detection:
+                for parent_service in trigger_test_parents:
+                    parent_node = reference_activate_service(loaded_files, service_providers, service_dependencies, 'test', parent_service)[0]
+                    if node not in service_dependencies[parent_node]:
+                        service_dependencies[parent_node].append(node)
+
+    return [node]
+
+
+# random repositories, with the parts of the dmake files objects used by the activation
+
+class NeededFor(object):
+    def __init__(self, kinds):
+        self.kinds = kinds
+
+    def kind(self, kind):
+        return kind in self.kinds
+
+class ServiceCustomization(object):
+    def __init__(self, kinds):
+        self.needed_for = NeededFor(kinds)
+
+    def get_service_name_unique_suffix(self):
+        return '--%x' % id(self)
+
+class SharedVolume(object):
+    def __init__(self, name):
+        self.name = name
+
+    def get_service_name(self):
+        return 'shared_volumes/%s' % self.name
+
+class WithSharedVolumes(object):
+    def __init__(self, volumes):
+        self.volumes = volumes
+
+    def get_shared_volumes(self):
+        for volume in self.volumes:
+            if volume.name.startswith('missing'):
+                raise SharedVolumeNotFoundException(volume.name)
+        return self.volumes
+
+class Service(WithSharedVolumes):
+    def __init__(self, service_name, needed_links, volumes):
+        super(Service, self).__init__(volumes)
+        self.service_name = service_name
+        self.needed_links = needed_links
+
+class Link(WithSharedVolumes):
+    def __init__(self, link_name, volumes):
+        super(Link, self).__init__(volumes)
+        self.link_name = link_name
+
+class DMakeFile(object):
+    def __init__(self, app_name):
+        self.app_name = app_name
+        self.services = []
+        self.links = {}
+
+    def get_app_name(self):
+        return self.app_name
+
+    def get_services(self):
+        return self.services
+
+    def _get_service_(self, service):
+        for s in self.services:
+            if '%s/%s' % (self.app_name, s.service_name) == service:
+                return s
+        raise DMakeException("Could not find service '%s'" % service)
+
+    def get_docker_link(self, service):
+        return self.links[service.split('/')[2]]
+
+
+def make_repository(rng):
+    loaded_files = {}
+    service_providers = {}
+    service_dependencies = {}
+    services = []
+    kinds = [set(), {'run'}, {'test'}, {'run', 'test'}, {'run', 'test', 'trigger_test'}, {'test', 'trigger_test'}, {'trigger_test'}]
+    customizations = [ServiceCustomization(rng.choice(kinds)) for _ in range(8)]
+    for i in range(rng.randint(1, 3)):
+        app_name = 'app%d' % i
+        file = '%s/dmake.yml' % app_name
+        dmake_file = loaded_files[file] = DMakeFile(app_name)
+        volumes = [SharedVolume('%s-volume%d' % (app_name, j)) for j in range(rng.randint(0, 3))]
+        for volume in volumes:
+            core.add_service_provider(service_providers, volume.get_service_name(), file)
+            service_dependencies[('shared_volume', volume.get_service_name(), None)] = []
+        if rng.random() < 0.1:
+            volumes.append(SharedVolume('missing'))
+        for j in range(rng.randint(0, 3)):
+            link = Link('link%d' % j, rng.sample(volumes, min(len(volumes), rng.randint(0, 2))))
+            dmake_file.links[link.link_name] = link
+            core.add_service_provider(service_providers, 'links/%s/%s' % (app_name, link.link_name), file)
+        bases = ['base/%s/base%d' % (app_name, j) for j in range(rng.randint(0, 2))]
+        for base in bases:
+            core.add_service_provider(service_providers, base, file)
+            service_dependencies[('base', base, None)] = [('base', 'ubuntu:20.04', None)]
+        for j in range(rng.randint(1, 8)):
+            service = Service('service%d' % j, rng.sample(sorted(dmake_file.links), rng.randint(0, len(dmake_file.links))),
+                              rng.sample(volumes, min(len(volumes), rng.randint(0, 2))))
+            dmake_file.services.append(service)
+            services.append((file, '%s/%s' % (app_name, service.service_name), rng.choice(bases + [None])))
+    # needs only to services defined later: no circular dependencies
+    for i, (file, service, base_variant) in enumerate(services):
+        needs = []
+        for _ in range(rng.randint(0, 4)):
+            if i + 1 < len(services):
+                needs.append((rng.choice(services[i + 1:])[1], rng.choice(customizations)))
+        if rng.random() < 0.03:
+            needs.append(('unknown/service', rng.choice(customizations)))
+        core.add_service_provider(service_providers, service, file, needs if needs or rng.random() < 0.5 else None, base_variant)
+    return loaded_files, service_providers, service_dependencies, [service for _, service, _ in services]
+
+
+def activate(activate_service, activate_file, repository, activations):
+    loaded_files, service_providers, service_dependencies, _ = repository
+    service_dependencies = {node: list(children) for node, children in service_dependencies.items()}
+    core.activation_templates.clear()
+    results = []
+    try:
+        for command, target in activations:
+            if target.endswith('.yml'):
+                results.append(activate_file(loaded_files, service_providers, service_dependencies, command, target))
+            else:
+                results.append(activate_service(loaded_files, service_providers, service_dependencies, command, target))
+    except Exception as e:
+        # e.g. KeyError for a needed service only declared to trigger its parent tests
+        results.append(repr(e))
+    return results, list(service_dependencies.items())
+
+
+def reference_activate_file(loaded_files, service_providers, service_dependencies, command, file):
+    dmake_file = loaded_files[file]
+    nodes = []
+    for service in dmake_file.get_services():
+        nodes += reference_activate_service(loaded_files, service_providers, service_dependencies, command, "%s/%s" % (dmake_file.app_name, service.service_name))
+    return nodes
+
+
+def set_options(monkeypatch, command, with_dependencies=True, change_detection=False, skip_tests=False):
+    # set by common.init
+    monkeypatch.setattr(common, 'command', command, raising=False)
+    monkeypatch.setattr(common, 'options', argparse.Namespace(with_dependencies=with_dependencies), raising=False)
+    monkeypatch.setattr(common, 'change_detection', change_detection, raising=False)
+    monkeypatch.setattr(common, 'skip_tests', skip_tests, raising=False)
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_same_service_dependencies_as_reference(seed, monkeypatch):
+    rng = random.Random(seed)
+    repository = make_repository(rng)
+    dmake_command = rng.choice(['test', 'run', 'deploy', 'shell', 'build_docker'])
+    set_options(monkeypatch, dmake_command, with_dependencies=rng.random() < 0.8, change_detection=rng.random() < 0.5, skip_tests=rng.random() < 0.1)
+
+    services = repository[3]
+    files = sorted(repository[0])
+    activations = []
+    for _ in range(rng.randint(1, 5)):
+        if dmake_command != 'shell' and rng.random() < 0.3:
+            activations.append((dmake_command, rng.choice(files)))
+        else:
+            activations.append((dmake_command, rng.choice(services)))
+
+    expected = activate(reference_activate_service, reference_activate_file, repository, activations)
+    assert activate(core.activate_service, core.activate_file, repository, activations) == expected
+
+
+def test_circular_dependencies(monkeypatch):
+    set_options(monkeypatch, 'run')
+    core.activation_templates.clear()
+    loaded_files = {'app/dmake.yml': DMakeFile('app')}
+    service_providers = {}
+    customization = ServiceCustomization({'run'})
+    for name, needs in [('a', ['b']), ('b', ['c']), ('c', ['b'])]:
+        loaded_files['app/dmake.yml'].services.append(Service(name, [], []))
+        core.add_service_provider(service_providers, 'app/%s' % name, 'app/dmake.yml', [('app/%s' % need, customization) for need in needs])
+    with pytest.raises(DMakeException) as excinfo:
+        core.activate_service(loaded_files, service_providers, {}, 'run', 'app/a', customization)
+    suffix = customization.get_service_name_unique_suffix()
+    assert str(excinfo.value) == "Circular dependencies: run @ app/b{0} -> run @ app/c{0} -> run @ app/b{0}".format(suffix)
+
+
+def test_deep_needs_chain(monkeypatch):
+    set_options(monkeypatch, 'run')
+    core.activation_templates.clear()
+    count = 5000
+    dmake_file = DMakeFile('app')
+    service_providers = {}
+    customization = ServiceCustomization({'run'})
+    for i in range(count):
+        dmake_file.services.append(Service('s%d' % i, [], []))
+        needs = [('app/s%d' % (i + 1), customization)] if i + 1 < count else []
+        core.add_service_provider(service_providers, 'app/s%d' % i, 'app/dmake.yml', needs)
+    service_dependencies = {}
+    core.activate_service({'app/dmake.yml': dmake_file}, service_providers, service_dependencies, 'run', 'app/s0', customization)
+    assert len(service_dependencies) == 2 * count
@@ -0,0 +1,120 @@
+import pytest
+
+import dmake.bash_pool as bash_pool
+from dmake.common import ShellError, eval_str_in_env, eval_str_in_env_with_shell
+
+
+@pytest.fixture
+def workers():
+    bash_pool.close_workers()
+    yield bash_pool.workers
+    bash_pool.close_workers()
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / 'env.sh'
+    path.write_text('export FROM_SOURCE="sourced value"\nNOT_EXPORTED=hidden\nsourced_function() { echo "function output"; }\n')
+    return str(path)
+
+
+values = [
+    '$(echo command substitution)',
+    '`echo backticks`',
+    '$((1 + 2))',
+    '${FOO:-$(echo default)}',
+    '$(printf "a\\nb\\n\\n")',
+    '$(echo $FOO)-$BAR',
+    "$(echo 'single quotes' \"double quotes\")",
+    '$(echo stderr >&2)',
+    '$(exit 3)',
+    '$(false)after',
+    '$UNSET_VAR$(echo x)',
+    '$1$#',
+]
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('value', values)
+@pytest.mark.parametrize('env', [{}, {'FOO': 'foo', 'BAR': "it's"}])
+def test_worker_matches_bash(workers, value, env, strict):
+    try:
+        expected = eval_str_in_env_with_shell(value, env, strict=strict)
+    except ShellError:
+        with pytest.raises(ShellError):
+            bash_pool.eval_str(value, env, strict=strict)
+        return
+    assert bash_pool.eval_str(value, env, strict=strict) == expected
+
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('value', ['$FROM_SOURCE', '$NOT_EXPORTED', '$(sourced_function)', '$(env | grep -c FROM_SOURCE)'])
+def test_worker_source(workers, source_file, value, strict):
+    expected = eval_str_in_env_with_shell(value, strict=strict, source=source_file)
+    assert bash_pool.eval_str(value, {}, strict=strict, source=source_file) == expected
+
+
+def test_worker_source_errors(workers, tmp_path):
+    path = tmp_path / 'unbound.sh'
+    path.write_text('echo $UNSET_VAR\n')
+    with pytest.raises(ShellError):
+        eval_str_in_env_with_shell('$(echo x)', strict=True, source=str(path))
+    with pytest.raises(ShellError):
+        bash_pool.eval_str('$(echo x)', {}, strict=True, source=str(path))
+    with pytest.raises(ShellError):
+        bash_pool.eval_str('$(echo x)', {}, strict=False, source=str(tmp_path / 'missing.sh'))
+
+
+def test_worker_is_reused(workers, source_file):
+    bash_pool.eval_str('$(echo 1)', {})
+    bash_pool.eval_str('$(echo 2)', {'FOO': 'foo'})
+    bash_pool.eval_str('$(echo 3)', {}, strict=True)
+    bash_pool.eval_str('$(echo 4)', {}, source=source_file)
+    bash_pool.eval_str('$(echo 5)', {}, source=source_file)
+    assert sorted(workers.keys(), key=str) == sorted([(None, False), (None, True), (source_file, False)], key=str)
+    processes = [worker.process for worker in workers.values()]
+    bash_pool.close_workers()
+    assert all(p.returncode is not None for p in processes)
+
+
+def test_worker_does_not_leak_state(workers, monkeypatch):
+    assert bash_pool.eval_str('$(echo $FOO)', {'FOO': 'foo'}) == 'foo'
+    assert bash_pool.eval_str('$(echo $FOO)', {}) == ''
+    monkeypatch.setenv('DMAKE_TEST_POOL', 'from environ')
+    assert bash_pool.eval_str('$(echo $DMAKE_TEST_POOL)', {}) == 'from environ'
+    monkeypatch.delenv('DMAKE_TEST_POOL')
+    assert bash_pool.eval_str('$(echo $DMAKE_TEST_POOL)', {}) == ''
+
+
+def test_source_with_env_is_unsupported(workers, source_file):
+    with pytest.raises(bash_pool.Unsupported):
+        bash_pool.eval_str('$(echo 1)', {'FOO': 'foo'}, source=source_file)
+
+
+def test_source_snapshot(workers, tmp_path):
+    counter = tmp_path / 'counter'
+    path = tmp_path / 'env.sh'
+    path.write_text('echo sourced >> %s\nexport SECRET=first\nLOCAL="local value"\nunset HOME\n' % counter)
+    source = str(path)
+    snapshot = bash_pool.get_source_snapshot(source)
+    assert snapshot['SECRET'] == 'first'
+    assert snapshot['LOCAL'] == 'local value'
+    assert 'HOME' not in snapshot
+    assert not any(name.startswith('__dmake_') for name in snapshot)
+
+    for value in ['$SECRET', '${LOCAL}-$SECRET', '${UNSET_VAR:-default}', '$(echo $SECRET)']:
+        assert eval_str_in_env(value, source=source) == eval_str_in_env_with_shell(value, source=source)
+    sourced_count = len(counter.read_text().splitlines())
+
+    for _ in range(3):
+        assert eval_str_in_env('$SECRET', source=source) == 'first'
+    assert len(counter.read_text().splitlines()) == sourced_count, "source file should be sourced once"
+
+    path.write_text('export SECRET=second\n')
+    assert eval_str_in_env('$SECRET', source=source) == 'second', "editing the source file should invalidate the snapshot"
+
+
+def test_source_snapshot_not_clean(workers, tmp_path):
+    path = tmp_path / 'noisy.sh'
+    path.write_text('echo noise\nexport SECRET=value\n')
+    assert bash_pool.get_source_snapshot(str(path)) is None
+    assert eval_str_in_env('$SECRET', source=str(path)) == eval_str_in_env_with_shell('$SECRET', source=str(path))
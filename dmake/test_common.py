@@ -2,7 +2,7 @@ import re
 
 import pytest
 
-from dmake.common import sanitize_name, sanitize_name_unique
+from dmake.common import sanitize_name, sanitize_name_unique, LRUCache, eval_cache, eval_str_in_env
 
 
 @pytest.mark.parametrize("test_input,expected", [
@@ -40,3 +40,31 @@ def test_sanitize_name_unique():
     assert sanitize_name_unique('foo_bar', mode='docker') == 'foo_bar', "When no sanitation is needed it should return identity"
     assert sanitize_name_unique('foo/bar', mode='docker') != sanitize_name_unique('foo#bar', mode='docker'), "Same sanitization should still be unique"
     assert sanitize_name_unique('foo/bar', mode='docker') == sanitize_name_unique('foo/bar', mode='docker'), "Sanitation should be stable"
+
+def test_lru_cache():
+    cache = LRUCache('test', max_size=2)
+    calls = []
+    def compute(value):
+        calls.append(value)
+        return value
+    assert cache.get('a', lambda: compute(1)) == 1
+    assert cache.get('a', lambda: compute(2)) == 1
+    assert cache.get('b', lambda: compute(3)) == 3
+    assert cache.get('c', lambda: compute(4)) == 4
+    assert cache.get('a', lambda: compute(5)) == 5, "least recently used entry should be evicted"
+    assert cache.get(None, lambda: compute(6)) == 6, "None key should not be cached"
+    assert cache.get(None, lambda: compute(7)) == 7
+    assert calls == [1, 3, 4, 5, 6, 7]
+    assert (cache.hits, cache.misses) == (1, 4)
+
+def test_eval_str_in_env_cache():
+    eval_cache.clear()
+    assert eval_str_in_env('${FOO:-default}', {'FOO': 'foo'}) == 'foo'
+    hits = eval_cache.hits
+    assert eval_str_in_env('${FOO:-default}', {'FOO': 'foo'}) == 'foo'
+    assert eval_cache.hits == hits + 1
+    assert eval_str_in_env('${FOO:-default}', {'FOO': 'bar'}) == 'bar'
+    assert eval_str_in_env('${FOO:-default}') == 'default'
+
+    values = set(eval_str_in_env('$(date +%s%N)') for _ in range(3))
+    assert len(values) == 3, "command substitution should never be cached"
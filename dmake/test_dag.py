@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from dmake import dag
+from dmake.common import DMakeException
+
+
+# the recursive implementations previously used by core.make, as reference
+
+def reference_check_no_circular_dependencies(dependencies):
+    is_leaf = {}
+    for k in dependencies:
+        is_leaf[k] = True
+
+    tree_depth = {}
+    def sub_check(key, walked_nodes = []):
+        if key in tree_depth:
+            return tree_depth[key]
+        if key not in dependencies:
+            return 0
+
+        walked_nodes = [key] + walked_nodes
+        depth = 0
+        for dep in dependencies[key]:
+            is_leaf[dep] = False
+            if dep in walked_nodes:
+                raise DMakeException("Circular dependencies: %s" % ' -> '.join(map(str, reversed([dep] + walked_nodes))))
+            depth = max(depth, 1 + sub_check(dep, walked_nodes))
+
+        tree_depth[key] = depth
+        return depth
+
+    for k in dependencies:
+        sub_check(k)
+
+    leaves = []
+    for k, v in is_leaf.items():
+        if v:
+            leaves.append((k, tree_depth[k]))
+
+    return leaves, tree_depth
+
+
+def reference_order_dependencies(dependencies, leaves):
+    ordered_build_files = {}
+    def sub_order(key, depth):
+        if key in ordered_build_files and depth >= ordered_build_files[key]:
+            return
+        ordered_build_files[key] = depth
+        if key in dependencies:
+            for f in dependencies[key]:
+                sub_order(f, depth - 1)
+
+    for file, depth in leaves:
+        sub_order(file, depth)
+    return ordered_build_files
+
+
+def random_dag(rng, nodes_count, edges_count):
+    nodes = ['n%d' % i for i in range(nodes_count)]
+    rng.shuffle(nodes)
+    dependencies = {}
+    for i, node in enumerate(nodes):
+        # only depend on nodes after: no cycle; some children are not keys
+        candidates = nodes[i + 1:]
+        children = rng.sample(candidates, min(len(candidates), rng.randint(0, edges_count)))
+        if children or rng.random() < 0.8:
+            dependencies[node] = children
+    keys = list(dependencies)
+    rng.shuffle(keys)
+    return {k: dependencies[k] for k in keys}
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_same_plan_as_reference(seed):
+    rng = random.Random(seed)
+    dependencies = random_dag(rng, rng.randint(1, 60), 4)
+    is_command_root = lambda node: int(node[1:]) % 3 != 0
+
+    plan = dag.plan(dependencies, is_command_root)
+    roots, heights, levels = plan.get_roots(), plan.get_heights(), plan.get_levels()
+    expected_roots, expected_heights = reference_check_no_circular_dependencies(dependencies)
+    expected_levels = reference_order_dependencies(dependencies, [(k, d) for k, d in expected_roots if is_command_root(k)])
+    assert roots == expected_roots
+    assert heights == expected_heights
+    # same order: the plan sorts the nodes by level, keeping this order for equal levels
+    assert list(levels.items()) == list(expected_levels.items())
+    nodes = plan.graph.nodes
+    assert [nodes[i] for i in plan.ordered()] == [k for k, _ in sorted(expected_levels.items(), key=lambda node_level: node_level[1])]
+    assert all(plan.is_ordered(i) for i in plan.reached)
+
+
+def test_graph_interning():
+    dependencies = {'a': ['b', 'x'], 'b': ['x', 'y'], 'c': []}
+    graph = dag.Graph(dependencies)
+    assert graph.nodes == ['a', 'b', 'c', 'x', 'y']
+    assert graph.keys_count == 3
+    assert graph.index == {'a': 0, 'b': 1, 'c': 2, 'x': 3, 'y': 4}
+    assert list(graph.offsets) == [0, 2, 4, 4, 4, 4]
+    assert list(graph.targets) == [1, 3, 3, 4]
+    for node, children in dependencies.items():
+        assert [graph.nodes[i] for i in graph.children(graph.index[node])] == children
+    assert list(graph.children(graph.index['y'])) == []
+
+
+def test_cycle():
+    dependencies = {'a': ['b'], 'b': ['c', 'd'], 'c': [], 'd': ['e'], 'e': ['b']}
+    with pytest.raises(DMakeException) as excinfo:
+        dag.plan(dependencies, lambda node: True)
+    assert str(excinfo.value) == "Circular dependencies: b -> d -> e -> b"
+
+    with pytest.raises(DMakeException) as excinfo:
+        dag.plan({'a': ['a']}, lambda node: True)
+    assert str(excinfo.value) == "Circular dependencies: a -> a"
+
+
+def test_deep_chain():
+    count = 20000
+    dependencies = {i: [i + 1] for i in range(count)}
+    plan = dag.plan(dependencies, lambda node: True)
+    assert plan.get_roots() == [(0, count)]
+    assert plan.get_heights()[count - 1] == 1
+    assert plan.get_levels()[count] == 0
+
+    dependencies[count] = [0]
+    with pytest.raises(DMakeException):
+        dag.plan(dependencies, lambda node: True)
+
+
+def test_diamonds():
+    # each level depends on both nodes of the next level: 2^depth paths
+    depth = 200
+    dependencies = {}
+    for i in range(depth):
+        for side in 'ab':
+            dependencies['%s%d' % (side, i)] = ['a%d' % (i + 1), 'b%d' % (i + 1)]
+    dependencies['top'] = ['a0', 'b0']
+    plan = dag.plan(dependencies, lambda node: node == 'top')
+    assert plan.get_roots() == [('top', depth + 1)]
+    assert plan.get_levels()['a%d' % depth] == 0
+    assert len(plan.reached) == 2 * depth + 3
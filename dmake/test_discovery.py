@@ -0,0 +1,140 @@
+import os
+import subprocess
+
+import pytest
+
+import dmake.common as common
+import dmake.discovery as discovery
+from dmake.common import DMakeException, run_shell_command
+from dmake.discovery import find_dmake_files
+
+
+files = [
+    'dmake.yml',
+    'app/dmake.yml',
+    'app/sub/dmake.yml',
+    'app/sub/deeper/dmake.yml',
+    'other/dmake.yml',
+    'other/node_modules/pkg/dmake.yml',
+    'other/build/dmake.yml',
+    'other/build.txt',
+    'not_dmake/dmake.yaml',
+    '.dmake/cached/dmake.yml',
+]
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    for path in files:
+        full_path = tmp_path / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text('dmake_version: 0.1\n')
+    os.symlink('app', str(tmp_path / 'link_to_app'))
+    monkeypatch.chdir(str(tmp_path))
+    return tmp_path
+
+
+def git_add_all(path):
+    subprocess.check_call(['git', 'init', '-q', str(path)])
+    subprocess.check_call(['git', '-C', str(path), 'add', '-A', '-f'])
+
+
+def test_walk_matches_find(tree):
+    expected = [f[2:] for f in run_shell_command('dmake_find . -name dmake.yml').split('\n') if f]
+    expected.remove('.dmake/cached/dmake.yml')
+    assert find_dmake_files('walk') == expected
+
+
+def test_dmakeignore(tree):
+    (tree / '.dmakeignore').write_text('# comment\nnode_modules\n/app/sub/deeper/\n')
+    (tree / 'other' / '.dmakeignore').write_text('build/\n')
+    expected = ['dmake.yml', 'app/dmake.yml', 'app/sub/dmake.yml', 'other/dmake.yml']
+    assert sorted(find_dmake_files('walk')) == sorted(expected)
+    git_add_all(tree)
+    assert sorted(find_dmake_files('git')) == sorted(expected)
+
+
+def test_dmakeignore_directory_only(tree):
+    (tree / '.dmakeignore').write_text('dmake.yml/\nbuil*\n')
+    assert 'other/build/dmake.yml' not in find_dmake_files('walk')
+    assert 'app/dmake.yml' in find_dmake_files('walk')
+
+
+def test_git_mode_only_tracked_files(tree):
+    git_add_all(tree)
+    (tree / 'untracked').mkdir()
+    (tree / 'untracked' / 'dmake.yml').write_text('dmake_version: 0.1\n')
+    os.remove(str(tree / 'app' / 'sub' / 'dmake.yml'))
+    expected = [f for f in find_dmake_files('walk') if f != 'untracked/dmake.yml']
+    assert sorted(find_dmake_files('git')) == sorted(expected)
+    assert '.dmake/cached/dmake.yml' not in find_dmake_files('git')
+
+
+def test_invalid_mode(tree):
+    with pytest.raises(DMakeException):
+        find_dmake_files('unknown')
+    (tree / '.dmakeignore').write_text('!negated\n')
+    with pytest.raises(DMakeException):
+        find_dmake_files('walk')
+
+
+def shell_symlinked_directories():
+    # the shell loop previously used by core.find_symlinked_directories, as reference
+    symlinks = []
+    for line in run_shell_command("for f in $(dmake_find . -type l); do echo \"$f $(ls -l $f | sed -e 's/.* -> //')\"; done").split('\n'):
+        l = line.split(' ')
+        if len(l) != 2:
+            continue
+        link_path = os.path.normpath(l[0])
+        if not os.path.isdir(link_path):
+            continue
+        linked_dir = os.path.normpath(os.path.join(os.path.dirname(link_path), l[1]))
+        if not os.path.isdir(linked_dir) or linked_dir[0] == '/':
+            continue
+        symlinks.append((link_path, linked_dir))
+    return symlinks
+
+
+@pytest.fixture
+def symlinks_tree(tree, monkeypatch):
+    os.symlink('../../other', str(tree / 'app' / 'sub' / 'link_to_other'))
+    os.symlink('deeper', str(tree / 'app' / 'sub' / 'link_to_deeper'))
+    os.symlink('../dmake.yml', str(tree / 'app' / 'link_to_file'))
+    os.symlink('missing', str(tree / 'app' / 'dangling'))
+    os.symlink(str(tree / 'other'), str(tree / 'absolute'))
+    monkeypatch.setattr(common, 'cache_dir', str(tree / '.dmake'), raising=False)
+    return tree
+
+
+def test_symlinks_walk_matches_shell(symlinks_tree):
+    expected = [('app/sub/link_to_deeper', 'app/sub/deeper'), ('app/sub/link_to_other', 'other'), ('link_to_app', 'app')]
+    assert sorted(shell_symlinked_directories()) == expected
+    assert sorted(discovery.find_symlinked_directories_walk()) == expected
+    # not supported by the shell loop
+    (symlinks_tree / 'with space').mkdir()
+    os.symlink('../app', str(symlinks_tree / 'with space' / 'link'))
+    assert ('with space/link', 'app') in discovery.find_symlinked_directories_walk()
+
+
+def test_symlinks_cache(symlinks_tree, monkeypatch):
+    git_add_all(symlinks_tree)
+    subprocess.check_call(['git', '-c', 'user.name=dmake', '-c', 'user.email=dmake@example.com', 'commit', '-q', '-m', 'commit'])
+    expected = sorted(discovery.find_symlinked_directories_walk())
+    assert sorted(discovery.find_symlinked_directories()) == expected
+    assert (symlinks_tree / '.dmake' / discovery.symlinks_cache_file_name).is_file()
+
+    # reused while HEAD tree and the index are unchanged
+    os.symlink('app', str(symlinks_tree / 'not_added'))
+    assert sorted(discovery.find_symlinked_directories()) == expected
+
+    subprocess.check_call(['git', 'add', 'not_added'])
+    assert ('not_added', 'app') in discovery.find_symlinked_directories()
+
+    monkeypatch.setattr(discovery, 'symlinks_cache_enabled', False)
+    os.symlink('other', str(symlinks_tree / 'not_added_either'))
+    assert ('not_added_either', 'other') in discovery.find_symlinked_directories()
+
+
+def test_symlinks_without_git(symlinks_tree):
+    assert sorted(discovery.find_symlinked_directories()) == sorted(discovery.find_symlinked_directories_walk())
+    assert not (symlinks_tree / '.dmake' / discovery.symlinks_cache_file_name).exists()
@@ -0,0 +1,86 @@
+import os
+import subprocess
+
+import pytest
+
+import dmake.common as common
+import dmake.durations as durations
+
+
+def test_load(tmp_path):
+    store_file = str(tmp_path / 'durations.tsv')
+    assert durations.load(store_file) == {}
+    with open(store_file, 'w') as f:
+        f.write('test @ app/web\t10\n')
+        f.write('malformed line\n')
+        f.write('build_docker @ app/web\t100\n')
+        f.write('test @ app/web\t20\n')
+    assert durations.load(store_file) == {'test @ app/web': 15, 'build_docker @ app/web': 100}
+
+
+def test_history_and_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(durations, 'history_size', 2)
+    store_file = str(tmp_path / 'durations.tsv')
+    with open(store_file, 'w') as f:
+        for seconds in range(1, 21):
+            f.write('test @ app/web\t%d\n' % seconds)
+    assert durations.load(store_file) == {'test @ app/web': 19.5}
+    with open(store_file) as f:
+        assert f.read() == 'test @ app/web\t19\ntest @ app/web\t20\n'
+    assert durations.load(store_file) == {'test @ app/web': 19.5}
+
+
+def test_key():
+    assert durations.get_key(('run', 'app/web', None)) == 'run @ app/web'
+
+
+@pytest.mark.parametrize('seconds, expected', [
+    (0.4, '0s'),
+    (59, '59s'),
+    (61, '1m01s'),
+    (3600 + 120, '1h02m'),
+])
+def test_format_duration(seconds, expected):
+    assert durations.format_duration(seconds) == expected
+
+
+def test_set_priorities():
+    parallel_nodes = [
+        {'id': 10, 'children': []},
+        {'id': 11, 'children': []},
+        {'id': 12, 'children': [0]},
+        {'id': 13, 'children': [1]},
+    ]
+    durations.set_priorities(parallel_nodes, {10: 5, 11: 1, 12: 1, 13: 10})
+    assert [parallel_node['priority'] for parallel_node in parallel_nodes] == [6, 11, 1, 10]
+
+
+def test_disabled_by_default():
+    env = dict(os.environ)
+    env.pop('DMAKE_DURATIONS', None)
+    assert subprocess.check_output(['python', '-c', 'import dmake.durations; print(dmake.durations.enabled)'],
+                                   env=env, universal_newlines=True) == 'False\n'
+
+
+def test_recording_commands(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    utils_dir = os.path.join(os.path.dirname(durations.__file__), 'utils')
+    env = dict(os.environ, DMAKE_TMP_DIR=str(tmp_path), PATH='%s:%s' % (utils_dir, os.environ['PATH']))
+    env.pop('DMAKE_DURATIONS_STORE', None)
+    commands = durations.wrap_commands([('sh', {'shell': 'true'})], 1, 'run @ app/web')
+    assert len(commands) == 3
+    # relative to the workspace running the commands
+    assert str(tmp_path) not in commands[-1][1]['shell']
+    for _, kwargs in commands:
+        subprocess.check_call(kwargs['shell'], shell=True, env=env, cwd=str(tmp_path))
+    assert durations.load(str(tmp_path / '.dmake' / 'durations.tsv')) == {'run @ app/web': 0}
+    store_file = str(tmp_path / 'store' / 'durations.tsv')
+    env['DMAKE_DURATIONS_STORE'] = store_file
+    for _, kwargs in commands:
+        subprocess.check_call(kwargs['shell'], shell=True, env=env, cwd=str(tmp_path))
+    assert durations.load(store_file) == {'run @ app/web': 0}
+    # best effort
+    env['DMAKE_DURATIONS_STORE'] = '/proc/no/store'
+    commands = durations.wrap_commands([], 2, 'key')
+    for _, kwargs in commands:
+        subprocess.check_call(kwargs['shell'], shell=True, env=env, cwd=str(tmp_path))
@@ -0,0 +1,283 @@
+import io
+import os
+import pty
+import select
+import signal
+import subprocess
+import time
+
+import pytest
+
+import dmake.common as common
+from dmake import core, dag, executor
+from dmake.common import DMakeException, append_command
+
+
+@pytest.fixture
+def make_node(tmp_path):
+    def make_node(name, script, children=(), locks=(('PARALLEL_BUILDERS', None),), held_locks=()):
+        path = str(tmp_path / ('%s.sh' % name))
+        with open(path, 'w') as f:
+            f.write('set -e\ncd "%s"\n%s\n' % (tmp_path, script))
+        return {'name': name, 'script': path, 'children': list(children), 'locks': [list(lock) for lock in locks],
+                'held_locks': [list(lock) for lock in held_locks]}
+    return make_node
+
+
+def wait_for(marker):
+    # fails if `marker` is not created by a concurrent node
+    return 'for i in $(seq 100); do [ -f %s ] && exit 0; sleep 0.05; done; exit 1' % marker
+
+
+def test_dependencies_order(make_node, tmp_path):
+    nodes = [
+        make_node('a', 'echo a >> order'),
+        make_node('b', 'echo b >> order', children=[0]),
+        make_node('c', 'echo c >> order', children=[0, 1]),
+    ]
+    assert executor.execute(nodes) == 0
+    assert (tmp_path / 'order').read_text() == 'a\nb\nc\n'
+
+
+def test_independent_nodes_run_concurrently(make_node, monkeypatch):
+    monkeypatch.setenv('DMAKE_PARALLEL_BUILDERS', '2')
+    nodes = [
+        make_node('a', 'touch a; ' + wait_for('b')),
+        make_node('b', 'touch b; ' + wait_for('a')),
+    ]
+    assert executor.execute(nodes) == 0
+
+
+def test_parallel_builders_lock(make_node, monkeypatch, tmp_path):
+    monkeypatch.setenv('DMAKE_PARALLEL_BUILDERS', '1')
+    script = 'mkdir running; sleep 0.1; rmdir running'
+    nodes = [make_node(name, script) for name in 'abc']
+    assert executor.execute(nodes) == 0
+    # not bounded: deploy nodes
+    nodes = [
+        make_node('a', 'touch a; ' + wait_for('b'), locks=[]),
+        make_node('b', 'touch b; ' + wait_for('a'), locks=[]),
+    ]
+    assert executor.execute(nodes) == 0
+
+
+def test_priority(make_node, monkeypatch, tmp_path):
+    monkeypatch.setenv('DMAKE_PARALLEL_BUILDERS', '1')
+    nodes = [make_node(name, 'echo %s >> order' % name) for name in 'abc']
+    nodes[2]['priority'] = 10
+    nodes[1]['priority'] = 5
+    assert executor.execute(nodes) == 0
+    assert (tmp_path / 'order').read_text() == 'c\nb\na\n'
+
+
+def test_gpus_held_until_the_end(make_node, monkeypatch, tmp_path):
+    monkeypatch.setenv('DMAKE_PARALLEL_BUILDERS', '4')
+    monkeypatch.setenv('DMAKE_GPUS', 'GPU_0,GPU_1')
+    gpus = [('GPUS', 'DMAKE_GPU')]
+    script = 'echo "${DMAKE_GPU}" >> gpus'
+    nodes = [
+        make_node('build', 'test -z "${DMAKE_GPU}"'),
+        # done once its daemon container started: the container still uses the GPU
+        make_node('daemon', script, children=[0], held_locks=gpus),
+        make_node('test', script + '; ' + wait_for('other'), children=[1], held_locks=gpus),
+        make_node('other', script + '; touch other', held_locks=gpus),
+    ]
+    assert executor.execute(nodes) == 0
+    assert len(set((tmp_path / 'gpus').read_text().split())) == 1
+
+
+def test_failure(make_node, tmp_path, capsys, monkeypatch):
+    monkeypatch.setenv('DMAKE_PARALLEL_BUILDERS', '2')
+    nodes = [
+        make_node('a', 'echo failing; exit 3'),
+        make_node('b', 'touch b', children=[0]),
+        make_node('c', 'sleep 0.1; touch c'),
+    ]
+    assert executor.execute(nodes) == 3
+    assert not (tmp_path / 'b').exists()
+    # already running: not interrupted
+    assert (tmp_path / 'c').exists()
+    out = capsys.readouterr().out
+    assert '[a] failing\n' in out
+    assert 'Failed: a' in out
+
+
+def test_nodes_without_stdin(make_node, tmp_path):
+    # e.g. concurrent `docker run -i` test nodes: they must not read the terminal
+    plan_file = str(tmp_path / 'plan.json')
+    executor.write_plan(plan_file, [make_node('a', 'if read -r line; then echo "read: $line"; fi; touch a')])
+    output = subprocess.check_output(executor.get_command(plan_file), shell=True, input='from the terminal\n',
+                                     universal_newlines=True, cwd=str(tmp_path))
+    assert (tmp_path / 'a').exists()
+    assert 'read:' not in output
+
+
+def test_plan_file(make_node, tmp_path):
+    plan_file = str(tmp_path / 'plan.json')
+    executor.write_plan(plan_file, [make_node('a', 'echo from a')])
+    output = subprocess.check_output(executor.get_command(plan_file), shell=True, universal_newlines=True, cwd=str(tmp_path))
+    assert '[a] from a\n' in output
+
+
+@pytest.mark.parametrize('value', ['', 'four', '2.5'])
+def test_invalid_parallel_builders(make_node, monkeypatch, tmp_path, value):
+    monkeypatch.setenv('DMAKE_PARALLEL_BUILDERS', value)
+    with pytest.raises(DMakeException, match='DMAKE_PARALLEL_BUILDERS'):
+        executor.get_lock_resources('PARALLEL_BUILDERS')
+    plan_file = str(tmp_path / 'plan.json')
+    executor.write_plan(plan_file, [make_node('a', 'touch a')])
+    p = subprocess.run(executor.get_command(plan_file), shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                       universal_newlines=True, cwd=str(tmp_path))
+    assert p.returncode == 1
+    assert p.stdout.startswith('ERROR: Invalid DMAKE_PARALLEL_BUILDERS environment variable')
+    assert not (tmp_path / 'a').exists()
+
+
+def test_bash_timeout(tmp_path):
+    commands = []
+    append_command(commands, 'timeout', time=1)
+    append_command(commands, 'sh', shell='sleep 30 | cat')
+    append_command(commands, 'timeout_end')
+    append_command(commands, 'sh', shell='echo not reached')
+    f = io.StringIO()
+    core.generate_command_bash(f, commands, timeouts=True)
+    script = tmp_path / 'script.sh'
+    script.write_text(f.getvalue())
+    start = time.time()
+    p = subprocess.run(['bash', str(script)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert time.time() - start < 10
+    assert p.returncode != 0
+    assert 'not reached' not in p.stdout
+    assert 'Timeout: killed after 1 seconds' in p.stderr
+
+    commands[1] = ('sh', {'shell': 'true'})
+    f = io.StringIO()
+    core.generate_command_bash(f, commands, timeouts=True)
+    script.write_text(f.getvalue())
+    p = subprocess.run(['bash', str(script)], stdout=subprocess.PIPE, universal_newlines=True)
+    assert p.returncode == 0
+    assert 'not reached' in p.stdout
+
+
+def test_bash_timeout_ignored_in_sequential_script():
+    commands = []
+    append_command(commands, 'timeout', time=1)
+    append_command(commands, 'sh', shell='run test')
+    append_command(commands, 'timeout_end')
+    f = io.StringIO()
+    core.generate_command_bash(f, commands)
+    assert 'dmake_wait_timeout' not in f.getvalue()
+    assert 'set -m' not in f.getvalue()
+    assert f.getvalue().endswith('set -e\nrun test\n')
+
+
+def run_in_pty(args, timeout):
+    """Return (returncode, output) of `args` run in a new terminal session, or None if it did not finish in time."""
+    pid, fd = pty.fork()
+    if pid == 0:
+        try:
+            os.execvp(args[0], args)
+        finally:
+            os._exit(127)
+    output = b''
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        ready, _, _ = select.select([fd], [], [], 0.1)
+        if ready:
+            try:
+                data = os.read(fd, 4096)
+            except OSError:
+                break
+            if not data:
+                break
+            output += data
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        os.close(fd)
+        return None
+    _, status = os.waitpid(pid, 0)
+    os.close(fd)
+    return os.waitstatus_to_exitcode(status), output.decode()
+
+
+def test_bash_timeout_reading_terminal(tmp_path):
+    # e.g. `docker run -i` in dmake_run_docker_test: not stopped by SIGTTIN in its background job
+    commands = []
+    append_command(commands, 'timeout', time=20)
+    append_command(commands, 'sh', shell='cat')
+    append_command(commands, 'timeout_end')
+    append_command(commands, 'sh', shell='echo done')
+    f = io.StringIO()
+    core.generate_command_bash(f, commands, timeouts=True)
+    script = tmp_path / 'script.sh'
+    script.write_text(f.getvalue())
+    result = run_in_pty(['bash', str(script)], timeout=10)
+    assert result is not None, 'stopped reading the terminal'
+    returncode, output = result
+    assert returncode == 0
+    assert 'done' in output
+    assert 'Timeout' not in output
+
+
+def test_generate_executor_plan(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, 'tmp_dir', str(tmp_path), raising=False)
+    base = ('base', 'base', None)
+    build = ('build_docker', 'app/web', None)
+    volume = ('shared_volume', 'volume', None)
+    test = ('test', 'app/web', None)
+    deploy = ('deploy', 'app/web', None)
+    plan = dag.plan({deploy: [build], test: [build, volume], build: [base], volume: [], base: []},
+                    lambda node: node[0] in ['test', 'deploy'])
+    index = plan.graph.index
+    nodes_commands = {i: [('sh', {'shell': 'echo %s' % node[0]})] for i, node in enumerate(plan.graph.nodes)}
+    # no commands: its dependencies are inherited
+    nodes_commands[index[build]] = []
+    nodes_need_gpu = {i: node[0] == 'test' for i, node in enumerate(plan.graph.nodes)}
+
+    parallel_nodes = core.get_parallel_nodes(plan, [('All', plan.ordered())], nodes_commands, nodes_need_gpu)
+    plan_file = core.generate_executor_plan(parallel_nodes, nodes_commands)
+    nodes = {node['name']: node for node in executor.read_plan(plan_file)}
+    names = [node['name'] for node in executor.read_plan(plan_file)]
+    assert sorted(names) == ['base @ base', 'deploy @ app/web', 'shared_volume @ volume', 'test @ app/web']
+    assert names[-1] == 'deploy @ app/web'
+    assert sorted(names[i] for i in nodes['test @ app/web']['children']) == ['base @ base', 'shared_volume @ volume']
+    assert nodes['test @ app/web']['locks'] == [['PARALLEL_BUILDERS', None]]
+    assert nodes['test @ app/web']['held_locks'] == [['GPUS', 'DMAKE_GPU']]
+    assert nodes['base @ base']['held_locks'] == []
+    # deploy: after everything else, not bounded by PARALLEL_BUILDERS
+    assert len(nodes['deploy @ app/web']['children']) == 3
+    assert nodes['deploy @ app/web']['locks'] == []
+    assert executor.execute(executor.read_plan(plan_file)) == 0
+
+
+def test_shell_in_foreground(tmp_path, monkeypatch):
+    # interactive: not run by the executor, it would lose the terminal
+    monkeypatch.setattr(common, 'tmp_dir', str(tmp_path), raising=False)
+    base = ('base', 'base', None)
+    volume = ('shared_volume', 'volume', None)
+    shell = ('shell', 'app/web', None)
+    plan = dag.plan({shell: [base, volume], volume: [], base: []}, lambda node: node[0] == 'shell')
+    nodes_commands = {i: [('sh', {'shell': 'echo %s' % node[0]})] for i, node in enumerate(plan.graph.nodes)}
+    nodes_commands[plan.graph.index[shell]] = [('sh', {'shell': 'test -t 0 && echo "shell on a terminal"'})]
+    nodes_need_gpu = {i: False for i in nodes_commands}
+    ordered_build_files = [('All', plan.ordered())]
+
+    parallel_nodes = core.get_parallel_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu)
+    assert sorted(parallel_node['name'] for parallel_node in parallel_nodes) == ['base @ base', 'shared_volume @ volume']
+    foreground_nodes = core.get_foreground_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu)
+    assert [foreground_node['name'] for foreground_node in foreground_nodes] == ['shell @ app/web']
+
+    commands = []
+    append_command(commands, 'sh', shell=executor.get_command(core.generate_executor_plan(parallel_nodes, nodes_commands)))
+    core.append_foreground_commands(commands, foreground_nodes, nodes_commands)
+    f = io.StringIO()
+    core.generate_command_bash(f, commands)
+    script = tmp_path / 'DMakefile'
+    script.write_text(f.getvalue())
+    result = run_in_pty(['bash', str(script)], timeout=30)
+    assert result is not None
+    returncode, output = result
+    assert returncode == 0
+    assert output.index('[base @ base] base') < output.index('- Running shell @ app/web')
+    assert 'shell on a terminal' in output
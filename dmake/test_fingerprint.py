@@ -0,0 +1,142 @@
+import os
+
+import pytest
+
+import dmake.dag as dag
+import dmake.fingerprint as fingerprint
+from dmake.fingerprint import DirectoryStore, DockerIgnorePattern, hash_path, is_dockerignored
+
+
+@pytest.fixture(autouse=True)
+def path_hashes(monkeypatch):
+    monkeypatch.setattr(fingerprint, 'path_hashes', {})
+
+
+@pytest.mark.parametrize('pattern, path, expected', [
+    ('build', 'build', True),
+    ('build', 'build/out.o', True),
+    ('build', 'src/build', False),
+    ('*.pyc', 'app.pyc', True),
+    ('*.pyc', 'src/app.pyc', False),
+    ('**/*.pyc', 'src/app.pyc', True),
+    ('**/*.pyc', 'app.pyc', True),
+    ('src/*/tmp', 'src/a/tmp/file', True),
+    ('src/*/tmp', 'src/a/b/tmp', False),
+    ('/node_modules', 'node_modules/lib', True),
+    ('file?.txt', 'file1.txt', True),
+    ('file[0-9].txt', 'filea.txt', False),
+])
+def test_dockerignore_pattern(pattern, path, expected):
+    assert DockerIgnorePattern(pattern).match(path) == expected
+
+
+def test_dockerignore_exceptions():
+    patterns = [DockerIgnorePattern(p) for p in ['*.md', '!README.md', 'docs']]
+    assert is_dockerignored('CHANGELOG.md', patterns)
+    assert not is_dockerignored('README.md', patterns)
+    assert is_dockerignored('docs/README.md', patterns)
+    assert not is_dockerignored('src/main.py', patterns)
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    write(str(tmp_path / 'src' / 'main.py'), 'print(1)\n')
+    write(str(tmp_path / 'src' / 'lib.py'), 'x = 1\n')
+    write(str(tmp_path / 'build' / 'out.o'), 'binary')
+    write(str(tmp_path / '.dockerignore'), '# comment\nbuild\n')
+    return tmp_path
+
+
+def rehash(path):
+    fingerprint.path_hashes.clear()
+    return hash_path(str(path))
+
+
+def test_hash_tree(tree):
+    h = rehash(tree)
+    assert rehash(tree) == h
+    # ignored by .dockerignore
+    write(str(tree / 'build' / 'out.o'), 'other binary')
+    assert rehash(tree) == h
+    # content
+    write(str(tree / 'src' / 'lib.py'), 'x = 2\n')
+    h2 = rehash(tree)
+    assert h2 != h
+    # executable bit
+    os.chmod(str(tree / 'src' / 'lib.py'), 0o755)
+    h3 = rehash(tree)
+    assert h3 != h2
+    # rename
+    os.rename(str(tree / 'src' / 'lib.py'), str(tree / 'src' / 'lib2.py'))
+    assert rehash(tree) != h3
+
+
+def test_hash_symlink_target(tree):
+    os.symlink('main.py', str(tree / 'src' / 'link'))
+    h = rehash(tree)
+    os.remove(str(tree / 'src' / 'link'))
+    os.symlink('lib.py', str(tree / 'src' / 'link'))
+    assert rehash(tree) != h
+
+
+def test_hash_missing_path(tmp_path):
+    assert hash_path(str(tmp_path / 'missing')) is None
+
+
+def make_plan(dependencies):
+    return dag.plan(dependencies, lambda node: node[0] in ['test', 'deploy'])
+
+
+def test_skipped_nodes(tmp_path):
+    base = ('base', 'base', None)
+    build_a = ('build_docker', 'a', None)
+    build_b = ('build_docker', 'b', None)
+    link = ('run_link', 'links/app/db', None)
+    test_a = ('test', 'a', None)
+    test_b = ('test', 'b', None)
+    plan = make_plan({
+        test_a: [build_a, link],
+        test_b: [build_b, link],
+        build_a: [base],
+        build_b: [base],
+        link: [],
+        base: [],
+    })
+    index = plan.graph.index
+    fingerprints = {i: 'fp%d' % i for i in plan.reached}
+    store = DirectoryStore(str(tmp_path / 'store'))
+
+    assert fingerprint.get_skipped_nodes(plan, fingerprints, store) == {}
+
+    # record test_a
+    commands = []
+    store.generate_record(commands, fingerprints[index[test_a]])
+    assert commands[0][0] == 'sh'
+    os.makedirs(store.path)
+    open(os.path.join(store.path, fingerprints[index[test_a]]), 'w').close()
+    skipped = fingerprint.get_skipped_nodes(plan, fingerprints, store)
+    assert skipped == {
+        index[test_a]: 'fingerprint recorded',
+        index[build_a]: 'not needed',
+    }
+
+    open(os.path.join(store.path, fingerprints[index[test_b]]), 'w').close()
+    skipped = fingerprint.get_skipped_nodes(plan, fingerprints, store)
+    assert set(skipped) == {index[node] for node in [test_a, test_b, build_a, build_b, link, base]}
+
+
+def test_roots_are_not_skipped(tmp_path):
+    build = ('build_docker', 'a', None)
+    deploy = ('deploy', 'a', None)
+    plan = make_plan({deploy: [build], build: []})
+    fingerprints = {i: 'fp%d' % i for i in plan.reached}
+    store = DirectoryStore(str(tmp_path))
+    for fp in fingerprints.values():
+        open(os.path.join(store.path, fp), 'w').close()
+    assert fingerprint.get_skipped_nodes(plan, fingerprints, store) == {}
@@ -0,0 +1,176 @@
+import os
+import subprocess
+
+import pytest
+
+import dmake.git_metadata as git_metadata
+from dmake.common import ShellError, run_shell_command
+
+
+def git(path, *args):
+    return subprocess.check_output(['git', '-C', str(path)] + list(args), stderr=subprocess.DEVNULL).decode().strip()
+
+
+def git_cli(path, *args):
+    try:
+        return git(path, *args)
+    except subprocess.CalledProcessError:
+        return None
+
+
+def commit(path, message='commit'):
+    git(path, '-c', 'user.name=dmake', '-c', 'user.email=dmake@example.com', 'commit', '--allow-empty', '-q', '-m', message)
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    for name in git_metadata.unsupported_environment:
+        monkeypatch.delenv(name, raising=False)
+    git_metadata.repositories.clear()
+    yield
+    git_metadata.repositories.clear()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / 'repo'
+    path.mkdir()
+    git(path, 'init', '-q', '-b', 'main')
+    commit(path)
+    return path
+
+
+@pytest.fixture
+def cloned_repo(tmp_path, repo):
+    path = tmp_path / 'clone'
+    git(tmp_path, 'clone', '-q', str(repo), str(path))
+    return path
+
+
+def native(path):
+    return git_metadata.GitRepository.discover(str(path))
+
+
+def check_same_as_cli(path, branch='HEAD'):
+    git_metadata.repositories.clear()
+    repository = native(path)
+    assert repository.toplevel == git(path, 'rev-parse', '--show-toplevel')
+    assert repository.get_head_branch() == git(path, 'rev-parse', '--abbrev-ref', 'HEAD')
+    assert repository.get_commit_id() == git(path, 'rev-parse', 'HEAD')
+    assert repository.get_upstream_branch(branch) == git_cli(path, 'rev-parse', '--abbrev-ref', '--symbolic-full-name', '%s@{upstream}' % branch)
+    for remote in ['origin', 'missing']:
+        assert repository.get_remote_url(remote) == (git_cli(path, 'config', '--get', 'remote.%s.url' % remote) or '')
+    # packed objects fall back to the CLI
+    assert git_metadata.get_tree_id(str(path)) == git(path, 'rev-parse', 'HEAD^{tree}')
+    assert repository.get_index_path() == os.path.join(str(path), git(path, 'rev-parse', '--git-path', 'index'))
+
+
+def test_plain_repo(repo):
+    check_same_as_cli(repo)
+    sub_dir = repo / 'sub' / 'dir'
+    sub_dir.mkdir(parents=True)
+    assert native(sub_dir).toplevel == git(sub_dir, 'rev-parse', '--show-toplevel')
+
+
+def test_tree_id(repo):
+    (repo / 'file').write_text('content')
+    git(repo, 'add', 'file')
+    commit(repo, 'with file')
+    assert native(repo).get_tree_id() == git(repo, 'rev-parse', 'HEAD^{tree}')
+    git(repo, 'gc', '-q')
+    with pytest.raises(git_metadata.Unsupported):
+        native(repo).get_tree_id()
+    assert git_metadata.get_tree_id(str(repo)) == git(repo, 'rev-parse', 'HEAD^{tree}')
+
+
+def test_remote_tracking_branch(cloned_repo):
+    check_same_as_cli(cloned_repo)
+    git(cloned_repo, 'checkout', '-q', '-b', 'feature', '--track', 'origin/main')
+    check_same_as_cli(cloned_repo)
+    check_same_as_cli(cloned_repo, branch='main')
+
+
+def test_packed_refs(cloned_repo):
+    git(cloned_repo, 'pack-refs', '--all')
+    assert not os.path.exists(os.path.join(str(cloned_repo), '.git', 'refs', 'heads', 'main'))
+    check_same_as_cli(cloned_repo)
+    commit(cloned_repo, 'after pack')
+    check_same_as_cli(cloned_repo)
+
+
+def test_detached_head(cloned_repo):
+    commit(cloned_repo, 'second')
+    git(cloned_repo, 'checkout', '-q', 'HEAD~1')
+    check_same_as_cli(cloned_repo)
+    assert native(cloned_repo).get_head_branch() == 'HEAD'
+    assert native(cloned_repo).get_upstream_branch('HEAD') is None
+
+
+def test_worktree(tmp_path, cloned_repo):
+    worktree = tmp_path / 'worktree'
+    git(cloned_repo, 'worktree', 'add', '-q', '-b', 'in-worktree', str(worktree))
+    check_same_as_cli(worktree)
+    commit(worktree, 'in worktree')
+    check_same_as_cli(worktree)
+    check_same_as_cli(cloned_repo)
+
+
+def test_separate_git_dir(tmp_path):
+    path = tmp_path / 'work'
+    git(tmp_path, 'init', '-q', '-b', 'main', '--separate-git-dir', str(tmp_path / 'gitdir'), str(path))
+    commit(path)
+    assert (path / '.git').is_file()
+    check_same_as_cli(path)
+
+
+def test_local_upstream(repo):
+    git(repo, 'checkout', '-q', '-b', 'feature', '--track', 'main')
+    check_same_as_cli(repo)
+    assert native(repo).get_upstream_branch('HEAD') == 'main'
+
+
+def test_config_parsing(repo):
+    with open(os.path.join(str(repo), '.git', 'config'), 'a') as f:
+        f.write('[remote "origin"]\n'
+                '\turl = "git@github.com:owner/na\\"me.git" # comment\n'
+                '\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+                '[Remote "other"] ; comment\n'
+                '\tURL = first\n'
+                '\turl = sec\\\n'
+                'ond\n')
+    check_same_as_cli(repo)
+    assert native(repo).get_remote_url('other') == git(repo, 'config', '--get', 'remote.other.url')
+
+
+def test_unsupported_falls_back_to_cli(repo, monkeypatch):
+    # a tag named like the branch makes the short name ambiguous
+    git(repo, 'tag', 'main')
+    with pytest.raises(git_metadata.Unsupported):
+        native(repo).get_head_branch()
+    monkeypatch.chdir(str(repo))
+    assert git_metadata.get_head_branch() == git(repo, 'rev-parse', '--abbrev-ref', 'HEAD')
+
+    with open(os.path.join(str(repo), '.git', 'config'), 'a') as f:
+        f.write('[include]\n\tpath = other.config\n')
+    with pytest.raises(git_metadata.Unsupported):
+        native(repo)
+    git_metadata.repositories.clear()
+    assert git_metadata.get_commit_id() == git(repo, 'rev-parse', 'HEAD')
+
+
+def test_unborn_branch(tmp_path, monkeypatch):
+    path = tmp_path / 'empty'
+    path.mkdir()
+    git(path, 'init', '-q', '-b', 'main')
+    with pytest.raises(git_metadata.Unsupported):
+        native(path).get_head_branch()
+    monkeypatch.chdir(str(path))
+    with pytest.raises(ShellError):
+        git_metadata.get_head_branch()
+
+
+def test_not_a_repository(tmp_path):
+    with pytest.raises(ShellError):
+        git_metadata.get_toplevel(str(tmp_path))
+    with pytest.raises(ShellError):
+        run_shell_command('git -C %s rev-parse --show-toplevel' % tmp_path)
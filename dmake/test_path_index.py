@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+import dmake.common as common
+from dmake import core
+from dmake.path_index import PathTrie, split_path
+
+
+def test_split_path():
+    assert split_path('') == []
+    assert split_path('.') == []
+    assert split_path('app/sub/') == ['app', 'sub']
+    assert split_path('./app//sub') == ['app', 'sub']
+
+
+@pytest.mark.parametrize('path, expected', [
+    ('', True),
+    ('.', True),
+    ('app', True),
+    ('app/', True),
+    ('app/sub', True),
+    ('app/sub/deeper', True),
+    ('app/other', False),
+    ('app2', True),
+    ('ap', False),
+    ('app/su', False),
+    ('other', False),
+])
+def test_has_changed(path, expected):
+    changed_dirs = PathTrie(['app/sub/deeper', 'app2'])
+    assert changed_dirs.has_changed(path) == expected
+
+
+def test_empty():
+    assert not PathTrie().has_changed('')
+    assert not PathTrie().has_changed('app')
+    # a change at the root of the repository
+    changed_dirs = PathTrie([''])
+    assert changed_dirs.has_changed('')
+    assert not changed_dirs.has_changed('app')
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_same_as_component_prefix_scan(seed):
+    rng = random.Random(seed)
+    components = ['a', 'ab', 'b', 'src', 'src2']
+    def random_dir():
+        return '/'.join(rng.choice(components) for _ in range(rng.randint(0, 4)))
+    dirs = [random_dir() for _ in range(rng.randint(1, 30))]
+    changed_dirs = PathTrie(dirs)
+    for _ in range(50):
+        root = random_dir()
+        expected = any(root == '' or d == root or d.startswith(root + '/') for d in dirs)
+        assert changed_dirs.has_changed(root) == expected
+
+
+def test_override_dirs(monkeypatch):
+    monkeypatch.setattr(common, 'change_detection_override_dirs', ['test/web', 'test/worker/'], raising=False)
+    changed_dirs = core.look_for_changed_directories()
+    assert changed_dirs.has_changed('test')
+    assert changed_dirs.has_changed('test/worker')
+    assert not changed_dirs.has_changed('test/web2')
@@ -0,0 +1,196 @@
+import io
+import subprocess
+
+import pytest
+
+import dmake.common as common
+from dmake import core, dag
+from dmake.common import append_command
+
+
+def make_commands():
+    commands = []
+    append_command(commands, 'echo', message="- Running test @ it's web")
+    append_command(commands, 'sh', shell='cd /')
+    append_command(commands, 'sh', shell='test "$PWD" != /')
+    append_command(commands, 'read_sh', var='DAEMON_ID', shell='echo id')
+    append_command(commands, 'sh', shell='echo $DAEMON_ID')
+    append_command(commands, 'try')
+    append_command(commands, 'sh', shell='false')
+    append_command(commands, 'catch', what='error')
+    append_command(commands, 'echo', message='ignored')
+    append_command(commands, 'catch_end')
+    append_command(commands, 'sh', shell=['a', 'b'])
+    append_command(commands, 'sh', shell='a')
+    append_command(commands, 'sh', shell='b')
+    append_command(commands, 'echo', message='- Running test @ other')
+    append_command(commands, 'sh', shell='c')
+    return commands
+
+
+def test_coalesce_boundaries():
+    commands = core.coalesce_sh_commands(make_commands())
+    assert [cmd for cmd, _ in commands] == ['sh', 'read_sh', 'sh', 'try', 'sh', 'catch', 'echo', 'catch_end', 'sh', 'sh', 'sh']
+    assert commands[0][1] == {'shell': "set -e\necho '- Running test @ it'\\''s web'\n(\ncd /\n)\n(\ntest \"$PWD\" != /\n)",
+                              'label': "- Running test @ it's web"}
+    assert commands[2][1] == {'shell': 'echo $DAEMON_ID'}
+    assert commands[8][1] == {'shell': ['a', 'b']}
+    assert commands[9][1] == {'shell': 'set -e\n(\na\n)\n(\nb\n)'}
+    assert commands[10][1]['label'] == '- Running test @ other'
+
+
+def test_coalesced_script_semantics(tmp_path):
+    commands = []
+    append_command(commands, 'echo', message='- Running test')
+    append_command(commands, 'sh', shell='cd "%s"; X=1; touch a' % tmp_path)
+    append_command(commands, 'sh', shell='test "$PWD" != "%s" && test -z "$X" && touch "%s/b"' % (tmp_path, tmp_path))
+    append_command(commands, 'sh', shell='false')
+    append_command(commands, 'sh', shell='touch "%s/c"' % tmp_path)
+    (_, kwargs), = core.coalesce_sh_commands(commands)
+    assert subprocess.call(kwargs['shell'], shell=True, cwd='/') != 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['a', 'b']
+
+
+def test_pipeline_labeled_sh(monkeypatch):
+    monkeypatch.setattr(common, 'build_description', None, raising=False)
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    monkeypatch.setattr(common, 'cache_dir', '.dmake', raising=False)
+    f = io.StringIO()
+    core.generate_command_pipeline(f, core.coalesce_sh_commands(make_commands()))
+    lines = [line.strip() for line in f.getvalue().split('\n')]
+    assert "sh(script: \"set -e\\necho \\'- Running test @ it\\'\\\\\\'\\'s web\\'\\n(\\ncd /\\n)\\n(\\ntest \\\"\\$PWD\\\" != /\\n)\", " \
+        "label: '- Running test @ it\\'s web')" in lines
+    assert "dmake_echo 'ignored'" in lines
+
+
+@pytest.mark.parametrize('shell', ['a', ['a']])
+def test_single_command_untouched(shell):
+    commands = []
+    append_command(commands, 'sh', shell=shell)
+    assert core.coalesce_sh_commands(commands) == commands
+
+
+def test_split(monkeypatch):
+    monkeypatch.setattr(common, 'build_description', None, raising=False)
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    commands = []
+    append_command(commands, 'stage', name='Testing')
+    append_command(commands, 'node', name='a')
+    append_command(commands, 'sh', shell='a')
+    append_command(commands, 'node_end')
+    append_command(commands, 'parallel')
+    append_command(commands, 'parallel_branch', name="it's {b}")
+    append_command(commands, 'node', name='b')
+    append_command(commands, 'sh', shell='b')
+    append_command(commands, 'node_end')
+    append_command(commands, 'parallel_branch_end')
+    append_command(commands, 'parallel_end')
+    append_command(commands, 'stage_end')
+    f = io.StringIO()
+    stats = core.generate_command_pipeline(f, commands, split=True)
+    lines = [line.strip() for line in f.getvalue().split('\n')]
+    stage = lines.index("stage('Testing') {")
+    assert lines[stage + 1:stage + 6] == [
+        'dmake_node_0()',
+        'def dmake_branches_0 = [:]',
+        "dmake_branches_0['it\\'s {b}'] = { dmake_node_1() }",
+        'parallel(dmake_branches_0)',
+        '}',
+    ]
+    # nested nodes are not split further
+    assert lines[lines.index('def dmake_node_1() {') + 1:][:2] == ['sh("b")', '}']
+    assert stats['functions'] == 2
+    assert stats['max_function_lines'] == 3
+
+
+def test_split_chunks(monkeypatch):
+    monkeypatch.setattr(common, 'build_description', None, raising=False)
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    monkeypatch.setattr(core, 'pipeline_chunk_size', 2)
+    commands = []
+    for name in 'abcde':
+        append_command(commands, 'node', name=name)
+        append_command(commands, 'sh', shell=name)
+        append_command(commands, 'node_end')
+    f = io.StringIO()
+    core.generate_command_pipeline(f, commands, split=True)
+    lines = [line.strip() for line in f.getvalue().split('\n')]
+    assert lines[lines.index('try {') + 1:][:3] == ['dmake_chunk_0()', 'dmake_chunk_1()', 'dmake_chunk_2()']
+    assert lines[lines.index('def dmake_chunk_2() {') + 1:][:2] == ['dmake_node_4()', '}']
+
+
+@pytest.mark.parametrize('split', [False, True])
+def test_read_sh_scoped_by_branch(monkeypatch, split):
+    # parallel execution by dependencies: `env` is shared by the branches
+    monkeypatch.setattr(common, 'build_description', None, raising=False)
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    monkeypatch.setattr(common, 'cache_dir', '.dmake', raising=False)
+    commands = []
+    append_command(commands, 'parallel', fail_fast=True)
+    for name in ['web', 'worker']:
+        append_command(commands, 'parallel_branch', name=name)
+        append_command(commands, 'wait_nodes', names=['base'])
+        append_command(commands, 'lock', label='GPUS', quantity=1, variable='DMAKE_GPU')
+        append_command(commands, 'read_sh', var='DAEMON_ID', shell='dmake_run_docker_daemon %s' % name, fail_if_empty=True)
+        append_command(commands, 'sh', shell='dmake_exec_docker ${DAEMON_ID} probe %s' % name)
+        append_command(commands, 'lock_end')
+        append_command(commands, 'node_done', name=name)
+        append_command(commands, 'parallel_branch_end')
+    append_command(commands, 'parallel_end')
+    f = io.StringIO()
+    core.generate_command_pipeline(f, core.coalesce_sh_commands(commands), split=split)
+    output = f.getvalue()
+    assert 'env.DAEMON_ID' not in output
+    lines = [line.strip() for line in output.split('\n')]
+    for name in ['web', 'worker']:
+        probe = lines.index('sh("dmake_exec_docker \\${DAEMON_ID} probe %s")' % name)
+        with_env = probe - 2
+        assert lines[with_env].startswith('withEnv(["DAEMON_ID=${readFile \'.dmake/output_')
+        assert lines[with_env - 1].startswith("sh('dmake_run_docker_daemon %s > .dmake/output_" % name)
+        # closed before the lock
+        assert lines[probe + 1:probe + 3] == ['}', '}']
+        assert lines[probe + 3] == "dmake_nodes_done['%s'] = true" % name
+    # sequential execution: unchanged
+    f = io.StringIO()
+    core.generate_command_pipeline(f, make_commands())
+    assert "env.DAEMON_ID = readFile '.dmake/output_" in f.getvalue()
+
+
+@pytest.mark.parametrize('split', [False, True])
+def test_gpus_locked_for_the_whole_run(monkeypatch, split):
+    # a daemon keeps using its GPU after its node is done
+    monkeypatch.setattr(common, 'build_description', None, raising=False)
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    build = ('build_docker', 'app/web', None)
+    daemon = ('run', 'app/web', None)
+    test = ('test', 'app/worker', None)
+    plan = dag.plan({test: [daemon, build], daemon: [build], build: []}, lambda node: node[0] == 'test')
+    nodes_commands = {i: [('sh', {'shell': 'dmake_%s' % node[0]})] for i, node in enumerate(plan.graph.nodes)}
+    nodes_need_gpu = {i: node[0] != 'build_docker' for i, node in enumerate(plan.graph.nodes)}
+    ordered_build_files = [('All', plan.ordered())]
+    parallel_nodes = core.get_parallel_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu)
+    commands = []
+    core.append_parallel_pipeline_commands(commands, parallel_nodes, [], nodes_commands)
+    f = io.StringIO()
+    core.generate_command_pipeline(f, commands, split=split)
+    lines = f.getvalue().split('\n')
+    gpu_locks = [k for k, line in enumerate(lines) if "label: 'GPUS'" in line]
+    assert len(gpu_locks) == 1
+    # around the parallel step
+    lock = gpu_locks[0]
+    indent = lines[lock][:-len(lines[lock].lstrip())]
+    lock_end = lines.index(indent + '}', lock)
+    stripped = [line.strip() for line in lines]
+    assert lock < stripped.index("stage('Parallel execution') {")
+    # split: the branches are functions called by the parallel step
+    parallel = next(k for k, line in enumerate(stripped) if line.startswith('parallel('))
+    assert lock < parallel < lock_end
+    if not split:
+        assert lock < stripped.index('sh("dmake_run")') < stripped.index('sh("dmake_test")') < lock_end
+
+    # no GPU node: no lock
+    nodes_need_gpu = {i: False for i in nodes_need_gpu}
+    commands = []
+    core.append_parallel_pipeline_commands(commands, core.get_parallel_nodes(plan, ordered_build_files, nodes_commands, nodes_need_gpu),
+                                           [], nodes_commands)
+    assert ('lock', {'label': 'GPUS', 'variable': 'DMAKE_GPU'}) not in commands
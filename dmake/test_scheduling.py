@@ -0,0 +1,87 @@
+import io
+import random
+
+import pytest
+
+import dmake.common as common
+from dmake import core
+from dmake.common import append_command
+from dmake.scheduling import get_critical_paths, get_heights, random_dag, simulate_dag, simulate_heights
+
+
+def test_get_heights():
+    assert get_heights([[], [], [0], [1, 2]]) == [0, 0, 1, 2]
+
+
+def test_get_critical_paths():
+    assert get_critical_paths([[], [], [0], [1, 2]], [1, 2, 3, 4]) == [8, 6, 7, 4]
+
+
+def test_priorities():
+    # the long chain 2 -> 3 should start first
+    children = [[], [], [], [2]]
+    durations = [1, 1, 1, 10]
+    assert simulate_dag(children, durations, workers=2) == 12
+    priorities = get_critical_paths(children, durations)
+    assert simulate_dag(children, durations, workers=2, priorities=priorities) == 11
+    assert simulate_heights([[], [], []], [10, 1, 1], workers=2) == 10
+    assert simulate_heights([[], [], []], [1, 1, 10], workers=2) == 11
+    assert simulate_heights([[], [], []], [1, 1, 10], workers=2, priorities=[1, 1, 10]) == 10
+
+
+def test_slow_node_barrier():
+    # a slow base (0) delays the unrelated build (3) of the next height
+    children = [[], [], [0], [1]]
+    durations = [10, 1, 1, 1]
+    assert simulate_heights(children, durations) == 11
+    assert simulate_dag(children, durations) == 11
+    assert simulate_heights([[], [], [0], [1], [3]], durations + [5]) == 16
+    assert simulate_dag([[], [], [0], [1], [3]], durations + [5]) == 11
+
+
+def test_workers_bound():
+    children = [[], [], [], []]
+    durations = [1, 1, 1, 1]
+    assert simulate_dag(children, durations, workers=1) == 4
+    assert simulate_dag(children, durations, workers=2) == 2
+    assert simulate_dag(children, durations) == 1
+    assert simulate_heights(children, durations, workers=3) == 2
+
+
+def test_empty():
+    assert simulate_dag([], []) == 0
+    assert simulate_heights([], []) == 0
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_critical_path(seed):
+    rng = random.Random(seed)
+    children, durations = random_dag(rng, 50)
+    finish = []
+    for i, node_children in enumerate(children):
+        finish.append(durations[i] + max((finish[child] for child in node_children), default=0))
+    # unbounded: each node starts as soon as its children are done
+    assert simulate_dag(children, durations) == pytest.approx(max(finish))
+    assert simulate_heights(children, durations) >= simulate_dag(children, durations)
+
+
+def test_pipeline_commands(monkeypatch):
+    monkeypatch.setattr(common, 'build_description', None, raising=False)
+    monkeypatch.setattr(common, 'relative_cache_dir', '.dmake', raising=False)
+    commands = []
+    append_command(commands, 'parallel', fail_fast=True)
+    for name, children in [('base', []), ("it's built", ['base'])]:
+        append_command(commands, 'parallel_branch', name=name)
+        if children:
+            append_command(commands, 'wait_nodes', names=children)
+        append_command(commands, 'sh', shell='true')
+        append_command(commands, 'node_done', name=name)
+        append_command(commands, 'parallel_branch_end')
+    append_command(commands, 'parallel_end')
+    f = io.StringIO()
+    core.generate_command_pipeline(f, commands)
+    lines = [line.strip() for line in f.getvalue().split('\n')]
+    assert lines.index('def dmake_nodes_done = [:]') < lines.index('parallel(')
+    assert lines[lines.index('parallel(') + 1] == 'failFast: true,'
+    assert "waitUntil { dmake_nodes_done['base'] == true }" in lines
+    assert "dmake_nodes_done['it\\'s built'] = true" in lines
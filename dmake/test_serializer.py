@@ -0,0 +1,106 @@
+import pickle
+
+import pytest
+
+from dmake.serializer import FieldSerializer, ValidationError, YAML2PipelineSerializer
+
+
+class ItemSerializer(YAML2PipelineSerializer):
+    name = FieldSerializer("string")
+    tags = FieldSerializer("array", child = "string", default = [])
+
+class OptionsSerializer(YAML2PipelineSerializer):
+    verbose = FieldSerializer("bool", default = False)
+
+class RootSerializer(YAML2PipelineSerializer):
+    items   = FieldSerializer("array", child = ItemSerializer(), default = [])
+    named   = FieldSerializer("dict", child = ItemSerializer(), default = {})
+    options = OptionsSerializer(optional = True)
+    count   = FieldSerializer("int", optional = True)
+
+
+def validate(data):
+    root = RootSerializer()
+    root._validate_('dmake.yml', needed_migrations=[], data=data)
+    return root
+
+
+def test_values():
+    root = validate({'items': [{'name': 'a'}, {'name': 'b', 'tags': ['x']}], 'named': {'c': {'name': 'c'}}, 'count': 3})
+    assert [item.name for item in root.items] == ['a', 'b']
+    assert [item.tags for item in root.items] == [[], ['x']]
+    assert root.named['c'].name == 'c'
+    assert root.count == 3
+    assert not root.options.has_value()
+    assert root._value_() == {'items': root.items, 'named': root.named, 'options': None, 'count': 3}
+
+
+def test_schema_is_not_modified():
+    schema = RootSerializer.__schema__
+    first = validate({'items': [{'name': 'a', 'tags': ['x']}], 'options': {'verbose': True}})
+    second = validate({'items': [{'name': 'b'}]})
+    assert RootSerializer.__schema__ is schema
+    assert first.items[0] is not second.items[0]
+    assert first.items[0].name == 'a' and first.items[0].tags == ['x']
+    assert first.options.verbose is True
+    assert not second.options.has_value()
+    assert not RootSerializer.__schema__['items'].child.has_value()
+    assert not RootSerializer.__schema__['options'].has_value()
+
+
+def test_default_values_are_copied():
+    first = validate({'items': [{'name': 'a'}]})
+    first.items[0].tags.append('modified')
+    second = validate({'items': [{'name': 'a'}]})
+    assert second.items[0].tags == []
+
+
+def test_errors():
+    with pytest.raises(ValidationError) as excinfo:
+        validate({'items': [{'name': 'a'}, {'tags': ['x']}]})
+    assert str(excinfo.value) == "Error with field 'items': Error with field 'name': got 'Null', expected a value of type string"
+    with pytest.raises(ValidationError) as excinfo:
+        validate({'named': {'key': {'name': 'a', 'unknown': 1}}})
+    assert str(excinfo.value) == "Error with field 'named': Error with field 'key': Unexpected field 'unknown'"
+    with pytest.raises(Exception) as excinfo:
+        RootSerializer().count
+    assert str(excinfo.value) == "No data has been validated yet, cannot access field 'count'"
+
+
+def test_set_field_and_customize_field():
+    root = validate({'count': 1})
+    root._set_field_('count', 2)
+    assert root.count == 2
+    with pytest.raises(AssertionError):
+        root._set_field_('unknown', 2)
+
+    item = ItemSerializer()
+    item._customize_field_('tags', optional = False, default = None)
+    with pytest.raises(ValidationError):
+        item._make_instance_()._validate_('dmake.yml', needed_migrations=[], data={'name': 'a'})
+    assert ItemSerializer.__schema__['tags'].default == []
+    ItemSerializer()._validate_('dmake.yml', needed_migrations=[], data={'name': 'a'})
+
+
+def test_pickle():
+    root = validate({'items': [{'name': 'a'}], 'options': {'verbose': True}})
+    loaded = pickle.loads(pickle.dumps(root))
+    assert loaded.items[0].name == 'a'
+    assert loaded.options.verbose is True
+    assert '__schema__' not in vars(loaded)
+
+
+def test_fields_are_read_only_slots():
+    root = validate({'items': [{'name': 'a'}], 'count': 1})
+    item = root.items[0]
+    assert 'name' in type(item).__slots__
+    assert not vars(item)
+    with pytest.raises(AttributeError) as excinfo:
+        root.count = 2
+    assert str(excinfo.value) == "Field 'count' is read-only, use _set_field_ to replace it"
+    assert root.count == 1
+    root.other = 2
+    assert root.other == 2
+    with pytest.raises(AttributeError):
+        root.unknown
+    assert not hasattr(RootSerializer(), 'count')
@@ -0,0 +1,163 @@
+import pytest
+
+from dmake.common import ShellError, eval_str_in_env, eval_str_in_env_with_shell
+from dmake.shell_expand import expand, NeedsShell
+
+
+env = {
+    'FOO': 'foo',
+    'BAR': 'bar baz',
+    'EMPTY': '',
+    'SPACES': '  padded  ',
+    'QUOTES': 'a "quoted" \'value\'',
+    'BACKSLASH': 'a\\b',
+    'DOLLAR': '$FOO',
+    'DASH_N': '-n',
+    'MULTILINE': 'line1\nline2',
+}
+
+# values handled in pure python
+expandable_values = [
+    '',
+    'plain',
+    '  surrounding spaces  ',
+    '$FOO',
+    '${FOO}',
+    '$FOO$BAR',
+    '${FOO}_suffix',
+    '$FOO_suffix',
+    'prefix-$FOO-suffix',
+    '$UNSET_VAR',
+    '${UNSET_VAR}',
+    '${UNSET_VAR:-default}',
+    '${UNSET_VAR-default}',
+    '${EMPTY:-default}',
+    '${EMPTY-default}',
+    '${FOO:-default}',
+    '${UNSET_VAR:-$FOO}',
+    '${UNSET_VAR:-${BAR}}',
+    '${UNSET_VAR:-${UNSET_OTHER:-nested}}',
+    '${UNSET_VAR:-}',
+    '${FOO:+alternate}',
+    '${EMPTY:+alternate}',
+    '${EMPTY+alternate}',
+    '${UNSET_VAR+alternate}',
+    '${UNSET_VAR:=assigned}-$UNSET_VAR',
+    '${EMPTY=assigned}',
+    '${FOO:?}',
+    '$SPACES',
+    '$QUOTES',
+    '$BACKSLASH',
+    '$DOLLAR',
+    '$MULTILINE',
+    '$DASH_N',
+    '-n',
+    '-neE',
+    '-',
+    '-x',
+    '$',
+    'trailing $',
+    '$ space',
+    '$%',
+    '$/path',
+    "$'ansi'",
+    '\\$FOO',
+    '\\\\$FOO',
+    '\\n',
+    '\\x',
+    'a\\\nb',
+    'with "quotes"',
+    "with 'single quotes'",
+    '~/home',
+    '*',
+    'a;b',
+    'a|b',
+    '{a,b}',
+    '100%',
+    'ünicode $FOO',
+]
+
+# values that need bash
+shell_values = [
+    '$(echo command)',
+    '`echo backticks`',
+    '$((1 + 2))',
+    '$[1 + 2]',
+    '${#FOO}',
+    '${FOO:1}',
+    '${FOO#f}',
+    '${FOO/o/0}',
+    '${!FOO}',
+    '$1',
+    '$#',
+    '$?',
+    '$0',
+    '$PWD',
+    '$SHLVL',
+    '${BASH_VERSION}',
+    '${UNSET_VAR:-"quoted"}',
+    '${UNSET_VAR:-\\}}',
+    '${FOO',
+    'trailing backslash\\',
+    'escaped quote \\"',
+]
+
+# values that make bash fail
+error_values = [
+    '${UNSET_VAR:?}',
+    '${UNSET_VAR?}',
+    '${EMPTY:?}',
+    '${UNSET_VAR:?custom message}',
+]
+
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('value', expandable_values)
+def test_expand_matches_bash(value, strict):
+    try:
+        expected = eval_str_in_env_with_shell(value, env, strict=strict)
+    except ShellError:
+        with pytest.raises(ShellError):
+            expand(value, env, strict=strict)
+        return
+    assert expand(value, env, strict=strict) == expected
+
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('value', shell_values)
+def test_expand_falls_back_to_bash(value, strict):
+    with pytest.raises(NeedsShell):
+        expand(value, env, strict=strict)
+    try:
+        expected = eval_str_in_env_with_shell(value, env, strict=strict)
+    except ShellError:
+        with pytest.raises(ShellError):
+            eval_str_in_env(value, env, strict=strict)
+        return
+    assert eval_str_in_env(value, env, strict=strict) == expected
+
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('value', error_values)
+def test_expand_errors_like_bash(value, strict):
+    with pytest.raises(ShellError):
+        eval_str_in_env_with_shell(value, env, strict=strict)
+    with pytest.raises(ShellError):
+        expand(value, env, strict=strict)
+
+
+@pytest.mark.parametrize('value', ['$UNSET_VAR', '${UNSET_VAR}', 'a-${UNSET_VAR:-$UNSET_OTHER}'])
+def test_expand_strict_unbound_variable(value):
+    assert expand(value, env, strict=False) == eval_str_in_env_with_shell(value, env, strict=False)
+    with pytest.raises(ShellError):
+        eval_str_in_env_with_shell(value, env, strict=True)
+    with pytest.raises(ShellError):
+        expand(value, env, strict=True)
+
+
+def test_expand_reads_process_environment(monkeypatch):
+    monkeypatch.setenv('DMAKE_TEST_EXPAND', 'from environ')
+    monkeypatch.setenv('DMAKE_DEBUG', '1')
+    for value in ['$DMAKE_TEST_EXPAND', '${DMAKE_DEBUG:-popped}']:
+        assert expand(value) == eval_str_in_env_with_shell(value)
+    assert expand('$DMAKE_TEST_EXPAND', {'DMAKE_TEST_EXPAND': 'overridden'}) == 'overridden'
@@ -0,0 +1,266 @@
+import io
+import os
+import threading
+
+# YAML loading and dumping for common.yaml_ordered_load and common.yaml_ordered_dump.
+#
+# The reference implementation is pure python ruamel.yaml, with YAML 1.1 semantics (what kubectl reads).
+# - ruamel YAML instances are reused (one per thread and options: they are not thread safe).
+# - Loading prefers a libyaml based loader when one is installed, tried in order:
+#   - ruamel.yaml's own C parser (ruamel.yaml.clib),
+#   - PyYAML's C parser, with ruamel's YAML 1.1 implicit resolvers and constructors semantics,
+#   and only if it passes a canary check: loading `canary` must give exactly the same result as the pure loader.
+#   Documents the fast loader cannot load (errors, YAML directives, unusual tags, duplicate keys) are loaded
+#   again with the pure loader: errors are reported by the reference implementation.
+# - Dumping always uses the pure emitter: the C emitters cannot skip the version directive,
+#   and their output is not byte identical.
+#
+# DMAKE_YAML_BACKEND: `auto` (default) or `pure` to disable the libyaml loaders.
+
+backend = os.getenv('DMAKE_YAML_BACKEND', 'auto')
+
+local = threading.local()
+fast_loader_lock = threading.Lock()
+fast_loader = None  # (name, load function), or False when there is none
+
+canary = '''
+booleans: [yes, no, on, off, y, n, true, false, True, FALSE, Yes, NO, 'yes', "no"]
+integers: [0, 42, -7, +12, 0777, 0x1F, 0b101, 1_000, 190:20:30, '12']
+floats: [1.5, -0.5, 1.0e3, 6.8523015e+5, 1_000.5, .inf, -.Inf, .nan, 190:20:30.15]
+nulls: [~, null, Null, '', ""]
+empty:
+dates: [2001-12-14, 2001-12-14t21:59:43.10-05:00, 2001-12-14 21:59:43.10 -5, 2001-12-14 21:59:43]
+strings: [hello, 1.2.3, 0o17, 09, v1, 'single', "double\\ttab", "café", 2001-12-14x]
+literal: |
+  line
+    indented
+
+folded: >-
+  folded
+  text
+base: &base {a: 1, b: [x, y]}
+other: &other {b: 2, c: 3}
+merged:
+  <<: *base
+  b: overridden
+merged_list:
+  <<: [*base, *other]
+  d: 4
+alias: *base
+123: integer key
+true: boolean key
+? complex key
+: complex value
+'''
+canary_duplicate_keys = 'a: 1\nb: 2\na: 3\n'
+
+
+# ruamel.yaml is imported on first use: slow to import, and not needed by all commands
+emitter_no_version_directive = None
+def get_emitter_no_version_directive():
+    global emitter_no_version_directive
+    if emitter_no_version_directive is None:
+        from ruamel.yaml.emitter import Emitter
+
+        class YAMLEmitterNoVersionDirective(Emitter):
+            def write_version_directive(self, version_text):
+                # disable emitting version directive (%YAML 1.1)
+                pass
+        emitter_no_version_directive = YAMLEmitterNoVersionDirective
+    return emitter_no_version_directive
+
+
+def get_pure_loader():
+    loader = getattr(local, 'pure_loader', None)
+    if loader is None:
+        from ruamel.yaml import YAML
+        loader = YAML(typ='safe', pure=True)
+        # kubectl and everyone else uses yaml 1.1
+        loader.version = (1, 1)
+        local.pure_loader = loader
+    return loader
+
+
+def pure_load(stream, all=False):
+    loader = get_pure_loader()
+    return list(loader.load_all(stream)) if all else loader.load(stream)
+
+
+def get_dumper(default_flow_style, normalize_indent):
+    key = (default_flow_style, normalize_indent) if normalize_indent else None
+    dumpers = getattr(local, 'dumpers', None)
+    if dumpers is None:
+        dumpers = local.dumpers = {}
+    dumper = dumpers.get(key)
+    if dumper is None:
+        from ruamel.yaml import YAML
+        dumper = YAML(pure=True)
+        # simplify concatenating yaml files
+        dumper.explicit_start = True
+        # kubernetes reads yaml 1.1, notably interprets `no` as boolean instead of string vs default ruamel which dumps yaml 1.2
+        dumper.version = (1, 1)
+        # kubectl does not tolerate %YAML 1.1 directive, disabling it
+        dumper.Emitter = get_emitter_no_version_directive()
+        if normalize_indent:
+            dumper.default_flow_style = default_flow_style
+            dumper.width = 4096
+            dumper.indent(mapping=2, sequence=4, offset=2)
+        dumpers[key] = dumper
+    return dumper
+
+
+def dump(data, stream, default_flow_style=False, all=False, normalize_indent=False):
+    dumper = get_dumper(default_flow_style, normalize_indent)
+    dumper.dump_all(data, stream) if all else dumper.dump(data, stream)
+
+
+###############################################################################
+# libyaml loaders
+
+def make_ruamel_libyaml_load():
+    import ruamel.yaml.main
+    if ruamel.yaml.main.CParser is None:
+        return None
+    from ruamel.yaml import YAML
+
+    def load(text, all):
+        loader = getattr(local, 'ruamel_libyaml_loader', None)
+        if loader is None:
+            loader = local.ruamel_libyaml_loader = YAML(typ='safe')
+            loader.version = (1, 1)
+        return list(loader.load_all(text)) if all else loader.load(text)
+    return load
+
+
+def make_pyyaml_libyaml_load():
+    try:
+        import yaml
+        from yaml.cyaml import CParser
+    except ImportError:
+        return None
+    import datetime
+    import ruamel.yaml.constructor
+    import ruamel.yaml.resolver
+
+    class Resolver(yaml.resolver.BaseResolver):
+        pass
+    Resolver.yaml_implicit_resolvers = {}
+    for versions, tag, regexp, first in ruamel.yaml.resolver.implicit_resolvers:
+        if (1, 1) in versions:
+            Resolver.add_implicit_resolver(tag, regexp, first)
+
+    class Constructor(yaml.constructor.SafeConstructor):
+        bool_values = ruamel.yaml.constructor.SafeConstructor.bool_values
+
+        def construct_mapping(self, node, deep=False):
+            # ruamel rejects duplicate keys: let it report the error
+            if isinstance(node, yaml.MappingNode):
+                keys = set()
+                for key_node, _ in node.value:
+                    if key_node.tag == 'tag:yaml.org,2002:merge':
+                        continue
+                    key = self.construct_object(key_node, deep=True)
+                    try:
+                        if key in keys:
+                            raise yaml.constructor.ConstructorError(None, None, "duplicate key", key_node.start_mark)
+                        keys.add(key)
+                    except TypeError:
+                        pass
+            return super(Constructor, self).construct_mapping(node, deep=deep)
+
+        def construct_yaml_bool(self, node):
+            return self.bool_values[self.construct_scalar(node).lower()]
+
+        def construct_yaml_timestamp(self, node):
+            # ruamel returns naive UTC datetimes
+            value = super(Constructor, self).construct_yaml_timestamp(node)
+            if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+                value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            return value
+
+    Constructor.add_constructor('tag:yaml.org,2002:bool', Constructor.construct_yaml_bool)
+    Constructor.add_constructor('tag:yaml.org,2002:timestamp', Constructor.construct_yaml_timestamp)
+    # not built like ruamel does: use the pure loader
+    for tag in ['binary', 'omap', 'pairs', 'set']:
+        Constructor.add_constructor('tag:yaml.org,2002:%s' % tag, Constructor.construct_undefined)
+
+    class Loader(CParser, Constructor, Resolver):
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Constructor.__init__(self)
+            Resolver.__init__(self)
+
+    def load(text, all):
+        loader = Loader(text)
+        try:
+            if all:
+                documents = []
+                while loader.check_data():
+                    documents.append(loader.get_data())
+                return documents
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+    return load
+
+
+fast_loaders = [
+    ('ruamel-libyaml', make_ruamel_libyaml_load),
+    ('pyyaml-libyaml', make_pyyaml_libyaml_load),
+]
+
+
+def check_fast_load(load):
+    """The canary check: same result as the pure loader, and duplicate keys are rejected."""
+    if repr(load(canary, False)) != repr(pure_load(canary)):
+        return False
+    try:
+        load(canary_duplicate_keys, False)
+    except Exception:
+        return True
+    return False
+
+
+def get_fast_loader():
+    global fast_loader
+    with fast_loader_lock:
+        if fast_loader is None:
+            fast_loader = False
+            if backend != 'pure':
+                for name, make_load in fast_loaders:
+                    try:
+                        load = make_load()
+                        if load is not None and check_fast_load(load):
+                            fast_loader = (name, load)
+                            break
+                    except Exception:
+                        pass
+        return fast_loader
+
+
+def get_loader_name():
+    loader = get_fast_loader()
+    return loader[0] if loader else 'pure'
+
+
+def load(stream, all=False):
+    loader = get_fast_loader()
+    if not loader:
+        return pure_load(stream, all)
+    if isinstance(stream, str):
+        text = stream
+    else:
+        position = stream.tell() if stream.seekable() else None
+        text = stream.read()
+    if '%YAML' not in text:
+        try:
+            return loader[1](text, all)
+        except Exception:
+            pass
+    if stream is not text:
+        # same error messages: they contain the file name
+        if position is None:
+            stream = io.StringIO(text)
+        else:
+            stream.seek(position)
+    return pure_load(stream, all)
@@ -0,0 +1,6862 @@
+def dmake_echo(message) { sh(script: "echo '${message}'", label: message) }
+dmake_nodes_done = [:]
+@NonCPS
+def dmake_nodes_are_done(names) { names.every { dmake_nodes_done[it] == true } }
+try {
+  sh("dmake_check_tmp_dir")
+
+  stage('Parallel execution') {
+    def dmake_branches_0 = [failFast: true]
+    dmake_chunk_0(dmake_branches_0)
+    dmake_chunk_1(dmake_branches_0)
+    dmake_chunk_2(dmake_branches_0)
+    dmake_chunk_3(dmake_branches_0)
+    dmake_chunk_4(dmake_branches_0)
+    dmake_chunk_5(dmake_branches_0)
+    dmake_chunk_6(dmake_branches_0)
+    dmake_chunk_7(dmake_branches_0)
+    dmake_chunk_8(dmake_branches_0)
+    dmake_chunk_9(dmake_branches_0)
+    dmake_chunk_10(dmake_branches_0)
+    dmake_chunk_11(dmake_branches_0)
+    dmake_chunk_12(dmake_branches_0)
+    dmake_chunk_13(dmake_branches_0)
+    dmake_chunk_14(dmake_branches_0)
+    dmake_chunk_15(dmake_branches_0)
+    dmake_chunk_16(dmake_branches_0)
+    dmake_chunk_17(dmake_branches_0)
+    dmake_chunk_18(dmake_branches_0)
+    dmake_chunk_19(dmake_branches_0)
+    parallel(dmake_branches_0)
+  }
+}
+catch (error) {
+  if ( env.DMAKE_PAUSE_ON_ERROR_BEFORE_CLEANUP == "1" ) {
+    slackSend channel: "#jenkins-dmake", message: "This jenkins build requires your attention: <${env.BUILD_URL}/console|${env.JOB_NAME} ${env.BUILD_NUMBER}>"
+    input message: 'An error occurred. DMake will stop and clean all the running containers upon any answer.'
+  }
+  throw error
+}
+finally {
+  sh("dmake_clean")
+}
+
+def dmake_node_0() {
+  sh("make n0")
+  dmake_nodes_done['n0'] = true
+}
+
+def dmake_node_1() {
+  waitUntil { dmake_nodes_are_done(['n0']) }
+  sh("make n1")
+  dmake_nodes_done['n1'] = true
+}
+
+def dmake_node_2() {
+  waitUntil { dmake_nodes_are_done(['n1']) }
+  sh("make n2")
+  dmake_nodes_done['n2'] = true
+}
+
+def dmake_node_3() {
+  waitUntil { dmake_nodes_are_done(['n2']) }
+  sh("make n3")
+  dmake_nodes_done['n3'] = true
+}
+
+def dmake_node_4() {
+  sh("make n4")
+  dmake_nodes_done['n4'] = true
+}
+
+def dmake_node_5() {
+  waitUntil { dmake_nodes_are_done(['n2']) }
+  sh("make n5")
+  dmake_nodes_done['n5'] = true
+}
+
+def dmake_node_6() {
+  waitUntil { dmake_nodes_are_done(['n3', 'n4']) }
+  sh("make n6")
+  dmake_nodes_done['n6'] = true
+}
+
+def dmake_node_7() {
+  waitUntil { dmake_nodes_are_done(['n4']) }
+  sh("make n7")
+  dmake_nodes_done['n7'] = true
+}
+
+def dmake_node_8() {
+  waitUntil { dmake_nodes_are_done(['n0', 'n6']) }
+  sh("make n8")
+  dmake_nodes_done['n8'] = true
+}
+
+def dmake_node_9() {
+  sh("make n9")
+  dmake_nodes_done['n9'] = true
+}
+
+def dmake_node_10() {
+  sh("make n10")
+  dmake_nodes_done['n10'] = true
+}
+
+def dmake_node_11() {
+  waitUntil { dmake_nodes_are_done(['n3', 'n5']) }
+  sh("make n11")
+  dmake_nodes_done['n11'] = true
+}
+
+def dmake_node_12() {
+  waitUntil { dmake_nodes_are_done(['n3']) }
+  sh("make n12")
+  dmake_nodes_done['n12'] = true
+}
+
+def dmake_node_13() {
+  waitUntil { dmake_nodes_are_done(['n2', 'n6', 'n12']) }
+  sh("make n13")
+  dmake_nodes_done['n13'] = true
+}
+
+def dmake_node_14() {
+  waitUntil { dmake_nodes_are_done(['n3', 'n6', 'n10']) }
+  sh("make n14")
+  dmake_nodes_done['n14'] = true
+}
+
+def dmake_node_15() {
+  waitUntil { dmake_nodes_are_done(['n6', 'n11']) }
+  sh("make n15")
+  dmake_nodes_done['n15'] = true
+}
+
+def dmake_node_16() {
+  waitUntil { dmake_nodes_are_done(['n5', 'n11']) }
+  sh("make n16")
+  dmake_nodes_done['n16'] = true
+}
+
+def dmake_node_17() {
+  waitUntil { dmake_nodes_are_done(['n9']) }
+  sh("make n17")
+  dmake_nodes_done['n17'] = true
+}
+
+def dmake_node_18() {
+  sh("make n18")
+  dmake_nodes_done['n18'] = true
+}
+
+def dmake_node_19() {
+  waitUntil { dmake_nodes_are_done(['n8', 'n9', 'n18']) }
+  sh("make n19")
+  dmake_nodes_done['n19'] = true
+}
+
+def dmake_node_20() {
+  sh("make n20")
+  dmake_nodes_done['n20'] = true
+}
+
+def dmake_node_21() {
+  waitUntil { dmake_nodes_are_done(['n13', 'n17', 'n20']) }
+  sh("make n21")
+  dmake_nodes_done['n21'] = true
+}
+
+def dmake_node_22() {
+  waitUntil { dmake_nodes_are_done(['n20']) }
+  sh("make n22")
+  dmake_nodes_done['n22'] = true
+}
+
+def dmake_node_23() {
+  waitUntil { dmake_nodes_are_done(['n18', 'n22']) }
+  sh("make n23")
+  dmake_nodes_done['n23'] = true
+}
+
+def dmake_node_24() {
+  waitUntil { dmake_nodes_are_done(['n13', 'n17']) }
+  sh("make n24")
+  dmake_nodes_done['n24'] = true
+}
+
+def dmake_node_25() {
+  waitUntil { dmake_nodes_are_done(['n16', 'n24']) }
+  sh("make n25")
+  dmake_nodes_done['n25'] = true
+}
+
+def dmake_node_26() {
+  waitUntil { dmake_nodes_are_done(['n19']) }
+  sh("make n26")
+  dmake_nodes_done['n26'] = true
+}
+
+def dmake_node_27() {
+  sh("make n27")
+  dmake_nodes_done['n27'] = true
+}
+
+def dmake_node_28() {
+  waitUntil { dmake_nodes_are_done(['n16']) }
+  sh("make n28")
+  dmake_nodes_done['n28'] = true
+}
+
+def dmake_node_29() {
+  sh("make n29")
+  dmake_nodes_done['n29'] = true
+}
+
+def dmake_node_30() {
+  sh("make n30")
+  dmake_nodes_done['n30'] = true
+}
+
+def dmake_node_31() {
+  sh("make n31")
+  dmake_nodes_done['n31'] = true
+}
+
+def dmake_node_32() {
+  waitUntil { dmake_nodes_are_done(['n31']) }
+  sh("make n32")
+  dmake_nodes_done['n32'] = true
+}
+
+def dmake_node_33() {
+  sh("make n33")
+  dmake_nodes_done['n33'] = true
+}
+
+def dmake_node_34() {
+  waitUntil { dmake_nodes_are_done(['n23', 'n26', 'n31']) }
+  sh("make n34")
+  dmake_nodes_done['n34'] = true
+}
+
+def dmake_node_35() {
+  waitUntil { dmake_nodes_are_done(['n28', 'n29']) }
+  sh("make n35")
+  dmake_nodes_done['n35'] = true
+}
+
+def dmake_node_36() {
+  sh("make n36")
+  dmake_nodes_done['n36'] = true
+}
+
+def dmake_node_37() {
+  waitUntil { dmake_nodes_are_done(['n28', 'n29', 'n30']) }
+  sh("make n37")
+  dmake_nodes_done['n37'] = true
+}
+
+def dmake_node_38() {
+  waitUntil { dmake_nodes_are_done(['n37']) }
+  sh("make n38")
+  dmake_nodes_done['n38'] = true
+}
+
+def dmake_node_39() {
+  sh("make n39")
+  dmake_nodes_done['n39'] = true
+}
+
+def dmake_node_40() {
+  waitUntil { dmake_nodes_are_done(['n33']) }
+  sh("make n40")
+  dmake_nodes_done['n40'] = true
+}
+
+def dmake_node_41() {
+  waitUntil { dmake_nodes_are_done(['n29', 'n31', 'n39']) }
+  sh("make n41")
+  dmake_nodes_done['n41'] = true
+}
+
+def dmake_node_42() {
+  waitUntil { dmake_nodes_are_done(['n35', 'n40']) }
+  sh("make n42")
+  dmake_nodes_done['n42'] = true
+}
+
+def dmake_node_43() {
+  waitUntil { dmake_nodes_are_done(['n39']) }
+  sh("make n43")
+  dmake_nodes_done['n43'] = true
+}
+
+def dmake_node_44() {
+  sh("make n44")
+  dmake_nodes_done['n44'] = true
+}
+
+def dmake_node_45() {
+  waitUntil { dmake_nodes_are_done(['n35', 'n36']) }
+  sh("make n45")
+  dmake_nodes_done['n45'] = true
+}
+
+def dmake_node_46() {
+  waitUntil { dmake_nodes_are_done(['n39', 'n44']) }
+  sh("make n46")
+  dmake_nodes_done['n46'] = true
+}
+
+def dmake_node_47() {
+  waitUntil { dmake_nodes_are_done(['n46']) }
+  sh("make n47")
+  dmake_nodes_done['n47'] = true
+}
+
+def dmake_node_48() {
+  sh("make n48")
+  dmake_nodes_done['n48'] = true
+}
+
+def dmake_node_49() {
+  waitUntil { dmake_nodes_are_done(['n39', 'n40']) }
+  sh("make n49")
+  dmake_nodes_done['n49'] = true
+}
+
+def dmake_node_50() {
+  waitUntil { dmake_nodes_are_done(['n38', 'n44', 'n47']) }
+  sh("make n50")
+  dmake_nodes_done['n50'] = true
+}
+
+def dmake_node_51() {
+  sh("make n51")
+  dmake_nodes_done['n51'] = true
+}
+
+def dmake_node_52() {
+  waitUntil { dmake_nodes_are_done(['n47']) }
+  sh("make n52")
+  dmake_nodes_done['n52'] = true
+}
+
+def dmake_node_53() {
+  sh("make n53")
+  dmake_nodes_done['n53'] = true
+}
+
+def dmake_node_54() {
+  waitUntil { dmake_nodes_are_done(['n42', 'n49']) }
+  sh("make n54")
+  dmake_nodes_done['n54'] = true
+}
+
+def dmake_node_55() {
+  waitUntil { dmake_nodes_are_done(['n44', 'n46', 'n51']) }
+  sh("make n55")
+  dmake_nodes_done['n55'] = true
+}
+
+def dmake_node_56() {
+  sh("make n56")
+  dmake_nodes_done['n56'] = true
+}
+
+def dmake_node_57() {
+  waitUntil { dmake_nodes_are_done(['n45', 'n48']) }
+  sh("make n57")
+  dmake_nodes_done['n57'] = true
+}
+
+def dmake_node_58() {
+  sh("make n58")
+  dmake_nodes_done['n58'] = true
+}
+
+def dmake_node_59() {
+  waitUntil { dmake_nodes_are_done(['n51']) }
+  sh("make n59")
+  dmake_nodes_done['n59'] = true
+}
+
+def dmake_node_60() {
+  sh("make n60")
+  dmake_nodes_done['n60'] = true
+}
+
+def dmake_node_61() {
+  sh("make n61")
+  dmake_nodes_done['n61'] = true
+}
+
+def dmake_node_62() {
+  sh("make n62")
+  dmake_nodes_done['n62'] = true
+}
+
+def dmake_node_63() {
+  waitUntil { dmake_nodes_are_done(['n52', 'n53']) }
+  sh("make n63")
+  dmake_nodes_done['n63'] = true
+}
+
+def dmake_node_64() {
+  sh("make n64")
+  dmake_nodes_done['n64'] = true
+}
+
+def dmake_node_65() {
+  waitUntil { dmake_nodes_are_done(['n58', 'n62']) }
+  sh("make n65")
+  dmake_nodes_done['n65'] = true
+}
+
+def dmake_node_66() {
+  waitUntil { dmake_nodes_are_done(['n61', 'n64', 'n65']) }
+  sh("make n66")
+  dmake_nodes_done['n66'] = true
+}
+
+def dmake_node_67() {
+  waitUntil { dmake_nodes_are_done(['n58']) }
+  sh("make n67")
+  dmake_nodes_done['n67'] = true
+}
+
+def dmake_node_68() {
+  waitUntil { dmake_nodes_are_done(['n58']) }
+  sh("make n68")
+  dmake_nodes_done['n68'] = true
+}
+
+def dmake_node_69() {
+  waitUntil { dmake_nodes_are_done(['n58', 'n68']) }
+  sh("make n69")
+  dmake_nodes_done['n69'] = true
+}
+
+def dmake_node_70() {
+  sh("make n70")
+  dmake_nodes_done['n70'] = true
+}
+
+def dmake_node_71() {
+  waitUntil { dmake_nodes_are_done(['n64', 'n65']) }
+  sh("make n71")
+  dmake_nodes_done['n71'] = true
+}
+
+def dmake_node_72() {
+  sh("make n72")
+  dmake_nodes_done['n72'] = true
+}
+
+def dmake_node_73() {
+  sh("make n73")
+  dmake_nodes_done['n73'] = true
+}
+
+def dmake_node_74() {
+  sh("make n74")
+  dmake_nodes_done['n74'] = true
+}
+
+def dmake_node_75() {
+  waitUntil { dmake_nodes_are_done(['n64', 'n69']) }
+  sh("make n75")
+  dmake_nodes_done['n75'] = true
+}
+
+def dmake_node_76() {
+  waitUntil { dmake_nodes_are_done(['n65', 'n69', 'n75']) }
+  sh("make n76")
+  dmake_nodes_done['n76'] = true
+}
+
+def dmake_node_77() {
+  waitUntil { dmake_nodes_are_done(['n65', 'n69', 'n70']) }
+  sh("make n77")
+  dmake_nodes_done['n77'] = true
+}
+
+def dmake_node_78() {
+  waitUntil { dmake_nodes_are_done(['n76']) }
+  sh("make n78")
+  dmake_nodes_done['n78'] = true
+}
+
+def dmake_node_79() {
+  sh("make n79")
+  dmake_nodes_done['n79'] = true
+}
+
+def dmake_node_80() {
+  waitUntil { dmake_nodes_are_done(['n68']) }
+  sh("make n80")
+  dmake_nodes_done['n80'] = true
+}
+
+def dmake_node_81() {
+  waitUntil { dmake_nodes_are_done(['n76', 'n80']) }
+  sh("make n81")
+  dmake_nodes_done['n81'] = true
+}
+
+def dmake_node_82() {
+  waitUntil { dmake_nodes_are_done(['n76']) }
+  sh("make n82")
+  dmake_nodes_done['n82'] = true
+}
+
+def dmake_node_83() {
+  waitUntil { dmake_nodes_are_done(['n73', 'n80']) }
+  sh("make n83")
+  dmake_nodes_done['n83'] = true
+}
+
+def dmake_node_84() {
+  sh("make n84")
+  dmake_nodes_done['n84'] = true
+}
+
+def dmake_node_85() {
+  sh("make n85")
+  dmake_nodes_done['n85'] = true
+}
+
+def dmake_node_86() {
+  waitUntil { dmake_nodes_are_done(['n75']) }
+  sh("make n86")
+  dmake_nodes_done['n86'] = true
+}
+
+def dmake_node_87() {
+  sh("make n87")
+  dmake_nodes_done['n87'] = true
+}
+
+def dmake_node_88() {
+  waitUntil { dmake_nodes_are_done(['n77']) }
+  sh("make n88")
+  dmake_nodes_done['n88'] = true
+}
+
+def dmake_node_89() {
+  waitUntil { dmake_nodes_are_done(['n78']) }
+  sh("make n89")
+  dmake_nodes_done['n89'] = true
+}
+
+def dmake_node_90() {
+  waitUntil { dmake_nodes_are_done(['n87']) }
+  sh("make n90")
+  dmake_nodes_done['n90'] = true
+}
+
+def dmake_node_91() {
+  waitUntil { dmake_nodes_are_done(['n84', 'n86', 'n89']) }
+  sh("make n91")
+  dmake_nodes_done['n91'] = true
+}
+
+def dmake_node_92() {
+  waitUntil { dmake_nodes_are_done(['n88']) }
+  sh("make n92")
+  dmake_nodes_done['n92'] = true
+}
+
+def dmake_node_93() {
+  waitUntil { dmake_nodes_are_done(['n86', 'n92']) }
+  sh("make n93")
+  dmake_nodes_done['n93'] = true
+}
+
+def dmake_node_94() {
+  waitUntil { dmake_nodes_are_done(['n86']) }
+  sh("make n94")
+  dmake_nodes_done['n94'] = true
+}
+
+def dmake_node_95() {
+  waitUntil { dmake_nodes_are_done(['n87', 'n90', 'n92']) }
+  sh("make n95")
+  dmake_nodes_done['n95'] = true
+}
+
+def dmake_node_96() {
+  sh("make n96")
+  dmake_nodes_done['n96'] = true
+}
+
+def dmake_node_97() {
+  waitUntil { dmake_nodes_are_done(['n85', 'n92']) }
+  sh("make n97")
+  dmake_nodes_done['n97'] = true
+}
+
+def dmake_node_98() {
+  waitUntil { dmake_nodes_are_done(['n96']) }
+  sh("make n98")
+  dmake_nodes_done['n98'] = true
+}
+
+def dmake_node_99() {
+  waitUntil { dmake_nodes_are_done(['n87', 'n95', 'n98']) }
+  sh("make n99")
+  dmake_nodes_done['n99'] = true
+}
+
+def dmake_node_100() {
+  sh("make n100")
+  dmake_nodes_done['n100'] = true
+}
+
+def dmake_node_101() {
+  waitUntil { dmake_nodes_are_done(['n93']) }
+  sh("make n101")
+  dmake_nodes_done['n101'] = true
+}
+
+def dmake_node_102() {
+  waitUntil { dmake_nodes_are_done(['n96', 'n99', 'n100']) }
+  sh("make n102")
+  dmake_nodes_done['n102'] = true
+}
+
+def dmake_node_103() {
+  sh("make n103")
+  dmake_nodes_done['n103'] = true
+}
+
+def dmake_node_104() {
+  waitUntil { dmake_nodes_are_done(['n96']) }
+  sh("make n104")
+  dmake_nodes_done['n104'] = true
+}
+
+def dmake_node_105() {
+  sh("make n105")
+  dmake_nodes_done['n105'] = true
+}
+
+def dmake_node_106() {
+  waitUntil { dmake_nodes_are_done(['n100', 'n105']) }
+  sh("make n106")
+  dmake_nodes_done['n106'] = true
+}
+
+def dmake_node_107() {
+  waitUntil { dmake_nodes_are_done(['n98']) }
+  sh("make n107")
+  dmake_nodes_done['n107'] = true
+}
+
+def dmake_node_108() {
+  sh("make n108")
+  dmake_nodes_done['n108'] = true
+}
+
+def dmake_node_109() {
+  waitUntil { dmake_nodes_are_done(['n104']) }
+  sh("make n109")
+  dmake_nodes_done['n109'] = true
+}
+
+def dmake_node_110() {
+  sh("make n110")
+  dmake_nodes_done['n110'] = true
+}
+
+def dmake_node_111() {
+  waitUntil { dmake_nodes_are_done(['n99', 'n105']) }
+  sh("make n111")
+  dmake_nodes_done['n111'] = true
+}
+
+def dmake_node_112() {
+  sh("make n112")
+  dmake_nodes_done['n112'] = true
+}
+
+def dmake_node_113() {
+  sh("make n113")
+  dmake_nodes_done['n113'] = true
+}
+
+def dmake_node_114() {
+  waitUntil { dmake_nodes_are_done(['n103', 'n110']) }
+  sh("make n114")
+  dmake_nodes_done['n114'] = true
+}
+
+def dmake_node_115() {
+  waitUntil { dmake_nodes_are_done(['n103', 'n104', 'n112']) }
+  sh("make n115")
+  dmake_nodes_done['n115'] = true
+}
+
+def dmake_node_116() {
+  waitUntil { dmake_nodes_are_done(['n105', 'n114']) }
+  sh("make n116")
+  dmake_nodes_done['n116'] = true
+}
+
+def dmake_node_117() {
+  waitUntil { dmake_nodes_are_done(['n107', 'n111']) }
+  sh("make n117")
+  dmake_nodes_done['n117'] = true
+}
+
+def dmake_node_118() {
+  sh("make n118")
+  dmake_nodes_done['n118'] = true
+}
+
+def dmake_node_119() {
+  waitUntil { dmake_nodes_are_done(['n107']) }
+  sh("make n119")
+  dmake_nodes_done['n119'] = true
+}
+
+def dmake_node_120() {
+  waitUntil { dmake_nodes_are_done(['n115']) }
+  sh("make n120")
+  dmake_nodes_done['n120'] = true
+}
+
+def dmake_node_121() {
+  sh("make n121")
+  dmake_nodes_done['n121'] = true
+}
+
+def dmake_node_122() {
+  waitUntil { dmake_nodes_are_done(['n110', 'n118']) }
+  sh("make n122")
+  dmake_nodes_done['n122'] = true
+}
+
+def dmake_node_123() {
+  waitUntil { dmake_nodes_are_done(['n114']) }
+  sh("make n123")
+  dmake_nodes_done['n123'] = true
+}
+
+def dmake_node_124() {
+  waitUntil { dmake_nodes_are_done(['n113', 'n116', 'n120']) }
+  sh("make n124")
+  dmake_nodes_done['n124'] = true
+}
+
+def dmake_node_125() {
+  waitUntil { dmake_nodes_are_done(['n114', 'n119', 'n124']) }
+  sh("make n125")
+  dmake_nodes_done['n125'] = true
+}
+
+def dmake_node_126() {
+  waitUntil { dmake_nodes_are_done(['n125']) }
+  sh("make n126")
+  dmake_nodes_done['n126'] = true
+}
+
+def dmake_node_127() {
+  waitUntil { dmake_nodes_are_done(['n115', 'n121', 'n125']) }
+  sh("make n127")
+  dmake_nodes_done['n127'] = true
+}
+
+def dmake_node_128() {
+  waitUntil { dmake_nodes_are_done(['n120', 'n127']) }
+  sh("make n128")
+  dmake_nodes_done['n128'] = true
+}
+
+def dmake_node_129() {
+  waitUntil { dmake_nodes_are_done(['n117', 'n128']) }
+  sh("make n129")
+  dmake_nodes_done['n129'] = true
+}
+
+def dmake_node_130() {
+  waitUntil { dmake_nodes_are_done(['n123']) }
+  sh("make n130")
+  dmake_nodes_done['n130'] = true
+}
+
+def dmake_node_131() {
+  waitUntil { dmake_nodes_are_done(['n119']) }
+  sh("make n131")
+  dmake_nodes_done['n131'] = true
+}
+
+def dmake_node_132() {
+  sh("make n132")
+  dmake_nodes_done['n132'] = true
+}
+
+def dmake_node_133() {
+  sh("make n133")
+  dmake_nodes_done['n133'] = true
+}
+
+def dmake_node_134() {
+  waitUntil { dmake_nodes_are_done(['n124']) }
+  sh("make n134")
+  dmake_nodes_done['n134'] = true
+}
+
+def dmake_node_135() {
+  waitUntil { dmake_nodes_are_done(['n123', 'n125']) }
+  sh("make n135")
+  dmake_nodes_done['n135'] = true
+}
+
+def dmake_node_136() {
+  waitUntil { dmake_nodes_are_done(['n128', 'n132', 'n135']) }
+  sh("make n136")
+  dmake_nodes_done['n136'] = true
+}
+
+def dmake_node_137() {
+  sh("make n137")
+  dmake_nodes_done['n137'] = true
+}
+
+def dmake_node_138() {
+  waitUntil { dmake_nodes_are_done(['n132']) }
+  sh("make n138")
+  dmake_nodes_done['n138'] = true
+}
+
+def dmake_node_139() {
+  waitUntil { dmake_nodes_are_done(['n132']) }
+  sh("make n139")
+  dmake_nodes_done['n139'] = true
+}
+
+def dmake_node_140() {
+  waitUntil { dmake_nodes_are_done(['n132']) }
+  sh("make n140")
+  dmake_nodes_done['n140'] = true
+}
+
+def dmake_node_141() {
+  waitUntil { dmake_nodes_are_done(['n138']) }
+  sh("make n141")
+  dmake_nodes_done['n141'] = true
+}
+
+def dmake_node_142() {
+  sh("make n142")
+  dmake_nodes_done['n142'] = true
+}
+
+def dmake_node_143() {
+  waitUntil { dmake_nodes_are_done(['n133', 'n140', 'n142']) }
+  sh("make n143")
+  dmake_nodes_done['n143'] = true
+}
+
+def dmake_node_144() {
+  sh("make n144")
+  dmake_nodes_done['n144'] = true
+}
+
+def dmake_node_145() {
+  sh("make n145")
+  dmake_nodes_done['n145'] = true
+}
+
+def dmake_node_146() {
+  waitUntil { dmake_nodes_are_done(['n137', 'n141']) }
+  sh("make n146")
+  dmake_nodes_done['n146'] = true
+}
+
+def dmake_node_147() {
+  sh("make n147")
+  dmake_nodes_done['n147'] = true
+}
+
+def dmake_node_148() {
+  waitUntil { dmake_nodes_are_done(['n137', 'n144']) }
+  sh("make n148")
+  dmake_nodes_done['n148'] = true
+}
+
+def dmake_node_149() {
+  waitUntil { dmake_nodes_are_done(['n139', 'n143', 'n148']) }
+  sh("make n149")
+  dmake_nodes_done['n149'] = true
+}
+
+def dmake_node_150() {
+  waitUntil { dmake_nodes_are_done(['n140', 'n143', 'n146']) }
+  sh("make n150")
+  dmake_nodes_done['n150'] = true
+}
+
+def dmake_node_151() {
+  sh("make n151")
+  dmake_nodes_done['n151'] = true
+}
+
+def dmake_node_152() {
+  sh("make n152")
+  dmake_nodes_done['n152'] = true
+}
+
+def dmake_node_153() {
+  waitUntil { dmake_nodes_are_done(['n141', 'n144', 'n145']) }
+  sh("make n153")
+  dmake_nodes_done['n153'] = true
+}
+
+def dmake_node_154() {
+  waitUntil { dmake_nodes_are_done(['n150', 'n151']) }
+  sh("make n154")
+  dmake_nodes_done['n154'] = true
+}
+
+def dmake_node_155() {
+  waitUntil { dmake_nodes_are_done(['n144', 'n150', 'n153']) }
+  sh("make n155")
+  dmake_nodes_done['n155'] = true
+}
+
+def dmake_node_156() {
+  waitUntil { dmake_nodes_are_done(['n144', 'n148', 'n154']) }
+  sh("make n156")
+  dmake_nodes_done['n156'] = true
+}
+
+def dmake_node_157() {
+  sh("make n157")
+  dmake_nodes_done['n157'] = true
+}
+
+def dmake_node_158() {
+  waitUntil { dmake_nodes_are_done(['n147', 'n150', 'n153']) }
+  sh("make n158")
+  dmake_nodes_done['n158'] = true
+}
+
+def dmake_node_159() {
+  waitUntil { dmake_nodes_are_done(['n156']) }
+  sh("make n159")
+  dmake_nodes_done['n159'] = true
+}
+
+def dmake_node_160() {
+  waitUntil { dmake_nodes_are_done(['n152', 'n156']) }
+  sh("make n160")
+  dmake_nodes_done['n160'] = true
+}
+
+def dmake_node_161() {
+  waitUntil { dmake_nodes_are_done(['n151']) }
+  sh("make n161")
+  dmake_nodes_done['n161'] = true
+}
+
+def dmake_node_162() {
+  waitUntil { dmake_nodes_are_done(['n152', 'n158']) }
+  sh("make n162")
+  dmake_nodes_done['n162'] = true
+}
+
+def dmake_node_163() {
+  sh("make n163")
+  dmake_nodes_done['n163'] = true
+}
+
+def dmake_node_164() {
+  waitUntil { dmake_nodes_are_done(['n156', 'n162', 'n163']) }
+  sh("make n164")
+  dmake_nodes_done['n164'] = true
+}
+
+def dmake_node_165() {
+  waitUntil { dmake_nodes_are_done(['n155']) }
+  sh("make n165")
+  dmake_nodes_done['n165'] = true
+}
+
+def dmake_node_166() {
+  waitUntil { dmake_nodes_are_done(['n156', 'n161', 'n163']) }
+  sh("make n166")
+  dmake_nodes_done['n166'] = true
+}
+
+def dmake_node_167() {
+  waitUntil { dmake_nodes_are_done(['n158', 'n161', 'n166']) }
+  sh("make n167")
+  dmake_nodes_done['n167'] = true
+}
+
+def dmake_node_168() {
+  waitUntil { dmake_nodes_are_done(['n163', 'n166']) }
+  sh("make n168")
+  dmake_nodes_done['n168'] = true
+}
+
+def dmake_node_169() {
+  waitUntil { dmake_nodes_are_done(['n168']) }
+  sh("make n169")
+  dmake_nodes_done['n169'] = true
+}
+
+def dmake_node_170() {
+  waitUntil { dmake_nodes_are_done(['n158']) }
+  sh("make n170")
+  dmake_nodes_done['n170'] = true
+}
+
+def dmake_node_171() {
+  sh("make n171")
+  dmake_nodes_done['n171'] = true
+}
+
+def dmake_node_172() {
+  sh("make n172")
+  dmake_nodes_done['n172'] = true
+}
+
+def dmake_node_173() {
+  waitUntil { dmake_nodes_are_done(['n161', 'n166', 'n172']) }
+  sh("make n173")
+  dmake_nodes_done['n173'] = true
+}
+
+def dmake_node_174() {
+  waitUntil { dmake_nodes_are_done(['n166', 'n172']) }
+  sh("make n174")
+  dmake_nodes_done['n174'] = true
+}
+
+def dmake_node_175() {
+  waitUntil { dmake_nodes_are_done(['n164', 'n166']) }
+  sh("make n175")
+  dmake_nodes_done['n175'] = true
+}
+
+def dmake_node_176() {
+  waitUntil { dmake_nodes_are_done(['n166', 'n169', 'n170']) }
+  sh("make n176")
+  dmake_nodes_done['n176'] = true
+}
+
+def dmake_node_177() {
+  waitUntil { dmake_nodes_are_done(['n172']) }
+  sh("make n177")
+  dmake_nodes_done['n177'] = true
+}
+
+def dmake_node_178() {
+  waitUntil { dmake_nodes_are_done(['n168', 'n169']) }
+  sh("make n178")
+  dmake_nodes_done['n178'] = true
+}
+
+def dmake_node_179() {
+  waitUntil { dmake_nodes_are_done(['n173', 'n174', 'n178']) }
+  sh("make n179")
+  dmake_nodes_done['n179'] = true
+}
+
+def dmake_node_180() {
+  waitUntil { dmake_nodes_are_done(['n168', 'n171', 'n177']) }
+  sh("make n180")
+  dmake_nodes_done['n180'] = true
+}
+
+def dmake_node_181() {
+  sh("make n181")
+  dmake_nodes_done['n181'] = true
+}
+
+def dmake_node_182() {
+  waitUntil { dmake_nodes_are_done(['n173']) }
+  sh("make n182")
+  dmake_nodes_done['n182'] = true
+}
+
+def dmake_node_183() {
+  waitUntil { dmake_nodes_are_done(['n176', 'n177']) }
+  sh("make n183")
+  dmake_nodes_done['n183'] = true
+}
+
+def dmake_node_184() {
+  waitUntil { dmake_nodes_are_done(['n179', 'n181', 'n182']) }
+  sh("make n184")
+  dmake_nodes_done['n184'] = true
+}
+
+def dmake_node_185() {
+  waitUntil { dmake_nodes_are_done(['n173', 'n177']) }
+  sh("make n185")
+  dmake_nodes_done['n185'] = true
+}
+
+def dmake_node_186() {
+  sh("make n186")
+  dmake_nodes_done['n186'] = true
+}
+
+def dmake_node_187() {
+  sh("make n187")
+  dmake_nodes_done['n187'] = true
+}
+
+def dmake_node_188() {
+  waitUntil { dmake_nodes_are_done(['n179', 'n183', 'n184']) }
+  sh("make n188")
+  dmake_nodes_done['n188'] = true
+}
+
+def dmake_node_189() {
+  sh("make n189")
+  dmake_nodes_done['n189'] = true
+}
+
+def dmake_node_190() {
+  waitUntil { dmake_nodes_are_done(['n178', 'n182', 'n183']) }
+  sh("make n190")
+  dmake_nodes_done['n190'] = true
+}
+
+def dmake_node_191() {
+  sh("make n191")
+  dmake_nodes_done['n191'] = true
+}
+
+def dmake_node_192() {
+  waitUntil { dmake_nodes_are_done(['n183']) }
+  sh("make n192")
+  dmake_nodes_done['n192'] = true
+}
+
+def dmake_node_193() {
+  waitUntil { dmake_nodes_are_done(['n185', 'n189']) }
+  sh("make n193")
+  dmake_nodes_done['n193'] = true
+}
+
+def dmake_node_194() {
+  waitUntil { dmake_nodes_are_done(['n185', 'n193']) }
+  sh("make n194")
+  dmake_nodes_done['n194'] = true
+}
+
+def dmake_node_195() {
+  sh("make n195")
+  dmake_nodes_done['n195'] = true
+}
+
+def dmake_node_196() {
+  waitUntil { dmake_nodes_are_done(['n184', 'n190', 'n191']) }
+  sh("make n196")
+  dmake_nodes_done['n196'] = true
+}
+
+def dmake_node_197() {
+  sh("make n197")
+  dmake_nodes_done['n197'] = true
+}
+
+def dmake_node_198() {
+  waitUntil { dmake_nodes_are_done(['n192']) }
+  sh("make n198")
+  dmake_nodes_done['n198'] = true
+}
+
+def dmake_node_199() {
+  sh("make n199")
+  dmake_nodes_done['n199'] = true
+}
+
+def dmake_node_200() {
+  waitUntil { dmake_nodes_are_done(['n188', 'n190', 'n191']) }
+  sh("make n200")
+  dmake_nodes_done['n200'] = true
+}
+
+def dmake_node_201() {
+  waitUntil { dmake_nodes_are_done(['n194', 'n200']) }
+  sh("make n201")
+  dmake_nodes_done['n201'] = true
+}
+
+def dmake_node_202() {
+  waitUntil { dmake_nodes_are_done(['n198', 'n199']) }
+  sh("make n202")
+  dmake_nodes_done['n202'] = true
+}
+
+def dmake_node_203() {
+  waitUntil { dmake_nodes_are_done(['n198', 'n199', 'n200']) }
+  sh("make n203")
+  dmake_nodes_done['n203'] = true
+}
+
+def dmake_node_204() {
+  waitUntil { dmake_nodes_are_done(['n192']) }
+  sh("make n204")
+  dmake_nodes_done['n204'] = true
+}
+
+def dmake_node_205() {
+  sh("make n205")
+  dmake_nodes_done['n205'] = true
+}
+
+def dmake_node_206() {
+  waitUntil { dmake_nodes_are_done(['n198']) }
+  sh("make n206")
+  dmake_nodes_done['n206'] = true
+}
+
+def dmake_node_207() {
+  sh("make n207")
+  dmake_nodes_done['n207'] = true
+}
+
+def dmake_node_208() {
+  sh("make n208")
+  dmake_nodes_done['n208'] = true
+}
+
+def dmake_node_209() {
+  sh("make n209")
+  dmake_nodes_done['n209'] = true
+}
+
+def dmake_node_210() {
+  waitUntil { dmake_nodes_are_done(['n208']) }
+  sh("make n210")
+  dmake_nodes_done['n210'] = true
+}
+
+def dmake_node_211() {
+  waitUntil { dmake_nodes_are_done(['n202', 'n210']) }
+  sh("make n211")
+  dmake_nodes_done['n211'] = true
+}
+
+def dmake_node_212() {
+  waitUntil { dmake_nodes_are_done(['n203', 'n205']) }
+  sh("make n212")
+  dmake_nodes_done['n212'] = true
+}
+
+def dmake_node_213() {
+  waitUntil { dmake_nodes_are_done(['n203']) }
+  sh("make n213")
+  dmake_nodes_done['n213'] = true
+}
+
+def dmake_node_214() {
+  waitUntil { dmake_nodes_are_done(['n207', 'n211']) }
+  sh("make n214")
+  dmake_nodes_done['n214'] = true
+}
+
+def dmake_node_215() {
+  waitUntil { dmake_nodes_are_done(['n205', 'n211', 'n214']) }
+  sh("make n215")
+  dmake_nodes_done['n215'] = true
+}
+
+def dmake_node_216() {
+  waitUntil { dmake_nodes_are_done(['n211']) }
+  sh("make n216")
+  dmake_nodes_done['n216'] = true
+}
+
+def dmake_node_217() {
+  waitUntil { dmake_nodes_are_done(['n208']) }
+  sh("make n217")
+  dmake_nodes_done['n217'] = true
+}
+
+def dmake_node_218() {
+  waitUntil { dmake_nodes_are_done(['n211', 'n215', 'n216']) }
+  sh("make n218")
+  dmake_nodes_done['n218'] = true
+}
+
+def dmake_node_219() {
+  sh("make n219")
+  dmake_nodes_done['n219'] = true
+}
+
+def dmake_node_220() {
+  waitUntil { dmake_nodes_are_done(['n215', 'n219']) }
+  sh("make n220")
+  dmake_nodes_done['n220'] = true
+}
+
+def dmake_node_221() {
+  waitUntil { dmake_nodes_are_done(['n219']) }
+  sh("make n221")
+  dmake_nodes_done['n221'] = true
+}
+
+def dmake_node_222() {
+  waitUntil { dmake_nodes_are_done(['n211', 'n215', 'n218']) }
+  sh("make n222")
+  dmake_nodes_done['n222'] = true
+}
+
+def dmake_node_223() {
+  waitUntil { dmake_nodes_are_done(['n216']) }
+  sh("make n223")
+  dmake_nodes_done['n223'] = true
+}
+
+def dmake_node_224() {
+  sh("make n224")
+  dmake_nodes_done['n224'] = true
+}
+
+def dmake_node_225() {
+  waitUntil { dmake_nodes_are_done(['n218']) }
+  sh("make n225")
+  dmake_nodes_done['n225'] = true
+}
+
+def dmake_node_226() {
+  waitUntil { dmake_nodes_are_done(['n218']) }
+  sh("make n226")
+  dmake_nodes_done['n226'] = true
+}
+
+def dmake_node_227() {
+  sh("make n227")
+  dmake_nodes_done['n227'] = true
+}
+
+def dmake_node_228() {
+  waitUntil { dmake_nodes_are_done(['n221']) }
+  sh("make n228")
+  dmake_nodes_done['n228'] = true
+}
+
+def dmake_node_229() {
+  sh("make n229")
+  dmake_nodes_done['n229'] = true
+}
+
+def dmake_node_230() {
+  waitUntil { dmake_nodes_are_done(['n218', 'n219']) }
+  sh("make n230")
+  dmake_nodes_done['n230'] = true
+}
+
+def dmake_node_231() {
+  waitUntil { dmake_nodes_are_done(['n222']) }
+  sh("make n231")
+  dmake_nodes_done['n231'] = true
+}
+
+def dmake_node_232() {
+  waitUntil { dmake_nodes_are_done(['n222', 'n230']) }
+  sh("make n232")
+  dmake_nodes_done['n232'] = true
+}
+
+def dmake_node_233() {
+  waitUntil { dmake_nodes_are_done(['n221', 'n227', 'n232']) }
+  sh("make n233")
+  dmake_nodes_done['n233'] = true
+}
+
+def dmake_node_234() {
+  waitUntil { dmake_nodes_are_done(['n222', 'n223', 'n231']) }
+  sh("make n234")
+  dmake_nodes_done['n234'] = true
+}
+
+def dmake_node_235() {
+  sh("make n235")
+  dmake_nodes_done['n235'] = true
+}
+
+def dmake_node_236() {
+  waitUntil { dmake_nodes_are_done(['n225']) }
+  sh("make n236")
+  dmake_nodes_done['n236'] = true
+}
+
+def dmake_node_237() {
+  waitUntil { dmake_nodes_are_done(['n228']) }
+  sh("make n237")
+  dmake_nodes_done['n237'] = true
+}
+
+def dmake_node_238() {
+  waitUntil { dmake_nodes_are_done(['n237']) }
+  sh("make n238")
+  dmake_nodes_done['n238'] = true
+}
+
+def dmake_node_239() {
+  waitUntil { dmake_nodes_are_done(['n238']) }
+  sh("make n239")
+  dmake_nodes_done['n239'] = true
+}
+
+def dmake_node_240() {
+  sh("make n240")
+  dmake_nodes_done['n240'] = true
+}
+
+def dmake_node_241() {
+  waitUntil { dmake_nodes_are_done(['n238']) }
+  sh("make n241")
+  dmake_nodes_done['n241'] = true
+}
+
+def dmake_node_242() {
+  waitUntil { dmake_nodes_are_done(['n230', 'n240', 'n241']) }
+  sh("make n242")
+  dmake_nodes_done['n242'] = true
+}
+
+def dmake_node_243() {
+  waitUntil { dmake_nodes_are_done(['n238']) }
+  sh("make n243")
+  dmake_nodes_done['n243'] = true
+}
+
+def dmake_node_244() {
+  waitUntil { dmake_nodes_are_done(['n236', 'n237', 'n239']) }
+  sh("make n244")
+  dmake_nodes_done['n244'] = true
+}
+
+def dmake_node_245() {
+  waitUntil { dmake_nodes_are_done(['n240', 'n241']) }
+  sh("make n245")
+  dmake_nodes_done['n245'] = true
+}
+
+def dmake_node_246() {
+  waitUntil { dmake_nodes_are_done(['n234', 'n244']) }
+  sh("make n246")
+  dmake_nodes_done['n246'] = true
+}
+
+def dmake_node_247() {
+  waitUntil { dmake_nodes_are_done(['n235', 'n240', 'n242']) }
+  sh("make n247")
+  dmake_nodes_done['n247'] = true
+}
+
+def dmake_node_248() {
+  sh("make n248")
+  dmake_nodes_done['n248'] = true
+}
+
+def dmake_node_249() {
+  waitUntil { dmake_nodes_are_done(['n240', 'n247']) }
+  sh("make n249")
+  dmake_nodes_done['n249'] = true
+}
+
+def dmake_node_250() {
+  waitUntil { dmake_nodes_are_done(['n239', 'n241', 'n242']) }
+  sh("make n250")
+  dmake_nodes_done['n250'] = true
+}
+
+def dmake_node_251() {
+  waitUntil { dmake_nodes_are_done(['n248']) }
+  sh("make n251")
+  dmake_nodes_done['n251'] = true
+}
+
+def dmake_node_252() {
+  waitUntil { dmake_nodes_are_done(['n242', 'n251']) }
+  sh("make n252")
+  dmake_nodes_done['n252'] = true
+}
+
+def dmake_node_253() {
+  sh("make n253")
+  dmake_nodes_done['n253'] = true
+}
+
+def dmake_node_254() {
+  waitUntil { dmake_nodes_are_done(['n247']) }
+  sh("make n254")
+  dmake_nodes_done['n254'] = true
+}
+
+def dmake_node_255() {
+  waitUntil { dmake_nodes_are_done(['n249', 'n250']) }
+  sh("make n255")
+  dmake_nodes_done['n255'] = true
+}
+
+def dmake_node_256() {
+  sh("make n256")
+  dmake_nodes_done['n256'] = true
+}
+
+def dmake_node_257() {
+  waitUntil { dmake_nodes_are_done(['n245', 'n247', 'n250']) }
+  sh("make n257")
+  dmake_nodes_done['n257'] = true
+}
+
+def dmake_node_258() {
+  waitUntil { dmake_nodes_are_done(['n255', 'n257']) }
+  sh("make n258")
+  dmake_nodes_done['n258'] = true
+}
+
+def dmake_node_259() {
+  waitUntil { dmake_nodes_are_done(['n249', 'n251', 'n255']) }
+  sh("make n259")
+  dmake_nodes_done['n259'] = true
+}
+
+def dmake_node_260() {
+  waitUntil { dmake_nodes_are_done(['n257']) }
+  sh("make n260")
+  dmake_nodes_done['n260'] = true
+}
+
+def dmake_node_261() {
+  waitUntil { dmake_nodes_are_done(['n253', 'n255', 'n259']) }
+  sh("make n261")
+  dmake_nodes_done['n261'] = true
+}
+
+def dmake_node_262() {
+  waitUntil { dmake_nodes_are_done(['n254', 'n258']) }
+  sh("make n262")
+  dmake_nodes_done['n262'] = true
+}
+
+def dmake_node_263() {
+  waitUntil { dmake_nodes_are_done(['n254', 'n257']) }
+  sh("make n263")
+  dmake_nodes_done['n263'] = true
+}
+
+def dmake_node_264() {
+  waitUntil { dmake_nodes_are_done(['n262']) }
+  sh("make n264")
+  dmake_nodes_done['n264'] = true
+}
+
+def dmake_node_265() {
+  waitUntil { dmake_nodes_are_done(['n253', 'n258', 'n260']) }
+  sh("make n265")
+  dmake_nodes_done['n265'] = true
+}
+
+def dmake_node_266() {
+  waitUntil { dmake_nodes_are_done(['n254']) }
+  sh("make n266")
+  dmake_nodes_done['n266'] = true
+}
+
+def dmake_node_267() {
+  waitUntil { dmake_nodes_are_done(['n265']) }
+  sh("make n267")
+  dmake_nodes_done['n267'] = true
+}
+
+def dmake_node_268() {
+  waitUntil { dmake_nodes_are_done(['n256', 'n259', 'n265']) }
+  sh("make n268")
+  dmake_nodes_done['n268'] = true
+}
+
+def dmake_node_269() {
+  waitUntil { dmake_nodes_are_done(['n258', 'n264', 'n266']) }
+  sh("make n269")
+  dmake_nodes_done['n269'] = true
+}
+
+def dmake_node_270() {
+  sh("make n270")
+  dmake_nodes_done['n270'] = true
+}
+
+def dmake_node_271() {
+  sh("make n271")
+  dmake_nodes_done['n271'] = true
+}
+
+def dmake_node_272() {
+  waitUntil { dmake_nodes_are_done(['n264', 'n266']) }
+  sh("make n272")
+  dmake_nodes_done['n272'] = true
+}
+
+def dmake_node_273() {
+  waitUntil { dmake_nodes_are_done(['n262', 'n265']) }
+  sh("make n273")
+  dmake_nodes_done['n273'] = true
+}
+
+def dmake_node_274() {
+  waitUntil { dmake_nodes_are_done(['n265', 'n268']) }
+  sh("make n274")
+  dmake_nodes_done['n274'] = true
+}
+
+def dmake_node_275() {
+  waitUntil { dmake_nodes_are_done(['n263', 'n272', 'n274']) }
+  sh("make n275")
+  dmake_nodes_done['n275'] = true
+}
+
+def dmake_node_276() {
+  waitUntil { dmake_nodes_are_done(['n273']) }
+  sh("make n276")
+  dmake_nodes_done['n276'] = true
+}
+
+def dmake_node_277() {
+  sh("make n277")
+  dmake_nodes_done['n277'] = true
+}
+
+def dmake_node_278() {
+  waitUntil { dmake_nodes_are_done(['n266']) }
+  sh("make n278")
+  dmake_nodes_done['n278'] = true
+}
+
+def dmake_node_279() {
+  waitUntil { dmake_nodes_are_done(['n267', 'n268']) }
+  sh("make n279")
+  dmake_nodes_done['n279'] = true
+}
+
+def dmake_node_280() {
+  waitUntil { dmake_nodes_are_done(['n268', 'n273', 'n279']) }
+  sh("make n280")
+  dmake_nodes_done['n280'] = true
+}
+
+def dmake_node_281() {
+  waitUntil { dmake_nodes_are_done(['n275', 'n279']) }
+  sh("make n281")
+  dmake_nodes_done['n281'] = true
+}
+
+def dmake_node_282() {
+  waitUntil { dmake_nodes_are_done(['n270', 'n278']) }
+  sh("make n282")
+  dmake_nodes_done['n282'] = true
+}
+
+def dmake_node_283() {
+  waitUntil { dmake_nodes_are_done(['n271', 'n281', 'n282']) }
+  sh("make n283")
+  dmake_nodes_done['n283'] = true
+}
+
+def dmake_node_284() {
+  waitUntil { dmake_nodes_are_done(['n274', 'n277', 'n281']) }
+  sh("make n284")
+  dmake_nodes_done['n284'] = true
+}
+
+def dmake_node_285() {
+  waitUntil { dmake_nodes_are_done(['n277']) }
+  sh("make n285")
+  dmake_nodes_done['n285'] = true
+}
+
+def dmake_node_286() {
+  waitUntil { dmake_nodes_are_done(['n278', 'n282']) }
+  sh("make n286")
+  dmake_nodes_done['n286'] = true
+}
+
+def dmake_node_287() {
+  waitUntil { dmake_nodes_are_done(['n282']) }
+  sh("make n287")
+  dmake_nodes_done['n287'] = true
+}
+
+def dmake_node_288() {
+  waitUntil { dmake_nodes_are_done(['n286']) }
+  sh("make n288")
+  dmake_nodes_done['n288'] = true
+}
+
+def dmake_node_289() {
+  waitUntil { dmake_nodes_are_done(['n278', 'n280']) }
+  sh("make n289")
+  dmake_nodes_done['n289'] = true
+}
+
+def dmake_node_290() {
+  waitUntil { dmake_nodes_are_done(['n285']) }
+  sh("make n290")
+  dmake_nodes_done['n290'] = true
+}
+
+def dmake_node_291() {
+  waitUntil { dmake_nodes_are_done(['n286']) }
+  sh("make n291")
+  dmake_nodes_done['n291'] = true
+}
+
+def dmake_node_292() {
+  sh("make n292")
+  dmake_nodes_done['n292'] = true
+}
+
+def dmake_node_293() {
+  sh("make n293")
+  dmake_nodes_done['n293'] = true
+}
+
+def dmake_node_294() {
+  waitUntil { dmake_nodes_are_done(['n287', 'n288', 'n290']) }
+  sh("make n294")
+  dmake_nodes_done['n294'] = true
+}
+
+def dmake_node_295() {
+  sh("make n295")
+  dmake_nodes_done['n295'] = true
+}
+
+def dmake_node_296() {
+  waitUntil { dmake_nodes_are_done(['n295']) }
+  sh("make n296")
+  dmake_nodes_done['n296'] = true
+}
+
+def dmake_node_297() {
+  waitUntil { dmake_nodes_are_done(['n285']) }
+  sh("make n297")
+  dmake_nodes_done['n297'] = true
+}
+
+def dmake_node_298() {
+  waitUntil { dmake_nodes_are_done(['n286', 'n292']) }
+  sh("make n298")
+  dmake_nodes_done['n298'] = true
+}
+
+def dmake_node_299() {
+  waitUntil { dmake_nodes_are_done(['n292']) }
+  sh("make n299")
+  dmake_nodes_done['n299'] = true
+}
+
+def dmake_node_300() {
+  waitUntil { dmake_nodes_are_done(['n288', 'n293', 'n295']) }
+  sh("make n300")
+  dmake_nodes_done['n300'] = true
+}
+
+def dmake_node_301() {
+  waitUntil { dmake_nodes_are_done(['n293', 'n299']) }
+  sh("make n301")
+  dmake_nodes_done['n301'] = true
+}
+
+def dmake_node_302() {
+  waitUntil { dmake_nodes_are_done(['n290', 'n292', 'n297']) }
+  sh("make n302")
+  dmake_nodes_done['n302'] = true
+}
+
+def dmake_node_303() {
+  waitUntil { dmake_nodes_are_done(['n292', 'n296', 'n302']) }
+  sh("make n303")
+  dmake_nodes_done['n303'] = true
+}
+
+def dmake_node_304() {
+  waitUntil { dmake_nodes_are_done(['n298']) }
+  sh("make n304")
+  dmake_nodes_done['n304'] = true
+}
+
+def dmake_node_305() {
+  sh("make n305")
+  dmake_nodes_done['n305'] = true
+}
+
+def dmake_node_306() {
+  waitUntil { dmake_nodes_are_done(['n294', 'n295', 'n301']) }
+  sh("make n306")
+  dmake_nodes_done['n306'] = true
+}
+
+def dmake_node_307() {
+  waitUntil { dmake_nodes_are_done(['n295', 'n305']) }
+  sh("make n307")
+  dmake_nodes_done['n307'] = true
+}
+
+def dmake_node_308() {
+  sh("make n308")
+  dmake_nodes_done['n308'] = true
+}
+
+def dmake_node_309() {
+  waitUntil { dmake_nodes_are_done(['n297', 'n299', 'n305']) }
+  sh("make n309")
+  dmake_nodes_done['n309'] = true
+}
+
+def dmake_node_310() {
+  sh("make n310")
+  dmake_nodes_done['n310'] = true
+}
+
+def dmake_node_311() {
+  waitUntil { dmake_nodes_are_done(['n301']) }
+  sh("make n311")
+  dmake_nodes_done['n311'] = true
+}
+
+def dmake_node_312() {
+  waitUntil { dmake_nodes_are_done(['n309']) }
+  sh("make n312")
+  dmake_nodes_done['n312'] = true
+}
+
+def dmake_node_313() {
+  waitUntil { dmake_nodes_are_done(['n301', 'n304', 'n311']) }
+  sh("make n313")
+  dmake_nodes_done['n313'] = true
+}
+
+def dmake_node_314() {
+  waitUntil { dmake_nodes_are_done(['n307']) }
+  sh("make n314")
+  dmake_nodes_done['n314'] = true
+}
+
+def dmake_node_315() {
+  waitUntil { dmake_nodes_are_done(['n305', 'n308', 'n312']) }
+  sh("make n315")
+  dmake_nodes_done['n315'] = true
+}
+
+def dmake_node_316() {
+  waitUntil { dmake_nodes_are_done(['n313']) }
+  sh("make n316")
+  dmake_nodes_done['n316'] = true
+}
+
+def dmake_node_317() {
+  waitUntil { dmake_nodes_are_done(['n307']) }
+  sh("make n317")
+  dmake_nodes_done['n317'] = true
+}
+
+def dmake_node_318() {
+  sh("make n318")
+  dmake_nodes_done['n318'] = true
+}
+
+def dmake_node_319() {
+  sh("make n319")
+  dmake_nodes_done['n319'] = true
+}
+
+def dmake_node_320() {
+  waitUntil { dmake_nodes_are_done(['n318']) }
+  sh("make n320")
+  dmake_nodes_done['n320'] = true
+}
+
+def dmake_node_321() {
+  waitUntil { dmake_nodes_are_done(['n314', 'n315', 'n318']) }
+  sh("make n321")
+  dmake_nodes_done['n321'] = true
+}
+
+def dmake_node_322() {
+  waitUntil { dmake_nodes_are_done(['n313', 'n318']) }
+  sh("make n322")
+  dmake_nodes_done['n322'] = true
+}
+
+def dmake_node_323() {
+  waitUntil { dmake_nodes_are_done(['n316', 'n320', 'n321']) }
+  sh("make n323")
+  dmake_nodes_done['n323'] = true
+}
+
+def dmake_node_324() {
+  waitUntil { dmake_nodes_are_done(['n315', 'n318', 'n319']) }
+  sh("make n324")
+  dmake_nodes_done['n324'] = true
+}
+
+def dmake_node_325() {
+  waitUntil { dmake_nodes_are_done(['n314', 'n319', 'n322']) }
+  sh("make n325")
+  dmake_nodes_done['n325'] = true
+}
+
+def dmake_node_326() {
+  waitUntil { dmake_nodes_are_done(['n314', 'n322']) }
+  sh("make n326")
+  dmake_nodes_done['n326'] = true
+}
+
+def dmake_node_327() {
+  waitUntil { dmake_nodes_are_done(['n319']) }
+  sh("make n327")
+  dmake_nodes_done['n327'] = true
+}
+
+def dmake_node_328() {
+  waitUntil { dmake_nodes_are_done(['n317', 'n324', 'n326']) }
+  sh("make n328")
+  dmake_nodes_done['n328'] = true
+}
+
+def dmake_node_329() {
+  waitUntil { dmake_nodes_are_done(['n317', 'n323', 'n327']) }
+  sh("make n329")
+  dmake_nodes_done['n329'] = true
+}
+
+def dmake_node_330() {
+  waitUntil { dmake_nodes_are_done(['n320', 'n325', 'n327']) }
+  sh("make n330")
+  dmake_nodes_done['n330'] = true
+}
+
+def dmake_node_331() {
+  waitUntil { dmake_nodes_are_done(['n328']) }
+  sh("make n331")
+  dmake_nodes_done['n331'] = true
+}
+
+def dmake_node_332() {
+  sh("make n332")
+  dmake_nodes_done['n332'] = true
+}
+
+def dmake_node_333() {
+  waitUntil { dmake_nodes_are_done(['n328', 'n331']) }
+  sh("make n333")
+  dmake_nodes_done['n333'] = true
+}
+
+def dmake_node_334() {
+  waitUntil { dmake_nodes_are_done(['n324', 'n331']) }
+  sh("make n334")
+  dmake_nodes_done['n334'] = true
+}
+
+def dmake_node_335() {
+  sh("make n335")
+  dmake_nodes_done['n335'] = true
+}
+
+def dmake_node_336() {
+  waitUntil { dmake_nodes_are_done(['n327', 'n328', 'n330']) }
+  sh("make n336")
+  dmake_nodes_done['n336'] = true
+}
+
+def dmake_node_337() {
+  waitUntil { dmake_nodes_are_done(['n325', 'n327']) }
+  sh("make n337")
+  dmake_nodes_done['n337'] = true
+}
+
+def dmake_node_338() {
+  sh("make n338")
+  dmake_nodes_done['n338'] = true
+}
+
+def dmake_node_339() {
+  sh("make n339")
+  dmake_nodes_done['n339'] = true
+}
+
+def dmake_node_340() {
+  waitUntil { dmake_nodes_are_done(['n330']) }
+  sh("make n340")
+  dmake_nodes_done['n340'] = true
+}
+
+def dmake_node_341() {
+  sh("make n341")
+  dmake_nodes_done['n341'] = true
+}
+
+def dmake_node_342() {
+  waitUntil { dmake_nodes_are_done(['n334', 'n339']) }
+  sh("make n342")
+  dmake_nodes_done['n342'] = true
+}
+
+def dmake_node_343() {
+  sh("make n343")
+  dmake_nodes_done['n343'] = true
+}
+
+def dmake_node_344() {
+  waitUntil { dmake_nodes_are_done(['n334', 'n336', 'n337']) }
+  sh("make n344")
+  dmake_nodes_done['n344'] = true
+}
+
+def dmake_node_345() {
+  waitUntil { dmake_nodes_are_done(['n339']) }
+  sh("make n345")
+  dmake_nodes_done['n345'] = true
+}
+
+def dmake_node_346() {
+  waitUntil { dmake_nodes_are_done(['n337', 'n340']) }
+  sh("make n346")
+  dmake_nodes_done['n346'] = true
+}
+
+def dmake_node_347() {
+  waitUntil { dmake_nodes_are_done(['n341', 'n346']) }
+  sh("make n347")
+  dmake_nodes_done['n347'] = true
+}
+
+def dmake_node_348() {
+  waitUntil { dmake_nodes_are_done(['n338']) }
+  sh("make n348")
+  dmake_nodes_done['n348'] = true
+}
+
+def dmake_node_349() {
+  sh("make n349")
+  dmake_nodes_done['n349'] = true
+}
+
+def dmake_node_350() {
+  waitUntil { dmake_nodes_are_done(['n347']) }
+  sh("make n350")
+  dmake_nodes_done['n350'] = true
+}
+
+def dmake_node_351() {
+  sh("make n351")
+  dmake_nodes_done['n351'] = true
+}
+
+def dmake_node_352() {
+  waitUntil { dmake_nodes_are_done(['n346']) }
+  sh("make n352")
+  dmake_nodes_done['n352'] = true
+}
+
+def dmake_node_353() {
+  sh("make n353")
+  dmake_nodes_done['n353'] = true
+}
+
+def dmake_node_354() {
+  waitUntil { dmake_nodes_are_done(['n343', 'n347', 'n349']) }
+  sh("make n354")
+  dmake_nodes_done['n354'] = true
+}
+
+def dmake_node_355() {
+  waitUntil { dmake_nodes_are_done(['n345', 'n346', 'n351']) }
+  sh("make n355")
+  dmake_nodes_done['n355'] = true
+}
+
+def dmake_node_356() {
+  waitUntil { dmake_nodes_are_done(['n344']) }
+  sh("make n356")
+  dmake_nodes_done['n356'] = true
+}
+
+def dmake_node_357() {
+  waitUntil { dmake_nodes_are_done(['n348', 'n354', 'n355']) }
+  sh("make n357")
+  dmake_nodes_done['n357'] = true
+}
+
+def dmake_node_358() {
+  waitUntil { dmake_nodes_are_done(['n346', 'n355']) }
+  sh("make n358")
+  dmake_nodes_done['n358'] = true
+}
+
+def dmake_node_359() {
+  waitUntil { dmake_nodes_are_done(['n347', 'n353', 'n356']) }
+  sh("make n359")
+  dmake_nodes_done['n359'] = true
+}
+
+def dmake_node_360() {
+  waitUntil { dmake_nodes_are_done(['n351', 'n353', 'n356']) }
+  sh("make n360")
+  dmake_nodes_done['n360'] = true
+}
+
+def dmake_node_361() {
+  sh("make n361")
+  dmake_nodes_done['n361'] = true
+}
+
+def dmake_node_362() {
+  waitUntil { dmake_nodes_are_done(['n352', 'n354', 'n357']) }
+  sh("make n362")
+  dmake_nodes_done['n362'] = true
+}
+
+def dmake_node_363() {
+  waitUntil { dmake_nodes_are_done(['n353', 'n360']) }
+  sh("make n363")
+  dmake_nodes_done['n363'] = true
+}
+
+def dmake_node_364() {
+  waitUntil { dmake_nodes_are_done(['n358', 'n361', 'n363']) }
+  sh("make n364")
+  dmake_nodes_done['n364'] = true
+}
+
+def dmake_node_365() {
+  waitUntil { dmake_nodes_are_done(['n354']) }
+  sh("make n365")
+  dmake_nodes_done['n365'] = true
+}
+
+def dmake_node_366() {
+  sh("make n366")
+  dmake_nodes_done['n366'] = true
+}
+
+def dmake_node_367() {
+  waitUntil { dmake_nodes_are_done(['n364']) }
+  sh("make n367")
+  dmake_nodes_done['n367'] = true
+}
+
+def dmake_node_368() {
+  waitUntil { dmake_nodes_are_done(['n363', 'n364', 'n365']) }
+  sh("make n368")
+  dmake_nodes_done['n368'] = true
+}
+
+def dmake_node_369() {
+  waitUntil { dmake_nodes_are_done(['n362', 'n365', 'n367']) }
+  sh("make n369")
+  dmake_nodes_done['n369'] = true
+}
+
+def dmake_node_370() {
+  waitUntil { dmake_nodes_are_done(['n361']) }
+  sh("make n370")
+  dmake_nodes_done['n370'] = true
+}
+
+def dmake_node_371() {
+  waitUntil { dmake_nodes_are_done(['n359', 'n362']) }
+  sh("make n371")
+  dmake_nodes_done['n371'] = true
+}
+
+def dmake_node_372() {
+  waitUntil { dmake_nodes_are_done(['n361', 'n371']) }
+  sh("make n372")
+  dmake_nodes_done['n372'] = true
+}
+
+def dmake_node_373() {
+  waitUntil { dmake_nodes_are_done(['n363', 'n367']) }
+  sh("make n373")
+  dmake_nodes_done['n373'] = true
+}
+
+def dmake_node_374() {
+  waitUntil { dmake_nodes_are_done(['n366', 'n367', 'n372']) }
+  sh("make n374")
+  dmake_nodes_done['n374'] = true
+}
+
+def dmake_node_375() {
+  sh("make n375")
+  dmake_nodes_done['n375'] = true
+}
+
+def dmake_node_376() {
+  waitUntil { dmake_nodes_are_done(['n367', 'n369', 'n374']) }
+  sh("make n376")
+  dmake_nodes_done['n376'] = true
+}
+
+def dmake_node_377() {
+  waitUntil { dmake_nodes_are_done(['n370', 'n371']) }
+  sh("make n377")
+  dmake_nodes_done['n377'] = true
+}
+
+def dmake_node_378() {
+  waitUntil { dmake_nodes_are_done(['n367', 'n373']) }
+  sh("make n378")
+  dmake_nodes_done['n378'] = true
+}
+
+def dmake_node_379() {
+  waitUntil { dmake_nodes_are_done(['n372']) }
+  sh("make n379")
+  dmake_nodes_done['n379'] = true
+}
+
+def dmake_node_380() {
+  waitUntil { dmake_nodes_are_done(['n371', 'n375']) }
+  sh("make n380")
+  dmake_nodes_done['n380'] = true
+}
+
+def dmake_node_381() {
+  waitUntil { dmake_nodes_are_done(['n376', 'n377', 'n380']) }
+  sh("make n381")
+  dmake_nodes_done['n381'] = true
+}
+
+def dmake_node_382() {
+  waitUntil { dmake_nodes_are_done(['n380']) }
+  sh("make n382")
+  dmake_nodes_done['n382'] = true
+}
+
+def dmake_node_383() {
+  waitUntil { dmake_nodes_are_done(['n376']) }
+  sh("make n383")
+  dmake_nodes_done['n383'] = true
+}
+
+def dmake_node_384() {
+  waitUntil { dmake_nodes_are_done(['n375', 'n377', 'n378']) }
+  sh("make n384")
+  dmake_nodes_done['n384'] = true
+}
+
+def dmake_node_385() {
+  sh("make n385")
+  dmake_nodes_done['n385'] = true
+}
+
+def dmake_node_386() {
+  sh("make n386")
+  dmake_nodes_done['n386'] = true
+}
+
+def dmake_node_387() {
+  waitUntil { dmake_nodes_are_done(['n376']) }
+  sh("make n387")
+  dmake_nodes_done['n387'] = true
+}
+
+def dmake_node_388() {
+  sh("make n388")
+  dmake_nodes_done['n388'] = true
+}
+
+def dmake_node_389() {
+  waitUntil { dmake_nodes_are_done(['n377', 'n379', 'n385']) }
+  sh("make n389")
+  dmake_nodes_done['n389'] = true
+}
+
+def dmake_node_390() {
+  waitUntil { dmake_nodes_are_done(['n379']) }
+  sh("make n390")
+  dmake_nodes_done['n390'] = true
+}
+
+def dmake_node_391() {
+  sh("make n391")
+  dmake_nodes_done['n391'] = true
+}
+
+def dmake_node_392() {
+  waitUntil { dmake_nodes_are_done(['n381', 'n382', 'n388']) }
+  sh("make n392")
+  dmake_nodes_done['n392'] = true
+}
+
+def dmake_node_393() {
+  waitUntil { dmake_nodes_are_done(['n381', 'n387', 'n388']) }
+  sh("make n393")
+  dmake_nodes_done['n393'] = true
+}
+
+def dmake_node_394() {
+  sh("make n394")
+  dmake_nodes_done['n394'] = true
+}
+
+def dmake_node_395() {
+  waitUntil { dmake_nodes_are_done(['n388', 'n394']) }
+  sh("make n395")
+  dmake_nodes_done['n395'] = true
+}
+
+def dmake_node_396() {
+  waitUntil { dmake_nodes_are_done(['n393']) }
+  sh("make n396")
+  dmake_nodes_done['n396'] = true
+}
+
+def dmake_node_397() {
+  sh("make n397")
+  dmake_nodes_done['n397'] = true
+}
+
+def dmake_node_398() {
+  waitUntil { dmake_nodes_are_done(['n395']) }
+  sh("make n398")
+  dmake_nodes_done['n398'] = true
+}
+
+def dmake_node_399() {
+  waitUntil { dmake_nodes_are_done(['n396']) }
+  sh("make n399")
+  dmake_nodes_done['n399'] = true
+}
+
+def dmake_node_400() {
+  waitUntil { dmake_nodes_are_done(['n389', 'n396', 'n399']) }
+  sh("make n400")
+  dmake_nodes_done['n400'] = true
+}
+
+def dmake_node_401() {
+  waitUntil { dmake_nodes_are_done(['n390', 'n396', 'n397']) }
+  sh("make n401")
+  dmake_nodes_done['n401'] = true
+}
+
+def dmake_node_402() {
+  waitUntil { dmake_nodes_are_done(['n392', 'n396']) }
+  sh("make n402")
+  dmake_nodes_done['n402'] = true
+}
+
+def dmake_node_403() {
+  waitUntil { dmake_nodes_are_done(['n394', 'n398']) }
+  sh("make n403")
+  dmake_nodes_done['n403'] = true
+}
+
+def dmake_node_404() {
+  waitUntil { dmake_nodes_are_done(['n392', 'n399', 'n403']) }
+  sh("make n404")
+  dmake_nodes_done['n404'] = true
+}
+
+def dmake_node_405() {
+  waitUntil { dmake_nodes_are_done(['n396', 'n399', 'n404']) }
+  sh("make n405")
+  dmake_nodes_done['n405'] = true
+}
+
+def dmake_node_406() {
+  waitUntil { dmake_nodes_are_done(['n401']) }
+  sh("make n406")
+  dmake_nodes_done['n406'] = true
+}
+
+def dmake_node_407() {
+  waitUntil { dmake_nodes_are_done(['n403']) }
+  sh("make n407")
+  dmake_nodes_done['n407'] = true
+}
+
+def dmake_node_408() {
+  sh("make n408")
+  dmake_nodes_done['n408'] = true
+}
+
+def dmake_node_409() {
+  sh("make n409")
+  dmake_nodes_done['n409'] = true
+}
+
+def dmake_node_410() {
+  waitUntil { dmake_nodes_are_done(['n405']) }
+  sh("make n410")
+  dmake_nodes_done['n410'] = true
+}
+
+def dmake_node_411() {
+  waitUntil { dmake_nodes_are_done(['n401', 'n402', 'n405']) }
+  sh("make n411")
+  dmake_nodes_done['n411'] = true
+}
+
+def dmake_node_412() {
+  waitUntil { dmake_nodes_are_done(['n408', 'n410']) }
+  sh("make n412")
+  dmake_nodes_done['n412'] = true
+}
+
+def dmake_node_413() {
+  waitUntil { dmake_nodes_are_done(['n403', 'n410', 'n411']) }
+  sh("make n413")
+  dmake_nodes_done['n413'] = true
+}
+
+def dmake_node_414() {
+  waitUntil { dmake_nodes_are_done(['n411']) }
+  sh("make n414")
+  dmake_nodes_done['n414'] = true
+}
+
+def dmake_node_415() {
+  waitUntil { dmake_nodes_are_done(['n406', 'n411']) }
+  sh("make n415")
+  dmake_nodes_done['n415'] = true
+}
+
+def dmake_node_416() {
+  waitUntil { dmake_nodes_are_done(['n411']) }
+  sh("make n416")
+  dmake_nodes_done['n416'] = true
+}
+
+def dmake_node_417() {
+  sh("make n417")
+  dmake_nodes_done['n417'] = true
+}
+
+def dmake_node_418() {
+  waitUntil { dmake_nodes_are_done(['n410', 'n416', 'n417']) }
+  sh("make n418")
+  dmake_nodes_done['n418'] = true
+}
+
+def dmake_node_419() {
+  waitUntil { dmake_nodes_are_done(['n409']) }
+  sh("make n419")
+  dmake_nodes_done['n419'] = true
+}
+
+def dmake_node_420() {
+  waitUntil { dmake_nodes_are_done(['n413', 'n414', 'n415']) }
+  sh("make n420")
+  dmake_nodes_done['n420'] = true
+}
+
+def dmake_node_421() {
+  waitUntil { dmake_nodes_are_done(['n412']) }
+  sh("make n421")
+  dmake_nodes_done['n421'] = true
+}
+
+def dmake_node_422() {
+  waitUntil { dmake_nodes_are_done(['n413', 'n417', 'n418']) }
+  sh("make n422")
+  dmake_nodes_done['n422'] = true
+}
+
+def dmake_node_423() {
+  sh("make n423")
+  dmake_nodes_done['n423'] = true
+}
+
+def dmake_node_424() {
+  waitUntil { dmake_nodes_are_done(['n418', 'n421', 'n423']) }
+  sh("make n424")
+  dmake_nodes_done['n424'] = true
+}
+
+def dmake_node_425() {
+  waitUntil { dmake_nodes_are_done(['n421']) }
+  sh("make n425")
+  dmake_nodes_done['n425'] = true
+}
+
+def dmake_node_426() {
+  waitUntil { dmake_nodes_are_done(['n415', 'n422', 'n425']) }
+  sh("make n426")
+  dmake_nodes_done['n426'] = true
+}
+
+def dmake_node_427() {
+  waitUntil { dmake_nodes_are_done(['n415', 'n418', 'n421']) }
+  sh("make n427")
+  dmake_nodes_done['n427'] = true
+}
+
+def dmake_node_428() {
+  sh("make n428")
+  dmake_nodes_done['n428'] = true
+}
+
+def dmake_node_429() {
+  waitUntil { dmake_nodes_are_done(['n426']) }
+  sh("make n429")
+  dmake_nodes_done['n429'] = true
+}
+
+def dmake_node_430() {
+  waitUntil { dmake_nodes_are_done(['n420', 'n425']) }
+  sh("make n430")
+  dmake_nodes_done['n430'] = true
+}
+
+def dmake_node_431() {
+  waitUntil { dmake_nodes_are_done(['n422', 'n425']) }
+  sh("make n431")
+  dmake_nodes_done['n431'] = true
+}
+
+def dmake_node_432() {
+  waitUntil { dmake_nodes_are_done(['n423', 'n429']) }
+  sh("make n432")
+  dmake_nodes_done['n432'] = true
+}
+
+def dmake_node_433() {
+  waitUntil { dmake_nodes_are_done(['n426']) }
+  sh("make n433")
+  dmake_nodes_done['n433'] = true
+}
+
+def dmake_node_434() {
+  sh("make n434")
+  dmake_nodes_done['n434'] = true
+}
+
+def dmake_node_435() {
+  waitUntil { dmake_nodes_are_done(['n423', 'n428', 'n429']) }
+  sh("make n435")
+  dmake_nodes_done['n435'] = true
+}
+
+def dmake_node_436() {
+  waitUntil { dmake_nodes_are_done(['n426']) }
+  sh("make n436")
+  dmake_nodes_done['n436'] = true
+}
+
+def dmake_node_437() {
+  waitUntil { dmake_nodes_are_done(['n425', 'n428', 'n429']) }
+  sh("make n437")
+  dmake_nodes_done['n437'] = true
+}
+
+def dmake_node_438() {
+  waitUntil { dmake_nodes_are_done(['n431', 'n435']) }
+  sh("make n438")
+  dmake_nodes_done['n438'] = true
+}
+
+def dmake_node_439() {
+  sh("make n439")
+  dmake_nodes_done['n439'] = true
+}
+
+def dmake_node_440() {
+  waitUntil { dmake_nodes_are_done(['n435']) }
+  sh("make n440")
+  dmake_nodes_done['n440'] = true
+}
+
+def dmake_node_441() {
+  waitUntil { dmake_nodes_are_done(['n431', 'n434']) }
+  sh("make n441")
+  dmake_nodes_done['n441'] = true
+}
+
+def dmake_node_442() {
+  waitUntil { dmake_nodes_are_done(['n431', 'n434', 'n439']) }
+  sh("make n442")
+  dmake_nodes_done['n442'] = true
+}
+
+def dmake_node_443() {
+  waitUntil { dmake_nodes_are_done(['n438']) }
+  sh("make n443")
+  dmake_nodes_done['n443'] = true
+}
+
+def dmake_node_444() {
+  waitUntil { dmake_nodes_are_done(['n437']) }
+  sh("make n444")
+  dmake_nodes_done['n444'] = true
+}
+
+def dmake_node_445() {
+  waitUntil { dmake_nodes_are_done(['n435']) }
+  sh("make n445")
+  dmake_nodes_done['n445'] = true
+}
+
+def dmake_node_446() {
+  waitUntil { dmake_nodes_are_done(['n437', 'n441', 'n443']) }
+  sh("make n446")
+  dmake_nodes_done['n446'] = true
+}
+
+def dmake_node_447() {
+  waitUntil { dmake_nodes_are_done(['n438', 'n443']) }
+  sh("make n447")
+  dmake_nodes_done['n447'] = true
+}
+
+def dmake_node_448() {
+  waitUntil { dmake_nodes_are_done(['n440']) }
+  sh("make n448")
+  dmake_nodes_done['n448'] = true
+}
+
+def dmake_node_449() {
+  sh("make n449")
+  dmake_nodes_done['n449'] = true
+}
+
+def dmake_node_450() {
+  waitUntil { dmake_nodes_are_done(['n443', 'n449']) }
+  sh("make n450")
+  dmake_nodes_done['n450'] = true
+}
+
+def dmake_node_451() {
+  waitUntil { dmake_nodes_are_done(['n440', 'n441']) }
+  sh("make n451")
+  dmake_nodes_done['n451'] = true
+}
+
+def dmake_node_452() {
+  waitUntil { dmake_nodes_are_done(['n441', 'n447']) }
+  sh("make n452")
+  dmake_nodes_done['n452'] = true
+}
+
+def dmake_node_453() {
+  waitUntil { dmake_nodes_are_done(['n442', 'n450', 'n452']) }
+  sh("make n453")
+  dmake_nodes_done['n453'] = true
+}
+
+def dmake_node_454() {
+  waitUntil { dmake_nodes_are_done(['n446']) }
+  sh("make n454")
+  dmake_nodes_done['n454'] = true
+}
+
+def dmake_node_455() {
+  waitUntil { dmake_nodes_are_done(['n443', 'n454']) }
+  sh("make n455")
+  dmake_nodes_done['n455'] = true
+}
+
+def dmake_node_456() {
+  waitUntil { dmake_nodes_are_done(['n445', 'n454']) }
+  sh("make n456")
+  dmake_nodes_done['n456'] = true
+}
+
+def dmake_node_457() {
+  waitUntil { dmake_nodes_are_done(['n445', 'n448']) }
+  sh("make n457")
+  dmake_nodes_done['n457'] = true
+}
+
+def dmake_node_458() {
+  waitUntil { dmake_nodes_are_done(['n450']) }
+  sh("make n458")
+  dmake_nodes_done['n458'] = true
+}
+
+def dmake_node_459() {
+  waitUntil { dmake_nodes_are_done(['n450', 'n451', 'n456']) }
+  sh("make n459")
+  dmake_nodes_done['n459'] = true
+}
+
+def dmake_node_460() {
+  waitUntil { dmake_nodes_are_done(['n449', 'n454', 'n455']) }
+  sh("make n460")
+  dmake_nodes_done['n460'] = true
+}
+
+def dmake_node_461() {
+  waitUntil { dmake_nodes_are_done(['n460']) }
+  sh("make n461")
+  dmake_nodes_done['n461'] = true
+}
+
+def dmake_node_462() {
+  waitUntil { dmake_nodes_are_done(['n451']) }
+  sh("make n462")
+  dmake_nodes_done['n462'] = true
+}
+
+def dmake_node_463() {
+  waitUntil { dmake_nodes_are_done(['n458']) }
+  sh("make n463")
+  dmake_nodes_done['n463'] = true
+}
+
+def dmake_node_464() {
+  waitUntil { dmake_nodes_are_done(['n453', 'n455', 'n460']) }
+  sh("make n464")
+  dmake_nodes_done['n464'] = true
+}
+
+def dmake_node_465() {
+  waitUntil { dmake_nodes_are_done(['n453', 'n455', 'n460']) }
+  sh("make n465")
+  dmake_nodes_done['n465'] = true
+}
+
+def dmake_node_466() {
+  waitUntil { dmake_nodes_are_done(['n457', 'n465']) }
+  sh("make n466")
+  dmake_nodes_done['n466'] = true
+}
+
+def dmake_node_467() {
+  waitUntil { dmake_nodes_are_done(['n457']) }
+  sh("make n467")
+  dmake_nodes_done['n467'] = true
+}
+
+def dmake_node_468() {
+  sh("make n468")
+  dmake_nodes_done['n468'] = true
+}
+
+def dmake_node_469() {
+  waitUntil { dmake_nodes_are_done(['n459', 'n460', 'n468']) }
+  sh("make n469")
+  dmake_nodes_done['n469'] = true
+}
+
+def dmake_node_470() {
+  waitUntil { dmake_nodes_are_done(['n469']) }
+  sh("make n470")
+  dmake_nodes_done['n470'] = true
+}
+
+def dmake_node_471() {
+  waitUntil { dmake_nodes_are_done(['n459', 'n470']) }
+  sh("make n471")
+  dmake_nodes_done['n471'] = true
+}
+
+def dmake_node_472() {
+  waitUntil { dmake_nodes_are_done(['n460']) }
+  sh("make n472")
+  dmake_nodes_done['n472'] = true
+}
+
+def dmake_node_473() {
+  waitUntil { dmake_nodes_are_done(['n464', 'n467', 'n469']) }
+  sh("make n473")
+  dmake_nodes_done['n473'] = true
+}
+
+def dmake_node_474() {
+  sh("make n474")
+  dmake_nodes_done['n474'] = true
+}
+
+def dmake_node_475() {
+  sh("make n475")
+  dmake_nodes_done['n475'] = true
+}
+
+def dmake_node_476() {
+  waitUntil { dmake_nodes_are_done(['n475']) }
+  sh("make n476")
+  dmake_nodes_done['n476'] = true
+}
+
+def dmake_node_477() {
+  waitUntil { dmake_nodes_are_done(['n470', 'n471', 'n475']) }
+  sh("make n477")
+  dmake_nodes_done['n477'] = true
+}
+
+def dmake_node_478() {
+  waitUntil { dmake_nodes_are_done(['n475']) }
+  sh("make n478")
+  dmake_nodes_done['n478'] = true
+}
+
+def dmake_node_479() {
+  sh("make n479")
+  dmake_nodes_done['n479'] = true
+}
+
+def dmake_node_480() {
+  sh("make n480")
+  dmake_nodes_done['n480'] = true
+}
+
+def dmake_node_481() {
+  waitUntil { dmake_nodes_are_done(['n478']) }
+  sh("make n481")
+  dmake_nodes_done['n481'] = true
+}
+
+def dmake_node_482() {
+  sh("make n482")
+  dmake_nodes_done['n482'] = true
+}
+
+def dmake_node_483() {
+  waitUntil { dmake_nodes_are_done(['n475', 'n476']) }
+  sh("make n483")
+  dmake_nodes_done['n483'] = true
+}
+
+def dmake_node_484() {
+  waitUntil { dmake_nodes_are_done(['n472']) }
+  sh("make n484")
+  dmake_nodes_done['n484'] = true
+}
+
+def dmake_node_485() {
+  waitUntil { dmake_nodes_are_done(['n482']) }
+  sh("make n485")
+  dmake_nodes_done['n485'] = true
+}
+
+def dmake_node_486() {
+  waitUntil { dmake_nodes_are_done(['n476', 'n478', 'n481']) }
+  sh("make n486")
+  dmake_nodes_done['n486'] = true
+}
+
+def dmake_node_487() {
+  waitUntil { dmake_nodes_are_done(['n480', 'n485']) }
+  sh("make n487")
+  dmake_nodes_done['n487'] = true
+}
+
+def dmake_node_488() {
+  waitUntil { dmake_nodes_are_done(['n480', 'n484', 'n487']) }
+  sh("make n488")
+  dmake_nodes_done['n488'] = true
+}
+
+def dmake_node_489() {
+  waitUntil { dmake_nodes_are_done(['n480']) }
+  sh("make n489")
+  dmake_nodes_done['n489'] = true
+}
+
+def dmake_node_490() {
+  waitUntil { dmake_nodes_are_done(['n486']) }
+  sh("make n490")
+  dmake_nodes_done['n490'] = true
+}
+
+def dmake_node_491() {
+  waitUntil { dmake_nodes_are_done(['n483', 'n484', 'n485']) }
+  sh("make n491")
+  dmake_nodes_done['n491'] = true
+}
+
+def dmake_node_492() {
+  sh("make n492")
+  dmake_nodes_done['n492'] = true
+}
+
+def dmake_node_493() {
+  waitUntil { dmake_nodes_are_done(['n482', 'n488']) }
+  sh("make n493")
+  dmake_nodes_done['n493'] = true
+}
+
+def dmake_node_494() {
+  waitUntil { dmake_nodes_are_done(['n482', 'n485']) }
+  sh("make n494")
+  dmake_nodes_done['n494'] = true
+}
+
+def dmake_node_495() {
+  waitUntil { dmake_nodes_are_done(['n493']) }
+  sh("make n495")
+  dmake_nodes_done['n495'] = true
+}
+
+def dmake_node_496() {
+  sh("make n496")
+  dmake_nodes_done['n496'] = true
+}
+
+def dmake_node_497() {
+  sh("make n497")
+  dmake_nodes_done['n497'] = true
+}
+
+def dmake_node_498() {
+  waitUntil { dmake_nodes_are_done(['n489', 'n492']) }
+  sh("make n498")
+  dmake_nodes_done['n498'] = true
+}
+
+def dmake_node_499() {
+  waitUntil { dmake_nodes_are_done(['n488', 'n496']) }
+  sh("make n499")
+  dmake_nodes_done['n499'] = true
+}
+
+def dmake_node_500() {
+  sh("make n500")
+  dmake_nodes_done['n500'] = true
+}
+
+def dmake_node_501() {
+  waitUntil { dmake_nodes_are_done(['n492', 'n494']) }
+  sh("make n501")
+  dmake_nodes_done['n501'] = true
+}
+
+def dmake_node_502() {
+  waitUntil { dmake_nodes_are_done(['n492', 'n501']) }
+  sh("make n502")
+  dmake_nodes_done['n502'] = true
+}
+
+def dmake_node_503() {
+  waitUntil { dmake_nodes_are_done(['n494', 'n500', 'n501']) }
+  sh("make n503")
+  dmake_nodes_done['n503'] = true
+}
+
+def dmake_node_504() {
+  sh("make n504")
+  dmake_nodes_done['n504'] = true
+}
+
+def dmake_node_505() {
+  waitUntil { dmake_nodes_are_done(['n501']) }
+  sh("make n505")
+  dmake_nodes_done['n505'] = true
+}
+
+def dmake_node_506() {
+  waitUntil { dmake_nodes_are_done(['n505']) }
+  sh("make n506")
+  dmake_nodes_done['n506'] = true
+}
+
+def dmake_node_507() {
+  waitUntil { dmake_nodes_are_done(['n499', 'n505']) }
+  sh("make n507")
+  dmake_nodes_done['n507'] = true
+}
+
+def dmake_node_508() {
+  waitUntil { dmake_nodes_are_done(['n500', 'n506']) }
+  sh("make n508")
+  dmake_nodes_done['n508'] = true
+}
+
+def dmake_node_509() {
+  waitUntil { dmake_nodes_are_done(['n498']) }
+  sh("make n509")
+  dmake_nodes_done['n509'] = true
+}
+
+def dmake_node_510() {
+  waitUntil { dmake_nodes_are_done(['n504', 'n505', 'n507']) }
+  sh("make n510")
+  dmake_nodes_done['n510'] = true
+}
+
+def dmake_node_511() {
+  waitUntil { dmake_nodes_are_done(['n500', 'n501', 'n509']) }
+  sh("make n511")
+  dmake_nodes_done['n511'] = true
+}
+
+def dmake_node_512() {
+  waitUntil { dmake_nodes_are_done(['n511']) }
+  sh("make n512")
+  dmake_nodes_done['n512'] = true
+}
+
+def dmake_node_513() {
+  sh("make n513")
+  dmake_nodes_done['n513'] = true
+}
+
+def dmake_node_514() {
+  waitUntil { dmake_nodes_are_done(['n503', 'n512']) }
+  sh("make n514")
+  dmake_nodes_done['n514'] = true
+}
+
+def dmake_node_515() {
+  sh("make n515")
+  dmake_nodes_done['n515'] = true
+}
+
+def dmake_node_516() {
+  waitUntil { dmake_nodes_are_done(['n505']) }
+  sh("make n516")
+  dmake_nodes_done['n516'] = true
+}
+
+def dmake_node_517() {
+  waitUntil { dmake_nodes_are_done(['n505', 'n507', 'n510']) }
+  sh("make n517")
+  dmake_nodes_done['n517'] = true
+}
+
+def dmake_node_518() {
+  waitUntil { dmake_nodes_are_done(['n506']) }
+  sh("make n518")
+  dmake_nodes_done['n518'] = true
+}
+
+def dmake_node_519() {
+  sh("make n519")
+  dmake_nodes_done['n519'] = true
+}
+
+def dmake_node_520() {
+  waitUntil { dmake_nodes_are_done(['n516']) }
+  sh("make n520")
+  dmake_nodes_done['n520'] = true
+}
+
+def dmake_node_521() {
+  waitUntil { dmake_nodes_are_done(['n509', 'n516', 'n517']) }
+  sh("make n521")
+  dmake_nodes_done['n521'] = true
+}
+
+def dmake_node_522() {
+  waitUntil { dmake_nodes_are_done(['n520']) }
+  sh("make n522")
+  dmake_nodes_done['n522'] = true
+}
+
+def dmake_node_523() {
+  sh("make n523")
+  dmake_nodes_done['n523'] = true
+}
+
+def dmake_node_524() {
+  waitUntil { dmake_nodes_are_done(['n515', 'n518']) }
+  sh("make n524")
+  dmake_nodes_done['n524'] = true
+}
+
+def dmake_node_525() {
+  sh("make n525")
+  dmake_nodes_done['n525'] = true
+}
+
+def dmake_node_526() {
+  sh("make n526")
+  dmake_nodes_done['n526'] = true
+}
+
+def dmake_node_527() {
+  waitUntil { dmake_nodes_are_done(['n523']) }
+  sh("make n527")
+  dmake_nodes_done['n527'] = true
+}
+
+def dmake_node_528() {
+  waitUntil { dmake_nodes_are_done(['n516', 'n521']) }
+  sh("make n528")
+  dmake_nodes_done['n528'] = true
+}
+
+def dmake_node_529() {
+  sh("make n529")
+  dmake_nodes_done['n529'] = true
+}
+
+def dmake_node_530() {
+  waitUntil { dmake_nodes_are_done(['n523', 'n525', 'n528']) }
+  sh("make n530")
+  dmake_nodes_done['n530'] = true
+}
+
+def dmake_node_531() {
+  sh("make n531")
+  dmake_nodes_done['n531'] = true
+}
+
+def dmake_node_532() {
+  waitUntil { dmake_nodes_are_done(['n527', 'n528', 'n531']) }
+  sh("make n532")
+  dmake_nodes_done['n532'] = true
+}
+
+def dmake_node_533() {
+  waitUntil { dmake_nodes_are_done(['n523']) }
+  sh("make n533")
+  dmake_nodes_done['n533'] = true
+}
+
+def dmake_node_534() {
+  waitUntil { dmake_nodes_are_done(['n523', 'n524']) }
+  sh("make n534")
+  dmake_nodes_done['n534'] = true
+}
+
+def dmake_node_535() {
+  sh("make n535")
+  dmake_nodes_done['n535'] = true
+}
+
+def dmake_node_536() {
+  waitUntil { dmake_nodes_are_done(['n529', 'n534']) }
+  sh("make n536")
+  dmake_nodes_done['n536'] = true
+}
+
+def dmake_node_537() {
+  waitUntil { dmake_nodes_are_done(['n535', 'n536']) }
+  sh("make n537")
+  dmake_nodes_done['n537'] = true
+}
+
+def dmake_node_538() {
+  waitUntil { dmake_nodes_are_done(['n529', 'n534']) }
+  sh("make n538")
+  dmake_nodes_done['n538'] = true
+}
+
+def dmake_node_539() {
+  waitUntil { dmake_nodes_are_done(['n532', 'n535']) }
+  sh("make n539")
+  dmake_nodes_done['n539'] = true
+}
+
+def dmake_node_540() {
+  waitUntil { dmake_nodes_are_done(['n529', 'n533', 'n534']) }
+  sh("make n540")
+  dmake_nodes_done['n540'] = true
+}
+
+def dmake_node_541() {
+  sh("make n541")
+  dmake_nodes_done['n541'] = true
+}
+
+def dmake_node_542() {
+  sh("make n542")
+  dmake_nodes_done['n542'] = true
+}
+
+def dmake_node_543() {
+  waitUntil { dmake_nodes_are_done(['n533', 'n536']) }
+  sh("make n543")
+  dmake_nodes_done['n543'] = true
+}
+
+def dmake_node_544() {
+  waitUntil { dmake_nodes_are_done(['n532', 'n535', 'n542']) }
+  sh("make n544")
+  dmake_nodes_done['n544'] = true
+}
+
+def dmake_node_545() {
+  waitUntil { dmake_nodes_are_done(['n535', 'n543']) }
+  sh("make n545")
+  dmake_nodes_done['n545'] = true
+}
+
+def dmake_node_546() {
+  waitUntil { dmake_nodes_are_done(['n536', 'n542', 'n544']) }
+  sh("make n546")
+  dmake_nodes_done['n546'] = true
+}
+
+def dmake_node_547() {
+  waitUntil { dmake_nodes_are_done(['n535', 'n538', 'n542']) }
+  sh("make n547")
+  dmake_nodes_done['n547'] = true
+}
+
+def dmake_node_548() {
+  waitUntil { dmake_nodes_are_done(['n545']) }
+  sh("make n548")
+  dmake_nodes_done['n548'] = true
+}
+
+def dmake_node_549() {
+  waitUntil { dmake_nodes_are_done(['n539', 'n546', 'n547']) }
+  sh("make n549")
+  dmake_nodes_done['n549'] = true
+}
+
+def dmake_node_550() {
+  waitUntil { dmake_nodes_are_done(['n542', 'n544']) }
+  sh("make n550")
+  dmake_nodes_done['n550'] = true
+}
+
+def dmake_node_551() {
+  waitUntil { dmake_nodes_are_done(['n547']) }
+  sh("make n551")
+  dmake_nodes_done['n551'] = true
+}
+
+def dmake_node_552() {
+  waitUntil { dmake_nodes_are_done(['n543', 'n547']) }
+  sh("make n552")
+  dmake_nodes_done['n552'] = true
+}
+
+def dmake_node_553() {
+  waitUntil { dmake_nodes_are_done(['n546']) }
+  sh("make n553")
+  dmake_nodes_done['n553'] = true
+}
+
+def dmake_node_554() {
+  waitUntil { dmake_nodes_are_done(['n544', 'n550']) }
+  sh("make n554")
+  dmake_nodes_done['n554'] = true
+}
+
+def dmake_node_555() {
+  sh("make n555")
+  dmake_nodes_done['n555'] = true
+}
+
+def dmake_node_556() {
+  waitUntil { dmake_nodes_are_done(['n555']) }
+  sh("make n556")
+  dmake_nodes_done['n556'] = true
+}
+
+def dmake_node_557() {
+  waitUntil { dmake_nodes_are_done(['n556']) }
+  sh("make n557")
+  dmake_nodes_done['n557'] = true
+}
+
+def dmake_node_558() {
+  waitUntil { dmake_nodes_are_done(['n550']) }
+  sh("make n558")
+  dmake_nodes_done['n558'] = true
+}
+
+def dmake_node_559() {
+  waitUntil { dmake_nodes_are_done(['n552', 'n553']) }
+  sh("make n559")
+  dmake_nodes_done['n559'] = true
+}
+
+def dmake_node_560() {
+  waitUntil { dmake_nodes_are_done(['n557']) }
+  sh("make n560")
+  dmake_nodes_done['n560'] = true
+}
+
+def dmake_node_561() {
+  waitUntil { dmake_nodes_are_done(['n550', 'n553', 'n557']) }
+  sh("make n561")
+  dmake_nodes_done['n561'] = true
+}
+
+def dmake_node_562() {
+  waitUntil { dmake_nodes_are_done(['n556', 'n560']) }
+  sh("make n562")
+  dmake_nodes_done['n562'] = true
+}
+
+def dmake_node_563() {
+  sh("make n563")
+  dmake_nodes_done['n563'] = true
+}
+
+def dmake_node_564() {
+  waitUntil { dmake_nodes_are_done(['n560', 'n561']) }
+  sh("make n564")
+  dmake_nodes_done['n564'] = true
+}
+
+def dmake_node_565() {
+  waitUntil { dmake_nodes_are_done(['n556', 'n558', 'n560']) }
+  sh("make n565")
+  dmake_nodes_done['n565'] = true
+}
+
+def dmake_node_566() {
+  sh("make n566")
+  dmake_nodes_done['n566'] = true
+}
+
+def dmake_node_567() {
+  sh("make n567")
+  dmake_nodes_done['n567'] = true
+}
+
+def dmake_node_568() {
+  waitUntil { dmake_nodes_are_done(['n565', 'n567']) }
+  sh("make n568")
+  dmake_nodes_done['n568'] = true
+}
+
+def dmake_node_569() {
+  waitUntil { dmake_nodes_are_done(['n557']) }
+  sh("make n569")
+  dmake_nodes_done['n569'] = true
+}
+
+def dmake_node_570() {
+  waitUntil { dmake_nodes_are_done(['n559', 'n567']) }
+  sh("make n570")
+  dmake_nodes_done['n570'] = true
+}
+
+def dmake_node_571() {
+  waitUntil { dmake_nodes_are_done(['n563']) }
+  sh("make n571")
+  dmake_nodes_done['n571'] = true
+}
+
+def dmake_node_572() {
+  waitUntil { dmake_nodes_are_done(['n562']) }
+  sh("make n572")
+  dmake_nodes_done['n572'] = true
+}
+
+def dmake_node_573() {
+  waitUntil { dmake_nodes_are_done(['n563', 'n565', 'n570']) }
+  sh("make n573")
+  dmake_nodes_done['n573'] = true
+}
+
+def dmake_node_574() {
+  waitUntil { dmake_nodes_are_done(['n564', 'n565', 'n571']) }
+  sh("make n574")
+  dmake_nodes_done['n574'] = true
+}
+
+def dmake_node_575() {
+  waitUntil { dmake_nodes_are_done(['n565', 'n567', 'n573']) }
+  sh("make n575")
+  dmake_nodes_done['n575'] = true
+}
+
+def dmake_node_576() {
+  waitUntil { dmake_nodes_are_done(['n567', 'n573']) }
+  sh("make n576")
+  dmake_nodes_done['n576'] = true
+}
+
+def dmake_node_577() {
+  waitUntil { dmake_nodes_are_done(['n576']) }
+  sh("make n577")
+  dmake_nodes_done['n577'] = true
+}
+
+def dmake_node_578() {
+  waitUntil { dmake_nodes_are_done(['n568']) }
+  sh("make n578")
+  dmake_nodes_done['n578'] = true
+}
+
+def dmake_node_579() {
+  waitUntil { dmake_nodes_are_done(['n570', 'n577']) }
+  sh("make n579")
+  dmake_nodes_done['n579'] = true
+}
+
+def dmake_node_580() {
+  waitUntil { dmake_nodes_are_done(['n571', 'n572', 'n578']) }
+  sh("make n580")
+  dmake_nodes_done['n580'] = true
+}
+
+def dmake_node_581() {
+  waitUntil { dmake_nodes_are_done(['n573', 'n576']) }
+  sh("make n581")
+  dmake_nodes_done['n581'] = true
+}
+
+def dmake_node_582() {
+  waitUntil { dmake_nodes_are_done(['n573', 'n574']) }
+  sh("make n582")
+  dmake_nodes_done['n582'] = true
+}
+
+def dmake_node_583() {
+  waitUntil { dmake_nodes_are_done(['n572', 'n580', 'n582']) }
+  sh("make n583")
+  dmake_nodes_done['n583'] = true
+}
+
+def dmake_node_584() {
+  waitUntil { dmake_nodes_are_done(['n574', 'n576', 'n578']) }
+  sh("make n584")
+  dmake_nodes_done['n584'] = true
+}
+
+def dmake_node_585() {
+  waitUntil { dmake_nodes_are_done(['n584']) }
+  sh("make n585")
+  dmake_nodes_done['n585'] = true
+}
+
+def dmake_node_586() {
+  waitUntil { dmake_nodes_are_done(['n580', 'n582']) }
+  sh("make n586")
+  dmake_nodes_done['n586'] = true
+}
+
+def dmake_node_587() {
+  waitUntil { dmake_nodes_are_done(['n581', 'n583', 'n586']) }
+  sh("make n587")
+  dmake_nodes_done['n587'] = true
+}
+
+def dmake_node_588() {
+  waitUntil { dmake_nodes_are_done(['n586']) }
+  sh("make n588")
+  dmake_nodes_done['n588'] = true
+}
+
+def dmake_node_589() {
+  waitUntil { dmake_nodes_are_done(['n580', 'n584', 'n588']) }
+  sh("make n589")
+  dmake_nodes_done['n589'] = true
+}
+
+def dmake_node_590() {
+  waitUntil { dmake_nodes_are_done(['n579', 'n585', 'n586']) }
+  sh("make n590")
+  dmake_nodes_done['n590'] = true
+}
+
+def dmake_node_591() {
+  waitUntil { dmake_nodes_are_done(['n582']) }
+  sh("make n591")
+  dmake_nodes_done['n591'] = true
+}
+
+def dmake_node_592() {
+  waitUntil { dmake_nodes_are_done(['n581', 'n583', 'n588']) }
+  sh("make n592")
+  dmake_nodes_done['n592'] = true
+}
+
+def dmake_node_593() {
+  sh("make n593")
+  dmake_nodes_done['n593'] = true
+}
+
+def dmake_node_594() {
+  waitUntil { dmake_nodes_are_done(['n591']) }
+  sh("make n594")
+  dmake_nodes_done['n594'] = true
+}
+
+def dmake_node_595() {
+  waitUntil { dmake_nodes_are_done(['n587', 'n589', 'n592']) }
+  sh("make n595")
+  dmake_nodes_done['n595'] = true
+}
+
+def dmake_node_596() {
+  sh("make n596")
+  dmake_nodes_done['n596'] = true
+}
+
+def dmake_node_597() {
+  waitUntil { dmake_nodes_are_done(['n596']) }
+  sh("make n597")
+  dmake_nodes_done['n597'] = true
+}
+
+def dmake_node_598() {
+  waitUntil { dmake_nodes_are_done(['n589', 'n594', 'n597']) }
+  sh("make n598")
+  dmake_nodes_done['n598'] = true
+}
+
+def dmake_node_599() {
+  waitUntil { dmake_nodes_are_done(['n588', 'n594', 'n596']) }
+  sh("make n599")
+  dmake_nodes_done['n599'] = true
+}
+
+def dmake_node_600() {
+  waitUntil { dmake_nodes_are_done(['n592', 'n593', 'n598']) }
+  sh("make n600")
+  dmake_nodes_done['n600'] = true
+}
+
+def dmake_node_601() {
+  sh("make n601")
+  dmake_nodes_done['n601'] = true
+}
+
+def dmake_node_602() {
+  sh("make n602")
+  dmake_nodes_done['n602'] = true
+}
+
+def dmake_node_603() {
+  waitUntil { dmake_nodes_are_done(['n591']) }
+  sh("make n603")
+  dmake_nodes_done['n603'] = true
+}
+
+def dmake_node_604() {
+  waitUntil { dmake_nodes_are_done(['n602', 'n603']) }
+  sh("make n604")
+  dmake_nodes_done['n604'] = true
+}
+
+def dmake_node_605() {
+  waitUntil { dmake_nodes_are_done(['n594', 'n603']) }
+  sh("make n605")
+  dmake_nodes_done['n605'] = true
+}
+
+def dmake_node_606() {
+  waitUntil { dmake_nodes_are_done(['n597']) }
+  sh("make n606")
+  dmake_nodes_done['n606'] = true
+}
+
+def dmake_node_607() {
+  waitUntil { dmake_nodes_are_done(['n601', 'n605', 'n606']) }
+  sh("make n607")
+  dmake_nodes_done['n607'] = true
+}
+
+def dmake_node_608() {
+  waitUntil { dmake_nodes_are_done(['n606', 'n607']) }
+  sh("make n608")
+  dmake_nodes_done['n608'] = true
+}
+
+def dmake_node_609() {
+  waitUntil { dmake_nodes_are_done(['n599', 'n602', 'n606']) }
+  sh("make n609")
+  dmake_nodes_done['n609'] = true
+}
+
+def dmake_node_610() {
+  waitUntil { dmake_nodes_are_done(['n601', 'n609']) }
+  sh("make n610")
+  dmake_nodes_done['n610'] = true
+}
+
+def dmake_node_611() {
+  waitUntil { dmake_nodes_are_done(['n601', 'n605', 'n607']) }
+  sh("make n611")
+  dmake_nodes_done['n611'] = true
+}
+
+def dmake_node_612() {
+  waitUntil { dmake_nodes_are_done(['n601', 'n605', 'n609']) }
+  sh("make n612")
+  dmake_nodes_done['n612'] = true
+}
+
+def dmake_node_613() {
+  waitUntil { dmake_nodes_are_done(['n601', 'n604', 'n609']) }
+  sh("make n613")
+  dmake_nodes_done['n613'] = true
+}
+
+def dmake_node_614() {
+  sh("make n614")
+  dmake_nodes_done['n614'] = true
+}
+
+def dmake_node_615() {
+  waitUntil { dmake_nodes_are_done(['n611', 'n614']) }
+  sh("make n615")
+  dmake_nodes_done['n615'] = true
+}
+
+def dmake_node_616() {
+  sh("make n616")
+  dmake_nodes_done['n616'] = true
+}
+
+def dmake_node_617() {
+  waitUntil { dmake_nodes_are_done(['n612']) }
+  sh("make n617")
+  dmake_nodes_done['n617'] = true
+}
+
+def dmake_node_618() {
+  sh("make n618")
+  dmake_nodes_done['n618'] = true
+}
+
+def dmake_node_619() {
+  waitUntil { dmake_nodes_are_done(['n617']) }
+  sh("make n619")
+  dmake_nodes_done['n619'] = true
+}
+
+def dmake_node_620() {
+  waitUntil { dmake_nodes_are_done(['n609']) }
+  sh("make n620")
+  dmake_nodes_done['n620'] = true
+}
+
+def dmake_node_621() {
+  waitUntil { dmake_nodes_are_done(['n613', 'n618', 'n620']) }
+  sh("make n621")
+  dmake_nodes_done['n621'] = true
+}
+
+def dmake_node_622() {
+  sh("make n622")
+  dmake_nodes_done['n622'] = true
+}
+
+def dmake_node_623() {
+  sh("make n623")
+  dmake_nodes_done['n623'] = true
+}
+
+def dmake_node_624() {
+  waitUntil { dmake_nodes_are_done(['n612', 'n616', 'n618']) }
+  sh("make n624")
+  dmake_nodes_done['n624'] = true
+}
+
+def dmake_node_625() {
+  sh("make n625")
+  dmake_nodes_done['n625'] = true
+}
+
+def dmake_node_626() {
+  waitUntil { dmake_nodes_are_done(['n621']) }
+  sh("make n626")
+  dmake_nodes_done['n626'] = true
+}
+
+def dmake_node_627() {
+  waitUntil { dmake_nodes_are_done(['n621', 'n624']) }
+  sh("make n627")
+  dmake_nodes_done['n627'] = true
+}
+
+def dmake_node_628() {
+  waitUntil { dmake_nodes_are_done(['n625', 'n627']) }
+  sh("make n628")
+  dmake_nodes_done['n628'] = true
+}
+
+def dmake_node_629() {
+  waitUntil { dmake_nodes_are_done(['n621']) }
+  sh("make n629")
+  dmake_nodes_done['n629'] = true
+}
+
+def dmake_node_630() {
+  waitUntil { dmake_nodes_are_done(['n621', 'n628']) }
+  sh("make n630")
+  dmake_nodes_done['n630'] = true
+}
+
+def dmake_node_631() {
+  sh("make n631")
+  dmake_nodes_done['n631'] = true
+}
+
+def dmake_node_632() {
+  waitUntil { dmake_nodes_are_done(['n620', 'n627', 'n630']) }
+  sh("make n632")
+  dmake_nodes_done['n632'] = true
+}
+
+def dmake_node_633() {
+  waitUntil { dmake_nodes_are_done(['n628', 'n630', 'n631']) }
+  sh("make n633")
+  dmake_nodes_done['n633'] = true
+}
+
+def dmake_node_634() {
+  sh("make n634")
+  dmake_nodes_done['n634'] = true
+}
+
+def dmake_node_635() {
+  waitUntil { dmake_nodes_are_done(['n626', 'n630']) }
+  sh("make n635")
+  dmake_nodes_done['n635'] = true
+}
+
+def dmake_node_636() {
+  waitUntil { dmake_nodes_are_done(['n626', 'n631', 'n633']) }
+  sh("make n636")
+  dmake_nodes_done['n636'] = true
+}
+
+def dmake_node_637() {
+  sh("make n637")
+  dmake_nodes_done['n637'] = true
+}
+
+def dmake_node_638() {
+  sh("make n638")
+  dmake_nodes_done['n638'] = true
+}
+
+def dmake_node_639() {
+  waitUntil { dmake_nodes_are_done(['n630', 'n636']) }
+  sh("make n639")
+  dmake_nodes_done['n639'] = true
+}
+
+def dmake_node_640() {
+  waitUntil { dmake_nodes_are_done(['n638']) }
+  sh("make n640")
+  dmake_nodes_done['n640'] = true
+}
+
+def dmake_node_641() {
+  waitUntil { dmake_nodes_are_done(['n631', 'n634', 'n636']) }
+  sh("make n641")
+  dmake_nodes_done['n641'] = true
+}
+
+def dmake_node_642() {
+  waitUntil { dmake_nodes_are_done(['n631', 'n639']) }
+  sh("make n642")
+  dmake_nodes_done['n642'] = true
+}
+
+def dmake_node_643() {
+  waitUntil { dmake_nodes_are_done(['n631', 'n632', 'n633']) }
+  sh("make n643")
+  dmake_nodes_done['n643'] = true
+}
+
+def dmake_node_644() {
+  waitUntil { dmake_nodes_are_done(['n635', 'n639', 'n642']) }
+  sh("make n644")
+  dmake_nodes_done['n644'] = true
+}
+
+def dmake_node_645() {
+  waitUntil { dmake_nodes_are_done(['n633', 'n637', 'n643']) }
+  sh("make n645")
+  dmake_nodes_done['n645'] = true
+}
+
+def dmake_node_646() {
+  sh("make n646")
+  dmake_nodes_done['n646'] = true
+}
+
+def dmake_node_647() {
+  sh("make n647")
+  dmake_nodes_done['n647'] = true
+}
+
+def dmake_node_648() {
+  waitUntil { dmake_nodes_are_done(['n641', 'n643']) }
+  sh("make n648")
+  dmake_nodes_done['n648'] = true
+}
+
+def dmake_node_649() {
+  waitUntil { dmake_nodes_are_done(['n639', 'n641', 'n645']) }
+  sh("make n649")
+  dmake_nodes_done['n649'] = true
+}
+
+def dmake_node_650() {
+  sh("make n650")
+  dmake_nodes_done['n650'] = true
+}
+
+def dmake_node_651() {
+  waitUntil { dmake_nodes_are_done(['n643']) }
+  sh("make n651")
+  dmake_nodes_done['n651'] = true
+}
+
+def dmake_node_652() {
+  waitUntil { dmake_nodes_are_done(['n641', 'n651']) }
+  sh("make n652")
+  dmake_nodes_done['n652'] = true
+}
+
+def dmake_node_653() {
+  sh("make n653")
+  dmake_nodes_done['n653'] = true
+}
+
+def dmake_node_654() {
+  waitUntil { dmake_nodes_are_done(['n649']) }
+  sh("make n654")
+  dmake_nodes_done['n654'] = true
+}
+
+def dmake_node_655() {
+  waitUntil { dmake_nodes_are_done(['n650']) }
+  sh("make n655")
+  dmake_nodes_done['n655'] = true
+}
+
+def dmake_node_656() {
+  waitUntil { dmake_nodes_are_done(['n644', 'n645', 'n654']) }
+  sh("make n656")
+  dmake_nodes_done['n656'] = true
+}
+
+def dmake_node_657() {
+  waitUntil { dmake_nodes_are_done(['n648', 'n649', 'n651']) }
+  sh("make n657")
+  dmake_nodes_done['n657'] = true
+}
+
+def dmake_node_658() {
+  waitUntil { dmake_nodes_are_done(['n648', 'n652']) }
+  sh("make n658")
+  dmake_nodes_done['n658'] = true
+}
+
+def dmake_node_659() {
+  waitUntil { dmake_nodes_are_done(['n650', 'n651', 'n656']) }
+  sh("make n659")
+  dmake_nodes_done['n659'] = true
+}
+
+def dmake_node_660() {
+  waitUntil { dmake_nodes_are_done(['n652', 'n653', 'n659']) }
+  sh("make n660")
+  dmake_nodes_done['n660'] = true
+}
+
+def dmake_node_661() {
+  waitUntil { dmake_nodes_are_done(['n656']) }
+  sh("make n661")
+  dmake_nodes_done['n661'] = true
+}
+
+def dmake_node_662() {
+  waitUntil { dmake_nodes_are_done(['n653', 'n654', 'n659']) }
+  sh("make n662")
+  dmake_nodes_done['n662'] = true
+}
+
+def dmake_node_663() {
+  waitUntil { dmake_nodes_are_done(['n654']) }
+  sh("make n663")
+  dmake_nodes_done['n663'] = true
+}
+
+def dmake_node_664() {
+  waitUntil { dmake_nodes_are_done(['n654', 'n660']) }
+  sh("make n664")
+  dmake_nodes_done['n664'] = true
+}
+
+def dmake_node_665() {
+  waitUntil { dmake_nodes_are_done(['n653', 'n658', 'n660']) }
+  sh("make n665")
+  dmake_nodes_done['n665'] = true
+}
+
+def dmake_node_666() {
+  waitUntil { dmake_nodes_are_done(['n655', 'n656', 'n664']) }
+  sh("make n666")
+  dmake_nodes_done['n666'] = true
+}
+
+def dmake_node_667() {
+  waitUntil { dmake_nodes_are_done(['n658', 'n659', 'n664']) }
+  sh("make n667")
+  dmake_nodes_done['n667'] = true
+}
+
+def dmake_node_668() {
+  waitUntil { dmake_nodes_are_done(['n656', 'n661', 'n667']) }
+  sh("make n668")
+  dmake_nodes_done['n668'] = true
+}
+
+def dmake_node_669() {
+  waitUntil { dmake_nodes_are_done(['n661', 'n664', 'n665']) }
+  sh("make n669")
+  dmake_nodes_done['n669'] = true
+}
+
+def dmake_node_670() {
+  waitUntil { dmake_nodes_are_done(['n664', 'n668']) }
+  sh("make n670")
+  dmake_nodes_done['n670'] = true
+}
+
+def dmake_node_671() {
+  waitUntil { dmake_nodes_are_done(['n663']) }
+  sh("make n671")
+  dmake_nodes_done['n671'] = true
+}
+
+def dmake_node_672() {
+  sh("make n672")
+  dmake_nodes_done['n672'] = true
+}
+
+def dmake_node_673() {
+  waitUntil { dmake_nodes_are_done(['n663', 'n667', 'n671']) }
+  sh("make n673")
+  dmake_nodes_done['n673'] = true
+}
+
+def dmake_node_674() {
+  waitUntil { dmake_nodes_are_done(['n669', 'n670']) }
+  sh("make n674")
+  dmake_nodes_done['n674'] = true
+}
+
+def dmake_node_675() {
+  waitUntil { dmake_nodes_are_done(['n668']) }
+  sh("make n675")
+  dmake_nodes_done['n675'] = true
+}
+
+def dmake_node_676() {
+  waitUntil { dmake_nodes_are_done(['n665', 'n667', 'n668']) }
+  sh("make n676")
+  dmake_nodes_done['n676'] = true
+}
+
+def dmake_node_677() {
+  sh("make n677")
+  dmake_nodes_done['n677'] = true
+}
+
+def dmake_node_678() {
+  waitUntil { dmake_nodes_are_done(['n667', 'n668', 'n677']) }
+  sh("make n678")
+  dmake_nodes_done['n678'] = true
+}
+
+def dmake_node_679() {
+  waitUntil { dmake_nodes_are_done(['n667']) }
+  sh("make n679")
+  dmake_nodes_done['n679'] = true
+}
+
+def dmake_node_680() {
+  waitUntil { dmake_nodes_are_done(['n670', 'n674', 'n678']) }
+  sh("make n680")
+  dmake_nodes_done['n680'] = true
+}
+
+def dmake_node_681() {
+  sh("make n681")
+  dmake_nodes_done['n681'] = true
+}
+
+def dmake_node_682() {
+  sh("make n682")
+  dmake_nodes_done['n682'] = true
+}
+
+def dmake_node_683() {
+  waitUntil { dmake_nodes_are_done(['n675', 'n682']) }
+  sh("make n683")
+  dmake_nodes_done['n683'] = true
+}
+
+def dmake_node_684() {
+  waitUntil { dmake_nodes_are_done(['n677', 'n679']) }
+  sh("make n684")
+  dmake_nodes_done['n684'] = true
+}
+
+def dmake_node_685() {
+  waitUntil { dmake_nodes_are_done(['n676', 'n680']) }
+  sh("make n685")
+  dmake_nodes_done['n685'] = true
+}
+
+def dmake_node_686() {
+  waitUntil { dmake_nodes_are_done(['n680']) }
+  sh("make n686")
+  dmake_nodes_done['n686'] = true
+}
+
+def dmake_node_687() {
+  sh("make n687")
+  dmake_nodes_done['n687'] = true
+}
+
+def dmake_node_688() {
+  sh("make n688")
+  dmake_nodes_done['n688'] = true
+}
+
+def dmake_node_689() {
+  sh("make n689")
+  dmake_nodes_done['n689'] = true
+}
+
+def dmake_node_690() {
+  waitUntil { dmake_nodes_are_done(['n685']) }
+  sh("make n690")
+  dmake_nodes_done['n690'] = true
+}
+
+def dmake_node_691() {
+  sh("make n691")
+  dmake_nodes_done['n691'] = true
+}
+
+def dmake_node_692() {
+  sh("make n692")
+  dmake_nodes_done['n692'] = true
+}
+
+def dmake_node_693() {
+  sh("make n693")
+  dmake_nodes_done['n693'] = true
+}
+
+def dmake_node_694() {
+  waitUntil { dmake_nodes_are_done(['n683', 'n688', 'n692']) }
+  sh("make n694")
+  dmake_nodes_done['n694'] = true
+}
+
+def dmake_node_695() {
+  waitUntil { dmake_nodes_are_done(['n691']) }
+  sh("make n695")
+  dmake_nodes_done['n695'] = true
+}
+
+def dmake_node_696() {
+  waitUntil { dmake_nodes_are_done(['n685', 'n686', 'n692']) }
+  sh("make n696")
+  dmake_nodes_done['n696'] = true
+}
+
+def dmake_node_697() {
+  waitUntil { dmake_nodes_are_done(['n686']) }
+  sh("make n697")
+  dmake_nodes_done['n697'] = true
+}
+
+def dmake_node_698() {
+  waitUntil { dmake_nodes_are_done(['n691', 'n694']) }
+  sh("make n698")
+  dmake_nodes_done['n698'] = true
+}
+
+def dmake_node_699() {
+  waitUntil { dmake_nodes_are_done(['n690', 'n691', 'n696']) }
+  sh("make n699")
+  dmake_nodes_done['n699'] = true
+}
+
+def dmake_node_700() {
+  waitUntil { dmake_nodes_are_done(['n692', 'n693', 'n699']) }
+  sh("make n700")
+  dmake_nodes_done['n700'] = true
+}
+
+def dmake_node_701() {
+  sh("make n701")
+  dmake_nodes_done['n701'] = true
+}
+
+def dmake_node_702() {
+  waitUntil { dmake_nodes_are_done(['n700']) }
+  sh("make n702")
+  dmake_nodes_done['n702'] = true
+}
+
+def dmake_node_703() {
+  waitUntil { dmake_nodes_are_done(['n693', 'n698', 'n702']) }
+  sh("make n703")
+  dmake_nodes_done['n703'] = true
+}
+
+def dmake_node_704() {
+  waitUntil { dmake_nodes_are_done(['n692']) }
+  sh("make n704")
+  dmake_nodes_done['n704'] = true
+}
+
+def dmake_node_705() {
+  waitUntil { dmake_nodes_are_done(['n696', 'n703']) }
+  sh("make n705")
+  dmake_nodes_done['n705'] = true
+}
+
+def dmake_node_706() {
+  waitUntil { dmake_nodes_are_done(['n704']) }
+  sh("make n706")
+  dmake_nodes_done['n706'] = true
+}
+
+def dmake_node_707() {
+  sh("make n707")
+  dmake_nodes_done['n707'] = true
+}
+
+def dmake_node_708() {
+  waitUntil { dmake_nodes_are_done(['n697', 'n702']) }
+  sh("make n708")
+  dmake_nodes_done['n708'] = true
+}
+
+def dmake_node_709() {
+  waitUntil { dmake_nodes_are_done(['n697', 'n702', 'n705']) }
+  sh("make n709")
+  dmake_nodes_done['n709'] = true
+}
+
+def dmake_node_710() {
+  sh("make n710")
+  dmake_nodes_done['n710'] = true
+}
+
+def dmake_node_711() {
+  waitUntil { dmake_nodes_are_done(['n701', 'n703']) }
+  sh("make n711")
+  dmake_nodes_done['n711'] = true
+}
+
+def dmake_node_712() {
+  sh("make n712")
+  dmake_nodes_done['n712'] = true
+}
+
+def dmake_node_713() {
+  sh("make n713")
+  dmake_nodes_done['n713'] = true
+}
+
+def dmake_node_714() {
+  waitUntil { dmake_nodes_are_done(['n706']) }
+  sh("make n714")
+  dmake_nodes_done['n714'] = true
+}
+
+def dmake_node_715() {
+  sh("make n715")
+  dmake_nodes_done['n715'] = true
+}
+
+def dmake_node_716() {
+  sh("make n716")
+  dmake_nodes_done['n716'] = true
+}
+
+def dmake_node_717() {
+  sh("make n717")
+  dmake_nodes_done['n717'] = true
+}
+
+def dmake_node_718() {
+  waitUntil { dmake_nodes_are_done(['n711']) }
+  sh("make n718")
+  dmake_nodes_done['n718'] = true
+}
+
+def dmake_node_719() {
+  waitUntil { dmake_nodes_are_done(['n707']) }
+  sh("make n719")
+  dmake_nodes_done['n719'] = true
+}
+
+def dmake_node_720() {
+  waitUntil { dmake_nodes_are_done(['n715']) }
+  sh("make n720")
+  dmake_nodes_done['n720'] = true
+}
+
+def dmake_node_721() {
+  waitUntil { dmake_nodes_are_done(['n714', 'n720']) }
+  sh("make n721")
+  dmake_nodes_done['n721'] = true
+}
+
+def dmake_node_722() {
+  waitUntil { dmake_nodes_are_done(['n712', 'n715', 'n717']) }
+  sh("make n722")
+  dmake_nodes_done['n722'] = true
+}
+
+def dmake_node_723() {
+  waitUntil { dmake_nodes_are_done(['n711', 'n714', 'n720']) }
+  sh("make n723")
+  dmake_nodes_done['n723'] = true
+}
+
+def dmake_node_724() {
+  waitUntil { dmake_nodes_are_done(['n714', 'n718', 'n723']) }
+  sh("make n724")
+  dmake_nodes_done['n724'] = true
+}
+
+def dmake_node_725() {
+  waitUntil { dmake_nodes_are_done(['n717']) }
+  sh("make n725")
+  dmake_nodes_done['n725'] = true
+}
+
+def dmake_node_726() {
+  sh("make n726")
+  dmake_nodes_done['n726'] = true
+}
+
+def dmake_node_727() {
+  waitUntil { dmake_nodes_are_done(['n716']) }
+  sh("make n727")
+  dmake_nodes_done['n727'] = true
+}
+
+def dmake_node_728() {
+  waitUntil { dmake_nodes_are_done(['n720', 'n722', 'n724']) }
+  sh("make n728")
+  dmake_nodes_done['n728'] = true
+}
+
+def dmake_node_729() {
+  waitUntil { dmake_nodes_are_done(['n718', 'n721', 'n724']) }
+  sh("make n729")
+  dmake_nodes_done['n729'] = true
+}
+
+def dmake_node_730() {
+  waitUntil { dmake_nodes_are_done(['n724', 'n727']) }
+  sh("make n730")
+  dmake_nodes_done['n730'] = true
+}
+
+def dmake_node_731() {
+  waitUntil { dmake_nodes_are_done(['n725']) }
+  sh("make n731")
+  dmake_nodes_done['n731'] = true
+}
+
+def dmake_node_732() {
+  waitUntil { dmake_nodes_are_done(['n720', 'n730', 'n731']) }
+  sh("make n732")
+  dmake_nodes_done['n732'] = true
+}
+
+def dmake_node_733() {
+  waitUntil { dmake_nodes_are_done(['n721', 'n732']) }
+  sh("make n733")
+  dmake_nodes_done['n733'] = true
+}
+
+def dmake_node_734() {
+  waitUntil { dmake_nodes_are_done(['n727', 'n730', 'n733']) }
+  sh("make n734")
+  dmake_nodes_done['n734'] = true
+}
+
+def dmake_node_735() {
+  waitUntil { dmake_nodes_are_done(['n725', 'n732', 'n734']) }
+  sh("make n735")
+  dmake_nodes_done['n735'] = true
+}
+
+def dmake_node_736() {
+  waitUntil { dmake_nodes_are_done(['n728']) }
+  sh("make n736")
+  dmake_nodes_done['n736'] = true
+}
+
+def dmake_node_737() {
+  waitUntil { dmake_nodes_are_done(['n734']) }
+  sh("make n737")
+  dmake_nodes_done['n737'] = true
+}
+
+def dmake_node_738() {
+  waitUntil { dmake_nodes_are_done(['n728', 'n731', 'n733']) }
+  sh("make n738")
+  dmake_nodes_done['n738'] = true
+}
+
+def dmake_node_739() {
+  waitUntil { dmake_nodes_are_done(['n732', 'n734']) }
+  sh("make n739")
+  dmake_nodes_done['n739'] = true
+}
+
+def dmake_node_740() {
+  waitUntil { dmake_nodes_are_done(['n728']) }
+  sh("make n740")
+  dmake_nodes_done['n740'] = true
+}
+
+def dmake_node_741() {
+  waitUntil { dmake_nodes_are_done(['n737', 'n738', 'n739']) }
+  sh("make n741")
+  dmake_nodes_done['n741'] = true
+}
+
+def dmake_node_742() {
+  waitUntil { dmake_nodes_are_done(['n732']) }
+  sh("make n742")
+  dmake_nodes_done['n742'] = true
+}
+
+def dmake_node_743() {
+  sh("make n743")
+  dmake_nodes_done['n743'] = true
+}
+
+def dmake_node_744() {
+  sh("make n744")
+  dmake_nodes_done['n744'] = true
+}
+
+def dmake_node_745() {
+  waitUntil { dmake_nodes_are_done(['n742']) }
+  sh("make n745")
+  dmake_nodes_done['n745'] = true
+}
+
+def dmake_node_746() {
+  waitUntil { dmake_nodes_are_done(['n741']) }
+  sh("make n746")
+  dmake_nodes_done['n746'] = true
+}
+
+def dmake_node_747() {
+  sh("make n747")
+  dmake_nodes_done['n747'] = true
+}
+
+def dmake_node_748() {
+  sh("make n748")
+  dmake_nodes_done['n748'] = true
+}
+
+def dmake_node_749() {
+  waitUntil { dmake_nodes_are_done(['n737', 'n739']) }
+  sh("make n749")
+  dmake_nodes_done['n749'] = true
+}
+
+def dmake_node_750() {
+  waitUntil { dmake_nodes_are_done(['n739', 'n741', 'n748']) }
+  sh("make n750")
+  dmake_nodes_done['n750'] = true
+}
+
+def dmake_node_751() {
+  waitUntil { dmake_nodes_are_done(['n745', 'n746', 'n749']) }
+  sh("make n751")
+  dmake_nodes_done['n751'] = true
+}
+
+def dmake_node_752() {
+  waitUntil { dmake_nodes_are_done(['n746']) }
+  sh("make n752")
+  dmake_nodes_done['n752'] = true
+}
+
+def dmake_node_753() {
+  sh("make n753")
+  dmake_nodes_done['n753'] = true
+}
+
+def dmake_node_754() {
+  waitUntil { dmake_nodes_are_done(['n746', 'n749']) }
+  sh("make n754")
+  dmake_nodes_done['n754'] = true
+}
+
+def dmake_node_755() {
+  waitUntil { dmake_nodes_are_done(['n754']) }
+  sh("make n755")
+  dmake_nodes_done['n755'] = true
+}
+
+def dmake_node_756() {
+  waitUntil { dmake_nodes_are_done(['n745']) }
+  sh("make n756")
+  dmake_nodes_done['n756'] = true
+}
+
+def dmake_node_757() {
+  waitUntil { dmake_nodes_are_done(['n746', 'n747']) }
+  sh("make n757")
+  dmake_nodes_done['n757'] = true
+}
+
+def dmake_node_758() {
+  waitUntil { dmake_nodes_are_done(['n747', 'n756']) }
+  sh("make n758")
+  dmake_nodes_done['n758'] = true
+}
+
+def dmake_node_759() {
+  waitUntil { dmake_nodes_are_done(['n751', 'n752']) }
+  sh("make n759")
+  dmake_nodes_done['n759'] = true
+}
+
+def dmake_node_760() {
+  waitUntil { dmake_nodes_are_done(['n758']) }
+  sh("make n760")
+  dmake_nodes_done['n760'] = true
+}
+
+def dmake_node_761() {
+  waitUntil { dmake_nodes_are_done(['n757']) }
+  sh("make n761")
+  dmake_nodes_done['n761'] = true
+}
+
+def dmake_node_762() {
+  sh("make n762")
+  dmake_nodes_done['n762'] = true
+}
+
+def dmake_node_763() {
+  sh("make n763")
+  dmake_nodes_done['n763'] = true
+}
+
+def dmake_node_764() {
+  waitUntil { dmake_nodes_are_done(['n754', 'n759', 'n763']) }
+  sh("make n764")
+  dmake_nodes_done['n764'] = true
+}
+
+def dmake_node_765() {
+  sh("make n765")
+  dmake_nodes_done['n765'] = true
+}
+
+def dmake_node_766() {
+  waitUntil { dmake_nodes_are_done(['n755', 'n758', 'n763']) }
+  sh("make n766")
+  dmake_nodes_done['n766'] = true
+}
+
+def dmake_node_767() {
+  waitUntil { dmake_nodes_are_done(['n766']) }
+  sh("make n767")
+  dmake_nodes_done['n767'] = true
+}
+
+def dmake_node_768() {
+  waitUntil { dmake_nodes_are_done(['n758', 'n763', 'n764']) }
+  sh("make n768")
+  dmake_nodes_done['n768'] = true
+}
+
+def dmake_node_769() {
+  waitUntil { dmake_nodes_are_done(['n767']) }
+  sh("make n769")
+  dmake_nodes_done['n769'] = true
+}
+
+def dmake_node_770() {
+  waitUntil { dmake_nodes_are_done(['n760']) }
+  sh("make n770")
+  dmake_nodes_done['n770'] = true
+}
+
+def dmake_node_771() {
+  waitUntil { dmake_nodes_are_done(['n766', 'n769']) }
+  sh("make n771")
+  dmake_nodes_done['n771'] = true
+}
+
+def dmake_node_772() {
+  sh("make n772")
+  dmake_nodes_done['n772'] = true
+}
+
+def dmake_node_773() {
+  waitUntil { dmake_nodes_are_done(['n761', 'n768']) }
+  sh("make n773")
+  dmake_nodes_done['n773'] = true
+}
+
+def dmake_node_774() {
+  waitUntil { dmake_nodes_are_done(['n765']) }
+  sh("make n774")
+  dmake_nodes_done['n774'] = true
+}
+
+def dmake_node_775() {
+  waitUntil { dmake_nodes_are_done(['n764', 'n768', 'n769']) }
+  sh("make n775")
+  dmake_nodes_done['n775'] = true
+}
+
+def dmake_node_776() {
+  waitUntil { dmake_nodes_are_done(['n767']) }
+  sh("make n776")
+  dmake_nodes_done['n776'] = true
+}
+
+def dmake_node_777() {
+  waitUntil { dmake_nodes_are_done(['n770', 'n772', 'n774']) }
+  sh("make n777")
+  dmake_nodes_done['n777'] = true
+}
+
+def dmake_node_778() {
+  waitUntil { dmake_nodes_are_done(['n766', 'n770']) }
+  sh("make n778")
+  dmake_nodes_done['n778'] = true
+}
+
+def dmake_node_779() {
+  waitUntil { dmake_nodes_are_done(['n771']) }
+  sh("make n779")
+  dmake_nodes_done['n779'] = true
+}
+
+def dmake_node_780() {
+  sh("make n780")
+  dmake_nodes_done['n780'] = true
+}
+
+def dmake_node_781() {
+  sh("make n781")
+  dmake_nodes_done['n781'] = true
+}
+
+def dmake_node_782() {
+  waitUntil { dmake_nodes_are_done(['n775', 'n776', 'n779']) }
+  sh("make n782")
+  dmake_nodes_done['n782'] = true
+}
+
+def dmake_node_783() {
+  waitUntil { dmake_nodes_are_done(['n773', 'n778']) }
+  sh("make n783")
+  dmake_nodes_done['n783'] = true
+}
+
+def dmake_node_784() {
+  sh("make n784")
+  dmake_nodes_done['n784'] = true
+}
+
+def dmake_node_785() {
+  waitUntil { dmake_nodes_are_done(['n773']) }
+  sh("make n785")
+  dmake_nodes_done['n785'] = true
+}
+
+def dmake_node_786() {
+  waitUntil { dmake_nodes_are_done(['n775']) }
+  sh("make n786")
+  dmake_nodes_done['n786'] = true
+}
+
+def dmake_node_787() {
+  waitUntil { dmake_nodes_are_done(['n776']) }
+  sh("make n787")
+  dmake_nodes_done['n787'] = true
+}
+
+def dmake_node_788() {
+  waitUntil { dmake_nodes_are_done(['n781']) }
+  sh("make n788")
+  dmake_nodes_done['n788'] = true
+}
+
+def dmake_node_789() {
+  waitUntil { dmake_nodes_are_done(['n780', 'n783']) }
+  sh("make n789")
+  dmake_nodes_done['n789'] = true
+}
+
+def dmake_node_790() {
+  waitUntil { dmake_nodes_are_done(['n787']) }
+  sh("make n790")
+  dmake_nodes_done['n790'] = true
+}
+
+def dmake_node_791() {
+  sh("make n791")
+  dmake_nodes_done['n791'] = true
+}
+
+def dmake_node_792() {
+  sh("make n792")
+  dmake_nodes_done['n792'] = true
+}
+
+def dmake_node_793() {
+  waitUntil { dmake_nodes_are_done(['n785', 'n792']) }
+  sh("make n793")
+  dmake_nodes_done['n793'] = true
+}
+
+def dmake_node_794() {
+  waitUntil { dmake_nodes_are_done(['n786', 'n787', 'n789']) }
+  sh("make n794")
+  dmake_nodes_done['n794'] = true
+}
+
+def dmake_node_795() {
+  waitUntil { dmake_nodes_are_done(['n789', 'n793']) }
+  sh("make n795")
+  dmake_nodes_done['n795'] = true
+}
+
+def dmake_node_796() {
+  waitUntil { dmake_nodes_are_done(['n784', 'n795']) }
+  sh("make n796")
+  dmake_nodes_done['n796'] = true
+}
+
+def dmake_node_797() {
+  waitUntil { dmake_nodes_are_done(['n789', 'n791', 'n795']) }
+  sh("make n797")
+  dmake_nodes_done['n797'] = true
+}
+
+def dmake_node_798() {
+  waitUntil { dmake_nodes_are_done(['n788']) }
+  sh("make n798")
+  dmake_nodes_done['n798'] = true
+}
+
+def dmake_node_799() {
+  waitUntil { dmake_nodes_are_done(['n796']) }
+  sh("make n799")
+  dmake_nodes_done['n799'] = true
+}
+
+def dmake_node_800() {
+  waitUntil { dmake_nodes_are_done(['n796', 'n799']) }
+  sh("make n800")
+  dmake_nodes_done['n800'] = true
+}
+
+def dmake_node_801() {
+  waitUntil { dmake_nodes_are_done(['n790', 'n792', 'n796']) }
+  sh("make n801")
+  dmake_nodes_done['n801'] = true
+}
+
+def dmake_node_802() {
+  sh("make n802")
+  dmake_nodes_done['n802'] = true
+}
+
+def dmake_node_803() {
+  sh("make n803")
+  dmake_nodes_done['n803'] = true
+}
+
+def dmake_node_804() {
+  waitUntil { dmake_nodes_are_done(['n794']) }
+  sh("make n804")
+  dmake_nodes_done['n804'] = true
+}
+
+def dmake_node_805() {
+  waitUntil { dmake_nodes_are_done(['n794', 'n804']) }
+  sh("make n805")
+  dmake_nodes_done['n805'] = true
+}
+
+def dmake_node_806() {
+  waitUntil { dmake_nodes_are_done(['n803']) }
+  sh("make n806")
+  dmake_nodes_done['n806'] = true
+}
+
+def dmake_node_807() {
+  waitUntil { dmake_nodes_are_done(['n796', 'n799', 'n804']) }
+  sh("make n807")
+  dmake_nodes_done['n807'] = true
+}
+
+def dmake_node_808() {
+  sh("make n808")
+  dmake_nodes_done['n808'] = true
+}
+
+def dmake_node_809() {
+  waitUntil { dmake_nodes_are_done(['n799']) }
+  sh("make n809")
+  dmake_nodes_done['n809'] = true
+}
+
+def dmake_node_810() {
+  waitUntil { dmake_nodes_are_done(['n800', 'n805']) }
+  sh("make n810")
+  dmake_nodes_done['n810'] = true
+}
+
+def dmake_node_811() {
+  sh("make n811")
+  dmake_nodes_done['n811'] = true
+}
+
+def dmake_node_812() {
+  sh("make n812")
+  dmake_nodes_done['n812'] = true
+}
+
+def dmake_node_813() {
+  waitUntil { dmake_nodes_are_done(['n806']) }
+  sh("make n813")
+  dmake_nodes_done['n813'] = true
+}
+
+def dmake_node_814() {
+  waitUntil { dmake_nodes_are_done(['n803', 'n809']) }
+  sh("make n814")
+  dmake_nodes_done['n814'] = true
+}
+
+def dmake_node_815() {
+  waitUntil { dmake_nodes_are_done(['n803', 'n808', 'n814']) }
+  sh("make n815")
+  dmake_nodes_done['n815'] = true
+}
+
+def dmake_node_816() {
+  waitUntil { dmake_nodes_are_done(['n804', 'n811']) }
+  sh("make n816")
+  dmake_nodes_done['n816'] = true
+}
+
+def dmake_node_817() {
+  waitUntil { dmake_nodes_are_done(['n807']) }
+  sh("make n817")
+  dmake_nodes_done['n817'] = true
+}
+
+def dmake_node_818() {
+  waitUntil { dmake_nodes_are_done(['n813', 'n816']) }
+  sh("make n818")
+  dmake_nodes_done['n818'] = true
+}
+
+def dmake_node_819() {
+  waitUntil { dmake_nodes_are_done(['n811', 'n814', 'n818']) }
+  sh("make n819")
+  dmake_nodes_done['n819'] = true
+}
+
+def dmake_node_820() {
+  waitUntil { dmake_nodes_are_done(['n809', 'n810', 'n812']) }
+  sh("make n820")
+  dmake_nodes_done['n820'] = true
+}
+
+def dmake_node_821() {
+  waitUntil { dmake_nodes_are_done(['n809', 'n816', 'n818']) }
+  sh("make n821")
+  dmake_nodes_done['n821'] = true
+}
+
+def dmake_node_822() {
+  sh("make n822")
+  dmake_nodes_done['n822'] = true
+}
+
+def dmake_node_823() {
+  waitUntil { dmake_nodes_are_done(['n812']) }
+  sh("make n823")
+  dmake_nodes_done['n823'] = true
+}
+
+def dmake_node_824() {
+  waitUntil { dmake_nodes_are_done(['n814', 'n820', 'n822']) }
+  sh("make n824")
+  dmake_nodes_done['n824'] = true
+}
+
+def dmake_node_825() {
+  waitUntil { dmake_nodes_are_done(['n815', 'n821']) }
+  sh("make n825")
+  dmake_nodes_done['n825'] = true
+}
+
+def dmake_node_826() {
+  sh("make n826")
+  dmake_nodes_done['n826'] = true
+}
+
+def dmake_node_827() {
+  waitUntil { dmake_nodes_are_done(['n818', 'n825', 'n826']) }
+  sh("make n827")
+  dmake_nodes_done['n827'] = true
+}
+
+def dmake_node_828() {
+  waitUntil { dmake_nodes_are_done(['n820', 'n821']) }
+  sh("make n828")
+  dmake_nodes_done['n828'] = true
+}
+
+def dmake_node_829() {
+  sh("make n829")
+  dmake_nodes_done['n829'] = true
+}
+
+def dmake_node_830() {
+  waitUntil { dmake_nodes_are_done(['n829']) }
+  sh("make n830")
+  dmake_nodes_done['n830'] = true
+}
+
+def dmake_node_831() {
+  waitUntil { dmake_nodes_are_done(['n822', 'n824', 'n830']) }
+  sh("make n831")
+  dmake_nodes_done['n831'] = true
+}
+
+def dmake_node_832() {
+  waitUntil { dmake_nodes_are_done(['n822', 'n831']) }
+  sh("make n832")
+  dmake_nodes_done['n832'] = true
+}
+
+def dmake_node_833() {
+  sh("make n833")
+  dmake_nodes_done['n833'] = true
+}
+
+def dmake_node_834() {
+  waitUntil { dmake_nodes_are_done(['n826', 'n831']) }
+  sh("make n834")
+  dmake_nodes_done['n834'] = true
+}
+
+def dmake_node_835() {
+  sh("make n835")
+  dmake_nodes_done['n835'] = true
+}
+
+def dmake_node_836() {
+  sh("make n836")
+  dmake_nodes_done['n836'] = true
+}
+
+def dmake_node_837() {
+  waitUntil { dmake_nodes_are_done(['n826', 'n834', 'n836']) }
+  sh("make n837")
+  dmake_nodes_done['n837'] = true
+}
+
+def dmake_node_838() {
+  waitUntil { dmake_nodes_are_done(['n833', 'n837']) }
+  sh("make n838")
+  dmake_nodes_done['n838'] = true
+}
+
+def dmake_node_839() {
+  sh("make n839")
+  dmake_nodes_done['n839'] = true
+}
+
+def dmake_node_840() {
+  waitUntil { dmake_nodes_are_done(['n837']) }
+  sh("make n840")
+  dmake_nodes_done['n840'] = true
+}
+
+def dmake_node_841() {
+  waitUntil { dmake_nodes_are_done(['n832', 'n833', 'n837']) }
+  sh("make n841")
+  dmake_nodes_done['n841'] = true
+}
+
+def dmake_node_842() {
+  sh("make n842")
+  dmake_nodes_done['n842'] = true
+}
+
+def dmake_node_843() {
+  waitUntil { dmake_nodes_are_done(['n839']) }
+  sh("make n843")
+  dmake_nodes_done['n843'] = true
+}
+
+def dmake_node_844() {
+  sh("make n844")
+  dmake_nodes_done['n844'] = true
+}
+
+def dmake_node_845() {
+  sh("make n845")
+  dmake_nodes_done['n845'] = true
+}
+
+def dmake_node_846() {
+  waitUntil { dmake_nodes_are_done(['n837', 'n842']) }
+  sh("make n846")
+  dmake_nodes_done['n846'] = true
+}
+
+def dmake_node_847() {
+  waitUntil { dmake_nodes_are_done(['n836', 'n840', 'n846']) }
+  sh("make n847")
+  dmake_nodes_done['n847'] = true
+}
+
+def dmake_node_848() {
+  waitUntil { dmake_nodes_are_done(['n837', 'n840']) }
+  sh("make n848")
+  dmake_nodes_done['n848'] = true
+}
+
+def dmake_node_849() {
+  sh("make n849")
+  dmake_nodes_done['n849'] = true
+}
+
+def dmake_node_850() {
+  waitUntil { dmake_nodes_are_done(['n838', 'n841', 'n844']) }
+  sh("make n850")
+  dmake_nodes_done['n850'] = true
+}
+
+def dmake_node_851() {
+  waitUntil { dmake_nodes_are_done(['n839', 'n841']) }
+  sh("make n851")
+  dmake_nodes_done['n851'] = true
+}
+
+def dmake_node_852() {
+  sh("make n852")
+  dmake_nodes_done['n852'] = true
+}
+
+def dmake_node_853() {
+  sh("make n853")
+  dmake_nodes_done['n853'] = true
+}
+
+def dmake_node_854() {
+  waitUntil { dmake_nodes_are_done(['n844', 'n845', 'n851']) }
+  sh("make n854")
+  dmake_nodes_done['n854'] = true
+}
+
+def dmake_node_855() {
+  sh("make n855")
+  dmake_nodes_done['n855'] = true
+}
+
+def dmake_node_856() {
+  waitUntil { dmake_nodes_are_done(['n850']) }
+  sh("make n856")
+  dmake_nodes_done['n856'] = true
+}
+
+def dmake_node_857() {
+  waitUntil { dmake_nodes_are_done(['n848', 'n853', 'n856']) }
+  sh("make n857")
+  dmake_nodes_done['n857'] = true
+}
+
+def dmake_node_858() {
+  sh("make n858")
+  dmake_nodes_done['n858'] = true
+}
+
+def dmake_node_859() {
+  sh("make n859")
+  dmake_nodes_done['n859'] = true
+}
+
+def dmake_node_860() {
+  waitUntil { dmake_nodes_are_done(['n850', 'n857', 'n859']) }
+  sh("make n860")
+  dmake_nodes_done['n860'] = true
+}
+
+def dmake_node_861() {
+  sh("make n861")
+  dmake_nodes_done['n861'] = true
+}
+
+def dmake_node_862() {
+  waitUntil { dmake_nodes_are_done(['n852', 'n861']) }
+  sh("make n862")
+  dmake_nodes_done['n862'] = true
+}
+
+def dmake_node_863() {
+  sh("make n863")
+  dmake_nodes_done['n863'] = true
+}
+
+def dmake_node_864() {
+  sh("make n864")
+  dmake_nodes_done['n864'] = true
+}
+
+def dmake_node_865() {
+  waitUntil { dmake_nodes_are_done(['n855', 'n856', 'n859']) }
+  sh("make n865")
+  dmake_nodes_done['n865'] = true
+}
+
+def dmake_node_866() {
+  waitUntil { dmake_nodes_are_done(['n854', 'n859', 'n863']) }
+  sh("make n866")
+  dmake_nodes_done['n866'] = true
+}
+
+def dmake_node_867() {
+  waitUntil { dmake_nodes_are_done(['n863']) }
+  sh("make n867")
+  dmake_nodes_done['n867'] = true
+}
+
+def dmake_node_868() {
+  sh("make n868")
+  dmake_nodes_done['n868'] = true
+}
+
+def dmake_node_869() {
+  waitUntil { dmake_nodes_are_done(['n861']) }
+  sh("make n869")
+  dmake_nodes_done['n869'] = true
+}
+
+def dmake_node_870() {
+  waitUntil { dmake_nodes_are_done(['n866']) }
+  sh("make n870")
+  dmake_nodes_done['n870'] = true
+}
+
+def dmake_node_871() {
+  waitUntil { dmake_nodes_are_done(['n859', 'n861']) }
+  sh("make n871")
+  dmake_nodes_done['n871'] = true
+}
+
+def dmake_node_872() {
+  waitUntil { dmake_nodes_are_done(['n860', 'n866']) }
+  sh("make n872")
+  dmake_nodes_done['n872'] = true
+}
+
+def dmake_node_873() {
+  waitUntil { dmake_nodes_are_done(['n866']) }
+  sh("make n873")
+  dmake_nodes_done['n873'] = true
+}
+
+def dmake_node_874() {
+  waitUntil { dmake_nodes_are_done(['n867', 'n869']) }
+  sh("make n874")
+  dmake_nodes_done['n874'] = true
+}
+
+def dmake_node_875() {
+  waitUntil { dmake_nodes_are_done(['n864', 'n874']) }
+  sh("make n875")
+  dmake_nodes_done['n875'] = true
+}
+
+def dmake_node_876() {
+  waitUntil { dmake_nodes_are_done(['n867', 'n875']) }
+  sh("make n876")
+  dmake_nodes_done['n876'] = true
+}
+
+def dmake_node_877() {
+  waitUntil { dmake_nodes_are_done(['n866', 'n869', 'n873']) }
+  sh("make n877")
+  dmake_nodes_done['n877'] = true
+}
+
+def dmake_node_878() {
+  waitUntil { dmake_nodes_are_done(['n866', 'n872']) }
+  sh("make n878")
+  dmake_nodes_done['n878'] = true
+}
+
+def dmake_node_879() {
+  waitUntil { dmake_nodes_are_done(['n868', 'n871', 'n877']) }
+  sh("make n879")
+  dmake_nodes_done['n879'] = true
+}
+
+def dmake_node_880() {
+  waitUntil { dmake_nodes_are_done(['n869', 'n879']) }
+  sh("make n880")
+  dmake_nodes_done['n880'] = true
+}
+
+def dmake_node_881() {
+  waitUntil { dmake_nodes_are_done(['n874', 'n877', 'n879']) }
+  sh("make n881")
+  dmake_nodes_done['n881'] = true
+}
+
+def dmake_node_882() {
+  waitUntil { dmake_nodes_are_done(['n874', 'n881']) }
+  sh("make n882")
+  dmake_nodes_done['n882'] = true
+}
+
+def dmake_node_883() {
+  waitUntil { dmake_nodes_are_done(['n879']) }
+  sh("make n883")
+  dmake_nodes_done['n883'] = true
+}
+
+def dmake_node_884() {
+  waitUntil { dmake_nodes_are_done(['n875', 'n877', 'n878']) }
+  sh("make n884")
+  dmake_nodes_done['n884'] = true
+}
+
+def dmake_node_885() {
+  sh("make n885")
+  dmake_nodes_done['n885'] = true
+}
+
+def dmake_node_886() {
+  waitUntil { dmake_nodes_are_done(['n876', 'n882']) }
+  sh("make n886")
+  dmake_nodes_done['n886'] = true
+}
+
+def dmake_node_887() {
+  waitUntil { dmake_nodes_are_done(['n880', 'n882', 'n884']) }
+  sh("make n887")
+  dmake_nodes_done['n887'] = true
+}
+
+def dmake_node_888() {
+  sh("make n888")
+  dmake_nodes_done['n888'] = true
+}
+
+def dmake_node_889() {
+  waitUntil { dmake_nodes_are_done(['n878', 'n879', 'n886']) }
+  sh("make n889")
+  dmake_nodes_done['n889'] = true
+}
+
+def dmake_node_890() {
+  waitUntil { dmake_nodes_are_done(['n882']) }
+  sh("make n890")
+  dmake_nodes_done['n890'] = true
+}
+
+def dmake_node_891() {
+  waitUntil { dmake_nodes_are_done(['n879', 'n887']) }
+  sh("make n891")
+  dmake_nodes_done['n891'] = true
+}
+
+def dmake_node_892() {
+  waitUntil { dmake_nodes_are_done(['n883', 'n885', 'n888']) }
+  sh("make n892")
+  dmake_nodes_done['n892'] = true
+}
+
+def dmake_node_893() {
+  sh("make n893")
+  dmake_nodes_done['n893'] = true
+}
+
+def dmake_node_894() {
+  waitUntil { dmake_nodes_are_done(['n886']) }
+  sh("make n894")
+  dmake_nodes_done['n894'] = true
+}
+
+def dmake_node_895() {
+  waitUntil { dmake_nodes_are_done(['n885', 'n892', 'n893']) }
+  sh("make n895")
+  dmake_nodes_done['n895'] = true
+}
+
+def dmake_node_896() {
+  waitUntil { dmake_nodes_are_done(['n894']) }
+  sh("make n896")
+  dmake_nodes_done['n896'] = true
+}
+
+def dmake_node_897() {
+  sh("make n897")
+  dmake_nodes_done['n897'] = true
+}
+
+def dmake_node_898() {
+  waitUntil { dmake_nodes_are_done(['n887']) }
+  sh("make n898")
+  dmake_nodes_done['n898'] = true
+}
+
+def dmake_node_899() {
+  sh("make n899")
+  dmake_nodes_done['n899'] = true
+}
+
+def dmake_node_900() {
+  waitUntil { dmake_nodes_are_done(['n892', 'n893', 'n897']) }
+  sh("make n900")
+  dmake_nodes_done['n900'] = true
+}
+
+def dmake_node_901() {
+  waitUntil { dmake_nodes_are_done(['n893', 'n894', 'n897']) }
+  sh("make n901")
+  dmake_nodes_done['n901'] = true
+}
+
+def dmake_node_902() {
+  waitUntil { dmake_nodes_are_done(['n891', 'n894']) }
+  sh("make n902")
+  dmake_nodes_done['n902'] = true
+}
+
+def dmake_node_903() {
+  waitUntil { dmake_nodes_are_done(['n891']) }
+  sh("make n903")
+  dmake_nodes_done['n903'] = true
+}
+
+def dmake_node_904() {
+  waitUntil { dmake_nodes_are_done(['n896', 'n897']) }
+  sh("make n904")
+  dmake_nodes_done['n904'] = true
+}
+
+def dmake_node_905() {
+  waitUntil { dmake_nodes_are_done(['n896', 'n903']) }
+  sh("make n905")
+  dmake_nodes_done['n905'] = true
+}
+
+def dmake_node_906() {
+  waitUntil { dmake_nodes_are_done(['n900', 'n905']) }
+  sh("make n906")
+  dmake_nodes_done['n906'] = true
+}
+
+def dmake_node_907() {
+  waitUntil { dmake_nodes_are_done(['n901', 'n904']) }
+  sh("make n907")
+  dmake_nodes_done['n907'] = true
+}
+
+def dmake_node_908() {
+  sh("make n908")
+  dmake_nodes_done['n908'] = true
+}
+
+def dmake_node_909() {
+  sh("make n909")
+  dmake_nodes_done['n909'] = true
+}
+
+def dmake_node_910() {
+  waitUntil { dmake_nodes_are_done(['n901', 'n908']) }
+  sh("make n910")
+  dmake_nodes_done['n910'] = true
+}
+
+def dmake_node_911() {
+  sh("make n911")
+  dmake_nodes_done['n911'] = true
+}
+
+def dmake_node_912() {
+  waitUntil { dmake_nodes_are_done(['n910', 'n911']) }
+  sh("make n912")
+  dmake_nodes_done['n912'] = true
+}
+
+def dmake_node_913() {
+  sh("make n913")
+  dmake_nodes_done['n913'] = true
+}
+
+def dmake_node_914() {
+  waitUntil { dmake_nodes_are_done(['n904', 'n905', 'n909']) }
+  sh("make n914")
+  dmake_nodes_done['n914'] = true
+}
+
+def dmake_node_915() {
+  waitUntil { dmake_nodes_are_done(['n912']) }
+  sh("make n915")
+  dmake_nodes_done['n915'] = true
+}
+
+def dmake_node_916() {
+  sh("make n916")
+  dmake_nodes_done['n916'] = true
+}
+
+def dmake_node_917() {
+  waitUntil { dmake_nodes_are_done(['n908']) }
+  sh("make n917")
+  dmake_nodes_done['n917'] = true
+}
+
+def dmake_node_918() {
+  waitUntil { dmake_nodes_are_done(['n916', 'n917']) }
+  sh("make n918")
+  dmake_nodes_done['n918'] = true
+}
+
+def dmake_node_919() {
+  waitUntil { dmake_nodes_are_done(['n907', 'n915', 'n916']) }
+  sh("make n919")
+  dmake_nodes_done['n919'] = true
+}
+
+def dmake_node_920() {
+  waitUntil { dmake_nodes_are_done(['n909']) }
+  sh("make n920")
+  dmake_nodes_done['n920'] = true
+}
+
+def dmake_node_921() {
+  sh("make n921")
+  dmake_nodes_done['n921'] = true
+}
+
+def dmake_node_922() {
+  waitUntil { dmake_nodes_are_done(['n917', 'n920', 'n921']) }
+  sh("make n922")
+  dmake_nodes_done['n922'] = true
+}
+
+def dmake_node_923() {
+  waitUntil { dmake_nodes_are_done(['n919', 'n922']) }
+  sh("make n923")
+  dmake_nodes_done['n923'] = true
+}
+
+def dmake_node_924() {
+  waitUntil { dmake_nodes_are_done(['n918', 'n922']) }
+  sh("make n924")
+  dmake_nodes_done['n924'] = true
+}
+
+def dmake_node_925() {
+  waitUntil { dmake_nodes_are_done(['n916', 'n922', 'n924']) }
+  sh("make n925")
+  dmake_nodes_done['n925'] = true
+}
+
+def dmake_node_926() {
+  waitUntil { dmake_nodes_are_done(['n915', 'n925']) }
+  sh("make n926")
+  dmake_nodes_done['n926'] = true
+}
+
+def dmake_node_927() {
+  waitUntil { dmake_nodes_are_done(['n923', 'n926']) }
+  sh("make n927")
+  dmake_nodes_done['n927'] = true
+}
+
+def dmake_node_928() {
+  waitUntil { dmake_nodes_are_done(['n917', 'n921']) }
+  sh("make n928")
+  dmake_nodes_done['n928'] = true
+}
+
+def dmake_node_929() {
+  sh("make n929")
+  dmake_nodes_done['n929'] = true
+}
+
+def dmake_node_930() {
+  waitUntil { dmake_nodes_are_done(['n919', 'n927']) }
+  sh("make n930")
+  dmake_nodes_done['n930'] = true
+}
+
+def dmake_node_931() {
+  sh("make n931")
+  dmake_nodes_done['n931'] = true
+}
+
+def dmake_node_932() {
+  waitUntil { dmake_nodes_are_done(['n927', 'n931']) }
+  sh("make n932")
+  dmake_nodes_done['n932'] = true
+}
+
+def dmake_node_933() {
+  sh("make n933")
+  dmake_nodes_done['n933'] = true
+}
+
+def dmake_node_934() {
+  waitUntil { dmake_nodes_are_done(['n925', 'n926']) }
+  sh("make n934")
+  dmake_nodes_done['n934'] = true
+}
+
+def dmake_node_935() {
+  waitUntil { dmake_nodes_are_done(['n927', 'n928', 'n930']) }
+  sh("make n935")
+  dmake_nodes_done['n935'] = true
+}
+
+def dmake_node_936() {
+  waitUntil { dmake_nodes_are_done(['n925', 'n929']) }
+  sh("make n936")
+  dmake_nodes_done['n936'] = true
+}
+
+def dmake_node_937() {
+  waitUntil { dmake_nodes_are_done(['n929', 'n930', 'n936']) }
+  sh("make n937")
+  dmake_nodes_done['n937'] = true
+}
+
+def dmake_node_938() {
+  waitUntil { dmake_nodes_are_done(['n937']) }
+  sh("make n938")
+  dmake_nodes_done['n938'] = true
+}
+
+def dmake_node_939() {
+  waitUntil { dmake_nodes_are_done(['n928', 'n931', 'n934']) }
+  sh("make n939")
+  dmake_nodes_done['n939'] = true
+}
+
+def dmake_node_940() {
+  waitUntil { dmake_nodes_are_done(['n936']) }
+  sh("make n940")
+  dmake_nodes_done['n940'] = true
+}
+
+def dmake_node_941() {
+  waitUntil { dmake_nodes_are_done(['n929', 'n934']) }
+  sh("make n941")
+  dmake_nodes_done['n941'] = true
+}
+
+def dmake_node_942() {
+  waitUntil { dmake_nodes_are_done(['n930', 'n937']) }
+  sh("make n942")
+  dmake_nodes_done['n942'] = true
+}
+
+def dmake_node_943() {
+  waitUntil { dmake_nodes_are_done(['n940', 'n941']) }
+  sh("make n943")
+  dmake_nodes_done['n943'] = true
+}
+
+def dmake_node_944() {
+  waitUntil { dmake_nodes_are_done(['n932', 'n939']) }
+  sh("make n944")
+  dmake_nodes_done['n944'] = true
+}
+
+def dmake_node_945() {
+  waitUntil { dmake_nodes_are_done(['n937', 'n944']) }
+  sh("make n945")
+  dmake_nodes_done['n945'] = true
+}
+
+def dmake_node_946() {
+  waitUntil { dmake_nodes_are_done(['n939']) }
+  sh("make n946")
+  dmake_nodes_done['n946'] = true
+}
+
+def dmake_node_947() {
+  sh("make n947")
+  dmake_nodes_done['n947'] = true
+}
+
+def dmake_node_948() {
+  sh("make n948")
+  dmake_nodes_done['n948'] = true
+}
+
+def dmake_node_949() {
+  waitUntil { dmake_nodes_are_done(['n939', 'n940', 'n941']) }
+  sh("make n949")
+  dmake_nodes_done['n949'] = true
+}
+
+def dmake_node_950() {
+  waitUntil { dmake_nodes_are_done(['n938', 'n942', 'n946']) }
+  sh("make n950")
+  dmake_nodes_done['n950'] = true
+}
+
+def dmake_node_951() {
+  waitUntil { dmake_nodes_are_done(['n945', 'n947']) }
+  sh("make n951")
+  dmake_nodes_done['n951'] = true
+}
+
+def dmake_node_952() {
+  waitUntil { dmake_nodes_are_done(['n941', 'n945']) }
+  sh("make n952")
+  dmake_nodes_done['n952'] = true
+}
+
+def dmake_node_953() {
+  waitUntil { dmake_nodes_are_done(['n941', 'n944']) }
+  sh("make n953")
+  dmake_nodes_done['n953'] = true
+}
+
+def dmake_node_954() {
+  sh("make n954")
+  dmake_nodes_done['n954'] = true
+}
+
+def dmake_node_955() {
+  sh("make n955")
+  dmake_nodes_done['n955'] = true
+}
+
+def dmake_node_956() {
+  sh("make n956")
+  dmake_nodes_done['n956'] = true
+}
+
+def dmake_node_957() {
+  waitUntil { dmake_nodes_are_done(['n947', 'n948']) }
+  sh("make n957")
+  dmake_nodes_done['n957'] = true
+}
+
+def dmake_node_958() {
+  waitUntil { dmake_nodes_are_done(['n948', 'n950', 'n953']) }
+  sh("make n958")
+  dmake_nodes_done['n958'] = true
+}
+
+def dmake_node_959() {
+  waitUntil { dmake_nodes_are_done(['n952', 'n958']) }
+  sh("make n959")
+  dmake_nodes_done['n959'] = true
+}
+
+def dmake_node_960() {
+  sh("make n960")
+  dmake_nodes_done['n960'] = true
+}
+
+def dmake_node_961() {
+  sh("make n961")
+  dmake_nodes_done['n961'] = true
+}
+
+def dmake_node_962() {
+  waitUntil { dmake_nodes_are_done(['n952', 'n959']) }
+  sh("make n962")
+  dmake_nodes_done['n962'] = true
+}
+
+def dmake_node_963() {
+  waitUntil { dmake_nodes_are_done(['n960']) }
+  sh("make n963")
+  dmake_nodes_done['n963'] = true
+}
+
+def dmake_node_964() {
+  waitUntil { dmake_nodes_are_done(['n958']) }
+  sh("make n964")
+  dmake_nodes_done['n964'] = true
+}
+
+def dmake_node_965() {
+  waitUntil { dmake_nodes_are_done(['n953', 'n962']) }
+  sh("make n965")
+  dmake_nodes_done['n965'] = true
+}
+
+def dmake_node_966() {
+  waitUntil { dmake_nodes_are_done(['n959', 'n965']) }
+  sh("make n966")
+  dmake_nodes_done['n966'] = true
+}
+
+def dmake_node_967() {
+  waitUntil { dmake_nodes_are_done(['n956', 'n960']) }
+  sh("make n967")
+  dmake_nodes_done['n967'] = true
+}
+
+def dmake_node_968() {
+  waitUntil { dmake_nodes_are_done(['n958', 'n959']) }
+  sh("make n968")
+  dmake_nodes_done['n968'] = true
+}
+
+def dmake_node_969() {
+  waitUntil { dmake_nodes_are_done(['n965']) }
+  sh("make n969")
+  dmake_nodes_done['n969'] = true
+}
+
+def dmake_node_970() {
+  sh("make n970")
+  dmake_nodes_done['n970'] = true
+}
+
+def dmake_node_971() {
+  waitUntil { dmake_nodes_are_done(['n961', 'n963', 'n966']) }
+  sh("make n971")
+  dmake_nodes_done['n971'] = true
+}
+
+def dmake_node_972() {
+  waitUntil { dmake_nodes_are_done(['n962', 'n964']) }
+  sh("make n972")
+  dmake_nodes_done['n972'] = true
+}
+
+def dmake_node_973() {
+  waitUntil { dmake_nodes_are_done(['n962', 'n966', 'n971']) }
+  sh("make n973")
+  dmake_nodes_done['n973'] = true
+}
+
+def dmake_node_974() {
+  waitUntil { dmake_nodes_are_done(['n968']) }
+  sh("make n974")
+  dmake_nodes_done['n974'] = true
+}
+
+def dmake_node_975() {
+  waitUntil { dmake_nodes_are_done(['n969', 'n972', 'n974']) }
+  sh("make n975")
+  dmake_nodes_done['n975'] = true
+}
+
+def dmake_node_976() {
+  waitUntil { dmake_nodes_are_done(['n964', 'n966']) }
+  sh("make n976")
+  dmake_nodes_done['n976'] = true
+}
+
+def dmake_node_977() {
+  sh("make n977")
+  dmake_nodes_done['n977'] = true
+}
+
+def dmake_node_978() {
+  waitUntil { dmake_nodes_are_done(['n969', 'n975']) }
+  sh("make n978")
+  dmake_nodes_done['n978'] = true
+}
+
+def dmake_node_979() {
+  waitUntil { dmake_nodes_are_done(['n973']) }
+  sh("make n979")
+  dmake_nodes_done['n979'] = true
+}
+
+def dmake_node_980() {
+  waitUntil { dmake_nodes_are_done(['n974', 'n977', 'n978']) }
+  sh("make n980")
+  dmake_nodes_done['n980'] = true
+}
+
+def dmake_node_981() {
+  waitUntil { dmake_nodes_are_done(['n971']) }
+  sh("make n981")
+  dmake_nodes_done['n981'] = true
+}
+
+def dmake_node_982() {
+  waitUntil { dmake_nodes_are_done(['n972', 'n976', 'n979']) }
+  sh("make n982")
+  dmake_nodes_done['n982'] = true
+}
+
+def dmake_node_983() {
+  sh("make n983")
+  dmake_nodes_done['n983'] = true
+}
+
+def dmake_node_984() {
+  waitUntil { dmake_nodes_are_done(['n977', 'n979']) }
+  sh("make n984")
+  dmake_nodes_done['n984'] = true
+}
+
+def dmake_node_985() {
+  sh("make n985")
+  dmake_nodes_done['n985'] = true
+}
+
+def dmake_node_986() {
+  waitUntil { dmake_nodes_are_done(['n979']) }
+  sh("make n986")
+  dmake_nodes_done['n986'] = true
+}
+
+def dmake_node_987() {
+  waitUntil { dmake_nodes_are_done(['n975', 'n978', 'n986']) }
+  sh("make n987")
+  dmake_nodes_done['n987'] = true
+}
+
+def dmake_node_988() {
+  waitUntil { dmake_nodes_are_done(['n978', 'n980', 'n985']) }
+  sh("make n988")
+  dmake_nodes_done['n988'] = true
+}
+
+def dmake_node_989() {
+  waitUntil { dmake_nodes_are_done(['n983']) }
+  sh("make n989")
+  dmake_nodes_done['n989'] = true
+}
+
+def dmake_node_990() {
+  waitUntil { dmake_nodes_are_done(['n983', 'n985', 'n988']) }
+  sh("make n990")
+  dmake_nodes_done['n990'] = true
+}
+
+def dmake_node_991() {
+  sh("make n991")
+  dmake_nodes_done['n991'] = true
+}
+
+def dmake_node_992() {
+  waitUntil { dmake_nodes_are_done(['n982', 'n984', 'n985']) }
+  sh("make n992")
+  dmake_nodes_done['n992'] = true
+}
+
+def dmake_node_993() {
+  waitUntil { dmake_nodes_are_done(['n984', 'n990', 'n992']) }
+  sh("make n993")
+  dmake_nodes_done['n993'] = true
+}
+
+def dmake_node_994() {
+  waitUntil { dmake_nodes_are_done(['n993']) }
+  sh("make n994")
+  dmake_nodes_done['n994'] = true
+}
+
+def dmake_node_995() {
+  waitUntil { dmake_nodes_are_done(['n983', 'n986', 'n989']) }
+  sh("make n995")
+  dmake_nodes_done['n995'] = true
+}
+
+def dmake_node_996() {
+  waitUntil { dmake_nodes_are_done(['n985', 'n988', 'n994']) }
+  sh("make n996")
+  dmake_nodes_done['n996'] = true
+}
+
+def dmake_node_997() {
+  waitUntil { dmake_nodes_are_done(['n987', 'n996']) }
+  sh("make n997")
+  dmake_nodes_done['n997'] = true
+}
+
+def dmake_node_998() {
+  waitUntil { dmake_nodes_are_done(['n986']) }
+  sh("make n998")
+  dmake_nodes_done['n998'] = true
+}
+
+def dmake_node_999() {
+  waitUntil { dmake_nodes_are_done(['n991', 'n996']) }
+  sh("make n999")
+  dmake_nodes_done['n999'] = true
+}
+
+def dmake_chunk_0(branches) {
+  branches['n0'] = { dmake_node_0() }
+  branches['n1'] = { dmake_node_1() }
+  branches['n2'] = { dmake_node_2() }
+  branches['n3'] = { dmake_node_3() }
+  branches['n4'] = { dmake_node_4() }
+  branches['n5'] = { dmake_node_5() }
+  branches['n6'] = { dmake_node_6() }
+  branches['n7'] = { dmake_node_7() }
+  branches['n8'] = { dmake_node_8() }
+  branches['n9'] = { dmake_node_9() }
+  branches['n10'] = { dmake_node_10() }
+  branches['n11'] = { dmake_node_11() }
+  branches['n12'] = { dmake_node_12() }
+  branches['n13'] = { dmake_node_13() }
+  branches['n14'] = { dmake_node_14() }
+  branches['n15'] = { dmake_node_15() }
+  branches['n16'] = { dmake_node_16() }
+  branches['n17'] = { dmake_node_17() }
+  branches['n18'] = { dmake_node_18() }
+  branches['n19'] = { dmake_node_19() }
+  branches['n20'] = { dmake_node_20() }
+  branches['n21'] = { dmake_node_21() }
+  branches['n22'] = { dmake_node_22() }
+  branches['n23'] = { dmake_node_23() }
+  branches['n24'] = { dmake_node_24() }
+  branches['n25'] = { dmake_node_25() }
+  branches['n26'] = { dmake_node_26() }
+  branches['n27'] = { dmake_node_27() }
+  branches['n28'] = { dmake_node_28() }
+  branches['n29'] = { dmake_node_29() }
+  branches['n30'] = { dmake_node_30() }
+  branches['n31'] = { dmake_node_31() }
+  branches['n32'] = { dmake_node_32() }
+  branches['n33'] = { dmake_node_33() }
+  branches['n34'] = { dmake_node_34() }
+  branches['n35'] = { dmake_node_35() }
+  branches['n36'] = { dmake_node_36() }
+  branches['n37'] = { dmake_node_37() }
+  branches['n38'] = { dmake_node_38() }
+  branches['n39'] = { dmake_node_39() }
+  branches['n40'] = { dmake_node_40() }
+  branches['n41'] = { dmake_node_41() }
+  branches['n42'] = { dmake_node_42() }
+  branches['n43'] = { dmake_node_43() }
+  branches['n44'] = { dmake_node_44() }
+  branches['n45'] = { dmake_node_45() }
+  branches['n46'] = { dmake_node_46() }
+  branches['n47'] = { dmake_node_47() }
+  branches['n48'] = { dmake_node_48() }
+  branches['n49'] = { dmake_node_49() }
+}
+
+def dmake_chunk_1(branches) {
+  branches['n50'] = { dmake_node_50() }
+  branches['n51'] = { dmake_node_51() }
+  branches['n52'] = { dmake_node_52() }
+  branches['n53'] = { dmake_node_53() }
+  branches['n54'] = { dmake_node_54() }
+  branches['n55'] = { dmake_node_55() }
+  branches['n56'] = { dmake_node_56() }
+  branches['n57'] = { dmake_node_57() }
+  branches['n58'] = { dmake_node_58() }
+  branches['n59'] = { dmake_node_59() }
+  branches['n60'] = { dmake_node_60() }
+  branches['n61'] = { dmake_node_61() }
+  branches['n62'] = { dmake_node_62() }
+  branches['n63'] = { dmake_node_63() }
+  branches['n64'] = { dmake_node_64() }
+  branches['n65'] = { dmake_node_65() }
+  branches['n66'] = { dmake_node_66() }
+  branches['n67'] = { dmake_node_67() }
+  branches['n68'] = { dmake_node_68() }
+  branches['n69'] = { dmake_node_69() }
+  branches['n70'] = { dmake_node_70() }
+  branches['n71'] = { dmake_node_71() }
+  branches['n72'] = { dmake_node_72() }
+  branches['n73'] = { dmake_node_73() }
+  branches['n74'] = { dmake_node_74() }
+  branches['n75'] = { dmake_node_75() }
+  branches['n76'] = { dmake_node_76() }
+  branches['n77'] = { dmake_node_77() }
+  branches['n78'] = { dmake_node_78() }
+  branches['n79'] = { dmake_node_79() }
+  branches['n80'] = { dmake_node_80() }
+  branches['n81'] = { dmake_node_81() }
+  branches['n82'] = { dmake_node_82() }
+  branches['n83'] = { dmake_node_83() }
+  branches['n84'] = { dmake_node_84() }
+  branches['n85'] = { dmake_node_85() }
+  branches['n86'] = { dmake_node_86() }
+  branches['n87'] = { dmake_node_87() }
+  branches['n88'] = { dmake_node_88() }
+  branches['n89'] = { dmake_node_89() }
+  branches['n90'] = { dmake_node_90() }
+  branches['n91'] = { dmake_node_91() }
+  branches['n92'] = { dmake_node_92() }
+  branches['n93'] = { dmake_node_93() }
+  branches['n94'] = { dmake_node_94() }
+  branches['n95'] = { dmake_node_95() }
+  branches['n96'] = { dmake_node_96() }
+  branches['n97'] = { dmake_node_97() }
+  branches['n98'] = { dmake_node_98() }
+  branches['n99'] = { dmake_node_99() }
+}
+
+def dmake_chunk_2(branches) {
+  branches['n100'] = { dmake_node_100() }
+  branches['n101'] = { dmake_node_101() }
+  branches['n102'] = { dmake_node_102() }
+  branches['n103'] = { dmake_node_103() }
+  branches['n104'] = { dmake_node_104() }
+  branches['n105'] = { dmake_node_105() }
+  branches['n106'] = { dmake_node_106() }
+  branches['n107'] = { dmake_node_107() }
+  branches['n108'] = { dmake_node_108() }
+  branches['n109'] = { dmake_node_109() }
+  branches['n110'] = { dmake_node_110() }
+  branches['n111'] = { dmake_node_111() }
+  branches['n112'] = { dmake_node_112() }
+  branches['n113'] = { dmake_node_113() }
+  branches['n114'] = { dmake_node_114() }
+  branches['n115'] = { dmake_node_115() }
+  branches['n116'] = { dmake_node_116() }
+  branches['n117'] = { dmake_node_117() }
+  branches['n118'] = { dmake_node_118() }
+  branches['n119'] = { dmake_node_119() }
+  branches['n120'] = { dmake_node_120() }
+  branches['n121'] = { dmake_node_121() }
+  branches['n122'] = { dmake_node_122() }
+  branches['n123'] = { dmake_node_123() }
+  branches['n124'] = { dmake_node_124() }
+  branches['n125'] = { dmake_node_125() }
+  branches['n126'] = { dmake_node_126() }
+  branches['n127'] = { dmake_node_127() }
+  branches['n128'] = { dmake_node_128() }
+  branches['n129'] = { dmake_node_129() }
+  branches['n130'] = { dmake_node_130() }
+  branches['n131'] = { dmake_node_131() }
+  branches['n132'] = { dmake_node_132() }
+  branches['n133'] = { dmake_node_133() }
+  branches['n134'] = { dmake_node_134() }
+  branches['n135'] = { dmake_node_135() }
+  branches['n136'] = { dmake_node_136() }
+  branches['n137'] = { dmake_node_137() }
+  branches['n138'] = { dmake_node_138() }
+  branches['n139'] = { dmake_node_139() }
+  branches['n140'] = { dmake_node_140() }
+  branches['n141'] = { dmake_node_141() }
+  branches['n142'] = { dmake_node_142() }
+  branches['n143'] = { dmake_node_143() }
+  branches['n144'] = { dmake_node_144() }
+  branches['n145'] = { dmake_node_145() }
+  branches['n146'] = { dmake_node_146() }
+  branches['n147'] = { dmake_node_147() }
+  branches['n148'] = { dmake_node_148() }
+  branches['n149'] = { dmake_node_149() }
+}
+
+def dmake_chunk_3(branches) {
+  branches['n150'] = { dmake_node_150() }
+  branches['n151'] = { dmake_node_151() }
+  branches['n152'] = { dmake_node_152() }
+  branches['n153'] = { dmake_node_153() }
+  branches['n154'] = { dmake_node_154() }
+  branches['n155'] = { dmake_node_155() }
+  branches['n156'] = { dmake_node_156() }
+  branches['n157'] = { dmake_node_157() }
+  branches['n158'] = { dmake_node_158() }
+  branches['n159'] = { dmake_node_159() }
+  branches['n160'] = { dmake_node_160() }
+  branches['n161'] = { dmake_node_161() }
+  branches['n162'] = { dmake_node_162() }
+  branches['n163'] = { dmake_node_163() }
+  branches['n164'] = { dmake_node_164() }
+  branches['n165'] = { dmake_node_165() }
+  branches['n166'] = { dmake_node_166() }
+  branches['n167'] = { dmake_node_167() }
+  branches['n168'] = { dmake_node_168() }
+  branches['n169'] = { dmake_node_169() }
+  branches['n170'] = { dmake_node_170() }
+  branches['n171'] = { dmake_node_171() }
+  branches['n172'] = { dmake_node_172() }
+  branches['n173'] = { dmake_node_173() }
+  branches['n174'] = { dmake_node_174() }
+  branches['n175'] = { dmake_node_175() }
+  branches['n176'] = { dmake_node_176() }
+  branches['n177'] = { dmake_node_177() }
+  branches['n178'] = { dmake_node_178() }
+  branches['n179'] = { dmake_node_179() }
+  branches['n180'] = { dmake_node_180() }
+  branches['n181'] = { dmake_node_181() }
+  branches['n182'] = { dmake_node_182() }
+  branches['n183'] = { dmake_node_183() }
+  branches['n184'] = { dmake_node_184() }
+  branches['n185'] = { dmake_node_185() }
+  branches['n186'] = { dmake_node_186() }
+  branches['n187'] = { dmake_node_187() }
+  branches['n188'] = { dmake_node_188() }
+  branches['n189'] = { dmake_node_189() }
+  branches['n190'] = { dmake_node_190() }
+  branches['n191'] = { dmake_node_191() }
+  branches['n192'] = { dmake_node_192() }
+  branches['n193'] = { dmake_node_193() }
+  branches['n194'] = { dmake_node_194() }
+  branches['n195'] = { dmake_node_195() }
+  branches['n196'] = { dmake_node_196() }
+  branches['n197'] = { dmake_node_197() }
+  branches['n198'] = { dmake_node_198() }
+  branches['n199'] = { dmake_node_199() }
+}
+
+def dmake_chunk_4(branches) {
+  branches['n200'] = { dmake_node_200() }
+  branches['n201'] = { dmake_node_201() }
+  branches['n202'] = { dmake_node_202() }
+  branches['n203'] = { dmake_node_203() }
+  branches['n204'] = { dmake_node_204() }
+  branches['n205'] = { dmake_node_205() }
+  branches['n206'] = { dmake_node_206() }
+  branches['n207'] = { dmake_node_207() }
+  branches['n208'] = { dmake_node_208() }
+  branches['n209'] = { dmake_node_209() }
+  branches['n210'] = { dmake_node_210() }
+  branches['n211'] = { dmake_node_211() }
+  branches['n212'] = { dmake_node_212() }
+  branches['n213'] = { dmake_node_213() }
+  branches['n214'] = { dmake_node_214() }
+  branches['n215'] = { dmake_node_215() }
+  branches['n216'] = { dmake_node_216() }
+  branches['n217'] = { dmake_node_217() }
+  branches['n218'] = { dmake_node_218() }
+  branches['n219'] = { dmake_node_219() }
+  branches['n220'] = { dmake_node_220() }
+  branches['n221'] = { dmake_node_221() }
+  branches['n222'] = { dmake_node_222() }
+  branches['n223'] = { dmake_node_223() }
+  branches['n224'] = { dmake_node_224() }
+  branches['n225'] = { dmake_node_225() }
+  branches['n226'] = { dmake_node_226() }
+  branches['n227'] = { dmake_node_227() }
+  branches['n228'] = { dmake_node_228() }
+  branches['n229'] = { dmake_node_229() }
+  branches['n230'] = { dmake_node_230() }
+  branches['n231'] = { dmake_node_231() }
+  branches['n232'] = { dmake_node_232() }
+  branches['n233'] = { dmake_node_233() }
+  branches['n234'] = { dmake_node_234() }
+  branches['n235'] = { dmake_node_235() }
+  branches['n236'] = { dmake_node_236() }
+  branches['n237'] = { dmake_node_237() }
+  branches['n238'] = { dmake_node_238() }
+  branches['n239'] = { dmake_node_239() }
+  branches['n240'] = { dmake_node_240() }
+  branches['n241'] = { dmake_node_241() }
+  branches['n242'] = { dmake_node_242() }
+  branches['n243'] = { dmake_node_243() }
+  branches['n244'] = { dmake_node_244() }
+  branches['n245'] = { dmake_node_245() }
+  branches['n246'] = { dmake_node_246() }
+  branches['n247'] = { dmake_node_247() }
+  branches['n248'] = { dmake_node_248() }
+  branches['n249'] = { dmake_node_249() }
+}
+
+def dmake_chunk_5(branches) {
+  branches['n250'] = { dmake_node_250() }
+  branches['n251'] = { dmake_node_251() }
+  branches['n252'] = { dmake_node_252() }
+  branches['n253'] = { dmake_node_253() }
+  branches['n254'] = { dmake_node_254() }
+  branches['n255'] = { dmake_node_255() }
+  branches['n256'] = { dmake_node_256() }
+  branches['n257'] = { dmake_node_257() }
+  branches['n258'] = { dmake_node_258() }
+  branches['n259'] = { dmake_node_259() }
+  branches['n260'] = { dmake_node_260() }
+  branches['n261'] = { dmake_node_261() }
+  branches['n262'] = { dmake_node_262() }
+  branches['n263'] = { dmake_node_263() }
+  branches['n264'] = { dmake_node_264() }
+  branches['n265'] = { dmake_node_265() }
+  branches['n266'] = { dmake_node_266() }
+  branches['n267'] = { dmake_node_267() }
+  branches['n268'] = { dmake_node_268() }
+  branches['n269'] = { dmake_node_269() }
+  branches['n270'] = { dmake_node_270() }
+  branches['n271'] = { dmake_node_271() }
+  branches['n272'] = { dmake_node_272() }
+  branches['n273'] = { dmake_node_273() }
+  branches['n274'] = { dmake_node_274() }
+  branches['n275'] = { dmake_node_275() }
+  branches['n276'] = { dmake_node_276() }
+  branches['n277'] = { dmake_node_277() }
+  branches['n278'] = { dmake_node_278() }
+  branches['n279'] = { dmake_node_279() }
+  branches['n280'] = { dmake_node_280() }
+  branches['n281'] = { dmake_node_281() }
+  branches['n282'] = { dmake_node_282() }
+  branches['n283'] = { dmake_node_283() }
+  branches['n284'] = { dmake_node_284() }
+  branches['n285'] = { dmake_node_285() }
+  branches['n286'] = { dmake_node_286() }
+  branches['n287'] = { dmake_node_287() }
+  branches['n288'] = { dmake_node_288() }
+  branches['n289'] = { dmake_node_289() }
+  branches['n290'] = { dmake_node_290() }
+  branches['n291'] = { dmake_node_291() }
+  branches['n292'] = { dmake_node_292() }
+  branches['n293'] = { dmake_node_293() }
+  branches['n294'] = { dmake_node_294() }
+  branches['n295'] = { dmake_node_295() }
+  branches['n296'] = { dmake_node_296() }
+  branches['n297'] = { dmake_node_297() }
+  branches['n298'] = { dmake_node_298() }
+  branches['n299'] = { dmake_node_299() }
+}
+
+def dmake_chunk_6(branches) {
+  branches['n300'] = { dmake_node_300() }
+  branches['n301'] = { dmake_node_301() }
+  branches['n302'] = { dmake_node_302() }
+  branches['n303'] = { dmake_node_303() }
+  branches['n304'] = { dmake_node_304() }
+  branches['n305'] = { dmake_node_305() }
+  branches['n306'] = { dmake_node_306() }
+  branches['n307'] = { dmake_node_307() }
+  branches['n308'] = { dmake_node_308() }
+  branches['n309'] = { dmake_node_309() }
+  branches['n310'] = { dmake_node_310() }
+  branches['n311'] = { dmake_node_311() }
+  branches['n312'] = { dmake_node_312() }
+  branches['n313'] = { dmake_node_313() }
+  branches['n314'] = { dmake_node_314() }
+  branches['n315'] = { dmake_node_315() }
+  branches['n316'] = { dmake_node_316() }
+  branches['n317'] = { dmake_node_317() }
+  branches['n318'] = { dmake_node_318() }
+  branches['n319'] = { dmake_node_319() }
+  branches['n320'] = { dmake_node_320() }
+  branches['n321'] = { dmake_node_321() }
+  branches['n322'] = { dmake_node_322() }
+  branches['n323'] = { dmake_node_323() }
+  branches['n324'] = { dmake_node_324() }
+  branches['n325'] = { dmake_node_325() }
+  branches['n326'] = { dmake_node_326() }
+  branches['n327'] = { dmake_node_327() }
+  branches['n328'] = { dmake_node_328() }
+  branches['n329'] = { dmake_node_329() }
+  branches['n330'] = { dmake_node_330() }
+  branches['n331'] = { dmake_node_331() }
+  branches['n332'] = { dmake_node_332() }
+  branches['n333'] = { dmake_node_333() }
+  branches['n334'] = { dmake_node_334() }
+  branches['n335'] = { dmake_node_335() }
+  branches['n336'] = { dmake_node_336() }
+  branches['n337'] = { dmake_node_337() }
+  branches['n338'] = { dmake_node_338() }
+  branches['n339'] = { dmake_node_339() }
+  branches['n340'] = { dmake_node_340() }
+  branches['n341'] = { dmake_node_341() }
+  branches['n342'] = { dmake_node_342() }
+  branches['n343'] = { dmake_node_343() }
+  branches['n344'] = { dmake_node_344() }
+  branches['n345'] = { dmake_node_345() }
+  branches['n346'] = { dmake_node_346() }
+  branches['n347'] = { dmake_node_347() }
+  branches['n348'] = { dmake_node_348() }
+  branches['n349'] = { dmake_node_349() }
+}
+
+def dmake_chunk_7(branches) {
+  branches['n350'] = { dmake_node_350() }
+  branches['n351'] = { dmake_node_351() }
+  branches['n352'] = { dmake_node_352() }
+  branches['n353'] = { dmake_node_353() }
+  branches['n354'] = { dmake_node_354() }
+  branches['n355'] = { dmake_node_355() }
+  branches['n356'] = { dmake_node_356() }
+  branches['n357'] = { dmake_node_357() }
+  branches['n358'] = { dmake_node_358() }
+  branches['n359'] = { dmake_node_359() }
+  branches['n360'] = { dmake_node_360() }
+  branches['n361'] = { dmake_node_361() }
+  branches['n362'] = { dmake_node_362() }
+  branches['n363'] = { dmake_node_363() }
+  branches['n364'] = { dmake_node_364() }
+  branches['n365'] = { dmake_node_365() }
+  branches['n366'] = { dmake_node_366() }
+  branches['n367'] = { dmake_node_367() }
+  branches['n368'] = { dmake_node_368() }
+  branches['n369'] = { dmake_node_369() }
+  branches['n370'] = { dmake_node_370() }
+  branches['n371'] = { dmake_node_371() }
+  branches['n372'] = { dmake_node_372() }
+  branches['n373'] = { dmake_node_373() }
+  branches['n374'] = { dmake_node_374() }
+  branches['n375'] = { dmake_node_375() }
+  branches['n376'] = { dmake_node_376() }
+  branches['n377'] = { dmake_node_377() }
+  branches['n378'] = { dmake_node_378() }
+  branches['n379'] = { dmake_node_379() }
+  branches['n380'] = { dmake_node_380() }
+  branches['n381'] = { dmake_node_381() }
+  branches['n382'] = { dmake_node_382() }
+  branches['n383'] = { dmake_node_383() }
+  branches['n384'] = { dmake_node_384() }
+  branches['n385'] = { dmake_node_385() }
+  branches['n386'] = { dmake_node_386() }
+  branches['n387'] = { dmake_node_387() }
+  branches['n388'] = { dmake_node_388() }
+  branches['n389'] = { dmake_node_389() }
+  branches['n390'] = { dmake_node_390() }
+  branches['n391'] = { dmake_node_391() }
+  branches['n392'] = { dmake_node_392() }
+  branches['n393'] = { dmake_node_393() }
+  branches['n394'] = { dmake_node_394() }
+  branches['n395'] = { dmake_node_395() }
+  branches['n396'] = { dmake_node_396() }
+  branches['n397'] = { dmake_node_397() }
+  branches['n398'] = { dmake_node_398() }
+  branches['n399'] = { dmake_node_399() }
+}
+
+def dmake_chunk_8(branches) {
+  branches['n400'] = { dmake_node_400() }
+  branches['n401'] = { dmake_node_401() }
+  branches['n402'] = { dmake_node_402() }
+  branches['n403'] = { dmake_node_403() }
+  branches['n404'] = { dmake_node_404() }
+  branches['n405'] = { dmake_node_405() }
+  branches['n406'] = { dmake_node_406() }
+  branches['n407'] = { dmake_node_407() }
+  branches['n408'] = { dmake_node_408() }
+  branches['n409'] = { dmake_node_409() }
+  branches['n410'] = { dmake_node_410() }
+  branches['n411'] = { dmake_node_411() }
+  branches['n412'] = { dmake_node_412() }
+  branches['n413'] = { dmake_node_413() }
+  branches['n414'] = { dmake_node_414() }
+  branches['n415'] = { dmake_node_415() }
+  branches['n416'] = { dmake_node_416() }
+  branches['n417'] = { dmake_node_417() }
+  branches['n418'] = { dmake_node_418() }
+  branches['n419'] = { dmake_node_419() }
+  branches['n420'] = { dmake_node_420() }
+  branches['n421'] = { dmake_node_421() }
+  branches['n422'] = { dmake_node_422() }
+  branches['n423'] = { dmake_node_423() }
+  branches['n424'] = { dmake_node_424() }
+  branches['n425'] = { dmake_node_425() }
+  branches['n426'] = { dmake_node_426() }
+  branches['n427'] = { dmake_node_427() }
+  branches['n428'] = { dmake_node_428() }
+  branches['n429'] = { dmake_node_429() }
+  branches['n430'] = { dmake_node_430() }
+  branches['n431'] = { dmake_node_431() }
+  branches['n432'] = { dmake_node_432() }
+  branches['n433'] = { dmake_node_433() }
+  branches['n434'] = { dmake_node_434() }
+  branches['n435'] = { dmake_node_435() }
+  branches['n436'] = { dmake_node_436() }
+  branches['n437'] = { dmake_node_437() }
+  branches['n438'] = { dmake_node_438() }
+  branches['n439'] = { dmake_node_439() }
+  branches['n440'] = { dmake_node_440() }
+  branches['n441'] = { dmake_node_441() }
+  branches['n442'] = { dmake_node_442() }
+  branches['n443'] = { dmake_node_443() }
+  branches['n444'] = { dmake_node_444() }
+  branches['n445'] = { dmake_node_445() }
+  branches['n446'] = { dmake_node_446() }
+  branches['n447'] = { dmake_node_447() }
+  branches['n448'] = { dmake_node_448() }
+  branches['n449'] = { dmake_node_449() }
+}
+
+def dmake_chunk_9(branches) {
+  branches['n450'] = { dmake_node_450() }
+  branches['n451'] = { dmake_node_451() }
+  branches['n452'] = { dmake_node_452() }
+  branches['n453'] = { dmake_node_453() }
+  branches['n454'] = { dmake_node_454() }
+  branches['n455'] = { dmake_node_455() }
+  branches['n456'] = { dmake_node_456() }
+  branches['n457'] = { dmake_node_457() }
+  branches['n458'] = { dmake_node_458() }
+  branches['n459'] = { dmake_node_459() }
+  branches['n460'] = { dmake_node_460() }
+  branches['n461'] = { dmake_node_461() }
+  branches['n462'] = { dmake_node_462() }
+  branches['n463'] = { dmake_node_463() }
+  branches['n464'] = { dmake_node_464() }
+  branches['n465'] = { dmake_node_465() }
+  branches['n466'] = { dmake_node_466() }
+  branches['n467'] = { dmake_node_467() }
+  branches['n468'] = { dmake_node_468() }
+  branches['n469'] = { dmake_node_469() }
+  branches['n470'] = { dmake_node_470() }
+  branches['n471'] = { dmake_node_471() }
+  branches['n472'] = { dmake_node_472() }
+  branches['n473'] = { dmake_node_473() }
+  branches['n474'] = { dmake_node_474() }
+  branches['n475'] = { dmake_node_475() }
+  branches['n476'] = { dmake_node_476() }
+  branches['n477'] = { dmake_node_477() }
+  branches['n478'] = { dmake_node_478() }
+  branches['n479'] = { dmake_node_479() }
+  branches['n480'] = { dmake_node_480() }
+  branches['n481'] = { dmake_node_481() }
+  branches['n482'] = { dmake_node_482() }
+  branches['n483'] = { dmake_node_483() }
+  branches['n484'] = { dmake_node_484() }
+  branches['n485'] = { dmake_node_485() }
+  branches['n486'] = { dmake_node_486() }
+  branches['n487'] = { dmake_node_487() }
+  branches['n488'] = { dmake_node_488() }
+  branches['n489'] = { dmake_node_489() }
+  branches['n490'] = { dmake_node_490() }
+  branches['n491'] = { dmake_node_491() }
+  branches['n492'] = { dmake_node_492() }
+  branches['n493'] = { dmake_node_493() }
+  branches['n494'] = { dmake_node_494() }
+  branches['n495'] = { dmake_node_495() }
+  branches['n496'] = { dmake_node_496() }
+  branches['n497'] = { dmake_node_497() }
+  branches['n498'] = { dmake_node_498() }
+  branches['n499'] = { dmake_node_499() }
+}
+
+def dmake_chunk_10(branches) {
+  branches['n500'] = { dmake_node_500() }
+  branches['n501'] = { dmake_node_501() }
+  branches['n502'] = { dmake_node_502() }
+  branches['n503'] = { dmake_node_503() }
+  branches['n504'] = { dmake_node_504() }
+  branches['n505'] = { dmake_node_505() }
+  branches['n506'] = { dmake_node_506() }
+  branches['n507'] = { dmake_node_507() }
+  branches['n508'] = { dmake_node_508() }
+  branches['n509'] = { dmake_node_509() }
+  branches['n510'] = { dmake_node_510() }
+  branches['n511'] = { dmake_node_511() }
+  branches['n512'] = { dmake_node_512() }
+  branches['n513'] = { dmake_node_513() }
+  branches['n514'] = { dmake_node_514() }
+  branches['n515'] = { dmake_node_515() }
+  branches['n516'] = { dmake_node_516() }
+  branches['n517'] = { dmake_node_517() }
+  branches['n518'] = { dmake_node_518() }
+  branches['n519'] = { dmake_node_519() }
+  branches['n520'] = { dmake_node_520() }
+  branches['n521'] = { dmake_node_521() }
+  branches['n522'] = { dmake_node_522() }
+  branches['n523'] = { dmake_node_523() }
+  branches['n524'] = { dmake_node_524() }
+  branches['n525'] = { dmake_node_525() }
+  branches['n526'] = { dmake_node_526() }
+  branches['n527'] = { dmake_node_527() }
+  branches['n528'] = { dmake_node_528() }
+  branches['n529'] = { dmake_node_529() }
+  branches['n530'] = { dmake_node_530() }
+  branches['n531'] = { dmake_node_531() }
+  branches['n532'] = { dmake_node_532() }
+  branches['n533'] = { dmake_node_533() }
+  branches['n534'] = { dmake_node_534() }
+  branches['n535'] = { dmake_node_535() }
+  branches['n536'] = { dmake_node_536() }
+  branches['n537'] = { dmake_node_537() }
+  branches['n538'] = { dmake_node_538() }
+  branches['n539'] = { dmake_node_539() }
+  branches['n540'] = { dmake_node_540() }
+  branches['n541'] = { dmake_node_541() }
+  branches['n542'] = { dmake_node_542() }
+  branches['n543'] = { dmake_node_543() }
+  branches['n544'] = { dmake_node_544() }
+  branches['n545'] = { dmake_node_545() }
+  branches['n546'] = { dmake_node_546() }
+  branches['n547'] = { dmake_node_547() }
+  branches['n548'] = { dmake_node_548() }
+  branches['n549'] = { dmake_node_549() }
+}
+
+def dmake_chunk_11(branches) {
+  branches['n550'] = { dmake_node_550() }
+  branches['n551'] = { dmake_node_551() }
+  branches['n552'] = { dmake_node_552() }
+  branches['n553'] = { dmake_node_553() }
+  branches['n554'] = { dmake_node_554() }
+  branches['n555'] = { dmake_node_555() }
+  branches['n556'] = { dmake_node_556() }
+  branches['n557'] = { dmake_node_557() }
+  branches['n558'] = { dmake_node_558() }
+  branches['n559'] = { dmake_node_559() }
+  branches['n560'] = { dmake_node_560() }
+  branches['n561'] = { dmake_node_561() }
+  branches['n562'] = { dmake_node_562() }
+  branches['n563'] = { dmake_node_563() }
+  branches['n564'] = { dmake_node_564() }
+  branches['n565'] = { dmake_node_565() }
+  branches['n566'] = { dmake_node_566() }
+  branches['n567'] = { dmake_node_567() }
+  branches['n568'] = { dmake_node_568() }
+  branches['n569'] = { dmake_node_569() }
+  branches['n570'] = { dmake_node_570() }
+  branches['n571'] = { dmake_node_571() }
+  branches['n572'] = { dmake_node_572() }
+  branches['n573'] = { dmake_node_573() }
+  branches['n574'] = { dmake_node_574() }
+  branches['n575'] = { dmake_node_575() }
+  branches['n576'] = { dmake_node_576() }
+  branches['n577'] = { dmake_node_577() }
+  branches['n578'] = { dmake_node_578() }
+  branches['n579'] = { dmake_node_579() }
+  branches['n580'] = { dmake_node_580() }
+  branches['n581'] = { dmake_node_581() }
+  branches['n582'] = { dmake_node_582() }
+  branches['n583'] = { dmake_node_583() }
+  branches['n584'] = { dmake_node_584() }
+  branches['n585'] = { dmake_node_585() }
+  branches['n586'] = { dmake_node_586() }
+  branches['n587'] = { dmake_node_587() }
+  branches['n588'] = { dmake_node_588() }
+  branches['n589'] = { dmake_node_589() }
+  branches['n590'] = { dmake_node_590() }
+  branches['n591'] = { dmake_node_591() }
+  branches['n592'] = { dmake_node_592() }
+  branches['n593'] = { dmake_node_593() }
+  branches['n594'] = { dmake_node_594() }
+  branches['n595'] = { dmake_node_595() }
+  branches['n596'] = { dmake_node_596() }
+  branches['n597'] = { dmake_node_597() }
+  branches['n598'] = { dmake_node_598() }
+  branches['n599'] = { dmake_node_599() }
+}
+
+def dmake_chunk_12(branches) {
+  branches['n600'] = { dmake_node_600() }
+  branches['n601'] = { dmake_node_601() }
+  branches['n602'] = { dmake_node_602() }
+  branches['n603'] = { dmake_node_603() }
+  branches['n604'] = { dmake_node_604() }
+  branches['n605'] = { dmake_node_605() }
+  branches['n606'] = { dmake_node_606() }
+  branches['n607'] = { dmake_node_607() }
+  branches['n608'] = { dmake_node_608() }
+  branches['n609'] = { dmake_node_609() }
+  branches['n610'] = { dmake_node_610() }
+  branches['n611'] = { dmake_node_611() }
+  branches['n612'] = { dmake_node_612() }
+  branches['n613'] = { dmake_node_613() }
+  branches['n614'] = { dmake_node_614() }
+  branches['n615'] = { dmake_node_615() }
+  branches['n616'] = { dmake_node_616() }
+  branches['n617'] = { dmake_node_617() }
+  branches['n618'] = { dmake_node_618() }
+  branches['n619'] = { dmake_node_619() }
+  branches['n620'] = { dmake_node_620() }
+  branches['n621'] = { dmake_node_621() }
+  branches['n622'] = { dmake_node_622() }
+  branches['n623'] = { dmake_node_623() }
+  branches['n624'] = { dmake_node_624() }
+  branches['n625'] = { dmake_node_625() }
+  branches['n626'] = { dmake_node_626() }
+  branches['n627'] = { dmake_node_627() }
+  branches['n628'] = { dmake_node_628() }
+  branches['n629'] = { dmake_node_629() }
+  branches['n630'] = { dmake_node_630() }
+  branches['n631'] = { dmake_node_631() }
+  branches['n632'] = { dmake_node_632() }
+  branches['n633'] = { dmake_node_633() }
+  branches['n634'] = { dmake_node_634() }
+  branches['n635'] = { dmake_node_635() }
+  branches['n636'] = { dmake_node_636() }
+  branches['n637'] = { dmake_node_637() }
+  branches['n638'] = { dmake_node_638() }
+  branches['n639'] = { dmake_node_639() }
+  branches['n640'] = { dmake_node_640() }
+  branches['n641'] = { dmake_node_641() }
+  branches['n642'] = { dmake_node_642() }
+  branches['n643'] = { dmake_node_643() }
+  branches['n644'] = { dmake_node_644() }
+  branches['n645'] = { dmake_node_645() }
+  branches['n646'] = { dmake_node_646() }
+  branches['n647'] = { dmake_node_647() }
+  branches['n648'] = { dmake_node_648() }
+  branches['n649'] = { dmake_node_649() }
+}
+
+def dmake_chunk_13(branches) {
+  branches['n650'] = { dmake_node_650() }
+  branches['n651'] = { dmake_node_651() }
+  branches['n652'] = { dmake_node_652() }
+  branches['n653'] = { dmake_node_653() }
+  branches['n654'] = { dmake_node_654() }
+  branches['n655'] = { dmake_node_655() }
+  branches['n656'] = { dmake_node_656() }
+  branches['n657'] = { dmake_node_657() }
+  branches['n658'] = { dmake_node_658() }
+  branches['n659'] = { dmake_node_659() }
+  branches['n660'] = { dmake_node_660() }
+  branches['n661'] = { dmake_node_661() }
+  branches['n662'] = { dmake_node_662() }
+  branches['n663'] = { dmake_node_663() }
+  branches['n664'] = { dmake_node_664() }
+  branches['n665'] = { dmake_node_665() }
+  branches['n666'] = { dmake_node_666() }
+  branches['n667'] = { dmake_node_667() }
+  branches['n668'] = { dmake_node_668() }
+  branches['n669'] = { dmake_node_669() }
+  branches['n670'] = { dmake_node_670() }
+  branches['n671'] = { dmake_node_671() }
+  branches['n672'] = { dmake_node_672() }
+  branches['n673'] = { dmake_node_673() }
+  branches['n674'] = { dmake_node_674() }
+  branches['n675'] = { dmake_node_675() }
+  branches['n676'] = { dmake_node_676() }
+  branches['n677'] = { dmake_node_677() }
+  branches['n678'] = { dmake_node_678() }
+  branches['n679'] = { dmake_node_679() }
+  branches['n680'] = { dmake_node_680() }
+  branches['n681'] = { dmake_node_681() }
+  branches['n682'] = { dmake_node_682() }
+  branches['n683'] = { dmake_node_683() }
+  branches['n684'] = { dmake_node_684() }
+  branches['n685'] = { dmake_node_685() }
+  branches['n686'] = { dmake_node_686() }
+  branches['n687'] = { dmake_node_687() }
+  branches['n688'] = { dmake_node_688() }
+  branches['n689'] = { dmake_node_689() }
+  branches['n690'] = { dmake_node_690() }
+  branches['n691'] = { dmake_node_691() }
+  branches['n692'] = { dmake_node_692() }
+  branches['n693'] = { dmake_node_693() }
+  branches['n694'] = { dmake_node_694() }
+  branches['n695'] = { dmake_node_695() }
+  branches['n696'] = { dmake_node_696() }
+  branches['n697'] = { dmake_node_697() }
+  branches['n698'] = { dmake_node_698() }
+  branches['n699'] = { dmake_node_699() }
+}
+
+def dmake_chunk_14(branches) {
+  branches['n700'] = { dmake_node_700() }
+  branches['n701'] = { dmake_node_701() }
+  branches['n702'] = { dmake_node_702() }
+  branches['n703'] = { dmake_node_703() }
+  branches['n704'] = { dmake_node_704() }
+  branches['n705'] = { dmake_node_705() }
+  branches['n706'] = { dmake_node_706() }
+  branches['n707'] = { dmake_node_707() }
+  branches['n708'] = { dmake_node_708() }
+  branches['n709'] = { dmake_node_709() }
+  branches['n710'] = { dmake_node_710() }
+  branches['n711'] = { dmake_node_711() }
+  branches['n712'] = { dmake_node_712() }
+  branches['n713'] = { dmake_node_713() }
+  branches['n714'] = { dmake_node_714() }
+  branches['n715'] = { dmake_node_715() }
+  branches['n716'] = { dmake_node_716() }
+  branches['n717'] = { dmake_node_717() }
+  branches['n718'] = { dmake_node_718() }
+  branches['n719'] = { dmake_node_719() }
+  branches['n720'] = { dmake_node_720() }
+  branches['n721'] = { dmake_node_721() }
+  branches['n722'] = { dmake_node_722() }
+  branches['n723'] = { dmake_node_723() }
+  branches['n724'] = { dmake_node_724() }
+  branches['n725'] = { dmake_node_725() }
+  branches['n726'] = { dmake_node_726() }
+  branches['n727'] = { dmake_node_727() }
+  branches['n728'] = { dmake_node_728() }
+  branches['n729'] = { dmake_node_729() }
+  branches['n730'] = { dmake_node_730() }
+  branches['n731'] = { dmake_node_731() }
+  branches['n732'] = { dmake_node_732() }
+  branches['n733'] = { dmake_node_733() }
+  branches['n734'] = { dmake_node_734() }
+  branches['n735'] = { dmake_node_735() }
+  branches['n736'] = { dmake_node_736() }
+  branches['n737'] = { dmake_node_737() }
+  branches['n738'] = { dmake_node_738() }
+  branches['n739'] = { dmake_node_739() }
+  branches['n740'] = { dmake_node_740() }
+  branches['n741'] = { dmake_node_741() }
+  branches['n742'] = { dmake_node_742() }
+  branches['n743'] = { dmake_node_743() }
+  branches['n744'] = { dmake_node_744() }
+  branches['n745'] = { dmake_node_745() }
+  branches['n746'] = { dmake_node_746() }
+  branches['n747'] = { dmake_node_747() }
+  branches['n748'] = { dmake_node_748() }
+  branches['n749'] = { dmake_node_749() }
+}
+
+def dmake_chunk_15(branches) {
+  branches['n750'] = { dmake_node_750() }
+  branches['n751'] = { dmake_node_751() }
+  branches['n752'] = { dmake_node_752() }
+  branches['n753'] = { dmake_node_753() }
+  branches['n754'] = { dmake_node_754() }
+  branches['n755'] = { dmake_node_755() }
+  branches['n756'] = { dmake_node_756() }
+  branches['n757'] = { dmake_node_757() }
+  branches['n758'] = { dmake_node_758() }
+  branches['n759'] = { dmake_node_759() }
+  branches['n760'] = { dmake_node_760() }
+  branches['n761'] = { dmake_node_761() }
+  branches['n762'] = { dmake_node_762() }
+  branches['n763'] = { dmake_node_763() }
+  branches['n764'] = { dmake_node_764() }
+  branches['n765'] = { dmake_node_765() }
+  branches['n766'] = { dmake_node_766() }
+  branches['n767'] = { dmake_node_767() }
+  branches['n768'] = { dmake_node_768() }
+  branches['n769'] = { dmake_node_769() }
+  branches['n770'] = { dmake_node_770() }
+  branches['n771'] = { dmake_node_771() }
+  branches['n772'] = { dmake_node_772() }
+  branches['n773'] = { dmake_node_773() }
+  branches['n774'] = { dmake_node_774() }
+  branches['n775'] = { dmake_node_775() }
+  branches['n776'] = { dmake_node_776() }
+  branches['n777'] = { dmake_node_777() }
+  branches['n778'] = { dmake_node_778() }
+  branches['n779'] = { dmake_node_779() }
+  branches['n780'] = { dmake_node_780() }
+  branches['n781'] = { dmake_node_781() }
+  branches['n782'] = { dmake_node_782() }
+  branches['n783'] = { dmake_node_783() }
+  branches['n784'] = { dmake_node_784() }
+  branches['n785'] = { dmake_node_785() }
+  branches['n786'] = { dmake_node_786() }
+  branches['n787'] = { dmake_node_787() }
+  branches['n788'] = { dmake_node_788() }
+  branches['n789'] = { dmake_node_789() }
+  branches['n790'] = { dmake_node_790() }
+  branches['n791'] = { dmake_node_791() }
+  branches['n792'] = { dmake_node_792() }
+  branches['n793'] = { dmake_node_793() }
+  branches['n794'] = { dmake_node_794() }
+  branches['n795'] = { dmake_node_795() }
+  branches['n796'] = { dmake_node_796() }
+  branches['n797'] = { dmake_node_797() }
+  branches['n798'] = { dmake_node_798() }
+  branches['n799'] = { dmake_node_799() }
+}
+
+def dmake_chunk_16(branches) {
+  branches['n800'] = { dmake_node_800() }
+  branches['n801'] = { dmake_node_801() }
+  branches['n802'] = { dmake_node_802() }
+  branches['n803'] = { dmake_node_803() }
+  branches['n804'] = { dmake_node_804() }
+  branches['n805'] = { dmake_node_805() }
+  branches['n806'] = { dmake_node_806() }
+  branches['n807'] = { dmake_node_807() }
+  branches['n808'] = { dmake_node_808() }
+  branches['n809'] = { dmake_node_809() }
+  branches['n810'] = { dmake_node_810() }
+  branches['n811'] = { dmake_node_811() }
+  branches['n812'] = { dmake_node_812() }
+  branches['n813'] = { dmake_node_813() }
+  branches['n814'] = { dmake_node_814() }
+  branches['n815'] = { dmake_node_815() }
+  branches['n816'] = { dmake_node_816() }
+  branches['n817'] = { dmake_node_817() }
+  branches['n818'] = { dmake_node_818() }
+  branches['n819'] = { dmake_node_819() }
+  branches['n820'] = { dmake_node_820() }
+  branches['n821'] = { dmake_node_821() }
+  branches['n822'] = { dmake_node_822() }
+  branches['n823'] = { dmake_node_823() }
+  branches['n824'] = { dmake_node_824() }
+  branches['n825'] = { dmake_node_825() }
+  branches['n826'] = { dmake_node_826() }
+  branches['n827'] = { dmake_node_827() }
+  branches['n828'] = { dmake_node_828() }
+  branches['n829'] = { dmake_node_829() }
+  branches['n830'] = { dmake_node_830() }
+  branches['n831'] = { dmake_node_831() }
+  branches['n832'] = { dmake_node_832() }
+  branches['n833'] = { dmake_node_833() }
+  branches['n834'] = { dmake_node_834() }
+  branches['n835'] = { dmake_node_835() }
+  branches['n836'] = { dmake_node_836() }
+  branches['n837'] = { dmake_node_837() }
+  branches['n838'] = { dmake_node_838() }
+  branches['n839'] = { dmake_node_839() }
+  branches['n840'] = { dmake_node_840() }
+  branches['n841'] = { dmake_node_841() }
+  branches['n842'] = { dmake_node_842() }
+  branches['n843'] = { dmake_node_843() }
+  branches['n844'] = { dmake_node_844() }
+  branches['n845'] = { dmake_node_845() }
+  branches['n846'] = { dmake_node_846() }
+  branches['n847'] = { dmake_node_847() }
+  branches['n848'] = { dmake_node_848() }
+  branches['n849'] = { dmake_node_849() }
+}
+
+def dmake_chunk_17(branches) {
+  branches['n850'] = { dmake_node_850() }
+  branches['n851'] = { dmake_node_851() }
+  branches['n852'] = { dmake_node_852() }
+  branches['n853'] = { dmake_node_853() }
+  branches['n854'] = { dmake_node_854() }
+  branches['n855'] = { dmake_node_855() }
+  branches['n856'] = { dmake_node_856() }
+  branches['n857'] = { dmake_node_857() }
+  branches['n858'] = { dmake_node_858() }
+  branches['n859'] = { dmake_node_859() }
+  branches['n860'] = { dmake_node_860() }
+  branches['n861'] = { dmake_node_861() }
+  branches['n862'] = { dmake_node_862() }
+  branches['n863'] = { dmake_node_863() }
+  branches['n864'] = { dmake_node_864() }
+  branches['n865'] = { dmake_node_865() }
+  branches['n866'] = { dmake_node_866() }
+  branches['n867'] = { dmake_node_867() }
+  branches['n868'] = { dmake_node_868() }
+  branches['n869'] = { dmake_node_869() }
+  branches['n870'] = { dmake_node_870() }
+  branches['n871'] = { dmake_node_871() }
+  branches['n872'] = { dmake_node_872() }
+  branches['n873'] = { dmake_node_873() }
+  branches['n874'] = { dmake_node_874() }
+  branches['n875'] = { dmake_node_875() }
+  branches['n876'] = { dmake_node_876() }
+  branches['n877'] = { dmake_node_877() }
+  branches['n878'] = { dmake_node_878() }
+  branches['n879'] = { dmake_node_879() }
+  branches['n880'] = { dmake_node_880() }
+  branches['n881'] = { dmake_node_881() }
+  branches['n882'] = { dmake_node_882() }
+  branches['n883'] = { dmake_node_883() }
+  branches['n884'] = { dmake_node_884() }
+  branches['n885'] = { dmake_node_885() }
+  branches['n886'] = { dmake_node_886() }
+  branches['n887'] = { dmake_node_887() }
+  branches['n888'] = { dmake_node_888() }
+  branches['n889'] = { dmake_node_889() }
+  branches['n890'] = { dmake_node_890() }
+  branches['n891'] = { dmake_node_891() }
+  branches['n892'] = { dmake_node_892() }
+  branches['n893'] = { dmake_node_893() }
+  branches['n894'] = { dmake_node_894() }
+  branches['n895'] = { dmake_node_895() }
+  branches['n896'] = { dmake_node_896() }
+  branches['n897'] = { dmake_node_897() }
+  branches['n898'] = { dmake_node_898() }
+  branches['n899'] = { dmake_node_899() }
+}
+
+def dmake_chunk_18(branches) {
+  branches['n900'] = { dmake_node_900() }
+  branches['n901'] = { dmake_node_901() }
+  branches['n902'] = { dmake_node_902() }
+  branches['n903'] = { dmake_node_903() }
+  branches['n904'] = { dmake_node_904() }
+  branches['n905'] = { dmake_node_905() }
+  branches['n906'] = { dmake_node_906() }
+  branches['n907'] = { dmake_node_907() }
+  branches['n908'] = { dmake_node_908() }
+  branches['n909'] = { dmake_node_909() }
+  branches['n910'] = { dmake_node_910() }
+  branches['n911'] = { dmake_node_911() }
+  branches['n912'] = { dmake_node_912() }
+  branches['n913'] = { dmake_node_913() }
+  branches['n914'] = { dmake_node_914() }
+  branches['n915'] = { dmake_node_915() }
+  branches['n916'] = { dmake_node_916() }
+  branches['n917'] = { dmake_node_917() }
+  branches['n918'] = { dmake_node_918() }
+  branches['n919'] = { dmake_node_919() }
+  branches['n920'] = { dmake_node_920() }
+  branches['n921'] = { dmake_node_921() }
+  branches['n922'] = { dmake_node_922() }
+  branches['n923'] = { dmake_node_923() }
+  branches['n924'] = { dmake_node_924() }
+  branches['n925'] = { dmake_node_925() }
+  branches['n926'] = { dmake_node_926() }
+  branches['n927'] = { dmake_node_927() }
+  branches['n928'] = { dmake_node_928() }
+  branches['n929'] = { dmake_node_929() }
+  branches['n930'] = { dmake_node_930() }
+  branches['n931'] = { dmake_node_931() }
+  branches['n932'] = { dmake_node_932() }
+  branches['n933'] = { dmake_node_933() }
+  branches['n934'] = { dmake_node_934() }
+  branches['n935'] = { dmake_node_935() }
+  branches['n936'] = { dmake_node_936() }
+  branches['n937'] = { dmake_node_937() }
+  branches['n938'] = { dmake_node_938() }
+  branches['n939'] = { dmake_node_939() }
+  branches['n940'] = { dmake_node_940() }
+  branches['n941'] = { dmake_node_941() }
+  branches['n942'] = { dmake_node_942() }
+  branches['n943'] = { dmake_node_943() }
+  branches['n944'] = { dmake_node_944() }
+  branches['n945'] = { dmake_node_945() }
+  branches['n946'] = { dmake_node_946() }
+  branches['n947'] = { dmake_node_947() }
+  branches['n948'] = { dmake_node_948() }
+  branches['n949'] = { dmake_node_949() }
+}
+
+def dmake_chunk_19(branches) {
+  branches['n950'] = { dmake_node_950() }
+  branches['n951'] = { dmake_node_951() }
+  branches['n952'] = { dmake_node_952() }
+  branches['n953'] = { dmake_node_953() }
+  branches['n954'] = { dmake_node_954() }
+  branches['n955'] = { dmake_node_955() }
+  branches['n956'] = { dmake_node_956() }
+  branches['n957'] = { dmake_node_957() }
+  branches['n958'] = { dmake_node_958() }
+  branches['n959'] = { dmake_node_959() }
+  branches['n960'] = { dmake_node_960() }
+  branches['n961'] = { dmake_node_961() }
+  branches['n962'] = { dmake_node_962() }
+  branches['n963'] = { dmake_node_963() }
+  branches['n964'] = { dmake_node_964() }
+  branches['n965'] = { dmake_node_965() }
+  branches['n966'] = { dmake_node_966() }
+  branches['n967'] = { dmake_node_967() }
+  branches['n968'] = { dmake_node_968() }
+  branches['n969'] = { dmake_node_969() }
+  branches['n970'] = { dmake_node_970() }
+  branches['n971'] = { dmake_node_971() }
+  branches['n972'] = { dmake_node_972() }
+  branches['n973'] = { dmake_node_973() }
+  branches['n974'] = { dmake_node_974() }
+  branches['n975'] = { dmake_node_975() }
+  branches['n976'] = { dmake_node_976() }
+  branches['n977'] = { dmake_node_977() }
+  branches['n978'] = { dmake_node_978() }
+  branches['n979'] = { dmake_node_979() }
+  branches['n980'] = { dmake_node_980() }
+  branches['n981'] = { dmake_node_981() }
+  branches['n982'] = { dmake_node_982() }
+  branches['n983'] = { dmake_node_983() }
+  branches['n984'] = { dmake_node_984() }
+  branches['n985'] = { dmake_node_985() }
+  branches['n986'] = { dmake_node_986() }
+  branches['n987'] = { dmake_node_987() }
+  branches['n988'] = { dmake_node_988() }
+  branches['n989'] = { dmake_node_989() }
+  branches['n990'] = { dmake_node_990() }
+  branches['n991'] = { dmake_node_991() }
+  branches['n992'] = { dmake_node_992() }
+  branches['n993'] = { dmake_node_993() }
+  branches['n994'] = { dmake_node_994() }
+  branches['n995'] = { dmake_node_995() }
+  branches['n996'] = { dmake_node_996() }
+  branches['n997'] = { dmake_node_997() }
+  branches['n998'] = { dmake_node_998() }
+  branches['n999'] = { dmake_node_999() }
+}
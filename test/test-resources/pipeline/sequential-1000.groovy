@@ -0,0 +1,5097 @@
+def dmake_echo(message) { sh(script: "echo '${message}'", label: message) }
+try {
+  sh("dmake_check_tmp_dir")
+
+  stage('Testing App') {
+    dmake_chunk_0()
+    dmake_chunk_1()
+    dmake_chunk_2()
+    dmake_chunk_3()
+    dmake_chunk_4()
+    dmake_chunk_5()
+    dmake_chunk_6()
+    dmake_chunk_7()
+    dmake_chunk_8()
+    dmake_chunk_9()
+    dmake_chunk_10()
+    dmake_chunk_11()
+    dmake_chunk_12()
+    dmake_chunk_13()
+    dmake_chunk_14()
+    dmake_chunk_15()
+    dmake_chunk_16()
+    dmake_chunk_17()
+    dmake_chunk_18()
+    dmake_chunk_19()
+  }
+}
+catch (error) {
+  if ( env.DMAKE_PAUSE_ON_ERROR_BEFORE_CLEANUP == "1" ) {
+    slackSend channel: "#jenkins-dmake", message: "This jenkins build requires your attention: <${env.BUILD_URL}/console|${env.JOB_NAME} ${env.BUILD_NUMBER}>"
+    input message: 'An error occurred. DMake will stop and clean all the running containers upon any answer.'
+  }
+  throw error
+}
+finally {
+  sh("dmake_clean")
+}
+
+def dmake_node_0() {
+  sh("make n0")
+}
+
+def dmake_node_1() {
+  sh("make n1")
+}
+
+def dmake_node_2() {
+  sh("make n2")
+}
+
+def dmake_node_3() {
+  sh("make n3")
+}
+
+def dmake_node_4() {
+  sh("make n4")
+}
+
+def dmake_node_5() {
+  sh("make n5")
+}
+
+def dmake_node_6() {
+  sh("make n6")
+}
+
+def dmake_node_7() {
+  sh("make n7")
+}
+
+def dmake_node_8() {
+  sh("make n8")
+}
+
+def dmake_node_9() {
+  sh("make n9")
+}
+
+def dmake_node_10() {
+  sh("make n10")
+}
+
+def dmake_node_11() {
+  sh("make n11")
+}
+
+def dmake_node_12() {
+  sh("make n12")
+}
+
+def dmake_node_13() {
+  sh("make n13")
+}
+
+def dmake_node_14() {
+  sh("make n14")
+}
+
+def dmake_node_15() {
+  sh("make n15")
+}
+
+def dmake_node_16() {
+  sh("make n16")
+}
+
+def dmake_node_17() {
+  sh("make n17")
+}
+
+def dmake_node_18() {
+  sh("make n18")
+}
+
+def dmake_node_19() {
+  sh("make n19")
+}
+
+def dmake_node_20() {
+  sh("make n20")
+}
+
+def dmake_node_21() {
+  sh("make n21")
+}
+
+def dmake_node_22() {
+  sh("make n22")
+}
+
+def dmake_node_23() {
+  sh("make n23")
+}
+
+def dmake_node_24() {
+  sh("make n24")
+}
+
+def dmake_node_25() {
+  sh("make n25")
+}
+
+def dmake_node_26() {
+  sh("make n26")
+}
+
+def dmake_node_27() {
+  sh("make n27")
+}
+
+def dmake_node_28() {
+  sh("make n28")
+}
+
+def dmake_node_29() {
+  sh("make n29")
+}
+
+def dmake_node_30() {
+  sh("make n30")
+}
+
+def dmake_node_31() {
+  sh("make n31")
+}
+
+def dmake_node_32() {
+  sh("make n32")
+}
+
+def dmake_node_33() {
+  sh("make n33")
+}
+
+def dmake_node_34() {
+  sh("make n34")
+}
+
+def dmake_node_35() {
+  sh("make n35")
+}
+
+def dmake_node_36() {
+  sh("make n36")
+}
+
+def dmake_node_37() {
+  sh("make n37")
+}
+
+def dmake_node_38() {
+  sh("make n38")
+}
+
+def dmake_node_39() {
+  sh("make n39")
+}
+
+def dmake_node_40() {
+  sh("make n40")
+}
+
+def dmake_node_41() {
+  sh("make n41")
+}
+
+def dmake_node_42() {
+  sh("make n42")
+}
+
+def dmake_node_43() {
+  sh("make n43")
+}
+
+def dmake_node_44() {
+  sh("make n44")
+}
+
+def dmake_node_45() {
+  sh("make n45")
+}
+
+def dmake_node_46() {
+  sh("make n46")
+}
+
+def dmake_node_47() {
+  sh("make n47")
+}
+
+def dmake_node_48() {
+  sh("make n48")
+}
+
+def dmake_node_49() {
+  sh("make n49")
+}
+
+def dmake_node_50() {
+  sh("make n50")
+}
+
+def dmake_node_51() {
+  sh("make n51")
+}
+
+def dmake_node_52() {
+  sh("make n52")
+}
+
+def dmake_node_53() {
+  sh("make n53")
+}
+
+def dmake_node_54() {
+  sh("make n54")
+}
+
+def dmake_node_55() {
+  sh("make n55")
+}
+
+def dmake_node_56() {
+  sh("make n56")
+}
+
+def dmake_node_57() {
+  sh("make n57")
+}
+
+def dmake_node_58() {
+  sh("make n58")
+}
+
+def dmake_node_59() {
+  sh("make n59")
+}
+
+def dmake_node_60() {
+  sh("make n60")
+}
+
+def dmake_node_61() {
+  sh("make n61")
+}
+
+def dmake_node_62() {
+  sh("make n62")
+}
+
+def dmake_node_63() {
+  sh("make n63")
+}
+
+def dmake_node_64() {
+  sh("make n64")
+}
+
+def dmake_node_65() {
+  sh("make n65")
+}
+
+def dmake_node_66() {
+  sh("make n66")
+}
+
+def dmake_node_67() {
+  sh("make n67")
+}
+
+def dmake_node_68() {
+  sh("make n68")
+}
+
+def dmake_node_69() {
+  sh("make n69")
+}
+
+def dmake_node_70() {
+  sh("make n70")
+}
+
+def dmake_node_71() {
+  sh("make n71")
+}
+
+def dmake_node_72() {
+  sh("make n72")
+}
+
+def dmake_node_73() {
+  sh("make n73")
+}
+
+def dmake_node_74() {
+  sh("make n74")
+}
+
+def dmake_node_75() {
+  sh("make n75")
+}
+
+def dmake_node_76() {
+  sh("make n76")
+}
+
+def dmake_node_77() {
+  sh("make n77")
+}
+
+def dmake_node_78() {
+  sh("make n78")
+}
+
+def dmake_node_79() {
+  sh("make n79")
+}
+
+def dmake_node_80() {
+  sh("make n80")
+}
+
+def dmake_node_81() {
+  sh("make n81")
+}
+
+def dmake_node_82() {
+  sh("make n82")
+}
+
+def dmake_node_83() {
+  sh("make n83")
+}
+
+def dmake_node_84() {
+  sh("make n84")
+}
+
+def dmake_node_85() {
+  sh("make n85")
+}
+
+def dmake_node_86() {
+  sh("make n86")
+}
+
+def dmake_node_87() {
+  sh("make n87")
+}
+
+def dmake_node_88() {
+  sh("make n88")
+}
+
+def dmake_node_89() {
+  sh("make n89")
+}
+
+def dmake_node_90() {
+  sh("make n90")
+}
+
+def dmake_node_91() {
+  sh("make n91")
+}
+
+def dmake_node_92() {
+  sh("make n92")
+}
+
+def dmake_node_93() {
+  sh("make n93")
+}
+
+def dmake_node_94() {
+  sh("make n94")
+}
+
+def dmake_node_95() {
+  sh("make n95")
+}
+
+def dmake_node_96() {
+  sh("make n96")
+}
+
+def dmake_node_97() {
+  sh("make n97")
+}
+
+def dmake_node_98() {
+  sh("make n98")
+}
+
+def dmake_node_99() {
+  sh("make n99")
+}
+
+def dmake_node_100() {
+  sh("make n100")
+}
+
+def dmake_node_101() {
+  sh("make n101")
+}
+
+def dmake_node_102() {
+  sh("make n102")
+}
+
+def dmake_node_103() {
+  sh("make n103")
+}
+
+def dmake_node_104() {
+  sh("make n104")
+}
+
+def dmake_node_105() {
+  sh("make n105")
+}
+
+def dmake_node_106() {
+  sh("make n106")
+}
+
+def dmake_node_107() {
+  sh("make n107")
+}
+
+def dmake_node_108() {
+  sh("make n108")
+}
+
+def dmake_node_109() {
+  sh("make n109")
+}
+
+def dmake_node_110() {
+  sh("make n110")
+}
+
+def dmake_node_111() {
+  sh("make n111")
+}
+
+def dmake_node_112() {
+  sh("make n112")
+}
+
+def dmake_node_113() {
+  sh("make n113")
+}
+
+def dmake_node_114() {
+  sh("make n114")
+}
+
+def dmake_node_115() {
+  sh("make n115")
+}
+
+def dmake_node_116() {
+  sh("make n116")
+}
+
+def dmake_node_117() {
+  sh("make n117")
+}
+
+def dmake_node_118() {
+  sh("make n118")
+}
+
+def dmake_node_119() {
+  sh("make n119")
+}
+
+def dmake_node_120() {
+  sh("make n120")
+}
+
+def dmake_node_121() {
+  sh("make n121")
+}
+
+def dmake_node_122() {
+  sh("make n122")
+}
+
+def dmake_node_123() {
+  sh("make n123")
+}
+
+def dmake_node_124() {
+  sh("make n124")
+}
+
+def dmake_node_125() {
+  sh("make n125")
+}
+
+def dmake_node_126() {
+  sh("make n126")
+}
+
+def dmake_node_127() {
+  sh("make n127")
+}
+
+def dmake_node_128() {
+  sh("make n128")
+}
+
+def dmake_node_129() {
+  sh("make n129")
+}
+
+def dmake_node_130() {
+  sh("make n130")
+}
+
+def dmake_node_131() {
+  sh("make n131")
+}
+
+def dmake_node_132() {
+  sh("make n132")
+}
+
+def dmake_node_133() {
+  sh("make n133")
+}
+
+def dmake_node_134() {
+  sh("make n134")
+}
+
+def dmake_node_135() {
+  sh("make n135")
+}
+
+def dmake_node_136() {
+  sh("make n136")
+}
+
+def dmake_node_137() {
+  sh("make n137")
+}
+
+def dmake_node_138() {
+  sh("make n138")
+}
+
+def dmake_node_139() {
+  sh("make n139")
+}
+
+def dmake_node_140() {
+  sh("make n140")
+}
+
+def dmake_node_141() {
+  sh("make n141")
+}
+
+def dmake_node_142() {
+  sh("make n142")
+}
+
+def dmake_node_143() {
+  sh("make n143")
+}
+
+def dmake_node_144() {
+  sh("make n144")
+}
+
+def dmake_node_145() {
+  sh("make n145")
+}
+
+def dmake_node_146() {
+  sh("make n146")
+}
+
+def dmake_node_147() {
+  sh("make n147")
+}
+
+def dmake_node_148() {
+  sh("make n148")
+}
+
+def dmake_node_149() {
+  sh("make n149")
+}
+
+def dmake_node_150() {
+  sh("make n150")
+}
+
+def dmake_node_151() {
+  sh("make n151")
+}
+
+def dmake_node_152() {
+  sh("make n152")
+}
+
+def dmake_node_153() {
+  sh("make n153")
+}
+
+def dmake_node_154() {
+  sh("make n154")
+}
+
+def dmake_node_155() {
+  sh("make n155")
+}
+
+def dmake_node_156() {
+  sh("make n156")
+}
+
+def dmake_node_157() {
+  sh("make n157")
+}
+
+def dmake_node_158() {
+  sh("make n158")
+}
+
+def dmake_node_159() {
+  sh("make n159")
+}
+
+def dmake_node_160() {
+  sh("make n160")
+}
+
+def dmake_node_161() {
+  sh("make n161")
+}
+
+def dmake_node_162() {
+  sh("make n162")
+}
+
+def dmake_node_163() {
+  sh("make n163")
+}
+
+def dmake_node_164() {
+  sh("make n164")
+}
+
+def dmake_node_165() {
+  sh("make n165")
+}
+
+def dmake_node_166() {
+  sh("make n166")
+}
+
+def dmake_node_167() {
+  sh("make n167")
+}
+
+def dmake_node_168() {
+  sh("make n168")
+}
+
+def dmake_node_169() {
+  sh("make n169")
+}
+
+def dmake_node_170() {
+  sh("make n170")
+}
+
+def dmake_node_171() {
+  sh("make n171")
+}
+
+def dmake_node_172() {
+  sh("make n172")
+}
+
+def dmake_node_173() {
+  sh("make n173")
+}
+
+def dmake_node_174() {
+  sh("make n174")
+}
+
+def dmake_node_175() {
+  sh("make n175")
+}
+
+def dmake_node_176() {
+  sh("make n176")
+}
+
+def dmake_node_177() {
+  sh("make n177")
+}
+
+def dmake_node_178() {
+  sh("make n178")
+}
+
+def dmake_node_179() {
+  sh("make n179")
+}
+
+def dmake_node_180() {
+  sh("make n180")
+}
+
+def dmake_node_181() {
+  sh("make n181")
+}
+
+def dmake_node_182() {
+  sh("make n182")
+}
+
+def dmake_node_183() {
+  sh("make n183")
+}
+
+def dmake_node_184() {
+  sh("make n184")
+}
+
+def dmake_node_185() {
+  sh("make n185")
+}
+
+def dmake_node_186() {
+  sh("make n186")
+}
+
+def dmake_node_187() {
+  sh("make n187")
+}
+
+def dmake_node_188() {
+  sh("make n188")
+}
+
+def dmake_node_189() {
+  sh("make n189")
+}
+
+def dmake_node_190() {
+  sh("make n190")
+}
+
+def dmake_node_191() {
+  sh("make n191")
+}
+
+def dmake_node_192() {
+  sh("make n192")
+}
+
+def dmake_node_193() {
+  sh("make n193")
+}
+
+def dmake_node_194() {
+  sh("make n194")
+}
+
+def dmake_node_195() {
+  sh("make n195")
+}
+
+def dmake_node_196() {
+  sh("make n196")
+}
+
+def dmake_node_197() {
+  sh("make n197")
+}
+
+def dmake_node_198() {
+  sh("make n198")
+}
+
+def dmake_node_199() {
+  sh("make n199")
+}
+
+def dmake_node_200() {
+  sh("make n200")
+}
+
+def dmake_node_201() {
+  sh("make n201")
+}
+
+def dmake_node_202() {
+  sh("make n202")
+}
+
+def dmake_node_203() {
+  sh("make n203")
+}
+
+def dmake_node_204() {
+  sh("make n204")
+}
+
+def dmake_node_205() {
+  sh("make n205")
+}
+
+def dmake_node_206() {
+  sh("make n206")
+}
+
+def dmake_node_207() {
+  sh("make n207")
+}
+
+def dmake_node_208() {
+  sh("make n208")
+}
+
+def dmake_node_209() {
+  sh("make n209")
+}
+
+def dmake_node_210() {
+  sh("make n210")
+}
+
+def dmake_node_211() {
+  sh("make n211")
+}
+
+def dmake_node_212() {
+  sh("make n212")
+}
+
+def dmake_node_213() {
+  sh("make n213")
+}
+
+def dmake_node_214() {
+  sh("make n214")
+}
+
+def dmake_node_215() {
+  sh("make n215")
+}
+
+def dmake_node_216() {
+  sh("make n216")
+}
+
+def dmake_node_217() {
+  sh("make n217")
+}
+
+def dmake_node_218() {
+  sh("make n218")
+}
+
+def dmake_node_219() {
+  sh("make n219")
+}
+
+def dmake_node_220() {
+  sh("make n220")
+}
+
+def dmake_node_221() {
+  sh("make n221")
+}
+
+def dmake_node_222() {
+  sh("make n222")
+}
+
+def dmake_node_223() {
+  sh("make n223")
+}
+
+def dmake_node_224() {
+  sh("make n224")
+}
+
+def dmake_node_225() {
+  sh("make n225")
+}
+
+def dmake_node_226() {
+  sh("make n226")
+}
+
+def dmake_node_227() {
+  sh("make n227")
+}
+
+def dmake_node_228() {
+  sh("make n228")
+}
+
+def dmake_node_229() {
+  sh("make n229")
+}
+
+def dmake_node_230() {
+  sh("make n230")
+}
+
+def dmake_node_231() {
+  sh("make n231")
+}
+
+def dmake_node_232() {
+  sh("make n232")
+}
+
+def dmake_node_233() {
+  sh("make n233")
+}
+
+def dmake_node_234() {
+  sh("make n234")
+}
+
+def dmake_node_235() {
+  sh("make n235")
+}
+
+def dmake_node_236() {
+  sh("make n236")
+}
+
+def dmake_node_237() {
+  sh("make n237")
+}
+
+def dmake_node_238() {
+  sh("make n238")
+}
+
+def dmake_node_239() {
+  sh("make n239")
+}
+
+def dmake_node_240() {
+  sh("make n240")
+}
+
+def dmake_node_241() {
+  sh("make n241")
+}
+
+def dmake_node_242() {
+  sh("make n242")
+}
+
+def dmake_node_243() {
+  sh("make n243")
+}
+
+def dmake_node_244() {
+  sh("make n244")
+}
+
+def dmake_node_245() {
+  sh("make n245")
+}
+
+def dmake_node_246() {
+  sh("make n246")
+}
+
+def dmake_node_247() {
+  sh("make n247")
+}
+
+def dmake_node_248() {
+  sh("make n248")
+}
+
+def dmake_node_249() {
+  sh("make n249")
+}
+
+def dmake_node_250() {
+  sh("make n250")
+}
+
+def dmake_node_251() {
+  sh("make n251")
+}
+
+def dmake_node_252() {
+  sh("make n252")
+}
+
+def dmake_node_253() {
+  sh("make n253")
+}
+
+def dmake_node_254() {
+  sh("make n254")
+}
+
+def dmake_node_255() {
+  sh("make n255")
+}
+
+def dmake_node_256() {
+  sh("make n256")
+}
+
+def dmake_node_257() {
+  sh("make n257")
+}
+
+def dmake_node_258() {
+  sh("make n258")
+}
+
+def dmake_node_259() {
+  sh("make n259")
+}
+
+def dmake_node_260() {
+  sh("make n260")
+}
+
+def dmake_node_261() {
+  sh("make n261")
+}
+
+def dmake_node_262() {
+  sh("make n262")
+}
+
+def dmake_node_263() {
+  sh("make n263")
+}
+
+def dmake_node_264() {
+  sh("make n264")
+}
+
+def dmake_node_265() {
+  sh("make n265")
+}
+
+def dmake_node_266() {
+  sh("make n266")
+}
+
+def dmake_node_267() {
+  sh("make n267")
+}
+
+def dmake_node_268() {
+  sh("make n268")
+}
+
+def dmake_node_269() {
+  sh("make n269")
+}
+
+def dmake_node_270() {
+  sh("make n270")
+}
+
+def dmake_node_271() {
+  sh("make n271")
+}
+
+def dmake_node_272() {
+  sh("make n272")
+}
+
+def dmake_node_273() {
+  sh("make n273")
+}
+
+def dmake_node_274() {
+  sh("make n274")
+}
+
+def dmake_node_275() {
+  sh("make n275")
+}
+
+def dmake_node_276() {
+  sh("make n276")
+}
+
+def dmake_node_277() {
+  sh("make n277")
+}
+
+def dmake_node_278() {
+  sh("make n278")
+}
+
+def dmake_node_279() {
+  sh("make n279")
+}
+
+def dmake_node_280() {
+  sh("make n280")
+}
+
+def dmake_node_281() {
+  sh("make n281")
+}
+
+def dmake_node_282() {
+  sh("make n282")
+}
+
+def dmake_node_283() {
+  sh("make n283")
+}
+
+def dmake_node_284() {
+  sh("make n284")
+}
+
+def dmake_node_285() {
+  sh("make n285")
+}
+
+def dmake_node_286() {
+  sh("make n286")
+}
+
+def dmake_node_287() {
+  sh("make n287")
+}
+
+def dmake_node_288() {
+  sh("make n288")
+}
+
+def dmake_node_289() {
+  sh("make n289")
+}
+
+def dmake_node_290() {
+  sh("make n290")
+}
+
+def dmake_node_291() {
+  sh("make n291")
+}
+
+def dmake_node_292() {
+  sh("make n292")
+}
+
+def dmake_node_293() {
+  sh("make n293")
+}
+
+def dmake_node_294() {
+  sh("make n294")
+}
+
+def dmake_node_295() {
+  sh("make n295")
+}
+
+def dmake_node_296() {
+  sh("make n296")
+}
+
+def dmake_node_297() {
+  sh("make n297")
+}
+
+def dmake_node_298() {
+  sh("make n298")
+}
+
+def dmake_node_299() {
+  sh("make n299")
+}
+
+def dmake_node_300() {
+  sh("make n300")
+}
+
+def dmake_node_301() {
+  sh("make n301")
+}
+
+def dmake_node_302() {
+  sh("make n302")
+}
+
+def dmake_node_303() {
+  sh("make n303")
+}
+
+def dmake_node_304() {
+  sh("make n304")
+}
+
+def dmake_node_305() {
+  sh("make n305")
+}
+
+def dmake_node_306() {
+  sh("make n306")
+}
+
+def dmake_node_307() {
+  sh("make n307")
+}
+
+def dmake_node_308() {
+  sh("make n308")
+}
+
+def dmake_node_309() {
+  sh("make n309")
+}
+
+def dmake_node_310() {
+  sh("make n310")
+}
+
+def dmake_node_311() {
+  sh("make n311")
+}
+
+def dmake_node_312() {
+  sh("make n312")
+}
+
+def dmake_node_313() {
+  sh("make n313")
+}
+
+def dmake_node_314() {
+  sh("make n314")
+}
+
+def dmake_node_315() {
+  sh("make n315")
+}
+
+def dmake_node_316() {
+  sh("make n316")
+}
+
+def dmake_node_317() {
+  sh("make n317")
+}
+
+def dmake_node_318() {
+  sh("make n318")
+}
+
+def dmake_node_319() {
+  sh("make n319")
+}
+
+def dmake_node_320() {
+  sh("make n320")
+}
+
+def dmake_node_321() {
+  sh("make n321")
+}
+
+def dmake_node_322() {
+  sh("make n322")
+}
+
+def dmake_node_323() {
+  sh("make n323")
+}
+
+def dmake_node_324() {
+  sh("make n324")
+}
+
+def dmake_node_325() {
+  sh("make n325")
+}
+
+def dmake_node_326() {
+  sh("make n326")
+}
+
+def dmake_node_327() {
+  sh("make n327")
+}
+
+def dmake_node_328() {
+  sh("make n328")
+}
+
+def dmake_node_329() {
+  sh("make n329")
+}
+
+def dmake_node_330() {
+  sh("make n330")
+}
+
+def dmake_node_331() {
+  sh("make n331")
+}
+
+def dmake_node_332() {
+  sh("make n332")
+}
+
+def dmake_node_333() {
+  sh("make n333")
+}
+
+def dmake_node_334() {
+  sh("make n334")
+}
+
+def dmake_node_335() {
+  sh("make n335")
+}
+
+def dmake_node_336() {
+  sh("make n336")
+}
+
+def dmake_node_337() {
+  sh("make n337")
+}
+
+def dmake_node_338() {
+  sh("make n338")
+}
+
+def dmake_node_339() {
+  sh("make n339")
+}
+
+def dmake_node_340() {
+  sh("make n340")
+}
+
+def dmake_node_341() {
+  sh("make n341")
+}
+
+def dmake_node_342() {
+  sh("make n342")
+}
+
+def dmake_node_343() {
+  sh("make n343")
+}
+
+def dmake_node_344() {
+  sh("make n344")
+}
+
+def dmake_node_345() {
+  sh("make n345")
+}
+
+def dmake_node_346() {
+  sh("make n346")
+}
+
+def dmake_node_347() {
+  sh("make n347")
+}
+
+def dmake_node_348() {
+  sh("make n348")
+}
+
+def dmake_node_349() {
+  sh("make n349")
+}
+
+def dmake_node_350() {
+  sh("make n350")
+}
+
+def dmake_node_351() {
+  sh("make n351")
+}
+
+def dmake_node_352() {
+  sh("make n352")
+}
+
+def dmake_node_353() {
+  sh("make n353")
+}
+
+def dmake_node_354() {
+  sh("make n354")
+}
+
+def dmake_node_355() {
+  sh("make n355")
+}
+
+def dmake_node_356() {
+  sh("make n356")
+}
+
+def dmake_node_357() {
+  sh("make n357")
+}
+
+def dmake_node_358() {
+  sh("make n358")
+}
+
+def dmake_node_359() {
+  sh("make n359")
+}
+
+def dmake_node_360() {
+  sh("make n360")
+}
+
+def dmake_node_361() {
+  sh("make n361")
+}
+
+def dmake_node_362() {
+  sh("make n362")
+}
+
+def dmake_node_363() {
+  sh("make n363")
+}
+
+def dmake_node_364() {
+  sh("make n364")
+}
+
+def dmake_node_365() {
+  sh("make n365")
+}
+
+def dmake_node_366() {
+  sh("make n366")
+}
+
+def dmake_node_367() {
+  sh("make n367")
+}
+
+def dmake_node_368() {
+  sh("make n368")
+}
+
+def dmake_node_369() {
+  sh("make n369")
+}
+
+def dmake_node_370() {
+  sh("make n370")
+}
+
+def dmake_node_371() {
+  sh("make n371")
+}
+
+def dmake_node_372() {
+  sh("make n372")
+}
+
+def dmake_node_373() {
+  sh("make n373")
+}
+
+def dmake_node_374() {
+  sh("make n374")
+}
+
+def dmake_node_375() {
+  sh("make n375")
+}
+
+def dmake_node_376() {
+  sh("make n376")
+}
+
+def dmake_node_377() {
+  sh("make n377")
+}
+
+def dmake_node_378() {
+  sh("make n378")
+}
+
+def dmake_node_379() {
+  sh("make n379")
+}
+
+def dmake_node_380() {
+  sh("make n380")
+}
+
+def dmake_node_381() {
+  sh("make n381")
+}
+
+def dmake_node_382() {
+  sh("make n382")
+}
+
+def dmake_node_383() {
+  sh("make n383")
+}
+
+def dmake_node_384() {
+  sh("make n384")
+}
+
+def dmake_node_385() {
+  sh("make n385")
+}
+
+def dmake_node_386() {
+  sh("make n386")
+}
+
+def dmake_node_387() {
+  sh("make n387")
+}
+
+def dmake_node_388() {
+  sh("make n388")
+}
+
+def dmake_node_389() {
+  sh("make n389")
+}
+
+def dmake_node_390() {
+  sh("make n390")
+}
+
+def dmake_node_391() {
+  sh("make n391")
+}
+
+def dmake_node_392() {
+  sh("make n392")
+}
+
+def dmake_node_393() {
+  sh("make n393")
+}
+
+def dmake_node_394() {
+  sh("make n394")
+}
+
+def dmake_node_395() {
+  sh("make n395")
+}
+
+def dmake_node_396() {
+  sh("make n396")
+}
+
+def dmake_node_397() {
+  sh("make n397")
+}
+
+def dmake_node_398() {
+  sh("make n398")
+}
+
+def dmake_node_399() {
+  sh("make n399")
+}
+
+def dmake_node_400() {
+  sh("make n400")
+}
+
+def dmake_node_401() {
+  sh("make n401")
+}
+
+def dmake_node_402() {
+  sh("make n402")
+}
+
+def dmake_node_403() {
+  sh("make n403")
+}
+
+def dmake_node_404() {
+  sh("make n404")
+}
+
+def dmake_node_405() {
+  sh("make n405")
+}
+
+def dmake_node_406() {
+  sh("make n406")
+}
+
+def dmake_node_407() {
+  sh("make n407")
+}
+
+def dmake_node_408() {
+  sh("make n408")
+}
+
+def dmake_node_409() {
+  sh("make n409")
+}
+
+def dmake_node_410() {
+  sh("make n410")
+}
+
+def dmake_node_411() {
+  sh("make n411")
+}
+
+def dmake_node_412() {
+  sh("make n412")
+}
+
+def dmake_node_413() {
+  sh("make n413")
+}
+
+def dmake_node_414() {
+  sh("make n414")
+}
+
+def dmake_node_415() {
+  sh("make n415")
+}
+
+def dmake_node_416() {
+  sh("make n416")
+}
+
+def dmake_node_417() {
+  sh("make n417")
+}
+
+def dmake_node_418() {
+  sh("make n418")
+}
+
+def dmake_node_419() {
+  sh("make n419")
+}
+
+def dmake_node_420() {
+  sh("make n420")
+}
+
+def dmake_node_421() {
+  sh("make n421")
+}
+
+def dmake_node_422() {
+  sh("make n422")
+}
+
+def dmake_node_423() {
+  sh("make n423")
+}
+
+def dmake_node_424() {
+  sh("make n424")
+}
+
+def dmake_node_425() {
+  sh("make n425")
+}
+
+def dmake_node_426() {
+  sh("make n426")
+}
+
+def dmake_node_427() {
+  sh("make n427")
+}
+
+def dmake_node_428() {
+  sh("make n428")
+}
+
+def dmake_node_429() {
+  sh("make n429")
+}
+
+def dmake_node_430() {
+  sh("make n430")
+}
+
+def dmake_node_431() {
+  sh("make n431")
+}
+
+def dmake_node_432() {
+  sh("make n432")
+}
+
+def dmake_node_433() {
+  sh("make n433")
+}
+
+def dmake_node_434() {
+  sh("make n434")
+}
+
+def dmake_node_435() {
+  sh("make n435")
+}
+
+def dmake_node_436() {
+  sh("make n436")
+}
+
+def dmake_node_437() {
+  sh("make n437")
+}
+
+def dmake_node_438() {
+  sh("make n438")
+}
+
+def dmake_node_439() {
+  sh("make n439")
+}
+
+def dmake_node_440() {
+  sh("make n440")
+}
+
+def dmake_node_441() {
+  sh("make n441")
+}
+
+def dmake_node_442() {
+  sh("make n442")
+}
+
+def dmake_node_443() {
+  sh("make n443")
+}
+
+def dmake_node_444() {
+  sh("make n444")
+}
+
+def dmake_node_445() {
+  sh("make n445")
+}
+
+def dmake_node_446() {
+  sh("make n446")
+}
+
+def dmake_node_447() {
+  sh("make n447")
+}
+
+def dmake_node_448() {
+  sh("make n448")
+}
+
+def dmake_node_449() {
+  sh("make n449")
+}
+
+def dmake_node_450() {
+  sh("make n450")
+}
+
+def dmake_node_451() {
+  sh("make n451")
+}
+
+def dmake_node_452() {
+  sh("make n452")
+}
+
+def dmake_node_453() {
+  sh("make n453")
+}
+
+def dmake_node_454() {
+  sh("make n454")
+}
+
+def dmake_node_455() {
+  sh("make n455")
+}
+
+def dmake_node_456() {
+  sh("make n456")
+}
+
+def dmake_node_457() {
+  sh("make n457")
+}
+
+def dmake_node_458() {
+  sh("make n458")
+}
+
+def dmake_node_459() {
+  sh("make n459")
+}
+
+def dmake_node_460() {
+  sh("make n460")
+}
+
+def dmake_node_461() {
+  sh("make n461")
+}
+
+def dmake_node_462() {
+  sh("make n462")
+}
+
+def dmake_node_463() {
+  sh("make n463")
+}
+
+def dmake_node_464() {
+  sh("make n464")
+}
+
+def dmake_node_465() {
+  sh("make n465")
+}
+
+def dmake_node_466() {
+  sh("make n466")
+}
+
+def dmake_node_467() {
+  sh("make n467")
+}
+
+def dmake_node_468() {
+  sh("make n468")
+}
+
+def dmake_node_469() {
+  sh("make n469")
+}
+
+def dmake_node_470() {
+  sh("make n470")
+}
+
+def dmake_node_471() {
+  sh("make n471")
+}
+
+def dmake_node_472() {
+  sh("make n472")
+}
+
+def dmake_node_473() {
+  sh("make n473")
+}
+
+def dmake_node_474() {
+  sh("make n474")
+}
+
+def dmake_node_475() {
+  sh("make n475")
+}
+
+def dmake_node_476() {
+  sh("make n476")
+}
+
+def dmake_node_477() {
+  sh("make n477")
+}
+
+def dmake_node_478() {
+  sh("make n478")
+}
+
+def dmake_node_479() {
+  sh("make n479")
+}
+
+def dmake_node_480() {
+  sh("make n480")
+}
+
+def dmake_node_481() {
+  sh("make n481")
+}
+
+def dmake_node_482() {
+  sh("make n482")
+}
+
+def dmake_node_483() {
+  sh("make n483")
+}
+
+def dmake_node_484() {
+  sh("make n484")
+}
+
+def dmake_node_485() {
+  sh("make n485")
+}
+
+def dmake_node_486() {
+  sh("make n486")
+}
+
+def dmake_node_487() {
+  sh("make n487")
+}
+
+def dmake_node_488() {
+  sh("make n488")
+}
+
+def dmake_node_489() {
+  sh("make n489")
+}
+
+def dmake_node_490() {
+  sh("make n490")
+}
+
+def dmake_node_491() {
+  sh("make n491")
+}
+
+def dmake_node_492() {
+  sh("make n492")
+}
+
+def dmake_node_493() {
+  sh("make n493")
+}
+
+def dmake_node_494() {
+  sh("make n494")
+}
+
+def dmake_node_495() {
+  sh("make n495")
+}
+
+def dmake_node_496() {
+  sh("make n496")
+}
+
+def dmake_node_497() {
+  sh("make n497")
+}
+
+def dmake_node_498() {
+  sh("make n498")
+}
+
+def dmake_node_499() {
+  sh("make n499")
+}
+
+def dmake_node_500() {
+  sh("make n500")
+}
+
+def dmake_node_501() {
+  sh("make n501")
+}
+
+def dmake_node_502() {
+  sh("make n502")
+}
+
+def dmake_node_503() {
+  sh("make n503")
+}
+
+def dmake_node_504() {
+  sh("make n504")
+}
+
+def dmake_node_505() {
+  sh("make n505")
+}
+
+def dmake_node_506() {
+  sh("make n506")
+}
+
+def dmake_node_507() {
+  sh("make n507")
+}
+
+def dmake_node_508() {
+  sh("make n508")
+}
+
+def dmake_node_509() {
+  sh("make n509")
+}
+
+def dmake_node_510() {
+  sh("make n510")
+}
+
+def dmake_node_511() {
+  sh("make n511")
+}
+
+def dmake_node_512() {
+  sh("make n512")
+}
+
+def dmake_node_513() {
+  sh("make n513")
+}
+
+def dmake_node_514() {
+  sh("make n514")
+}
+
+def dmake_node_515() {
+  sh("make n515")
+}
+
+def dmake_node_516() {
+  sh("make n516")
+}
+
+def dmake_node_517() {
+  sh("make n517")
+}
+
+def dmake_node_518() {
+  sh("make n518")
+}
+
+def dmake_node_519() {
+  sh("make n519")
+}
+
+def dmake_node_520() {
+  sh("make n520")
+}
+
+def dmake_node_521() {
+  sh("make n521")
+}
+
+def dmake_node_522() {
+  sh("make n522")
+}
+
+def dmake_node_523() {
+  sh("make n523")
+}
+
+def dmake_node_524() {
+  sh("make n524")
+}
+
+def dmake_node_525() {
+  sh("make n525")
+}
+
+def dmake_node_526() {
+  sh("make n526")
+}
+
+def dmake_node_527() {
+  sh("make n527")
+}
+
+def dmake_node_528() {
+  sh("make n528")
+}
+
+def dmake_node_529() {
+  sh("make n529")
+}
+
+def dmake_node_530() {
+  sh("make n530")
+}
+
+def dmake_node_531() {
+  sh("make n531")
+}
+
+def dmake_node_532() {
+  sh("make n532")
+}
+
+def dmake_node_533() {
+  sh("make n533")
+}
+
+def dmake_node_534() {
+  sh("make n534")
+}
+
+def dmake_node_535() {
+  sh("make n535")
+}
+
+def dmake_node_536() {
+  sh("make n536")
+}
+
+def dmake_node_537() {
+  sh("make n537")
+}
+
+def dmake_node_538() {
+  sh("make n538")
+}
+
+def dmake_node_539() {
+  sh("make n539")
+}
+
+def dmake_node_540() {
+  sh("make n540")
+}
+
+def dmake_node_541() {
+  sh("make n541")
+}
+
+def dmake_node_542() {
+  sh("make n542")
+}
+
+def dmake_node_543() {
+  sh("make n543")
+}
+
+def dmake_node_544() {
+  sh("make n544")
+}
+
+def dmake_node_545() {
+  sh("make n545")
+}
+
+def dmake_node_546() {
+  sh("make n546")
+}
+
+def dmake_node_547() {
+  sh("make n547")
+}
+
+def dmake_node_548() {
+  sh("make n548")
+}
+
+def dmake_node_549() {
+  sh("make n549")
+}
+
+def dmake_node_550() {
+  sh("make n550")
+}
+
+def dmake_node_551() {
+  sh("make n551")
+}
+
+def dmake_node_552() {
+  sh("make n552")
+}
+
+def dmake_node_553() {
+  sh("make n553")
+}
+
+def dmake_node_554() {
+  sh("make n554")
+}
+
+def dmake_node_555() {
+  sh("make n555")
+}
+
+def dmake_node_556() {
+  sh("make n556")
+}
+
+def dmake_node_557() {
+  sh("make n557")
+}
+
+def dmake_node_558() {
+  sh("make n558")
+}
+
+def dmake_node_559() {
+  sh("make n559")
+}
+
+def dmake_node_560() {
+  sh("make n560")
+}
+
+def dmake_node_561() {
+  sh("make n561")
+}
+
+def dmake_node_562() {
+  sh("make n562")
+}
+
+def dmake_node_563() {
+  sh("make n563")
+}
+
+def dmake_node_564() {
+  sh("make n564")
+}
+
+def dmake_node_565() {
+  sh("make n565")
+}
+
+def dmake_node_566() {
+  sh("make n566")
+}
+
+def dmake_node_567() {
+  sh("make n567")
+}
+
+def dmake_node_568() {
+  sh("make n568")
+}
+
+def dmake_node_569() {
+  sh("make n569")
+}
+
+def dmake_node_570() {
+  sh("make n570")
+}
+
+def dmake_node_571() {
+  sh("make n571")
+}
+
+def dmake_node_572() {
+  sh("make n572")
+}
+
+def dmake_node_573() {
+  sh("make n573")
+}
+
+def dmake_node_574() {
+  sh("make n574")
+}
+
+def dmake_node_575() {
+  sh("make n575")
+}
+
+def dmake_node_576() {
+  sh("make n576")
+}
+
+def dmake_node_577() {
+  sh("make n577")
+}
+
+def dmake_node_578() {
+  sh("make n578")
+}
+
+def dmake_node_579() {
+  sh("make n579")
+}
+
+def dmake_node_580() {
+  sh("make n580")
+}
+
+def dmake_node_581() {
+  sh("make n581")
+}
+
+def dmake_node_582() {
+  sh("make n582")
+}
+
+def dmake_node_583() {
+  sh("make n583")
+}
+
+def dmake_node_584() {
+  sh("make n584")
+}
+
+def dmake_node_585() {
+  sh("make n585")
+}
+
+def dmake_node_586() {
+  sh("make n586")
+}
+
+def dmake_node_587() {
+  sh("make n587")
+}
+
+def dmake_node_588() {
+  sh("make n588")
+}
+
+def dmake_node_589() {
+  sh("make n589")
+}
+
+def dmake_node_590() {
+  sh("make n590")
+}
+
+def dmake_node_591() {
+  sh("make n591")
+}
+
+def dmake_node_592() {
+  sh("make n592")
+}
+
+def dmake_node_593() {
+  sh("make n593")
+}
+
+def dmake_node_594() {
+  sh("make n594")
+}
+
+def dmake_node_595() {
+  sh("make n595")
+}
+
+def dmake_node_596() {
+  sh("make n596")
+}
+
+def dmake_node_597() {
+  sh("make n597")
+}
+
+def dmake_node_598() {
+  sh("make n598")
+}
+
+def dmake_node_599() {
+  sh("make n599")
+}
+
+def dmake_node_600() {
+  sh("make n600")
+}
+
+def dmake_node_601() {
+  sh("make n601")
+}
+
+def dmake_node_602() {
+  sh("make n602")
+}
+
+def dmake_node_603() {
+  sh("make n603")
+}
+
+def dmake_node_604() {
+  sh("make n604")
+}
+
+def dmake_node_605() {
+  sh("make n605")
+}
+
+def dmake_node_606() {
+  sh("make n606")
+}
+
+def dmake_node_607() {
+  sh("make n607")
+}
+
+def dmake_node_608() {
+  sh("make n608")
+}
+
+def dmake_node_609() {
+  sh("make n609")
+}
+
+def dmake_node_610() {
+  sh("make n610")
+}
+
+def dmake_node_611() {
+  sh("make n611")
+}
+
+def dmake_node_612() {
+  sh("make n612")
+}
+
+def dmake_node_613() {
+  sh("make n613")
+}
+
+def dmake_node_614() {
+  sh("make n614")
+}
+
+def dmake_node_615() {
+  sh("make n615")
+}
+
+def dmake_node_616() {
+  sh("make n616")
+}
+
+def dmake_node_617() {
+  sh("make n617")
+}
+
+def dmake_node_618() {
+  sh("make n618")
+}
+
+def dmake_node_619() {
+  sh("make n619")
+}
+
+def dmake_node_620() {
+  sh("make n620")
+}
+
+def dmake_node_621() {
+  sh("make n621")
+}
+
+def dmake_node_622() {
+  sh("make n622")
+}
+
+def dmake_node_623() {
+  sh("make n623")
+}
+
+def dmake_node_624() {
+  sh("make n624")
+}
+
+def dmake_node_625() {
+  sh("make n625")
+}
+
+def dmake_node_626() {
+  sh("make n626")
+}
+
+def dmake_node_627() {
+  sh("make n627")
+}
+
+def dmake_node_628() {
+  sh("make n628")
+}
+
+def dmake_node_629() {
+  sh("make n629")
+}
+
+def dmake_node_630() {
+  sh("make n630")
+}
+
+def dmake_node_631() {
+  sh("make n631")
+}
+
+def dmake_node_632() {
+  sh("make n632")
+}
+
+def dmake_node_633() {
+  sh("make n633")
+}
+
+def dmake_node_634() {
+  sh("make n634")
+}
+
+def dmake_node_635() {
+  sh("make n635")
+}
+
+def dmake_node_636() {
+  sh("make n636")
+}
+
+def dmake_node_637() {
+  sh("make n637")
+}
+
+def dmake_node_638() {
+  sh("make n638")
+}
+
+def dmake_node_639() {
+  sh("make n639")
+}
+
+def dmake_node_640() {
+  sh("make n640")
+}
+
+def dmake_node_641() {
+  sh("make n641")
+}
+
+def dmake_node_642() {
+  sh("make n642")
+}
+
+def dmake_node_643() {
+  sh("make n643")
+}
+
+def dmake_node_644() {
+  sh("make n644")
+}
+
+def dmake_node_645() {
+  sh("make n645")
+}
+
+def dmake_node_646() {
+  sh("make n646")
+}
+
+def dmake_node_647() {
+  sh("make n647")
+}
+
+def dmake_node_648() {
+  sh("make n648")
+}
+
+def dmake_node_649() {
+  sh("make n649")
+}
+
+def dmake_node_650() {
+  sh("make n650")
+}
+
+def dmake_node_651() {
+  sh("make n651")
+}
+
+def dmake_node_652() {
+  sh("make n652")
+}
+
+def dmake_node_653() {
+  sh("make n653")
+}
+
+def dmake_node_654() {
+  sh("make n654")
+}
+
+def dmake_node_655() {
+  sh("make n655")
+}
+
+def dmake_node_656() {
+  sh("make n656")
+}
+
+def dmake_node_657() {
+  sh("make n657")
+}
+
+def dmake_node_658() {
+  sh("make n658")
+}
+
+def dmake_node_659() {
+  sh("make n659")
+}
+
+def dmake_node_660() {
+  sh("make n660")
+}
+
+def dmake_node_661() {
+  sh("make n661")
+}
+
+def dmake_node_662() {
+  sh("make n662")
+}
+
+def dmake_node_663() {
+  sh("make n663")
+}
+
+def dmake_node_664() {
+  sh("make n664")
+}
+
+def dmake_node_665() {
+  sh("make n665")
+}
+
+def dmake_node_666() {
+  sh("make n666")
+}
+
+def dmake_node_667() {
+  sh("make n667")
+}
+
+def dmake_node_668() {
+  sh("make n668")
+}
+
+def dmake_node_669() {
+  sh("make n669")
+}
+
+def dmake_node_670() {
+  sh("make n670")
+}
+
+def dmake_node_671() {
+  sh("make n671")
+}
+
+def dmake_node_672() {
+  sh("make n672")
+}
+
+def dmake_node_673() {
+  sh("make n673")
+}
+
+def dmake_node_674() {
+  sh("make n674")
+}
+
+def dmake_node_675() {
+  sh("make n675")
+}
+
+def dmake_node_676() {
+  sh("make n676")
+}
+
+def dmake_node_677() {
+  sh("make n677")
+}
+
+def dmake_node_678() {
+  sh("make n678")
+}
+
+def dmake_node_679() {
+  sh("make n679")
+}
+
+def dmake_node_680() {
+  sh("make n680")
+}
+
+def dmake_node_681() {
+  sh("make n681")
+}
+
+def dmake_node_682() {
+  sh("make n682")
+}
+
+def dmake_node_683() {
+  sh("make n683")
+}
+
+def dmake_node_684() {
+  sh("make n684")
+}
+
+def dmake_node_685() {
+  sh("make n685")
+}
+
+def dmake_node_686() {
+  sh("make n686")
+}
+
+def dmake_node_687() {
+  sh("make n687")
+}
+
+def dmake_node_688() {
+  sh("make n688")
+}
+
+def dmake_node_689() {
+  sh("make n689")
+}
+
+def dmake_node_690() {
+  sh("make n690")
+}
+
+def dmake_node_691() {
+  sh("make n691")
+}
+
+def dmake_node_692() {
+  sh("make n692")
+}
+
+def dmake_node_693() {
+  sh("make n693")
+}
+
+def dmake_node_694() {
+  sh("make n694")
+}
+
+def dmake_node_695() {
+  sh("make n695")
+}
+
+def dmake_node_696() {
+  sh("make n696")
+}
+
+def dmake_node_697() {
+  sh("make n697")
+}
+
+def dmake_node_698() {
+  sh("make n698")
+}
+
+def dmake_node_699() {
+  sh("make n699")
+}
+
+def dmake_node_700() {
+  sh("make n700")
+}
+
+def dmake_node_701() {
+  sh("make n701")
+}
+
+def dmake_node_702() {
+  sh("make n702")
+}
+
+def dmake_node_703() {
+  sh("make n703")
+}
+
+def dmake_node_704() {
+  sh("make n704")
+}
+
+def dmake_node_705() {
+  sh("make n705")
+}
+
+def dmake_node_706() {
+  sh("make n706")
+}
+
+def dmake_node_707() {
+  sh("make n707")
+}
+
+def dmake_node_708() {
+  sh("make n708")
+}
+
+def dmake_node_709() {
+  sh("make n709")
+}
+
+def dmake_node_710() {
+  sh("make n710")
+}
+
+def dmake_node_711() {
+  sh("make n711")
+}
+
+def dmake_node_712() {
+  sh("make n712")
+}
+
+def dmake_node_713() {
+  sh("make n713")
+}
+
+def dmake_node_714() {
+  sh("make n714")
+}
+
+def dmake_node_715() {
+  sh("make n715")
+}
+
+def dmake_node_716() {
+  sh("make n716")
+}
+
+def dmake_node_717() {
+  sh("make n717")
+}
+
+def dmake_node_718() {
+  sh("make n718")
+}
+
+def dmake_node_719() {
+  sh("make n719")
+}
+
+def dmake_node_720() {
+  sh("make n720")
+}
+
+def dmake_node_721() {
+  sh("make n721")
+}
+
+def dmake_node_722() {
+  sh("make n722")
+}
+
+def dmake_node_723() {
+  sh("make n723")
+}
+
+def dmake_node_724() {
+  sh("make n724")
+}
+
+def dmake_node_725() {
+  sh("make n725")
+}
+
+def dmake_node_726() {
+  sh("make n726")
+}
+
+def dmake_node_727() {
+  sh("make n727")
+}
+
+def dmake_node_728() {
+  sh("make n728")
+}
+
+def dmake_node_729() {
+  sh("make n729")
+}
+
+def dmake_node_730() {
+  sh("make n730")
+}
+
+def dmake_node_731() {
+  sh("make n731")
+}
+
+def dmake_node_732() {
+  sh("make n732")
+}
+
+def dmake_node_733() {
+  sh("make n733")
+}
+
+def dmake_node_734() {
+  sh("make n734")
+}
+
+def dmake_node_735() {
+  sh("make n735")
+}
+
+def dmake_node_736() {
+  sh("make n736")
+}
+
+def dmake_node_737() {
+  sh("make n737")
+}
+
+def dmake_node_738() {
+  sh("make n738")
+}
+
+def dmake_node_739() {
+  sh("make n739")
+}
+
+def dmake_node_740() {
+  sh("make n740")
+}
+
+def dmake_node_741() {
+  sh("make n741")
+}
+
+def dmake_node_742() {
+  sh("make n742")
+}
+
+def dmake_node_743() {
+  sh("make n743")
+}
+
+def dmake_node_744() {
+  sh("make n744")
+}
+
+def dmake_node_745() {
+  sh("make n745")
+}
+
+def dmake_node_746() {
+  sh("make n746")
+}
+
+def dmake_node_747() {
+  sh("make n747")
+}
+
+def dmake_node_748() {
+  sh("make n748")
+}
+
+def dmake_node_749() {
+  sh("make n749")
+}
+
+def dmake_node_750() {
+  sh("make n750")
+}
+
+def dmake_node_751() {
+  sh("make n751")
+}
+
+def dmake_node_752() {
+  sh("make n752")
+}
+
+def dmake_node_753() {
+  sh("make n753")
+}
+
+def dmake_node_754() {
+  sh("make n754")
+}
+
+def dmake_node_755() {
+  sh("make n755")
+}
+
+def dmake_node_756() {
+  sh("make n756")
+}
+
+def dmake_node_757() {
+  sh("make n757")
+}
+
+def dmake_node_758() {
+  sh("make n758")
+}
+
+def dmake_node_759() {
+  sh("make n759")
+}
+
+def dmake_node_760() {
+  sh("make n760")
+}
+
+def dmake_node_761() {
+  sh("make n761")
+}
+
+def dmake_node_762() {
+  sh("make n762")
+}
+
+def dmake_node_763() {
+  sh("make n763")
+}
+
+def dmake_node_764() {
+  sh("make n764")
+}
+
+def dmake_node_765() {
+  sh("make n765")
+}
+
+def dmake_node_766() {
+  sh("make n766")
+}
+
+def dmake_node_767() {
+  sh("make n767")
+}
+
+def dmake_node_768() {
+  sh("make n768")
+}
+
+def dmake_node_769() {
+  sh("make n769")
+}
+
+def dmake_node_770() {
+  sh("make n770")
+}
+
+def dmake_node_771() {
+  sh("make n771")
+}
+
+def dmake_node_772() {
+  sh("make n772")
+}
+
+def dmake_node_773() {
+  sh("make n773")
+}
+
+def dmake_node_774() {
+  sh("make n774")
+}
+
+def dmake_node_775() {
+  sh("make n775")
+}
+
+def dmake_node_776() {
+  sh("make n776")
+}
+
+def dmake_node_777() {
+  sh("make n777")
+}
+
+def dmake_node_778() {
+  sh("make n778")
+}
+
+def dmake_node_779() {
+  sh("make n779")
+}
+
+def dmake_node_780() {
+  sh("make n780")
+}
+
+def dmake_node_781() {
+  sh("make n781")
+}
+
+def dmake_node_782() {
+  sh("make n782")
+}
+
+def dmake_node_783() {
+  sh("make n783")
+}
+
+def dmake_node_784() {
+  sh("make n784")
+}
+
+def dmake_node_785() {
+  sh("make n785")
+}
+
+def dmake_node_786() {
+  sh("make n786")
+}
+
+def dmake_node_787() {
+  sh("make n787")
+}
+
+def dmake_node_788() {
+  sh("make n788")
+}
+
+def dmake_node_789() {
+  sh("make n789")
+}
+
+def dmake_node_790() {
+  sh("make n790")
+}
+
+def dmake_node_791() {
+  sh("make n791")
+}
+
+def dmake_node_792() {
+  sh("make n792")
+}
+
+def dmake_node_793() {
+  sh("make n793")
+}
+
+def dmake_node_794() {
+  sh("make n794")
+}
+
+def dmake_node_795() {
+  sh("make n795")
+}
+
+def dmake_node_796() {
+  sh("make n796")
+}
+
+def dmake_node_797() {
+  sh("make n797")
+}
+
+def dmake_node_798() {
+  sh("make n798")
+}
+
+def dmake_node_799() {
+  sh("make n799")
+}
+
+def dmake_node_800() {
+  sh("make n800")
+}
+
+def dmake_node_801() {
+  sh("make n801")
+}
+
+def dmake_node_802() {
+  sh("make n802")
+}
+
+def dmake_node_803() {
+  sh("make n803")
+}
+
+def dmake_node_804() {
+  sh("make n804")
+}
+
+def dmake_node_805() {
+  sh("make n805")
+}
+
+def dmake_node_806() {
+  sh("make n806")
+}
+
+def dmake_node_807() {
+  sh("make n807")
+}
+
+def dmake_node_808() {
+  sh("make n808")
+}
+
+def dmake_node_809() {
+  sh("make n809")
+}
+
+def dmake_node_810() {
+  sh("make n810")
+}
+
+def dmake_node_811() {
+  sh("make n811")
+}
+
+def dmake_node_812() {
+  sh("make n812")
+}
+
+def dmake_node_813() {
+  sh("make n813")
+}
+
+def dmake_node_814() {
+  sh("make n814")
+}
+
+def dmake_node_815() {
+  sh("make n815")
+}
+
+def dmake_node_816() {
+  sh("make n816")
+}
+
+def dmake_node_817() {
+  sh("make n817")
+}
+
+def dmake_node_818() {
+  sh("make n818")
+}
+
+def dmake_node_819() {
+  sh("make n819")
+}
+
+def dmake_node_820() {
+  sh("make n820")
+}
+
+def dmake_node_821() {
+  sh("make n821")
+}
+
+def dmake_node_822() {
+  sh("make n822")
+}
+
+def dmake_node_823() {
+  sh("make n823")
+}
+
+def dmake_node_824() {
+  sh("make n824")
+}
+
+def dmake_node_825() {
+  sh("make n825")
+}
+
+def dmake_node_826() {
+  sh("make n826")
+}
+
+def dmake_node_827() {
+  sh("make n827")
+}
+
+def dmake_node_828() {
+  sh("make n828")
+}
+
+def dmake_node_829() {
+  sh("make n829")
+}
+
+def dmake_node_830() {
+  sh("make n830")
+}
+
+def dmake_node_831() {
+  sh("make n831")
+}
+
+def dmake_node_832() {
+  sh("make n832")
+}
+
+def dmake_node_833() {
+  sh("make n833")
+}
+
+def dmake_node_834() {
+  sh("make n834")
+}
+
+def dmake_node_835() {
+  sh("make n835")
+}
+
+def dmake_node_836() {
+  sh("make n836")
+}
+
+def dmake_node_837() {
+  sh("make n837")
+}
+
+def dmake_node_838() {
+  sh("make n838")
+}
+
+def dmake_node_839() {
+  sh("make n839")
+}
+
+def dmake_node_840() {
+  sh("make n840")
+}
+
+def dmake_node_841() {
+  sh("make n841")
+}
+
+def dmake_node_842() {
+  sh("make n842")
+}
+
+def dmake_node_843() {
+  sh("make n843")
+}
+
+def dmake_node_844() {
+  sh("make n844")
+}
+
+def dmake_node_845() {
+  sh("make n845")
+}
+
+def dmake_node_846() {
+  sh("make n846")
+}
+
+def dmake_node_847() {
+  sh("make n847")
+}
+
+def dmake_node_848() {
+  sh("make n848")
+}
+
+def dmake_node_849() {
+  sh("make n849")
+}
+
+def dmake_node_850() {
+  sh("make n850")
+}
+
+def dmake_node_851() {
+  sh("make n851")
+}
+
+def dmake_node_852() {
+  sh("make n852")
+}
+
+def dmake_node_853() {
+  sh("make n853")
+}
+
+def dmake_node_854() {
+  sh("make n854")
+}
+
+def dmake_node_855() {
+  sh("make n855")
+}
+
+def dmake_node_856() {
+  sh("make n856")
+}
+
+def dmake_node_857() {
+  sh("make n857")
+}
+
+def dmake_node_858() {
+  sh("make n858")
+}
+
+def dmake_node_859() {
+  sh("make n859")
+}
+
+def dmake_node_860() {
+  sh("make n860")
+}
+
+def dmake_node_861() {
+  sh("make n861")
+}
+
+def dmake_node_862() {
+  sh("make n862")
+}
+
+def dmake_node_863() {
+  sh("make n863")
+}
+
+def dmake_node_864() {
+  sh("make n864")
+}
+
+def dmake_node_865() {
+  sh("make n865")
+}
+
+def dmake_node_866() {
+  sh("make n866")
+}
+
+def dmake_node_867() {
+  sh("make n867")
+}
+
+def dmake_node_868() {
+  sh("make n868")
+}
+
+def dmake_node_869() {
+  sh("make n869")
+}
+
+def dmake_node_870() {
+  sh("make n870")
+}
+
+def dmake_node_871() {
+  sh("make n871")
+}
+
+def dmake_node_872() {
+  sh("make n872")
+}
+
+def dmake_node_873() {
+  sh("make n873")
+}
+
+def dmake_node_874() {
+  sh("make n874")
+}
+
+def dmake_node_875() {
+  sh("make n875")
+}
+
+def dmake_node_876() {
+  sh("make n876")
+}
+
+def dmake_node_877() {
+  sh("make n877")
+}
+
+def dmake_node_878() {
+  sh("make n878")
+}
+
+def dmake_node_879() {
+  sh("make n879")
+}
+
+def dmake_node_880() {
+  sh("make n880")
+}
+
+def dmake_node_881() {
+  sh("make n881")
+}
+
+def dmake_node_882() {
+  sh("make n882")
+}
+
+def dmake_node_883() {
+  sh("make n883")
+}
+
+def dmake_node_884() {
+  sh("make n884")
+}
+
+def dmake_node_885() {
+  sh("make n885")
+}
+
+def dmake_node_886() {
+  sh("make n886")
+}
+
+def dmake_node_887() {
+  sh("make n887")
+}
+
+def dmake_node_888() {
+  sh("make n888")
+}
+
+def dmake_node_889() {
+  sh("make n889")
+}
+
+def dmake_node_890() {
+  sh("make n890")
+}
+
+def dmake_node_891() {
+  sh("make n891")
+}
+
+def dmake_node_892() {
+  sh("make n892")
+}
+
+def dmake_node_893() {
+  sh("make n893")
+}
+
+def dmake_node_894() {
+  sh("make n894")
+}
+
+def dmake_node_895() {
+  sh("make n895")
+}
+
+def dmake_node_896() {
+  sh("make n896")
+}
+
+def dmake_node_897() {
+  sh("make n897")
+}
+
+def dmake_node_898() {
+  sh("make n898")
+}
+
+def dmake_node_899() {
+  sh("make n899")
+}
+
+def dmake_node_900() {
+  sh("make n900")
+}
+
+def dmake_node_901() {
+  sh("make n901")
+}
+
+def dmake_node_902() {
+  sh("make n902")
+}
+
+def dmake_node_903() {
+  sh("make n903")
+}
+
+def dmake_node_904() {
+  sh("make n904")
+}
+
+def dmake_node_905() {
+  sh("make n905")
+}
+
+def dmake_node_906() {
+  sh("make n906")
+}
+
+def dmake_node_907() {
+  sh("make n907")
+}
+
+def dmake_node_908() {
+  sh("make n908")
+}
+
+def dmake_node_909() {
+  sh("make n909")
+}
+
+def dmake_node_910() {
+  sh("make n910")
+}
+
+def dmake_node_911() {
+  sh("make n911")
+}
+
+def dmake_node_912() {
+  sh("make n912")
+}
+
+def dmake_node_913() {
+  sh("make n913")
+}
+
+def dmake_node_914() {
+  sh("make n914")
+}
+
+def dmake_node_915() {
+  sh("make n915")
+}
+
+def dmake_node_916() {
+  sh("make n916")
+}
+
+def dmake_node_917() {
+  sh("make n917")
+}
+
+def dmake_node_918() {
+  sh("make n918")
+}
+
+def dmake_node_919() {
+  sh("make n919")
+}
+
+def dmake_node_920() {
+  sh("make n920")
+}
+
+def dmake_node_921() {
+  sh("make n921")
+}
+
+def dmake_node_922() {
+  sh("make n922")
+}
+
+def dmake_node_923() {
+  sh("make n923")
+}
+
+def dmake_node_924() {
+  sh("make n924")
+}
+
+def dmake_node_925() {
+  sh("make n925")
+}
+
+def dmake_node_926() {
+  sh("make n926")
+}
+
+def dmake_node_927() {
+  sh("make n927")
+}
+
+def dmake_node_928() {
+  sh("make n928")
+}
+
+def dmake_node_929() {
+  sh("make n929")
+}
+
+def dmake_node_930() {
+  sh("make n930")
+}
+
+def dmake_node_931() {
+  sh("make n931")
+}
+
+def dmake_node_932() {
+  sh("make n932")
+}
+
+def dmake_node_933() {
+  sh("make n933")
+}
+
+def dmake_node_934() {
+  sh("make n934")
+}
+
+def dmake_node_935() {
+  sh("make n935")
+}
+
+def dmake_node_936() {
+  sh("make n936")
+}
+
+def dmake_node_937() {
+  sh("make n937")
+}
+
+def dmake_node_938() {
+  sh("make n938")
+}
+
+def dmake_node_939() {
+  sh("make n939")
+}
+
+def dmake_node_940() {
+  sh("make n940")
+}
+
+def dmake_node_941() {
+  sh("make n941")
+}
+
+def dmake_node_942() {
+  sh("make n942")
+}
+
+def dmake_node_943() {
+  sh("make n943")
+}
+
+def dmake_node_944() {
+  sh("make n944")
+}
+
+def dmake_node_945() {
+  sh("make n945")
+}
+
+def dmake_node_946() {
+  sh("make n946")
+}
+
+def dmake_node_947() {
+  sh("make n947")
+}
+
+def dmake_node_948() {
+  sh("make n948")
+}
+
+def dmake_node_949() {
+  sh("make n949")
+}
+
+def dmake_node_950() {
+  sh("make n950")
+}
+
+def dmake_node_951() {
+  sh("make n951")
+}
+
+def dmake_node_952() {
+  sh("make n952")
+}
+
+def dmake_node_953() {
+  sh("make n953")
+}
+
+def dmake_node_954() {
+  sh("make n954")
+}
+
+def dmake_node_955() {
+  sh("make n955")
+}
+
+def dmake_node_956() {
+  sh("make n956")
+}
+
+def dmake_node_957() {
+  sh("make n957")
+}
+
+def dmake_node_958() {
+  sh("make n958")
+}
+
+def dmake_node_959() {
+  sh("make n959")
+}
+
+def dmake_node_960() {
+  sh("make n960")
+}
+
+def dmake_node_961() {
+  sh("make n961")
+}
+
+def dmake_node_962() {
+  sh("make n962")
+}
+
+def dmake_node_963() {
+  sh("make n963")
+}
+
+def dmake_node_964() {
+  sh("make n964")
+}
+
+def dmake_node_965() {
+  sh("make n965")
+}
+
+def dmake_node_966() {
+  sh("make n966")
+}
+
+def dmake_node_967() {
+  sh("make n967")
+}
+
+def dmake_node_968() {
+  sh("make n968")
+}
+
+def dmake_node_969() {
+  sh("make n969")
+}
+
+def dmake_node_970() {
+  sh("make n970")
+}
+
+def dmake_node_971() {
+  sh("make n971")
+}
+
+def dmake_node_972() {
+  sh("make n972")
+}
+
+def dmake_node_973() {
+  sh("make n973")
+}
+
+def dmake_node_974() {
+  sh("make n974")
+}
+
+def dmake_node_975() {
+  sh("make n975")
+}
+
+def dmake_node_976() {
+  sh("make n976")
+}
+
+def dmake_node_977() {
+  sh("make n977")
+}
+
+def dmake_node_978() {
+  sh("make n978")
+}
+
+def dmake_node_979() {
+  sh("make n979")
+}
+
+def dmake_node_980() {
+  sh("make n980")
+}
+
+def dmake_node_981() {
+  sh("make n981")
+}
+
+def dmake_node_982() {
+  sh("make n982")
+}
+
+def dmake_node_983() {
+  sh("make n983")
+}
+
+def dmake_node_984() {
+  sh("make n984")
+}
+
+def dmake_node_985() {
+  sh("make n985")
+}
+
+def dmake_node_986() {
+  sh("make n986")
+}
+
+def dmake_node_987() {
+  sh("make n987")
+}
+
+def dmake_node_988() {
+  sh("make n988")
+}
+
+def dmake_node_989() {
+  sh("make n989")
+}
+
+def dmake_node_990() {
+  sh("make n990")
+}
+
+def dmake_node_991() {
+  sh("make n991")
+}
+
+def dmake_node_992() {
+  sh("make n992")
+}
+
+def dmake_node_993() {
+  sh("make n993")
+}
+
+def dmake_node_994() {
+  sh("make n994")
+}
+
+def dmake_node_995() {
+  sh("make n995")
+}
+
+def dmake_node_996() {
+  sh("make n996")
+}
+
+def dmake_node_997() {
+  sh("make n997")
+}
+
+def dmake_node_998() {
+  sh("make n998")
+}
+
+def dmake_node_999() {
+  sh("make n999")
+}
+
+def dmake_chunk_0() {
+  dmake_node_0()
+  dmake_node_1()
+  dmake_node_2()
+  dmake_node_3()
+  dmake_node_4()
+  dmake_node_5()
+  dmake_node_6()
+  dmake_node_7()
+  dmake_node_8()
+  dmake_node_9()
+  dmake_node_10()
+  dmake_node_11()
+  dmake_node_12()
+  dmake_node_13()
+  dmake_node_14()
+  dmake_node_15()
+  dmake_node_16()
+  dmake_node_17()
+  dmake_node_18()
+  dmake_node_19()
+  dmake_node_20()
+  dmake_node_21()
+  dmake_node_22()
+  dmake_node_23()
+  dmake_node_24()
+  dmake_node_25()
+  dmake_node_26()
+  dmake_node_27()
+  dmake_node_28()
+  dmake_node_29()
+  dmake_node_30()
+  dmake_node_31()
+  dmake_node_32()
+  dmake_node_33()
+  dmake_node_34()
+  dmake_node_35()
+  dmake_node_36()
+  dmake_node_37()
+  dmake_node_38()
+  dmake_node_39()
+  dmake_node_40()
+  dmake_node_41()
+  dmake_node_42()
+  dmake_node_43()
+  dmake_node_44()
+  dmake_node_45()
+  dmake_node_46()
+  dmake_node_47()
+  dmake_node_48()
+  dmake_node_49()
+}
+
+def dmake_chunk_1() {
+  dmake_node_50()
+  dmake_node_51()
+  dmake_node_52()
+  dmake_node_53()
+  dmake_node_54()
+  dmake_node_55()
+  dmake_node_56()
+  dmake_node_57()
+  dmake_node_58()
+  dmake_node_59()
+  dmake_node_60()
+  dmake_node_61()
+  dmake_node_62()
+  dmake_node_63()
+  dmake_node_64()
+  dmake_node_65()
+  dmake_node_66()
+  dmake_node_67()
+  dmake_node_68()
+  dmake_node_69()
+  dmake_node_70()
+  dmake_node_71()
+  dmake_node_72()
+  dmake_node_73()
+  dmake_node_74()
+  dmake_node_75()
+  dmake_node_76()
+  dmake_node_77()
+  dmake_node_78()
+  dmake_node_79()
+  dmake_node_80()
+  dmake_node_81()
+  dmake_node_82()
+  dmake_node_83()
+  dmake_node_84()
+  dmake_node_85()
+  dmake_node_86()
+  dmake_node_87()
+  dmake_node_88()
+  dmake_node_89()
+  dmake_node_90()
+  dmake_node_91()
+  dmake_node_92()
+  dmake_node_93()
+  dmake_node_94()
+  dmake_node_95()
+  dmake_node_96()
+  dmake_node_97()
+  dmake_node_98()
+  dmake_node_99()
+}
+
+def dmake_chunk_2() {
+  dmake_node_100()
+  dmake_node_101()
+  dmake_node_102()
+  dmake_node_103()
+  dmake_node_104()
+  dmake_node_105()
+  dmake_node_106()
+  dmake_node_107()
+  dmake_node_108()
+  dmake_node_109()
+  dmake_node_110()
+  dmake_node_111()
+  dmake_node_112()
+  dmake_node_113()
+  dmake_node_114()
+  dmake_node_115()
+  dmake_node_116()
+  dmake_node_117()
+  dmake_node_118()
+  dmake_node_119()
+  dmake_node_120()
+  dmake_node_121()
+  dmake_node_122()
+  dmake_node_123()
+  dmake_node_124()
+  dmake_node_125()
+  dmake_node_126()
+  dmake_node_127()
+  dmake_node_128()
+  dmake_node_129()
+  dmake_node_130()
+  dmake_node_131()
+  dmake_node_132()
+  dmake_node_133()
+  dmake_node_134()
+  dmake_node_135()
+  dmake_node_136()
+  dmake_node_137()
+  dmake_node_138()
+  dmake_node_139()
+  dmake_node_140()
+  dmake_node_141()
+  dmake_node_142()
+  dmake_node_143()
+  dmake_node_144()
+  dmake_node_145()
+  dmake_node_146()
+  dmake_node_147()
+  dmake_node_148()
+  dmake_node_149()
+}
+
+def dmake_chunk_3() {
+  dmake_node_150()
+  dmake_node_151()
+  dmake_node_152()
+  dmake_node_153()
+  dmake_node_154()
+  dmake_node_155()
+  dmake_node_156()
+  dmake_node_157()
+  dmake_node_158()
+  dmake_node_159()
+  dmake_node_160()
+  dmake_node_161()
+  dmake_node_162()
+  dmake_node_163()
+  dmake_node_164()
+  dmake_node_165()
+  dmake_node_166()
+  dmake_node_167()
+  dmake_node_168()
+  dmake_node_169()
+  dmake_node_170()
+  dmake_node_171()
+  dmake_node_172()
+  dmake_node_173()
+  dmake_node_174()
+  dmake_node_175()
+  dmake_node_176()
+  dmake_node_177()
+  dmake_node_178()
+  dmake_node_179()
+  dmake_node_180()
+  dmake_node_181()
+  dmake_node_182()
+  dmake_node_183()
+  dmake_node_184()
+  dmake_node_185()
+  dmake_node_186()
+  dmake_node_187()
+  dmake_node_188()
+  dmake_node_189()
+  dmake_node_190()
+  dmake_node_191()
+  dmake_node_192()
+  dmake_node_193()
+  dmake_node_194()
+  dmake_node_195()
+  dmake_node_196()
+  dmake_node_197()
+  dmake_node_198()
+  dmake_node_199()
+}
+
+def dmake_chunk_4() {
+  dmake_node_200()
+  dmake_node_201()
+  dmake_node_202()
+  dmake_node_203()
+  dmake_node_204()
+  dmake_node_205()
+  dmake_node_206()
+  dmake_node_207()
+  dmake_node_208()
+  dmake_node_209()
+  dmake_node_210()
+  dmake_node_211()
+  dmake_node_212()
+  dmake_node_213()
+  dmake_node_214()
+  dmake_node_215()
+  dmake_node_216()
+  dmake_node_217()
+  dmake_node_218()
+  dmake_node_219()
+  dmake_node_220()
+  dmake_node_221()
+  dmake_node_222()
+  dmake_node_223()
+  dmake_node_224()
+  dmake_node_225()
+  dmake_node_226()
+  dmake_node_227()
+  dmake_node_228()
+  dmake_node_229()
+  dmake_node_230()
+  dmake_node_231()
+  dmake_node_232()
+  dmake_node_233()
+  dmake_node_234()
+  dmake_node_235()
+  dmake_node_236()
+  dmake_node_237()
+  dmake_node_238()
+  dmake_node_239()
+  dmake_node_240()
+  dmake_node_241()
+  dmake_node_242()
+  dmake_node_243()
+  dmake_node_244()
+  dmake_node_245()
+  dmake_node_246()
+  dmake_node_247()
+  dmake_node_248()
+  dmake_node_249()
+}
+
+def dmake_chunk_5() {
+  dmake_node_250()
+  dmake_node_251()
+  dmake_node_252()
+  dmake_node_253()
+  dmake_node_254()
+  dmake_node_255()
+  dmake_node_256()
+  dmake_node_257()
+  dmake_node_258()
+  dmake_node_259()
+  dmake_node_260()
+  dmake_node_261()
+  dmake_node_262()
+  dmake_node_263()
+  dmake_node_264()
+  dmake_node_265()
+  dmake_node_266()
+  dmake_node_267()
+  dmake_node_268()
+  dmake_node_269()
+  dmake_node_270()
+  dmake_node_271()
+  dmake_node_272()
+  dmake_node_273()
+  dmake_node_274()
+  dmake_node_275()
+  dmake_node_276()
+  dmake_node_277()
+  dmake_node_278()
+  dmake_node_279()
+  dmake_node_280()
+  dmake_node_281()
+  dmake_node_282()
+  dmake_node_283()
+  dmake_node_284()
+  dmake_node_285()
+  dmake_node_286()
+  dmake_node_287()
+  dmake_node_288()
+  dmake_node_289()
+  dmake_node_290()
+  dmake_node_291()
+  dmake_node_292()
+  dmake_node_293()
+  dmake_node_294()
+  dmake_node_295()
+  dmake_node_296()
+  dmake_node_297()
+  dmake_node_298()
+  dmake_node_299()
+}
+
+def dmake_chunk_6() {
+  dmake_node_300()
+  dmake_node_301()
+  dmake_node_302()
+  dmake_node_303()
+  dmake_node_304()
+  dmake_node_305()
+  dmake_node_306()
+  dmake_node_307()
+  dmake_node_308()
+  dmake_node_309()
+  dmake_node_310()
+  dmake_node_311()
+  dmake_node_312()
+  dmake_node_313()
+  dmake_node_314()
+  dmake_node_315()
+  dmake_node_316()
+  dmake_node_317()
+  dmake_node_318()
+  dmake_node_319()
+  dmake_node_320()
+  dmake_node_321()
+  dmake_node_322()
+  dmake_node_323()
+  dmake_node_324()
+  dmake_node_325()
+  dmake_node_326()
+  dmake_node_327()
+  dmake_node_328()
+  dmake_node_329()
+  dmake_node_330()
+  dmake_node_331()
+  dmake_node_332()
+  dmake_node_333()
+  dmake_node_334()
+  dmake_node_335()
+  dmake_node_336()
+  dmake_node_337()
+  dmake_node_338()
+  dmake_node_339()
+  dmake_node_340()
+  dmake_node_341()
+  dmake_node_342()
+  dmake_node_343()
+  dmake_node_344()
+  dmake_node_345()
+  dmake_node_346()
+  dmake_node_347()
+  dmake_node_348()
+  dmake_node_349()
+}
+
+def dmake_chunk_7() {
+  dmake_node_350()
+  dmake_node_351()
+  dmake_node_352()
+  dmake_node_353()
+  dmake_node_354()
+  dmake_node_355()
+  dmake_node_356()
+  dmake_node_357()
+  dmake_node_358()
+  dmake_node_359()
+  dmake_node_360()
+  dmake_node_361()
+  dmake_node_362()
+  dmake_node_363()
+  dmake_node_364()
+  dmake_node_365()
+  dmake_node_366()
+  dmake_node_367()
+  dmake_node_368()
+  dmake_node_369()
+  dmake_node_370()
+  dmake_node_371()
+  dmake_node_372()
+  dmake_node_373()
+  dmake_node_374()
+  dmake_node_375()
+  dmake_node_376()
+  dmake_node_377()
+  dmake_node_378()
+  dmake_node_379()
+  dmake_node_380()
+  dmake_node_381()
+  dmake_node_382()
+  dmake_node_383()
+  dmake_node_384()
+  dmake_node_385()
+  dmake_node_386()
+  dmake_node_387()
+  dmake_node_388()
+  dmake_node_389()
+  dmake_node_390()
+  dmake_node_391()
+  dmake_node_392()
+  dmake_node_393()
+  dmake_node_394()
+  dmake_node_395()
+  dmake_node_396()
+  dmake_node_397()
+  dmake_node_398()
+  dmake_node_399()
+}
+
+def dmake_chunk_8() {
+  dmake_node_400()
+  dmake_node_401()
+  dmake_node_402()
+  dmake_node_403()
+  dmake_node_404()
+  dmake_node_405()
+  dmake_node_406()
+  dmake_node_407()
+  dmake_node_408()
+  dmake_node_409()
+  dmake_node_410()
+  dmake_node_411()
+  dmake_node_412()
+  dmake_node_413()
+  dmake_node_414()
+  dmake_node_415()
+  dmake_node_416()
+  dmake_node_417()
+  dmake_node_418()
+  dmake_node_419()
+  dmake_node_420()
+  dmake_node_421()
+  dmake_node_422()
+  dmake_node_423()
+  dmake_node_424()
+  dmake_node_425()
+  dmake_node_426()
+  dmake_node_427()
+  dmake_node_428()
+  dmake_node_429()
+  dmake_node_430()
+  dmake_node_431()
+  dmake_node_432()
+  dmake_node_433()
+  dmake_node_434()
+  dmake_node_435()
+  dmake_node_436()
+  dmake_node_437()
+  dmake_node_438()
+  dmake_node_439()
+  dmake_node_440()
+  dmake_node_441()
+  dmake_node_442()
+  dmake_node_443()
+  dmake_node_444()
+  dmake_node_445()
+  dmake_node_446()
+  dmake_node_447()
+  dmake_node_448()
+  dmake_node_449()
+}
+
+def dmake_chunk_9() {
+  dmake_node_450()
+  dmake_node_451()
+  dmake_node_452()
+  dmake_node_453()
+  dmake_node_454()
+  dmake_node_455()
+  dmake_node_456()
+  dmake_node_457()
+  dmake_node_458()
+  dmake_node_459()
+  dmake_node_460()
+  dmake_node_461()
+  dmake_node_462()
+  dmake_node_463()
+  dmake_node_464()
+  dmake_node_465()
+  dmake_node_466()
+  dmake_node_467()
+  dmake_node_468()
+  dmake_node_469()
+  dmake_node_470()
+  dmake_node_471()
+  dmake_node_472()
+  dmake_node_473()
+  dmake_node_474()
+  dmake_node_475()
+  dmake_node_476()
+  dmake_node_477()
+  dmake_node_478()
+  dmake_node_479()
+  dmake_node_480()
+  dmake_node_481()
+  dmake_node_482()
+  dmake_node_483()
+  dmake_node_484()
+  dmake_node_485()
+  dmake_node_486()
+  dmake_node_487()
+  dmake_node_488()
+  dmake_node_489()
+  dmake_node_490()
+  dmake_node_491()
+  dmake_node_492()
+  dmake_node_493()
+  dmake_node_494()
+  dmake_node_495()
+  dmake_node_496()
+  dmake_node_497()
+  dmake_node_498()
+  dmake_node_499()
+}
+
+def dmake_chunk_10() {
+  dmake_node_500()
+  dmake_node_501()
+  dmake_node_502()
+  dmake_node_503()
+  dmake_node_504()
+  dmake_node_505()
+  dmake_node_506()
+  dmake_node_507()
+  dmake_node_508()
+  dmake_node_509()
+  dmake_node_510()
+  dmake_node_511()
+  dmake_node_512()
+  dmake_node_513()
+  dmake_node_514()
+  dmake_node_515()
+  dmake_node_516()
+  dmake_node_517()
+  dmake_node_518()
+  dmake_node_519()
+  dmake_node_520()
+  dmake_node_521()
+  dmake_node_522()
+  dmake_node_523()
+  dmake_node_524()
+  dmake_node_525()
+  dmake_node_526()
+  dmake_node_527()
+  dmake_node_528()
+  dmake_node_529()
+  dmake_node_530()
+  dmake_node_531()
+  dmake_node_532()
+  dmake_node_533()
+  dmake_node_534()
+  dmake_node_535()
+  dmake_node_536()
+  dmake_node_537()
+  dmake_node_538()
+  dmake_node_539()
+  dmake_node_540()
+  dmake_node_541()
+  dmake_node_542()
+  dmake_node_543()
+  dmake_node_544()
+  dmake_node_545()
+  dmake_node_546()
+  dmake_node_547()
+  dmake_node_548()
+  dmake_node_549()
+}
+
+def dmake_chunk_11() {
+  dmake_node_550()
+  dmake_node_551()
+  dmake_node_552()
+  dmake_node_553()
+  dmake_node_554()
+  dmake_node_555()
+  dmake_node_556()
+  dmake_node_557()
+  dmake_node_558()
+  dmake_node_559()
+  dmake_node_560()
+  dmake_node_561()
+  dmake_node_562()
+  dmake_node_563()
+  dmake_node_564()
+  dmake_node_565()
+  dmake_node_566()
+  dmake_node_567()
+  dmake_node_568()
+  dmake_node_569()
+  dmake_node_570()
+  dmake_node_571()
+  dmake_node_572()
+  dmake_node_573()
+  dmake_node_574()
+  dmake_node_575()
+  dmake_node_576()
+  dmake_node_577()
+  dmake_node_578()
+  dmake_node_579()
+  dmake_node_580()
+  dmake_node_581()
+  dmake_node_582()
+  dmake_node_583()
+  dmake_node_584()
+  dmake_node_585()
+  dmake_node_586()
+  dmake_node_587()
+  dmake_node_588()
+  dmake_node_589()
+  dmake_node_590()
+  dmake_node_591()
+  dmake_node_592()
+  dmake_node_593()
+  dmake_node_594()
+  dmake_node_595()
+  dmake_node_596()
+  dmake_node_597()
+  dmake_node_598()
+  dmake_node_599()
+}
+
+def dmake_chunk_12() {
+  dmake_node_600()
+  dmake_node_601()
+  dmake_node_602()
+  dmake_node_603()
+  dmake_node_604()
+  dmake_node_605()
+  dmake_node_606()
+  dmake_node_607()
+  dmake_node_608()
+  dmake_node_609()
+  dmake_node_610()
+  dmake_node_611()
+  dmake_node_612()
+  dmake_node_613()
+  dmake_node_614()
+  dmake_node_615()
+  dmake_node_616()
+  dmake_node_617()
+  dmake_node_618()
+  dmake_node_619()
+  dmake_node_620()
+  dmake_node_621()
+  dmake_node_622()
+  dmake_node_623()
+  dmake_node_624()
+  dmake_node_625()
+  dmake_node_626()
+  dmake_node_627()
+  dmake_node_628()
+  dmake_node_629()
+  dmake_node_630()
+  dmake_node_631()
+  dmake_node_632()
+  dmake_node_633()
+  dmake_node_634()
+  dmake_node_635()
+  dmake_node_636()
+  dmake_node_637()
+  dmake_node_638()
+  dmake_node_639()
+  dmake_node_640()
+  dmake_node_641()
+  dmake_node_642()
+  dmake_node_643()
+  dmake_node_644()
+  dmake_node_645()
+  dmake_node_646()
+  dmake_node_647()
+  dmake_node_648()
+  dmake_node_649()
+}
+
+def dmake_chunk_13() {
+  dmake_node_650()
+  dmake_node_651()
+  dmake_node_652()
+  dmake_node_653()
+  dmake_node_654()
+  dmake_node_655()
+  dmake_node_656()
+  dmake_node_657()
+  dmake_node_658()
+  dmake_node_659()
+  dmake_node_660()
+  dmake_node_661()
+  dmake_node_662()
+  dmake_node_663()
+  dmake_node_664()
+  dmake_node_665()
+  dmake_node_666()
+  dmake_node_667()
+  dmake_node_668()
+  dmake_node_669()
+  dmake_node_670()
+  dmake_node_671()
+  dmake_node_672()
+  dmake_node_673()
+  dmake_node_674()
+  dmake_node_675()
+  dmake_node_676()
+  dmake_node_677()
+  dmake_node_678()
+  dmake_node_679()
+  dmake_node_680()
+  dmake_node_681()
+  dmake_node_682()
+  dmake_node_683()
+  dmake_node_684()
+  dmake_node_685()
+  dmake_node_686()
+  dmake_node_687()
+  dmake_node_688()
+  dmake_node_689()
+  dmake_node_690()
+  dmake_node_691()
+  dmake_node_692()
+  dmake_node_693()
+  dmake_node_694()
+  dmake_node_695()
+  dmake_node_696()
+  dmake_node_697()
+  dmake_node_698()
+  dmake_node_699()
+}
+
+def dmake_chunk_14() {
+  dmake_node_700()
+  dmake_node_701()
+  dmake_node_702()
+  dmake_node_703()
+  dmake_node_704()
+  dmake_node_705()
+  dmake_node_706()
+  dmake_node_707()
+  dmake_node_708()
+  dmake_node_709()
+  dmake_node_710()
+  dmake_node_711()
+  dmake_node_712()
+  dmake_node_713()
+  dmake_node_714()
+  dmake_node_715()
+  dmake_node_716()
+  dmake_node_717()
+  dmake_node_718()
+  dmake_node_719()
+  dmake_node_720()
+  dmake_node_721()
+  dmake_node_722()
+  dmake_node_723()
+  dmake_node_724()
+  dmake_node_725()
+  dmake_node_726()
+  dmake_node_727()
+  dmake_node_728()
+  dmake_node_729()
+  dmake_node_730()
+  dmake_node_731()
+  dmake_node_732()
+  dmake_node_733()
+  dmake_node_734()
+  dmake_node_735()
+  dmake_node_736()
+  dmake_node_737()
+  dmake_node_738()
+  dmake_node_739()
+  dmake_node_740()
+  dmake_node_741()
+  dmake_node_742()
+  dmake_node_743()
+  dmake_node_744()
+  dmake_node_745()
+  dmake_node_746()
+  dmake_node_747()
+  dmake_node_748()
+  dmake_node_749()
+}
+
+def dmake_chunk_15() {
+  dmake_node_750()
+  dmake_node_751()
+  dmake_node_752()
+  dmake_node_753()
+  dmake_node_754()
+  dmake_node_755()
+  dmake_node_756()
+  dmake_node_757()
+  dmake_node_758()
+  dmake_node_759()
+  dmake_node_760()
+  dmake_node_761()
+  dmake_node_762()
+  dmake_node_763()
+  dmake_node_764()
+  dmake_node_765()
+  dmake_node_766()
+  dmake_node_767()
+  dmake_node_768()
+  dmake_node_769()
+  dmake_node_770()
+  dmake_node_771()
+  dmake_node_772()
+  dmake_node_773()
+  dmake_node_774()
+  dmake_node_775()
+  dmake_node_776()
+  dmake_node_777()
+  dmake_node_778()
+  dmake_node_779()
+  dmake_node_780()
+  dmake_node_781()
+  dmake_node_782()
+  dmake_node_783()
+  dmake_node_784()
+  dmake_node_785()
+  dmake_node_786()
+  dmake_node_787()
+  dmake_node_788()
+  dmake_node_789()
+  dmake_node_790()
+  dmake_node_791()
+  dmake_node_792()
+  dmake_node_793()
+  dmake_node_794()
+  dmake_node_795()
+  dmake_node_796()
+  dmake_node_797()
+  dmake_node_798()
+  dmake_node_799()
+}
+
+def dmake_chunk_16() {
+  dmake_node_800()
+  dmake_node_801()
+  dmake_node_802()
+  dmake_node_803()
+  dmake_node_804()
+  dmake_node_805()
+  dmake_node_806()
+  dmake_node_807()
+  dmake_node_808()
+  dmake_node_809()
+  dmake_node_810()
+  dmake_node_811()
+  dmake_node_812()
+  dmake_node_813()
+  dmake_node_814()
+  dmake_node_815()
+  dmake_node_816()
+  dmake_node_817()
+  dmake_node_818()
+  dmake_node_819()
+  dmake_node_820()
+  dmake_node_821()
+  dmake_node_822()
+  dmake_node_823()
+  dmake_node_824()
+  dmake_node_825()
+  dmake_node_826()
+  dmake_node_827()
+  dmake_node_828()
+  dmake_node_829()
+  dmake_node_830()
+  dmake_node_831()
+  dmake_node_832()
+  dmake_node_833()
+  dmake_node_834()
+  dmake_node_835()
+  dmake_node_836()
+  dmake_node_837()
+  dmake_node_838()
+  dmake_node_839()
+  dmake_node_840()
+  dmake_node_841()
+  dmake_node_842()
+  dmake_node_843()
+  dmake_node_844()
+  dmake_node_845()
+  dmake_node_846()
+  dmake_node_847()
+  dmake_node_848()
+  dmake_node_849()
+}
+
+def dmake_chunk_17() {
+  dmake_node_850()
+  dmake_node_851()
+  dmake_node_852()
+  dmake_node_853()
+  dmake_node_854()
+  dmake_node_855()
+  dmake_node_856()
+  dmake_node_857()
+  dmake_node_858()
+  dmake_node_859()
+  dmake_node_860()
+  dmake_node_861()
+  dmake_node_862()
+  dmake_node_863()
+  dmake_node_864()
+  dmake_node_865()
+  dmake_node_866()
+  dmake_node_867()
+  dmake_node_868()
+  dmake_node_869()
+  dmake_node_870()
+  dmake_node_871()
+  dmake_node_872()
+  dmake_node_873()
+  dmake_node_874()
+  dmake_node_875()
+  dmake_node_876()
+  dmake_node_877()
+  dmake_node_878()
+  dmake_node_879()
+  dmake_node_880()
+  dmake_node_881()
+  dmake_node_882()
+  dmake_node_883()
+  dmake_node_884()
+  dmake_node_885()
+  dmake_node_886()
+  dmake_node_887()
+  dmake_node_888()
+  dmake_node_889()
+  dmake_node_890()
+  dmake_node_891()
+  dmake_node_892()
+  dmake_node_893()
+  dmake_node_894()
+  dmake_node_895()
+  dmake_node_896()
+  dmake_node_897()
+  dmake_node_898()
+  dmake_node_899()
+}
+
+def dmake_chunk_18() {
+  dmake_node_900()
+  dmake_node_901()
+  dmake_node_902()
+  dmake_node_903()
+  dmake_node_904()
+  dmake_node_905()
+  dmake_node_906()
+  dmake_node_907()
+  dmake_node_908()
+  dmake_node_909()
+  dmake_node_910()
+  dmake_node_911()
+  dmake_node_912()
+  dmake_node_913()
+  dmake_node_914()
+  dmake_node_915()
+  dmake_node_916()
+  dmake_node_917()
+  dmake_node_918()
+  dmake_node_919()
+  dmake_node_920()
+  dmake_node_921()
+  dmake_node_922()
+  dmake_node_923()
+  dmake_node_924()
+  dmake_node_925()
+  dmake_node_926()
+  dmake_node_927()
+  dmake_node_928()
+  dmake_node_929()
+  dmake_node_930()
+  dmake_node_931()
+  dmake_node_932()
+  dmake_node_933()
+  dmake_node_934()
+  dmake_node_935()
+  dmake_node_936()
+  dmake_node_937()
+  dmake_node_938()
+  dmake_node_939()
+  dmake_node_940()
+  dmake_node_941()
+  dmake_node_942()
+  dmake_node_943()
+  dmake_node_944()
+  dmake_node_945()
+  dmake_node_946()
+  dmake_node_947()
+  dmake_node_948()
+  dmake_node_949()
+}
+
+def dmake_chunk_19() {
+  dmake_node_950()
+  dmake_node_951()
+  dmake_node_952()
+  dmake_node_953()
+  dmake_node_954()
+  dmake_node_955()
+  dmake_node_956()
+  dmake_node_957()
+  dmake_node_958()
+  dmake_node_959()
+  dmake_node_960()
+  dmake_node_961()
+  dmake_node_962()
+  dmake_node_963()
+  dmake_node_964()
+  dmake_node_965()
+  dmake_node_966()
+  dmake_node_967()
+  dmake_node_968()
+  dmake_node_969()
+  dmake_node_970()
+  dmake_node_971()
+  dmake_node_972()
+  dmake_node_973()
+  dmake_node_974()
+  dmake_node_975()
+  dmake_node_976()
+  dmake_node_977()
+  dmake_node_978()
+  dmake_node_979()
+  dmake_node_980()
+  dmake_node_981()
+  dmake_node_982()
+  dmake_node_983()
+  dmake_node_984()
+  dmake_node_985()
+  dmake_node_986()
+  dmake_node_987()
+  dmake_node_988()
+  dmake_node_989()
+  dmake_node_990()
+  dmake_node_991()
+  dmake_node_992()
+  dmake_node_993()
+  dmake_node_994()
+  dmake_node_995()
+  dmake_node_996()
+  dmake_node_997()
+  dmake_node_998()
+  dmake_node_999()
+}
@@ -0,0 +1,78 @@
+import pytest
+
+from dmake import cli, common, core, deepobuild, files_cache
+
+
+@pytest.fixture
+def loaded_files(monkeypatch):
+    args = cli.argparser.parse_args(['test', '*'])
+    common.init(args)
+    monkeypatch.setattr(files_cache, 'enabled', False)
+    deepobuild.reset()
+    common.is_release_branch = None
+    loaded_files = core.make(args, parse_files_only=True)
+    monkeypatch.setattr(common, 'force_full_deploy', False)
+    yield loaded_files
+    deepobuild.reset()
+
+
+def find_active(loaded_files, monkeypatch, changed_paths):
+    """Return the activated files and services, for the `changed_paths` (None: unknown changes)."""
+    activated = []
+    monkeypatch.setattr(core, 'activate_file', lambda loaded_files, service_providers, service_dependencies, command, file: activated.append(file))
+    monkeypatch.setattr(core, 'activate_service', lambda loaded_files, service_providers, service_dependencies, command, service: activated.append(service))
+    monkeypatch.setattr(common, 'change_detection_override_dirs', changed_paths)
+    if changed_paths is None:
+        monkeypatch.setattr(core, 'look_for_changed_directories', lambda: None)
+    core.find_active_files(loaded_files, {}, {}, '', 'test')
+    return activated
+
+
+def set_sources(loaded_files, service_name, sources):
+    for service in loaded_files['test/web/dmake.yml'].get_services():
+        if service.service_name == service_name:
+            service._set_field_('sources', sources)
+
+
+def test_directory_level(loaded_files, monkeypatch):
+    assert find_active(loaded_files, monkeypatch, ['test/web/app']) == [
+        'test/web/dmake.yml',
+        # additional build context: `test/`
+        'dmake-test/test-worker:ubuntu-1804',
+        'dmake-test/test-worker:ubuntu-2004',
+    ]
+    assert find_active(loaded_files, monkeypatch, ['test/web2']) == []
+    assert find_active(loaded_files, monkeypatch, ['test/worker/src/main.cpp']) == ['test/worker/dmake.yml']
+
+
+def test_unknown_changes(loaded_files, monkeypatch):
+    assert find_active(loaded_files, monkeypatch, None) == list(loaded_files)
+
+
+def test_sources(loaded_files, monkeypatch):
+    set_sources(loaded_files, 'test-web', ['test/web/web', 'test/web/manage.py'])
+    # other services of the file: still directory-level
+    assert find_active(loaded_files, monkeypatch, ['test/web/app/views.py']) == [
+        'dmake-test/test-web2',
+        'dmake-test/test-worker:ubuntu-1804',
+        'dmake-test/test-worker:ubuntu-2004',
+    ]
+    assert find_active(loaded_files, monkeypatch, ['test/web/manage.py']) == [
+        'dmake-test/test-web',
+        'dmake-test/test-web2',
+        'dmake-test/test-worker:ubuntu-1804',
+        'dmake-test/test-worker:ubuntu-2004',
+    ]
+    assert find_active(loaded_files, monkeypatch, ['test/web/web/settings.py'])[:2] == ['dmake-test/test-web', 'dmake-test/test-web2']
+    # component-aware: `test/web/web` is not a prefix of `test/web/web2`
+    assert find_active(loaded_files, monkeypatch, ['test/web/web2/file'])[:1] == ['dmake-test/test-web2']
+
+
+def test_sources_outside_of_the_dmake_file_directory(loaded_files, monkeypatch):
+    set_sources(loaded_files, 'test-web', ['test/worker/src'])
+    set_sources(loaded_files, 'test-web2', ['test/web/app'])
+    assert find_active(loaded_files, monkeypatch, ['test/worker/src/main.cpp']) == ['dmake-test/test-web', 'test/worker/dmake.yml']
+    assert find_active(loaded_files, monkeypatch, ['test/web/web']) == [
+        'dmake-test/test-worker:ubuntu-1804',
+        'dmake-test/test-worker:ubuntu-2004',
+    ]
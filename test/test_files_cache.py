@@ -0,0 +1,216 @@
+import logging
+import pathlib
+
+import pytest
+
+from dmake import cli, common, core, deepobuild, files_cache, serializer
+from dmake.deepobuild import DMakeFile, LinkNames, SharedVolumes
+
+
+def to_data(value):
+    """Plain data view of validated objects, to compare them."""
+    if isinstance(value, serializer.YAML2PipelineSerializer):
+        if not value.has_value():
+            return None
+        return {k: to_data(getattr(value, k)) for k in value.__schema__}
+    if isinstance(value, list):
+        return [to_data(v) for v in value]
+    if isinstance(value, dict):
+        return {k: to_data(v) for k, v in value.items()}
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return type(value).__name__
+
+
+def registries():
+    return (sorted((name, volume.id) for name, volume in SharedVolumes.volumes.items()),
+            sorted((name, kind, file) for name, (kind, _, file) in LinkNames.link_names.items()))
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    args = cli.argparser.parse_args(['test', '*'])
+    common.init(args)
+    monkeypatch.setattr(common, 'cache_dir', str(tmp_path))
+    monkeypatch.setattr(files_cache, 'enabled', True)
+    monkeypatch.setattr(files_cache, 'entries', None)
+    monkeypatch.setattr(files_cache, 'pending_hashes', {})
+    yield args
+    deepobuild.reset()
+
+
+def load_files(args):
+    deepobuild.reset()
+    common.is_release_branch = None
+    loaded_files = core.make(args, parse_files_only=True)
+    return loaded_files, registries()
+
+
+def forget_loaded_entries(monkeypatch):
+    # as if in a new process: read the cache file again
+    monkeypatch.setattr(files_cache, 'entries', None)
+
+
+def test_cached_files_are_equivalent(cache, monkeypatch, caplog):
+    monkeypatch.setattr(files_cache, 'enabled', False)
+    with caplog.at_level(logging.WARNING, logger='dmake'):
+        expected_files, expected_registries = load_files(cache)
+    expected_warnings = [r.getMessage() for r in caplog.records if r.levelno >= logging.WARNING]
+    caplog.clear()
+
+    monkeypatch.setattr(files_cache, 'enabled', True)
+    load_files(cache)
+    assert set(files_cache.entries) == set(expected_files)
+    forget_loaded_entries(monkeypatch)
+
+    def no_validation(self, file, data):
+        raise AssertionError("%s should be loaded from the cache" % file)
+    monkeypatch.setattr(DMakeFile, '_validate_file_', no_validation)
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger='dmake'):
+        cached_files, cached_registries = load_files(cache)
+    assert [r.getMessage() for r in caplog.records if r.levelno >= logging.WARNING] == expected_warnings
+
+    assert list(cached_files) == list(expected_files)
+    for file in expected_files:
+        assert to_data(cached_files[file]) == to_data(expected_files[file])
+    assert cached_registries == expected_registries
+    for dmake_file in cached_files.values():
+        for service in dmake_file.get_services():
+            for needed_service in service.needed_services:
+                assert needed_service._id == hash(needed_service)
+
+
+def get_alone(file):
+    deepobuild.reset()
+    return files_cache.get(file)
+
+
+def test_cache_invalidation(cache, monkeypatch):
+    load_files(cache)
+    file = 'test/web/dmake.yml'
+    assert get_alone(file) is not None
+
+    entry = files_cache.entries[file]
+    monkeypatch.setitem(files_cache.entries, file, dict(entry, hash='modified'))
+    assert get_alone(file) is None
+
+    monkeypatch.setitem(files_cache.entries, file, entry)
+    assert get_alone(file) is not None
+
+    # e.g. a referenced script deleted
+    path, _ = entry['path_statuses'][0]
+    get_path_status = serializer.get_path_status
+    monkeypatch.setattr(serializer, 'get_path_status', lambda p: None if p == path else get_path_status(p))
+    assert get_alone(file) is None
+
+
+def test_code_change_invalidates_cache(cache, monkeypatch, tmp_path):
+    load_files(cache)
+    forget_loaded_entries(monkeypatch)
+    monkeypatch.setattr(files_cache, 'code_version', 'other')
+    assert files_cache.get_entries() == {}
+
+    # a module used by the validation, outside of the serializers
+    modules = files_cache.get_code_modules()
+    assert {'common.py', 'kubernetes.py', 'serializer.py', 'deepobuild.py'} <= set(modules)
+    assert 'test_common.py' not in modules
+    package_dir = tmp_path / 'dmake'
+    for module in modules:
+        (package_dir / module).parent.mkdir(parents=True, exist_ok=True)
+        (package_dir / module).write_bytes(pathlib.Path(files_cache.package_dir, module).read_bytes())
+    monkeypatch.setattr(files_cache, 'package_dir', str(package_dir))
+    monkeypatch.setattr(files_cache, 'code_version', None)
+    load_files(cache)
+    forget_loaded_entries(monkeypatch)
+    assert files_cache.get_entries() != {}
+    with open(str(package_dir / 'common.py'), 'a') as f:
+        f.write('\n# changed\n')
+    forget_loaded_entries(monkeypatch)
+    monkeypatch.setattr(files_cache, 'code_version', None)
+    assert files_cache.get_entries() == {}
+
+
+def test_replay_conflict_restores_registries(cache, monkeypatch):
+    load_files(cache)
+    deepobuild.reset()
+    file = 'test/e2e/dmake.yml'
+    other = object()
+    LinkNames.link_names['test-web'] = ('docker_link', other, 'other/dmake.yml')
+    before = dict(LinkNames.link_names), dict(SharedVolumes.volumes)
+    assert files_cache.get(file) is None
+    assert (LinkNames.link_names, SharedVolumes.volumes) == before
+
+
+def test_cache_disabled(cache, monkeypatch):
+    monkeypatch.setattr(files_cache, 'enabled', False)
+    load_files(cache)
+    assert files_cache.entries is None
+
+
+# parallel validation: the workers results are used like cache entries
+
+@pytest.fixture
+def parallel(cache, monkeypatch):
+    monkeypatch.setattr(files_cache, 'enabled', False)
+    monkeypatch.setattr(core, 'load_jobs_min_files', 1)
+    monkeypatch.setenv('DMAKE_LOAD_JOBS', '3')
+    return cache
+
+
+def test_parallel_validation_is_equivalent(parallel, monkeypatch, caplog):
+    monkeypatch.setenv('DMAKE_LOAD_JOBS', '1')
+    with caplog.at_level(logging.WARNING, logger='dmake'):
+        expected_files, expected_registries = load_files(parallel)
+    expected_warnings = [r.getMessage() for r in caplog.records if r.levelno >= logging.WARNING]
+
+    monkeypatch.setenv('DMAKE_LOAD_JOBS', '3')
+    init = DMakeFile.__init__
+    def only_in_workers(self, file, data, validate_only=False):
+        assert validate_only, "%s should be validated by a worker" % file
+        init(self, file, data, validate_only)
+    monkeypatch.setattr(DMakeFile, '__init__', only_in_workers)
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger='dmake'):
+        files, registries_ = load_files(parallel)
+    assert [r.getMessage() for r in caplog.records if r.levelno >= logging.WARNING] == expected_warnings
+
+    assert list(files) == list(expected_files)
+    for file in expected_files:
+        assert to_data(files[file]) == to_data(expected_files[file])
+    assert registries_ == expected_registries
+
+
+def test_parallel_validation_failure(parallel, monkeypatch):
+    files = core.load_dmake_files_list()
+    read_dmake_file = core.read_dmake_file
+    def fail_in_workers(file):
+        if file == 'test/web/dmake.yml':
+            raise common.DMakeException('invalid')
+        return read_dmake_file(file)
+    monkeypatch.setattr(core, 'read_dmake_file', fail_in_workers)
+    core.prevalidate_dmake_files(files)
+    assert set(core.prevalidated_files) == set(files) - set(['test/web/dmake.yml'])
+
+
+def test_parallel_validation_replay_conflict(parallel):
+    deepobuild.reset()
+    core.prevalidate_dmake_files(core.load_dmake_files_list())
+    file = 'test/e2e/dmake.yml'
+    LinkNames.link_names['test-web'] = ('docker_link', object(), 'other/dmake.yml')
+    before = dict(LinkNames.link_names), dict(SharedVolumes.volumes)
+    assert core.get_prevalidated_dmake_file(file) is None
+    assert (LinkNames.link_names, SharedVolumes.volumes) == before
+
+
+def test_only_files_read_through_get_are_stored(cache, monkeypatch):
+    load_files(cache)
+    file = 'test/web/dmake.yml'
+    entry = files_cache.entries[file]
+    assert get_alone(file) is not None
+    # validating other data for the same file, e.g. in a test
+    deepobuild.reset()
+    data = core.read_dmake_file(file)
+    data['app_name'] = 'other'
+    DMakeFile(file, data)
+    assert files_cache.entries[file] is entry
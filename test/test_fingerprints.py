@@ -0,0 +1,46 @@
+import pytest
+
+from dmake import cli, common, core, dag, deepobuild, files_cache, fingerprint
+
+
+@pytest.fixture
+def loaded_files(monkeypatch):
+    args = cli.argparser.parse_args(['test', '*'])
+    common.init(args)
+    monkeypatch.setattr(files_cache, 'enabled', False)
+    deepobuild.reset()
+    common.is_release_branch = None
+    loaded_files = core.make(args, parse_files_only=True)
+    yield loaded_files
+    deepobuild.reset()
+
+
+def get_fingerprints(loaded_files, nodes):
+    service_providers = {}
+    for _, service, _ in nodes:
+        core.add_service_provider(service_providers, service, 'test/worker/dmake.yml')
+    plan = dag.plan({node: [] for node in nodes}, lambda node: True)
+    fingerprints = fingerprint.get_fingerprints(plan, loaded_files, service_providers)
+    return [fingerprints[plan.graph.index[node]] for node in nodes]
+
+
+NODES = [
+    ('build_docker', 'dmake-test/test-worker:ubuntu-1804', None),
+    ('build_docker', 'dmake-test/test-worker:ubuntu-2004', None),
+    ('test', 'dmake-test/test-worker:ubuntu-1804', None),
+    ('test', 'dmake-test/test-worker:ubuntu-2004', None),
+]
+
+
+def test_fingerprints(loaded_files):
+    fingerprints = get_fingerprints(loaded_files, NODES)
+    assert len(set(fingerprints)) == len(NODES)
+    assert get_fingerprints(loaded_files, NODES) == fingerprints
+
+
+def test_referenced_environment_variables(loaded_files, monkeypatch):
+    # `BUILD_HOSTNAME: ${HOSTNAME}` build arg
+    monkeypatch.setenv('HOSTNAME', 'host1')
+    fingerprints = get_fingerprints(loaded_files, NODES)
+    monkeypatch.setenv('HOSTNAME', 'host2')
+    assert get_fingerprints(loaded_files, NODES)[0] != fingerprints[0]
@@ -0,0 +1,114 @@
+import io
+import os
+import random
+
+import pytest
+
+from dmake import common, core
+from dmake.common import append_command
+from dmake.scheduling import random_dag
+
+resources_path = os.path.join(os.path.dirname(__file__), 'test-resources', 'pipeline')
+nodes_count = 1000
+
+
+pipeline_config = {'build_description': None, 'relative_cache_dir': '.dmake', 'cache_dir': '.dmake'}
+
+
+@pytest.fixture(autouse=True)
+def set_pipeline_config(monkeypatch):
+    for name, value in pipeline_config.items():
+        monkeypatch.setattr(common, name, value, raising=False)
+
+
+# compact nodes, to keep the golden files small
+def get_name(k):
+    return 'n%d' % k
+
+
+def get_node_commands(k):
+    commands = []
+    append_command(commands, 'sh', shell='make %s' % get_name(k))
+    return commands
+
+
+def get_sequential_commands():
+    """A synthetic 1000 nodes plan, shaped like core.make: sequential execution."""
+    commands = []
+    append_command(commands, 'sh', shell='dmake_check_tmp_dir')
+    append_command(commands, 'stage', name='Testing App')
+    for k in range(nodes_count):
+        append_command(commands, 'node', name=get_name(k))
+        commands += get_node_commands(k)
+        append_command(commands, 'node_end')
+    append_command(commands, 'stage_end')
+    return commands
+
+
+def get_dag_commands():
+    """A synthetic 1000 nodes plan, shaped like core.make: parallel execution by dependencies."""
+    children, _ = random_dag(random.Random(0), nodes_count)
+    names = [get_name(k) for k in range(nodes_count)]
+    commands = []
+    append_command(commands, 'sh', shell='dmake_check_tmp_dir')
+    append_command(commands, 'stage', name='Parallel execution')
+    append_command(commands, 'parallel', fail_fast=True)
+    for k in range(nodes_count):
+        append_command(commands, 'parallel_branch', name=names[k])
+        if children[k]:
+            append_command(commands, 'wait_nodes', names=[names[child] for child in children[k]])
+        commands += get_node_commands(k)
+        append_command(commands, 'node_done', name=names[k])
+        append_command(commands, 'parallel_branch_end')
+    append_command(commands, 'parallel_end')
+    append_command(commands, 'stage_end')
+    return commands
+
+
+def generate(commands):
+    f = io.StringIO()
+    stats = core.generate_command_pipeline(f, core.coalesce_sh_commands(commands), split=True)
+    return f.getvalue(), stats
+
+
+def golden_outputs():
+    """Golden file name -> generated Jenkinsfile."""
+    return {
+        'sequential-1000.groovy': generate(get_sequential_commands())[0],
+        'dag-1000.groovy': generate(get_dag_commands())[0],
+    }
+
+
+def generate_resources_pipeline():
+    for name, value in pipeline_config.items():
+        setattr(common, name, value)
+    for name, output in golden_outputs().items():
+        with open(os.path.join(resources_path, name), 'w') as f:
+            f.write(output)
+
+
+def test_golden_outputs():
+    for name, output in golden_outputs().items():
+        with open(os.path.join(resources_path, name)) as f:
+            assert f.read() == output, (
+                "Unexpected Jenkinsfile for '{name}'. If the change is expected, update the golden files with:"
+                "\npython -c 'import test_pipeline_split; test_pipeline_split.generate_resources_pipeline()'".format(name=name))
+
+
+@pytest.mark.parametrize('get_commands', [get_sequential_commands, get_dag_commands])
+def test_split_sizes(get_commands):
+    _, stats = generate(get_commands())
+    # the driver only calls the chunk functions, which call at most pipeline_chunk_size nodes
+    assert stats['driver_lines'] < 50
+    assert stats['max_function_lines'] <= core.pipeline_chunk_size + 2
+    assert stats['functions'] == nodes_count + nodes_count // core.pipeline_chunk_size
+    assert stats['steps'] >= nodes_count
+
+
+@pytest.mark.parametrize('get_commands', [get_sequential_commands, get_dag_commands])
+def test_not_split(get_commands):
+    f = io.StringIO()
+    stats = core.generate_command_pipeline(f, get_commands())
+    assert stats['functions'] == 0
+    assert stats['driver_lines'] == len(f.getvalue().splitlines())
+    assert 'dmake_node_' not in f.getvalue()
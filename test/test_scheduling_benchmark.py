@@ -0,0 +1,35 @@
+import random
+
+from dmake.scheduling import get_critical_paths, random_dag, simulate_dag, simulate_heights
+
+nodes_count = 300
+seeds = range(20)
+
+
+def test_makespan_benchmark():
+    for workers in [4, 16, None]:
+        heights_total = 0.0
+        dag_total = 0.0
+        for seed in seeds:
+            children, durations = random_dag(random.Random(seed), nodes_count)
+            heights_total += simulate_heights(children, durations, workers)
+            dag_total += simulate_dag(children, durations, workers)
+        print("%d nodes, %s workers: makespan by height %.0f, by dependencies %.0f: %.0f%% reduction" % (
+            nodes_count, workers or 'unbounded', heights_total / len(seeds), dag_total / len(seeds),
+            100 * (1 - dag_total / heights_total)))
+        assert dag_total < heights_total
+
+
+def test_critical_path_benchmark():
+    for workers in [4, 16]:
+        plan_order_total = 0.0
+        critical_path_total = 0.0
+        for seed in seeds:
+            children, durations = random_dag(random.Random(seed), nodes_count)
+            priorities = get_critical_paths(children, durations)
+            plan_order_total += simulate_dag(children, durations, workers)
+            critical_path_total += simulate_dag(children, durations, workers, priorities)
+        print("%d nodes, %d workers: makespan in plan order %.0f, critical path first %.0f: %.0f%% reduction" % (
+            nodes_count, workers, plan_order_total / len(seeds), critical_path_total / len(seeds),
+            100 * (1 - critical_path_total / plan_order_total)))
+        assert critical_path_total <= plan_order_total
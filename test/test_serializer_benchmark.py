@@ -0,0 +1,120 @@
+import copy
+import time
+import tracemalloc
+
+import pytest
+
+from dmake import cli, common, deepobuild
+from dmake.serializer import YAML2PipelineSerializer
+
+services_count = 500
+dmake_file_path = 'test/web/dmake.yml'
+
+
+@pytest.fixture
+def dmake_file():
+    """A synthetic dmake file with 500 services."""
+    common.init(cli.argparser.parse_args(['test', '*']))
+    with open(dmake_file_path) as f:
+        data = common.yaml_ordered_load(f)
+    service = data['services'][0]
+    service.pop('needed_services', None)
+    service.pop('needed_links', None)
+    data['services'] = []
+    for i in range(services_count):
+        data['services'].append(copy.deepcopy(service))
+        data['services'][-1]['service_name'] = 'service-%d' % i
+    data.pop('volumes', None)
+    deepobuild.reset()
+    yield deepobuild.DMakeFile(dmake_file_path, data)
+    deepobuild.reset()
+
+
+class DictRecord(object):
+    """The previous storage, for comparison: values in a per object dict, read through `__getattribute__`."""
+    def __init__(self, schema, values):
+        self.__schema__ = schema
+        self.__optional__ = False
+        self.__help_text__ = ''
+        self.__has_value__ = True
+        self.__values__ = values
+
+    def __getattribute__(self, key):
+        if key[0] == '_':
+            return object.__getattribute__(self, key)
+        if key not in object.__getattribute__(self, '__schema__'):
+            return object.__getattribute__(self, key)
+        return object.__getattribute__(self, '__values__')[key]
+
+
+def make_slots_record(value, values):
+    record = value._make_instance_()
+    for k, v in values.items():
+        record._set_field_(k, v)
+    record.__has_value__ = value.has_value()
+    return record
+
+
+def make_dict_record(value, values):
+    record = DictRecord(value.__schema__, values)
+    record.__has_value__ = value.has_value()
+    return record
+
+
+def copy_records(value, make_record):
+    """Copy the validated objects tree with `make_record`, sharing the leaf values."""
+    if isinstance(value, YAML2PipelineSerializer):
+        values = {k: copy_records(getattr(value, k), make_record) for k in value.__schema__} if value.has_value() else {}
+        return make_record(value, values)
+    if isinstance(value, list):
+        return [copy_records(v, make_record) for v in value]
+    if isinstance(value, dict):
+        return {k: copy_records(v, make_record) for k, v in value.items()}
+    return value
+
+
+def read_fields(services):
+    for service in services:
+        service.service_name
+        service.config.docker_image.entrypoint
+        service.config.docker_image.start_script
+        service.tests.commands
+        service.config.readiness_probe.command
+        service.dev.entrypoint
+
+
+def best_time(function, *args, runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def allocated_size(function, *args):
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def test_attribute_access_and_memory_benchmark(dmake_file):
+    services = dmake_file.services
+    assert len(services) == services_count
+    records = copy_records(services, make_dict_record)
+    read_fields(records)
+
+    slots_access = best_time(read_fields, services)
+    dict_access = best_time(read_fields, records)
+    slots_size = allocated_size(copy_records, services, make_slots_record)
+    dict_size = allocated_size(copy_records, services, make_dict_record)
+
+    print("%d services: attribute access %.2f ms (dict records: %.2f ms), objects memory %.0f kB (dict records: %.0f kB)" % (
+        services_count, slots_access * 1000, dict_access * 1000, slots_size / 1024, dict_size / 1024))
+    assert slots_access < dict_access
+    assert slots_size < dict_size
@@ -0,0 +1,55 @@
+import pytest
+
+from dmake import cli, common, core, deepobuild, files_cache
+
+
+@pytest.fixture
+def services(monkeypatch):
+    args = cli.argparser.parse_args(['test', '*'])
+    common.init(args)
+    monkeypatch.setattr(files_cache, 'enabled', False)
+    deepobuild.reset()
+    common.is_release_branch = None
+    loaded_files = core.make(args, parse_files_only=True)
+    yield {service.service_name: service for service in loaded_files['test/worker/dmake.yml'].get_services()}
+    deepobuild.reset()
+
+
+def test_variants_share_the_service_definition(services):
+    first = services['test-worker:ubuntu-1804']
+    second = services['test-worker:ubuntu-2004']
+    for service, variant in [(first, 'ubuntu-1804'), (second, 'ubuntu-2004')]:
+        assert service.is_variant
+        assert service.variant == variant
+        assert service.original_service_name == 'test-worker'
+        assert service.config.docker_image.base_image_variant == variant
+        assert service.config.docker_image.service is service
+        assert service.deploy.service is service
+        assert service.config.docker_image.get_image_name().startswith('dmake-test-worker:')
+        assert service.config.docker_image.get_image_name().endswith('-%s' % variant)
+
+    assert first.config is not second.config
+    assert first.config.docker_image is not second.config.docker_image
+    assert first.tests is second.tests
+    assert first.dev is second.dev
+    assert first.needed_links is second.needed_links
+    assert first.config.ports is second.config.ports
+    assert first.config.docker_image.build is second.config.docker_image.build
+
+
+def test_build_does_not_modify_shared_fields(services, monkeypatch):
+    monkeypatch.setenv('HOSTNAME', 'build-host')
+    first = services['test-worker:ubuntu-1804']
+    second = services['test-worker:ubuntu-2004']
+    build = first.config.docker_image.build
+    build_args = {'BASE_IMAGE': 'base'}
+    commands = []
+    for service in [first, second]:
+        service.config.docker_image.build._serialize_(commands, 'worker/', service.config.docker_image.get_image_name(), build_args)
+    assert build.args == {'BUILD_HOSTNAME': '${HOSTNAME}'}
+    assert build.labels['build-host'] == '${HOSTNAME}'
+    assert build_args == {'BASE_IMAGE': 'base'}
+    assert len(commands) == 2
+    for command in commands:
+        assert '--build-arg=BUILD_HOSTNAME=build-host' in command[1]['shell']
+        assert '--label=build-host=build-host' in command[1]['shell']
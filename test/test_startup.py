@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules only needed to load and generate dmake files
+heavy_modules = ['dmake.core', 'dmake.deepobuild', 'dmake.serializer', 'dmake.docker_image', 'dmake.kubernetes', 'ruamel.yaml']
+
+
+def run_python(script, env=None):
+    full_env = os.environ.copy()
+    full_env['PYTHONPATH'] = root + os.pathsep + full_env.get('PYTHONPATH', '')
+    full_env.update(env or {})
+    return subprocess.check_output([sys.executable, '-c', script], cwd=os.path.dirname(__file__), env=full_env, stderr=subprocess.STDOUT).decode()
+
+
+@pytest.mark.parametrize('args', [['stop'], ['release', 'app'], ['generate-doc', 'usage'], ['completion']])
+def test_light_commands_do_not_import_heavy_modules(args):
+    output = run_python("""
+import os, sys
+import dmake.common as common
+import dmake.cli as cli
+args = cli.argparser.parse_args({args!r})
+common.init(args, early_exit=True)
+print(' '.join(sorted(sys.modules)))
+print(os.path.exists(os.environ['DMAKE_TMP_DIR']))
+print('tmp_dir' in vars(common), 'username' in vars(common))
+""".format(args=args))
+    modules, tmp_dir_exists, computed = output.strip().split('\n')[-3:]
+    modules = modules.split()
+    for module in heavy_modules:
+        assert module not in modules
+    assert tmp_dir_exists == 'False'
+    assert computed == 'False False'
+
+
+def test_lazy_attributes():
+    output = run_python("""
+import os
+import dmake.common as common
+import dmake.cli as cli
+common.init(cli.argparser.parse_args(['stop']), early_exit=True)
+path = os.environ['DMAKE_TMP_DIR']
+assert not os.path.exists(path)
+assert common.tmp_dir == path
+assert os.path.isdir(path)
+sub_dir = common.make_tmp_dir('sub')
+assert sub_dir.startswith(path)
+print(common.username)
+os.system('rm -rf %s' % path)
+""")
+    assert output.strip() == subprocess.check_output(['id', '-un']).decode().strip()
+
+
+def test_startup_benchmark():
+    def best_of(script, runs=3):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            run_python(script)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    cli_startup = best_of("import dmake.cli as cli; cli.argparser.parse_args(['stop'])")
+    full_import = best_of("import dmake.cli, dmake.core, dmake.commands.graph, ruamel.yaml")
+    print("cli startup: %.1f ms, with all modules: %.1f ms" % (cli_startup * 1000, full_import * 1000))
+    assert cli_startup < full_import
+
+
+def test_profile_imports():
+    output = run_python("import dmake.startup_profile as p; p.start(); import dmake.cli", env={'DMAKE_PROFILE_IMPORTS': '1'})
+    assert 'DMake startup profile:' in output
+    assert 'dmake.cli' in output
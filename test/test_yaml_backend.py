@@ -0,0 +1,138 @@
+import os
+import threading
+
+import pytest
+
+from dmake import common, kubernetes, yaml_backend
+
+resources_path = os.path.join(os.path.dirname(__file__), 'test-resources', 'yaml')
+dmake_files = [os.path.join(os.path.dirname(__file__), name, 'dmake.yml') for name in ['web', 'worker', 'e2e', 'k8s', 'gpu']]
+
+strings = {
+    'plain': 'hello',
+    'yaml_1_1_booleans': ['yes', 'no', 'on', 'off', 'y', 'n', 'True'],
+    'numbers_like': ['0777', '0x1F', '1e3', '1_000', '190:20:30', '.inf', '1.2.3', '09'],
+    'nulls_like': ['', '~', 'null'],
+    'special': ['- item', 'key: value', '#comment', '@at', '`backquote`', "it's", '"quoted"', ' leading space', 'trailing space '],
+    'multiline': 'first line\n  indented\n\nlast line\n',
+    'long': 'word ' * 30,
+    'unicode': 'café ☕',
+    'numbers': [0, -1, 1.5, 1e20, float('inf')],
+    'booleans': [True, False, None],
+    'nested': [{'a': [1, {'b': []}], 'c': {}}, [[]]],
+}
+
+
+def read_resource(name):
+    with open(os.path.join(resources_path, name)) as f:
+        return f.read()
+
+
+def read_file(path):
+    with open(path) as f:
+        return f.read()
+
+
+def golden_outputs():
+    """Golden file name -> output, generated by the pure python ruamel implementation."""
+    outputs = {}
+    for name in ['types', 'manifest']:
+        outputs['%s.load.txt' % name] = repr(common.yaml_ordered_load(read_resource('%s.yaml' % name), all=True)) + '\n'
+    outputs['types.dump.yaml'] = common.yaml_ordered_dump(common.yaml_ordered_load(read_resource('types.yaml')))
+    outputs['manifest.dump.yaml'] = common.yaml_ordered_dump(common.yaml_ordered_load(read_resource('manifest.yaml'), all=True), all=True)
+    outputs['manifest.metadata.yaml'] = kubernetes.dump_all_str_and_add_metadata(read_resource('manifest.yaml'), {'app': 'web', 'dmake': 'yes'}, {'on': 'off'})
+    outputs['strings.dump.yaml'] = common.yaml_ordered_dump(strings)
+    outputs['strings.normalized.yaml'] = common.yaml_ordered_dump(strings, normalize_indent=True)
+    outputs['dmake_files.normalized.yaml'] = ''.join(common.yaml_ordered_dump(common.yaml_ordered_load(read_file(path)), normalize_indent=True) for path in dmake_files)
+    return outputs
+
+
+def generate_resources_yaml():
+    for name, output in golden_outputs().items():
+        with open(os.path.join(resources_path, name), 'w') as f:
+            f.write(output)
+
+
+def test_golden_outputs():
+    for name, output in golden_outputs().items():
+        assert read_resource(name) == output, (
+            "Unexpected YAML output for '{name}'. If the change is expected, update the golden files with:"
+            "\npython -c 'import test_yaml_backend; test_yaml_backend.generate_resources_yaml()'".format(name=name))
+
+
+@pytest.fixture(params=['fast', 'pure'])
+def loader(request, monkeypatch):
+    if request.param == 'pure':
+        monkeypatch.setattr(yaml_backend, 'fast_loader', False)
+    elif not yaml_backend.get_fast_loader():
+        pytest.skip("no libyaml loader available")
+    return request.param
+
+
+def test_golden_outputs_all_loaders(loader):
+    test_golden_outputs()
+
+
+def all_yaml_files():
+    root = os.path.dirname(os.path.dirname(__file__))
+    paths = [os.path.join(resources_path, name) for name in ['types.yaml', 'manifest.yaml']]
+    for directory in ['test', 'tutorial']:
+        for dirpath, _, filenames in os.walk(os.path.join(root, directory)):
+            paths += [os.path.join(dirpath, name) for name in filenames if name.endswith(('.yml', '.yaml'))]
+    return sorted(paths)
+
+
+def test_fast_loader_same_as_pure():
+    fast_loader = yaml_backend.get_fast_loader()
+    if not fast_loader:
+        pytest.skip("no libyaml loader available")
+    for path in all_yaml_files():
+        text = read_file(path)
+        try:
+            expected = repr(yaml_backend.pure_load(text, all=True))
+        except Exception:
+            continue
+        assert repr(fast_loader[1](text, True)) == expected, path
+
+
+@pytest.mark.parametrize('text', [
+    'a: 1\nb: 2\na: 3\n',
+    'a: 1\n b: 2\n',
+    'a: [1, 2\n',
+    'a: =\n',
+    'a: !!omap [b: 1]\n',
+    '%YAML 1.2\n---\na: yes\n',
+    '--- 1\n--- 2\n',
+    '',
+])
+def test_same_result_or_error_as_pure(text, tmp_path, monkeypatch):
+    def load(stream):
+        try:
+            return repr(common.yaml_ordered_load(stream))
+        except common.DMakeException as e:
+            return 'error: %s' % e
+    path = tmp_path / 'file.yml'
+    path.write_text(text)
+    results = []
+    for fast_loader in [yaml_backend.get_fast_loader(), False]:
+        monkeypatch.setattr(yaml_backend, 'fast_loader', fast_loader)
+        with open(str(path)) as stream:
+            results.append((load(text), load(stream)))
+    assert results[0] == results[1]
+
+
+def test_instances_are_reused_per_thread():
+    assert yaml_backend.get_dumper(False, False) is yaml_backend.get_dumper(False, False)
+    assert yaml_backend.get_dumper(False, True) is not yaml_backend.get_dumper(False, False)
+    expected = read_resource('manifest.dump.yaml')
+    manifest = read_resource('manifest.yaml')
+    results = []
+    def dump_manifest():
+        for _ in range(5):
+            results.append(common.yaml_ordered_dump(common.yaml_ordered_load(manifest, all=True), all=True))
+    threads = [threading.Thread(target=dump_manifest) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 20